@@ -0,0 +1,60 @@
+import asyncio
+import os
+import tempfile
+import time
+from typing import Any, List
+
+from llama_index.evaluation import BatchEvalRunner, QueryResponseEvaluator
+from llama_index.indices.list.base import ListIndex
+from llama_index.indices.service_context import ServiceContext
+from llama_index.llms.base import CompletionResponse, llm_completion_callback
+from llama_index.llms.mock import MockLLM
+from llama_index.schema import Document
+from llama_index.token_counter.mock_embed_model import MockEmbedding
+
+
+class SlowLLM(MockLLM):
+    """Mock LLM taking a fixed time per call, like a remote LLM."""
+
+    delay: float = 0.05
+
+    @llm_completion_callback()
+    def complete(self, prompt: str, **kwargs: Any) -> CompletionResponse:
+        time.sleep(self.delay)
+        return CompletionResponse(text="YES")
+
+    @llm_completion_callback()
+    async def acomplete(self, prompt: str, **kwargs: Any) -> CompletionResponse:
+        await asyncio.sleep(self.delay)
+        return CompletionResponse(text="YES")
+
+
+def bench_batch_runner(
+    num_queries: int = 100, workers_list: List[int] = [1, 8, 32]
+) -> None:
+    """Benchmark running and evaluating queries over a list index."""
+    print("Benchmarking batch evaluation\n---------------------------")
+    service_context = ServiceContext.from_defaults(
+        llm=SlowLLM(), embed_model=MockEmbedding(embed_dim=8)
+    )
+    index = ListIndex.from_documents(
+        [Document(text=f"text {i}") for i in range(3)],
+        service_context=service_context,
+    )
+    queries = [f"query {i}" for i in range(num_queries)]
+    for workers in workers_list:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            checkpoint_path = os.path.join(tmp_dir, "checkpoint.json")
+            for run in ["first run", "resumed"]:
+                runner = BatchEvalRunner(
+                    QueryResponseEvaluator(service_context=service_context),
+                    query_engine=index.as_query_engine(),
+                    workers=workers,
+                    checkpoint_path=checkpoint_path,
+                )
+                runner.evaluate_queries(queries)
+                print(f"workers={workers}, {run}:\n{runner.stats}\n")
+
+
+if __name__ == "__main__":
+    bench_batch_runner()
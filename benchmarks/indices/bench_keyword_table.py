@@ -0,0 +1,64 @@
+import random
+import time
+from typing import List
+
+from llama_index import ServiceContext
+from llama_index.indices.keyword_table.simple_base import SimpleKeywordTableIndex
+from llama_index.indices.query.schema import QueryBundle
+from llama_index.llms.mock import MockLLM
+from llama_index.schema import TextNode
+from llama_index.token_counter.mock_embed_model import MockEmbedding
+
+
+def generate_nodes(
+    num_nodes: int = 100, words_per_node: int = 50, vocab_size: int = 20000
+) -> List[TextNode]:
+    random.seed(42)  # Make this reproducible
+    vocab = [f"word{i}" for i in range(vocab_size)]
+    return [
+        TextNode(text=" ".join(random.choices(vocab, k=words_per_node)))
+        for _ in range(num_nodes)
+    ]
+
+
+def bench_keyword_table(
+    num_nodes: List[int] = [1000, 10000, 100000],
+    num_queries: int = 100,
+    words_per_query: int = 10,
+) -> None:
+    """Benchmark simple keyword table index build and retrieval."""
+    print("Benchmarking SimpleKeywordTableIndex\n---------------------------")
+    service_context = ServiceContext.from_defaults(
+        llm=MockLLM(), embed_model=MockEmbedding(embed_dim=1)
+    )
+    for num_node in num_nodes:
+        nodes = generate_nodes(num_nodes=num_node)
+
+        time1 = time.perf_counter()
+        index = SimpleKeywordTableIndex(nodes, service_context=service_context)
+        time2 = time.perf_counter()
+        print(f"Building index over {num_node} nodes took {time2 - time1} seconds")
+
+        retriever = index.as_retriever(retriever_mode="simple")
+        queries = [
+            " ".join(node.get_content().split()[:words_per_query])
+            for node in random.choices(nodes, k=num_queries)
+        ]
+        # first query builds the in-memory postings
+        time1 = time.perf_counter()
+        retriever.retrieve(QueryBundle(queries[0]))
+        time2 = time.perf_counter()
+        print(f"First query over {num_node} nodes took {time2 - time1} seconds")
+
+        time1 = time.perf_counter()
+        for query in queries:
+            retriever.retrieve(QueryBundle(query))
+        time2 = time.perf_counter()
+        print(
+            f"Querying index of {num_node} nodes took "
+            f"{(time2 - time1) / num_queries} seconds per query"
+        )
+
+
+if __name__ == "__main__":
+    bench_keyword_table()
@@ -0,0 +1,73 @@
+import random
+import time
+from typing import List
+
+from llama_index.indices.prompt_helper import PromptHelper
+from llama_index.prompts.default_prompts import (
+    DEFAULT_REFINE_PROMPT,
+    DEFAULT_TEXT_QA_PROMPT,
+)
+
+
+def generate_chunks(
+    num_chunks: int = 50, words_per_chunk: int = 400, vocab_size: int = 20000
+) -> List[str]:
+    random.seed(42)  # Make this reproducible
+    vocab = [f"word{i}" for i in range(vocab_size)]
+    return [
+        " ".join(random.choices(vocab, k=words_per_chunk)) for _ in range(num_chunks)
+    ]
+
+
+def bench_refine_packing(num_chunks: List[int] = [10, 50], num_runs: int = 3) -> None:
+    """Benchmark the packing done by a refine over retrieved chunks."""
+    print("Benchmarking PromptHelper packing\n---------------------------")
+    prompt_helper = PromptHelper(context_window=4096, num_output=256)
+    qa_template = DEFAULT_TEXT_QA_PROMPT.partial_format(query_str="What is word1?")
+    refine_template = DEFAULT_REFINE_PROMPT.partial_format(
+        query_str="What is word1?", existing_answer="word1 is a word."
+    )
+    for num_chunk in num_chunks:
+        text_chunks = generate_chunks(num_chunks=num_chunk)
+
+        # compact: repack all chunks, then refine each packed chunk
+        time1 = time.perf_counter()
+        for _ in range(num_runs):
+            packed_chunks = prompt_helper.repack(qa_template, text_chunks)
+            for packed_chunk in packed_chunks:
+                prompt_helper.repack(qa_template, [packed_chunk])
+                prompt_helper.get_text_splitter_given_prompt(
+                    refine_template
+                ).split_text(packed_chunk)
+        time2 = time.perf_counter()
+        print(
+            f"Compact refine packing over {num_chunk} chunks took "
+            f"{(time2 - time1) / num_runs} seconds"
+        )
+
+        # refine: repack each chunk on its own
+        time1 = time.perf_counter()
+        for _ in range(num_runs):
+            for text_chunk in text_chunks:
+                for packed_chunk in prompt_helper.repack(qa_template, [text_chunk]):
+                    prompt_helper.get_text_splitter_given_prompt(
+                        refine_template
+                    ).split_text(packed_chunk)
+        time2 = time.perf_counter()
+        print(
+            f"Refine packing over {num_chunk} chunks took "
+            f"{(time2 - time1) / num_runs} seconds"
+        )
+
+        time1 = time.perf_counter()
+        for _ in range(num_runs):
+            prompt_helper.truncate(qa_template, text_chunks)
+        time2 = time.perf_counter()
+        print(
+            f"Truncating {num_chunk} chunks took "
+            f"{(time2 - time1) / num_runs} seconds"
+        )
+
+
+if __name__ == "__main__":
+    bench_refine_packing()
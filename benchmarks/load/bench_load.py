@@ -0,0 +1,216 @@
+"""Load test of query and chat engines, against simulated providers.
+
+Runs N concurrent query engines or chat engines over an index built with a
+`SimulatedLLM` and a `SimulatedEmbedding`, i.e. with the latencies, token pacing
+and rate limits of remote providers but without network access, and reports
+throughput, time to first token, tail latency and rate-limited requests:
+
+    python benchmarks/load/bench_load.py --concurrency 1 8 32 --mode chat \
+        --llm-latency 0.5 --requests-per-minute 600 --output results.json
+"""
+import argparse
+import json
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from llama_index import Document, ServiceContext, VectorStoreIndex
+from llama_index.chat_engine.types import ChatMode
+from llama_index.embeddings.simulated import SimulatedEmbedding
+from llama_index.llms.simulated import LatencyProfile, RateLimitError, SimulatedLLM
+
+DEFAULT_PERCENTILES = (50, 90, 99)
+
+
+def get_percentiles(latencies: List[float]) -> Dict[str, float]:
+    if len(latencies) == 0:
+        return {}
+    values = np.percentile(latencies, DEFAULT_PERCENTILES)
+    return {
+        f"p{percentile}": float(value)
+        for percentile, value in zip(DEFAULT_PERCENTILES, values)
+    }
+
+
+def format_percentiles(percentiles: Dict[str, float]) -> str:
+    if len(percentiles) == 0:
+        return "-"
+    return ", ".join(f"{name}={value:.3f}s" for name, value in percentiles.items())
+
+
+def run_request(
+    engine: Any, query: str, mode: str, streaming: bool
+) -> Tuple[float, Optional[float]]:
+    """Run a request, returning its latency and time to first token (if streamed)."""
+    time1 = time.perf_counter()
+    response: Any
+    if mode == "chat":
+        response = engine.stream_chat(query) if streaming else engine.chat(query)
+    else:
+        response = engine.query(query)
+
+    first_token_time = None
+    if streaming:
+        for _ in response.response_gen:
+            if first_token_time is None:
+                first_token_time = time.perf_counter() - time1
+    return time.perf_counter() - time1, first_token_time
+
+
+def run_load_test(
+    create_engine: Callable[[], Any],
+    queries: List[str],
+    concurrency: int,
+    mode: str = "query",
+    streaming: bool = True,
+) -> Dict[str, Any]:
+    """Run queries through `concurrency` engines at once, one per thread.
+
+    Each thread creates its own engine (e.g. a chat engine, with its own
+    history), then takes the next query until there are none left. Requests
+    failing with a `RateLimitError` are counted, not retried.
+
+    """
+    query_queue: queue.Queue = queue.Queue()
+    for query in queries:
+        query_queue.put(query)
+    latencies: List[float] = []
+    first_token_times: List[float] = []
+    num_rate_limited = [0]
+    lock = threading.Lock()
+
+    def worker() -> None:
+        engine = create_engine()
+        while True:
+            try:
+                query = query_queue.get(block=False)
+            except queue.Empty:
+                return
+            try:
+                latency, first_token_time = run_request(engine, query, mode, streaming)
+            except RateLimitError:
+                with lock:
+                    num_rate_limited[0] += 1
+                continue
+            with lock:
+                latencies.append(latency)
+                if first_token_time is not None:
+                    first_token_times.append(first_token_time)
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    time1 = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - time1
+
+    return {
+        "mode": mode,
+        "streaming": streaming,
+        "concurrency": concurrency,
+        "num_requests": len(queries),
+        "num_rate_limited": num_rate_limited[0],
+        "elapsed_s": elapsed,
+        "throughput": len(latencies) / elapsed,
+        "latency_s": get_percentiles(latencies),
+        "first_token_s": get_percentiles(first_token_times),
+    }
+
+
+def bench_load(
+    concurrency_list: List[int] = [1, 8, 32],
+    modes: List[str] = ["query", "chat"],
+    num_requests: int = 32,
+    streaming: bool = True,
+    llm_latency: float = 0.2,
+    per_output_token: float = 0.005,
+    num_output_tokens: int = 32,
+    embed_latency: float = 0.05,
+    requests_per_minute: Optional[float] = None,
+    seed: int = 42,
+    output: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Load test query and chat engines over a vector index."""
+    print("Benchmarking engines under load\n---------------------------")
+    llm = SimulatedLLM(
+        profile=LatencyProfile(
+            latency=llm_latency,
+            per_output_token=per_output_token,
+            requests_per_minute=requests_per_minute,
+            seed=seed,
+        ),
+        num_output_tokens=num_output_tokens,
+    )
+    embed_model = SimulatedEmbedding(
+        profile=LatencyProfile(latency=embed_latency, per_output_token=0, seed=seed)
+    )
+    service_context = ServiceContext.from_defaults(llm=llm, embed_model=embed_model)
+    index = VectorStoreIndex.from_documents(
+        [Document(text=f"document {i} " * 100) for i in range(20)],
+        service_context=service_context,
+    )
+    queries = [f"query {i}" for i in range(num_requests)]
+
+    def create_engine(mode: str) -> Callable[[], Any]:
+        if mode == "chat":
+            return lambda: index.as_chat_engine(chat_mode=ChatMode.CONTEXT)
+        return lambda: index.as_query_engine(streaming=streaming)
+
+    results = []
+    for mode in modes:
+        for concurrency in concurrency_list:
+            result = run_load_test(
+                create_engine(mode),
+                queries,
+                concurrency,
+                mode=mode,
+                streaming=streaming,
+            )
+            print(
+                f"{mode}, {concurrency} concurrent: "
+                f"{result['throughput']:.2f} requests/s, "
+                f"{result['num_rate_limited']} rate limited, "
+                f"latency {format_percentiles(result['latency_s'])}, "
+                f"first token {format_percentiles(result['first_token_s'])}"
+            )
+            results.append(result)
+
+    if output is not None:
+        with open(output, "w") as f:
+            json.dump(results, f, indent=2)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument(
+        "--mode", nargs="+", choices=["query", "chat"], default=["query", "chat"]
+    )
+    parser.add_argument("--num-requests", type=int, default=32)
+    parser.add_argument("--no-streaming", action="store_true")
+    parser.add_argument("--llm-latency", type=float, default=0.2)
+    parser.add_argument("--per-output-token", type=float, default=0.005)
+    parser.add_argument("--num-output-tokens", type=int, default=32)
+    parser.add_argument("--embed-latency", type=float, default=0.05)
+    parser.add_argument("--requests-per-minute", type=float, default=None)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+    bench_load(
+        concurrency_list=args.concurrency,
+        modes=args.mode,
+        num_requests=args.num_requests,
+        streaming=not args.no_streaming,
+        llm_latency=args.llm_latency,
+        per_output_token=args.per_output_token,
+        num_output_tokens=args.num_output_tokens,
+        embed_latency=args.embed_latency,
+        requests_per_minute=args.requests_per_minute,
+        seed=args.seed,
+        output=args.output,
+    )
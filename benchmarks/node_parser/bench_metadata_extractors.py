@@ -0,0 +1,70 @@
+import asyncio
+import time
+from typing import Any, List
+
+from llama_index.llms.base import CompletionResponse, llm_completion_callback
+from llama_index.llms.mock import MockLLM
+from llama_index.node_parser.extractors import (
+    KeywordExtractor,
+    MetadataExtractor,
+    QuestionsAnsweredExtractor,
+    SummaryExtractor,
+)
+from llama_index.schema import BaseNode, TextNode
+from llama_index.storage.kvstore.simple_kvstore import SimpleKVStore
+
+
+class SlowLLM(MockLLM):
+    """Mock LLM taking a fixed time per call, like a remote LLM."""
+
+    delay: float = 0.05
+
+    @llm_completion_callback()
+    def complete(self, prompt: str, **kwargs: Any) -> CompletionResponse:
+        time.sleep(self.delay)
+        return CompletionResponse(text="text")
+
+    @llm_completion_callback()
+    async def acomplete(self, prompt: str, **kwargs: Any) -> CompletionResponse:
+        await asyncio.sleep(self.delay)
+        return CompletionResponse(text="text")
+
+
+def get_nodes(num_nodes: int) -> List[BaseNode]:
+    return [TextNode(text=f"text {i} " * 100) for i in range(num_nodes)]
+
+
+def bench_metadata_extractors(
+    num_nodes: int = 50, num_workers_list: List[int] = [1, 8, 32]
+) -> None:
+    """Benchmark extracting metadata with three LLM extractors."""
+    print("Benchmarking metadata extraction\n---------------------------")
+    llm = SlowLLM()
+    for num_workers in num_workers_list:
+        cache = SimpleKVStore()
+        kwargs: Any = {
+            "llm": llm,
+            "num_workers": num_workers,
+            "cache": cache,
+            "show_progress": False,
+        }
+        metadata_extractor = MetadataExtractor(
+            extractors=[
+                SummaryExtractor(**kwargs),
+                QuestionsAnsweredExtractor(**kwargs),
+                KeywordExtractor(**kwargs),
+            ],
+            in_place=False,
+        )
+        for run in ["first run", "unchanged nodes"]:
+            time1 = time.perf_counter()
+            metadata_extractor.process_nodes(get_nodes(num_nodes))
+            time2 = time.perf_counter()
+            print(
+                f"Extracting {num_nodes} nodes with {num_workers} workers "
+                f"({run}) took {time2 - time1} seconds"
+            )
+
+
+if __name__ == "__main__":
+    bench_metadata_extractors()
@@ -0,0 +1,41 @@
+import time
+from typing import List
+
+from llama_index.prompts.default_prompts import (
+    DEFAULT_REFINE_PROMPT,
+    DEFAULT_TEXT_QA_PROMPT,
+)
+from llama_index.prompts.prompt_utils import get_empty_prompt_txt
+
+
+def bench_prompts(num_calls: List[int] = [1000, 10000]) -> None:
+    """Benchmark the per-query work done on prompt templates."""
+    print("Benchmarking prompt formatting\n---------------------------")
+    context_str = "word " * 400
+    for num_call in num_calls:
+        time1 = time.perf_counter()
+        for _ in range(num_call):
+            DEFAULT_TEXT_QA_PROMPT.format(
+                context_str=context_str, query_str="What is word1?"
+            )
+        time2 = time.perf_counter()
+        print(f"Formatting {num_call} prompts took {time2 - time1} seconds")
+
+        time1 = time.perf_counter()
+        for _ in range(num_call):
+            DEFAULT_REFINE_PROMPT.partial_format(
+                query_str="What is word1?", existing_answer="word1 is a word."
+            ).format(context_msg=context_str)
+        time2 = time.perf_counter()
+        print(f"Partially formatting {num_call} prompts took {time2 - time1} seconds")
+
+        qa_template = DEFAULT_TEXT_QA_PROMPT.partial_format(query_str="What is word1?")
+        time1 = time.perf_counter()
+        for _ in range(num_call):
+            get_empty_prompt_txt(qa_template)
+        time2 = time.perf_counter()
+        print(f"Getting {num_call} empty prompt texts took {time2 - time1} seconds")
+
+
+if __name__ == "__main__":
+    bench_prompts()
@@ -0,0 +1,104 @@
+import time
+import tracemalloc
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Dict, List, Optional
+
+from llama_index.readers.base import BaseReader
+from llama_index.readers.file.base import SimpleDirectoryReader
+from llama_index.readers.file.manifest import FileManifest
+from llama_index.readers.file.tabular_reader import PandasCSVReader
+from llama_index.schema import Document
+
+
+class SlowReader(BaseReader):
+    """Reader waiting on each file, like a reader of a remote or slow disk."""
+
+    def load_data(
+        self, file: Path, extra_info: Optional[Dict] = None
+    ) -> List[Document]:
+        time.sleep(0.01)
+        return [Document(text=file.read_text(), metadata=extra_info or {})]
+
+
+def bench_load_data(
+    num_files: int = 200, num_workers_list: List[Optional[int]] = [None, 4, 8]
+) -> None:
+    """Benchmark loading a directory, sequentially and with workers."""
+    print("Benchmarking SimpleDirectoryReader\n---------------------------")
+    with TemporaryDirectory() as tmp_dir:
+        for i in range(num_files):
+            with open(f"{tmp_dir}/file{i}.slow", "w") as f:
+                f.write("word " * 1000)
+
+        reader = SimpleDirectoryReader(tmp_dir, file_extractor={".slow": SlowReader()})
+        for num_workers in num_workers_list:
+            time1 = time.perf_counter()
+            reader.load_data(num_workers=num_workers)
+            time2 = time.perf_counter()
+            print(
+                f"Loading {num_files} files with {num_workers} workers "
+                f"took {time2 - time1} seconds"
+            )
+
+
+def bench_incremental_load_data(num_files: int = 2000) -> None:
+    """Benchmark resyncing a directory with a manifest."""
+    print("Benchmarking incremental loads\n---------------------------")
+    with TemporaryDirectory() as tmp_dir:
+        for i in range(num_files):
+            with open(f"{tmp_dir}/file{i}.txt", "w") as f:
+                f.write("word " * 10000)
+
+        manifest = FileManifest()
+        for run in ["Full load", "Resync, unchanged", "Resync, 1% changed"]:
+            if run == "Resync, 1% changed":
+                for i in range(0, num_files, 100):
+                    with open(f"{tmp_dir}/file{i}.txt", "a") as f:
+                        f.write("word")
+            time1 = time.perf_counter()
+            reader = SimpleDirectoryReader(tmp_dir, manifest=manifest)
+            documents = reader.load_data()
+            time2 = time.perf_counter()
+            print(
+                f"{run} of {num_files} files ({len(documents)} loaded) "
+                f"took {time2 - time1} seconds"
+            )
+
+
+def bench_csv_load_data(num_rows: int = 50000) -> None:
+    """Benchmark the peak memory of loading a CSV file, at once and by chunks."""
+    print("Benchmarking CSV loads\n---------------------------")
+    with TemporaryDirectory() as tmp_dir:
+        with open(f"{tmp_dir}/file.csv", "w") as f:
+            f.write("id,name,text\n")
+            for i in range(num_rows):
+                f.write(f"{i},name{i},{'word ' * 20}\n")
+
+        for name, reader, documents_per_batch in [
+            ("At once", PandasCSVReader(concat_rows=False), None),
+            ("By chunks", PandasCSVReader(concat_rows=False, chunksize=1000), 1000),
+        ]:
+            directory_reader = SimpleDirectoryReader(
+                tmp_dir, file_extractor={".csv": reader}
+            )
+            tracemalloc.start()
+            time1 = time.perf_counter()
+            num_documents = 0
+            for docs in directory_reader.iter_data(
+                documents_per_batch=documents_per_batch
+            ):
+                num_documents += len(docs)
+            time2 = time.perf_counter()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(
+                f"{name}: {num_documents} documents took {time2 - time1} seconds, "
+                f"peak memory {peak / 2**20:.1f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    bench_load_data()
+    bench_incremental_load_data()
+    bench_csv_load_data()
@@ -0,0 +1,436 @@
+"""Retrieval benchmark suite, over indices, retrievers and docstores.
+
+Runs offline, with mock LLMs and embeddings, on generated nodes (seeded, so runs
+are reproducible). For each case and number of nodes, it times the build of the
+index, inserting and deleting nodes, persisting and loading it, and retrieval
+latency percentiles. Results are written as JSON, to track regressions:
+
+    python benchmarks/retrieval/bench_retrieval.py --sizes 1000 10000 100000 \
+        --cases vector keyword --output results.json
+
+Steps a case doesn't support (e.g. deleting from a tree index) are null.
+"""
+import argparse
+import json
+import platform
+import random
+import subprocess
+import tempfile
+import time
+import zlib
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from llama_index import ServiceContext, StorageContext, load_index_from_storage
+from llama_index.indices.base import BaseIndex
+from llama_index.indices.base_retriever import BaseRetriever
+from llama_index.indices.keyword_table.simple_base import SimpleKeywordTableIndex
+from llama_index.indices.knowledge_graph.base import KnowledgeGraphIndex
+from llama_index.indices.tree.base import TreeIndex
+from llama_index.indices.vector_store.base import VectorStoreIndex
+from llama_index.llms.mock import MockLLM
+from llama_index.prompts import PromptTemplate
+from llama_index.schema import BaseNode, NodeRelationship, RelatedNodeInfo, TextNode
+from llama_index.storage.docstore import SimpleDocumentStore
+from llama_index.storage.docstore.types import BaseDocumentStore
+from llama_index.token_counter.mock_embed_model import MockEmbedding
+
+DEFAULT_SIZES = [1000, 10000]
+DEFAULT_PERCENTILES = (50, 90, 99)
+
+
+class HashEmbedding(MockEmbedding):
+    """Mock embedding, random but deterministic per text."""
+
+    def _get_embedding(self, text: str) -> List[float]:
+        rng = np.random.default_rng(zlib.crc32(text.encode("utf-8")))
+        return rng.standard_normal(self.embed_dim).tolist()
+
+    def _get_query_embedding(self, query: str) -> List[float]:
+        return self._get_embedding(query)
+
+    def _get_text_embedding(self, text: str) -> List[float]:
+        return self._get_embedding(text)
+
+    async def _aget_query_embedding(self, query: str) -> List[float]:
+        return self._get_embedding(query)
+
+    async def _aget_text_embedding(self, text: str) -> List[float]:
+        return self._get_embedding(text)
+
+
+def generate_nodes(
+    num_nodes: int,
+    words_per_node: int = 50,
+    vocab_size: int = 20000,
+    nodes_per_doc: int = 10,
+    seed: int = 42,
+) -> List[BaseNode]:
+    """Generate nodes of random words, `nodes_per_doc` per ref doc."""
+    rng = random.Random(seed)
+    vocab = [f"word{i}" for i in range(vocab_size)]
+    return [
+        TextNode(
+            id_=f"node{i}",
+            text=" ".join(rng.choices(vocab, k=words_per_node)),
+            relationships={
+                NodeRelationship.SOURCE: RelatedNodeInfo(
+                    node_id=f"doc{i // nodes_per_doc}"
+                )
+            },
+        )
+        for i in range(num_nodes)
+    ]
+
+
+def generate_queries(
+    nodes: Sequence[BaseNode],
+    num_queries: int,
+    words_per_query: int = 5,
+    seed: int = 42,
+) -> List[str]:
+    """Generate queries from words of random nodes."""
+    rng = random.Random(seed)
+    return [
+        " ".join(rng.sample(node.get_content().split(), words_per_query))
+        for node in rng.choices(nodes, k=num_queries)
+    ]
+
+
+def get_percentiles(latencies: List[float]) -> Dict[str, float]:
+    values = np.percentile(latencies, DEFAULT_PERCENTILES)
+    percentiles = {
+        f"p{percentile}": float(value)
+        for percentile, value in zip(DEFAULT_PERCENTILES, values)
+    }
+    percentiles["mean"] = float(np.mean(latencies))
+    return percentiles
+
+
+def time_call(fn: Callable[[], Any]) -> float:
+    time1 = time.perf_counter()
+    fn()
+    return time.perf_counter() - time1
+
+
+def time_queries(fn: Callable[[str], Any], queries: List[str]) -> Dict[str, float]:
+    return get_percentiles([time_call(lambda: fn(query)) for query in queries])
+
+
+def bench_index(
+    build_index: Callable[[List[BaseNode]], BaseIndex],
+    get_retriever: Callable[[BaseIndex], BaseRetriever],
+    nodes: List[BaseNode],
+    queries: List[str],
+    num_changed: int,
+    service_context: ServiceContext,
+) -> Dict[str, Any]:
+    """Benchmark an index: build, insert, query, delete, persist and load.
+
+    The index is built over all nodes but the last `num_changed`, which are then
+    inserted, and the ref docs of the first `num_changed` nodes are deleted.
+
+    """
+    result: Dict[str, Any] = {}
+    index: BaseIndex
+    time1 = time.perf_counter()
+    index = build_index(nodes[:-num_changed])
+    result["build_s"] = time.perf_counter() - time1
+    result["insert_s"] = time_call(lambda: index.insert_nodes(nodes[-num_changed:]))
+
+    retriever = get_retriever(index)
+    # first query may build in-memory structures
+    result["first_query_s"] = time_call(lambda: retriever.retrieve(queries[0]))
+    result["query_latency_s"] = time_queries(retriever.retrieve, queries)
+
+    ref_doc_ids = list(
+        {node.ref_doc_id: None for node in nodes[:num_changed] if node.ref_doc_id}
+    )
+
+    def delete_ref_docs() -> None:
+        for ref_doc_id in ref_doc_ids:
+            index.delete_ref_doc(ref_doc_id)
+
+    try:
+        result["delete_s"] = time_call(delete_ref_docs)
+    except NotImplementedError:
+        result["delete_s"] = None
+
+    with tempfile.TemporaryDirectory() as persist_dir:
+        result["persist_s"] = time_call(
+            lambda: index.storage_context.persist(persist_dir=persist_dir)
+        )
+        result["load_s"] = time_call(
+            lambda: load_index_from_storage(
+                StorageContext.from_defaults(persist_dir=persist_dir),
+                service_context=service_context,
+            )
+        )
+    return result
+
+
+def bench_vector(
+    nodes: List[BaseNode], queries: List[str], num_changed: int, embed_dim: int
+) -> Dict[str, Any]:
+    service_context = ServiceContext.from_defaults(
+        llm=MockLLM(), embed_model=HashEmbedding(embed_dim=embed_dim)
+    )
+    return bench_index(
+        lambda nodes: VectorStoreIndex(nodes, service_context=service_context),
+        lambda index: index.as_retriever(similarity_top_k=10),
+        nodes,
+        queries,
+        num_changed,
+        service_context,
+    )
+
+
+def bench_keyword(
+    nodes: List[BaseNode], queries: List[str], num_changed: int, embed_dim: int
+) -> Dict[str, Any]:
+    service_context = ServiceContext.from_defaults(
+        llm=MockLLM(), embed_model=HashEmbedding(embed_dim=embed_dim)
+    )
+    return bench_index(
+        lambda nodes: SimpleKeywordTableIndex(nodes, service_context=service_context),
+        lambda index: index.as_retriever(retriever_mode="simple"),
+        nodes,
+        queries,
+        num_changed,
+        service_context,
+    )
+
+
+def bench_tree(
+    nodes: List[BaseNode], queries: List[str], num_changed: int, embed_dim: int
+) -> Dict[str, Any]:
+    # short summaries, so that the levels of the tree don't grow
+    service_context = ServiceContext.from_defaults(
+        llm=MockLLM(max_tokens=32), embed_model=HashEmbedding(embed_dim=embed_dim)
+    )
+    return bench_index(
+        lambda nodes: TreeIndex(nodes, service_context=service_context),
+        lambda index: index.as_retriever(retriever_mode="select_leaf_embedding"),
+        nodes,
+        queries,
+        num_changed,
+        service_context,
+    )
+
+
+def _extract_triplets(text: str) -> List[tuple]:
+    words = text.split()[:10]
+    return [(words[i], "relates to", words[i + 1]) for i in range(0, len(words), 2)]
+
+
+def bench_kg(
+    nodes: List[BaseNode], queries: List[str], num_changed: int, embed_dim: int
+) -> Dict[str, Any]:
+    # the mock LLM echoes the prompt, i.e. the words of the query as keywords
+    service_context = ServiceContext.from_defaults(
+        llm=MockLLM(), embed_model=HashEmbedding(embed_dim=embed_dim)
+    )
+    return bench_index(
+        lambda nodes: KnowledgeGraphIndex(
+            nodes,
+            service_context=service_context,
+            kg_triplet_extract_fn=_extract_triplets,
+        ),
+        lambda index: index.as_retriever(
+            retriever_mode="keyword",
+            query_keyword_extract_template=PromptTemplate("KEYWORDS: {question}"),
+        ),
+        nodes,
+        queries,
+        num_changed,
+        service_context,
+    )
+
+
+def bench_bm25(
+    nodes: List[BaseNode], queries: List[str], num_changed: int, embed_dim: int
+) -> Dict[str, Any]:
+    from llama_index.retrievers import BM25Retriever
+
+    docstore = SimpleDocumentStore()
+    docstore.add_documents(nodes)
+    result: Dict[str, Any] = {}
+    retriever: BM25Retriever
+    time1 = time.perf_counter()
+    retriever = BM25Retriever(docstore, tokenizer=str.split, similarity_top_k=10)
+    result["build_s"] = time.perf_counter() - time1
+    result["first_query_s"] = time_call(lambda: retriever.retrieve(queries[0]))
+    result["query_latency_s"] = time_queries(retriever.retrieve, queries)
+    # built over a docstore snapshot, no insert, delete or persistence
+    result.update(insert_s=None, delete_s=None, persist_s=None, load_s=None)
+    return result
+
+
+def bench_docstore(
+    docstore: BaseDocumentStore,
+    nodes: List[BaseNode],
+    queries: List[str],
+    num_changed: int,
+) -> Dict[str, Any]:
+    """Benchmark a docstore: add, insert, get nodes, delete, persist and load.
+
+    Node lookups are timed instead of retrievals, one per query.
+
+    """
+    result: Dict[str, Any] = {}
+    result["build_s"] = time_call(lambda: docstore.add_documents(nodes[:-num_changed]))
+    result["insert_s"] = time_call(lambda: docstore.add_documents(nodes[-num_changed:]))
+    rng = random.Random(42)
+    node_ids = [node.node_id for node in rng.choices(nodes, k=len(queries))]
+    result["first_query_s"] = time_call(lambda: docstore.get_node(node_ids[0]))
+    result["query_latency_s"] = get_percentiles(
+        [time_call(lambda: docstore.get_node(node_id)) for node_id in node_ids]
+    )
+    result["delete_s"] = time_call(
+        lambda: [docstore.delete_document(node.node_id) for node in nodes[:num_changed]]
+    )
+
+    if isinstance(docstore, SimpleDocumentStore):
+        with tempfile.TemporaryDirectory() as persist_dir:
+            persist_path = f"{persist_dir}/docstore.json"
+            result["persist_s"] = time_call(lambda: docstore.persist(persist_path))
+            result["load_s"] = time_call(
+                lambda: SimpleDocumentStore.from_persist_path(persist_path)
+            )
+    else:
+        result.update(persist_s=None, load_s=None)
+    return result
+
+
+def get_cases(
+    redis_url: Optional[str] = None, mongo_uri: Optional[str] = None
+) -> Dict[str, Callable[..., Dict[str, Any]]]:
+    """Get the benchmark cases, with the remote docstores configured."""
+    cases: Dict[str, Callable[..., Dict[str, Any]]] = {
+        "vector": bench_vector,
+        "keyword": bench_keyword,
+        "tree": bench_tree,
+        "kg": bench_kg,
+        "bm25": bench_bm25,
+        "docstore_simple": lambda nodes, queries, num_changed, embed_dim: (
+            bench_docstore(SimpleDocumentStore(), nodes, queries, num_changed)
+        ),
+    }
+    if redis_url is not None:
+        url = redis_url
+
+        def bench_redis(
+            nodes: List[BaseNode], queries: List[str], num_changed: int, embed_dim: int
+        ) -> Dict[str, Any]:
+            import redis  # type: ignore
+
+            from llama_index.storage.docstore import RedisDocumentStore
+
+            docstore = RedisDocumentStore.from_redis_client(
+                redis.Redis.from_url(url), namespace=f"bench{len(nodes)}"
+            )
+            return bench_docstore(docstore, nodes, queries, num_changed)
+
+        cases["docstore_redis"] = bench_redis
+    if mongo_uri is not None:
+        uri = mongo_uri
+
+        def bench_mongo(
+            nodes: List[BaseNode], queries: List[str], num_changed: int, embed_dim: int
+        ) -> Dict[str, Any]:
+            from llama_index.storage.docstore import MongoDocumentStore
+
+            docstore = MongoDocumentStore.from_uri(uri, namespace=f"bench{len(nodes)}")
+            return bench_docstore(docstore, nodes, queries, num_changed)
+
+        cases["docstore_mongo"] = bench_mongo
+    return cases
+
+
+def get_environment() -> Dict[str, Any]:
+    try:
+        commit: Optional[str] = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+    }
+
+
+def bench_retrieval(
+    sizes: List[int] = DEFAULT_SIZES,
+    case_names: Optional[List[str]] = None,
+    num_queries: int = 100,
+    changed_fraction: float = 0.01,
+    embed_dim: int = 64,
+    seed: int = 42,
+    redis_url: Optional[str] = None,
+    mongo_uri: Optional[str] = None,
+    output: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Run the retrieval benchmarks, writing the results as JSON to `output`."""
+    cases = get_cases(redis_url=redis_url, mongo_uri=mongo_uri)
+    case_names = case_names or list(cases)
+    results = []
+    for num_nodes in sizes:
+        nodes = generate_nodes(num_nodes, seed=seed)
+        queries = generate_queries(nodes, num_queries, seed=seed)
+        num_changed = max(int(num_nodes * changed_fraction), 1)
+        for case_name in case_names:
+            print(f"Benchmarking {case_name} over {num_nodes} nodes")
+            result: Dict[str, Any] = {"case": case_name, "num_nodes": num_nodes}
+            try:
+                result.update(cases[case_name](nodes, queries, num_changed, embed_dim))
+            except ImportError as e:
+                result["skipped"] = str(e)
+            print(json.dumps(result))
+            results.append(result)
+
+    report = {
+        "environment": get_environment(),
+        "params": {
+            "sizes": sizes,
+            "num_queries": num_queries,
+            "changed_fraction": changed_fraction,
+            "embed_dim": embed_dim,
+            "seed": seed,
+        },
+        "results": results,
+    }
+    if output is not None:
+        with open(output, "w") as f:
+            json.dump(report, f, indent=2)
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--cases", nargs="+", default=None)
+    parser.add_argument("--num-queries", type=int, default=100)
+    parser.add_argument("--changed-fraction", type=float, default=0.01)
+    parser.add_argument("--embed-dim", type=int, default=64)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--redis-url", default=None)
+    parser.add_argument("--mongo-uri", default=None)
+    parser.add_argument("--output", default="retrieval_results.json")
+    args = parser.parse_args()
+    bench_retrieval(
+        sizes=args.sizes,
+        case_names=args.cases,
+        num_queries=args.num_queries,
+        changed_fraction=args.changed_fraction,
+        embed_dim=args.embed_dim,
+        seed=args.seed,
+        redis_url=args.redis_url,
+        mongo_uri=args.mongo_uri,
+        output=args.output,
+    )
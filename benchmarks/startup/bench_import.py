@@ -0,0 +1,58 @@
+import json
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+# modules that `import llama_index` alone should not import
+HEAVY_MODULES = ["langchain", "pandas", "sqlalchemy", "nltk", "transformers"]
+
+STATEMENTS = [
+    "import llama_index",
+    "from llama_index import Document",
+    "from llama_index import ServiceContext",
+    "from llama_index import VectorStoreIndex",
+    "from llama_index import SimpleDirectoryReader",
+    "from llama_index.llms import OpenAI",
+    "from llama_index.vector_stores import SimpleVectorStore",
+]
+
+
+def time_import(statement: str) -> Dict:
+    """Time a statement in a fresh interpreter, and get the heavy modules imported."""
+    code = (
+        "import json, sys, time\n"
+        "start_time = time.perf_counter()\n"
+        f"{statement}\n"
+        "end_time = time.perf_counter()\n"
+        f"heavy_modules = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+        "print(json.dumps([end_time - start_time, heavy_modules]))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    seconds, heavy_modules = json.loads(output.splitlines()[-1])
+    return {"seconds": seconds, "heavy_modules": heavy_modules}
+
+
+def bench_import(statements: List[str] = STATEMENTS, num_runs: int = 5) -> bool:
+    """Benchmark import time, return whether `import llama_index` stays light."""
+    print("Benchmarking import time\n---------------------------")
+    is_light = True
+    for statement in statements:
+        results = [time_import(statement) for _ in range(num_runs)]
+        seconds = statistics.median(result["seconds"] for result in results)
+        heavy_modules = results[0]["heavy_modules"]
+        print(
+            f"`{statement}` took {seconds:.3f} seconds "
+            f"(heavy modules imported: {heavy_modules or 'none'})"
+        )
+        if statement == "import llama_index" and heavy_modules:
+            is_light = False
+    return is_light
+
+
+if __name__ == "__main__":
+    if not bench_import():
+        print("Regression: `import llama_index` imports heavy modules")
+        sys.exit(1)
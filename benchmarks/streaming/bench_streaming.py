@@ -0,0 +1,103 @@
+import queue
+import time
+from threading import Thread
+from typing import Generator, List
+
+from llama_index.chat_engine.types import StreamingAgentChatResponse
+from llama_index.llms.base import ChatMessage, ChatResponse
+from llama_index.memory import ChatMemoryBuffer
+
+
+def slow_chat_stream(
+    first_token_delay: float, num_tokens: int, token_delay: float
+) -> Generator[ChatResponse, None, None]:
+    """Chat stream of an LLM that is slow to answer."""
+    time.sleep(first_token_delay)
+    text = ""
+    for _ in range(num_tokens):
+        time.sleep(token_delay)
+        text += "token "
+        yield ChatResponse(message=ChatMessage(content=text), delta="token ")
+
+
+def polling_consumer(token_queue: queue.Queue, is_done: List[bool]) -> None:
+    """Consume a queue the way streaming responses used to, for comparison."""
+    while not is_done[0] or not token_queue.empty():
+        try:
+            token_queue.get(block=False)
+        except queue.Empty:
+            continue
+
+
+def bench_idle_streams(
+    num_streams: List[int] = [1, 10, 100],
+    first_token_delay: float = 1.0,
+    num_tokens: int = 20,
+    token_delay: float = 0.01,
+) -> None:
+    """Benchmark CPU use of streams waiting on a slow LLM."""
+    print("Benchmarking idle streaming chat responses\n---------------------------")
+    for num_stream in num_streams:
+        responses = [
+            StreamingAgentChatResponse(
+                chat_stream=slow_chat_stream(first_token_delay, num_tokens, token_delay)
+            )
+            for _ in range(num_stream)
+        ]
+        threads = []
+        for response in responses:
+            writer = Thread(
+                target=response.write_response_to_history,
+                args=(ChatMemoryBuffer.from_defaults(),),
+            )
+            reader = Thread(target=lambda r: list(r.response_gen), args=(response,))
+            threads.extend([writer, reader])
+
+        cpu_time1, time1 = time.process_time(), time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        cpu_time2, time2 = time.process_time(), time.perf_counter()
+
+        first_token_latencies = [r.metrics.first_token_latency or 0 for r in responses]
+        tokens_per_second = [r.metrics.tokens_per_second or 0 for r in responses]
+        print(
+            f"{num_stream} streams: "
+            f"{(cpu_time2 - cpu_time1) / num_stream / (time2 - time1):.4f} "
+            "CPU seconds per stream per second, "
+            f"mean first token latency {sum(first_token_latencies) / num_stream:.3f}s, "
+            f"mean {sum(tokens_per_second) / num_stream:.1f} tokens/sec"
+        )
+
+
+def bench_polling_streams(
+    num_streams: List[int] = [1, 10], first_token_delay: float = 1.0
+) -> None:
+    """Benchmark CPU use of busy-wait consumers, for comparison."""
+    print("Benchmarking busy-wait consumers\n---------------------------")
+    for num_stream in num_streams:
+        is_done = [False]
+        threads = [
+            Thread(target=polling_consumer, args=(queue.Queue(), is_done))
+            for _ in range(num_stream)
+        ]
+
+        cpu_time1, time1 = time.process_time(), time.perf_counter()
+        for thread in threads:
+            thread.start()
+        time.sleep(first_token_delay)
+        is_done[0] = True
+        for thread in threads:
+            thread.join()
+        cpu_time2, time2 = time.process_time(), time.perf_counter()
+        print(
+            f"{num_stream} streams: "
+            f"{(cpu_time2 - cpu_time1) / num_stream / (time2 - time1):.4f} "
+            "CPU seconds per stream per second"
+        )
+
+
+if __name__ == "__main__":
+    bench_idle_streams()
+    bench_polling_streams()
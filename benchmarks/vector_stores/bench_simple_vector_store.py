@@ -1,6 +1,9 @@
 import random
 import time
 from typing import List
+
+import numpy as np
+
 from llama_index.schema import TextNode
 
 from llama_index.vector_stores.types import (
@@ -25,18 +28,18 @@ def generate_vectors(
 
 
 def bench_simple_vector_store(
-    num_vectors: List[int] = [10, 50, 100, 500, 1000]
+    num_vectors: List[int] = [10, 50, 100, 500, 1000], num_queries: int = 20
 ) -> None:
     """Benchmark simple vector store."""
     print("Benchmarking SimpleVectorStore\n---------------------------")
     for num_vector in num_vectors:
         vectors = generate_vectors(num_vectors=num_vector)
 
-        vector_store = SimpleVectorStore(vectors=vectors)
+        vector_store = SimpleVectorStore()
 
-        time1 = time.time()
+        time1 = time.perf_counter()
         vector_store.add(embedding_results=vectors)
-        time2 = time.time()
+        time2 = time.perf_counter()
         print(f"Adding {num_vector} vectors took {time2 - time1} seconds")
 
         for mode in [
@@ -44,15 +47,18 @@ def bench_simple_vector_store(
             VectorStoreQueryMode.SVM,
             VectorStoreQueryMode.MMR,
         ]:
-            time1 = time.time()
-            query = VectorStoreQuery(
-                query_embedding=vectors[0].embedding, similarity_top_k=10, mode=mode
-            )
-            vector_store.query(query=query)
-            time2 = time.time()
+            latencies = []
+            for vector in random.choices(vectors, k=num_queries):
+                query = VectorStoreQuery(
+                    query_embedding=vector.embedding, similarity_top_k=10, mode=mode
+                )
+                time1 = time.perf_counter()
+                vector_store.query(query=query)
+                latencies.append(time.perf_counter() - time1)
+            p50, p90, p99 = np.percentile(latencies, [50, 90, 99])
             print(
-                f"""Querying store of {num_vector} \
-vectors with {mode} mode took {time2 - time1} seconds"""
+                f"Querying store of {num_vector} vectors with {mode} mode took "
+                f"p50={p50:.5f}s, p90={p90:.5f}s, p99={p99:.5f}s"
             )
 
 
@@ -1,4 +1,9 @@
-"""Init file of LlamaIndex."""
+"""Init file of LlamaIndex.
+
+The public API is imported lazily, on first access, so that `import llama_index`
+does not import every index, reader and integration (and their dependencies).
+
+"""
 from pathlib import Path
 
 with open(Path(__file__).absolute().parents[0] / "VERSION") as _f:
@@ -7,140 +12,238 @@ with open(Path(__file__).absolute().parents[0] / "VERSION") as _f:
 
 import logging
 from logging import NullHandler
-from typing import Optional
-
-from llama_index.data_structs.struct_type import IndexStructType
-
-# embeddings
-from llama_index.embeddings.langchain import LangchainEmbedding
-from llama_index.embeddings.openai import OpenAIEmbedding
-
-
-# indices
-from llama_index.indices.keyword_table import (
-    KeywordTableIndex,
-    RAKEKeywordTableIndex,
-    SimpleKeywordTableIndex,
-    GPTKeywordTableIndex,
-    GPTRAKEKeywordTableIndex,
-    GPTSimpleKeywordTableIndex,
-)
-from llama_index.indices.knowledge_graph import (
-    KnowledgeGraphIndex,
-    GPTKnowledgeGraphIndex,
-)
-from llama_index.indices.list import ListIndex, GPTListIndex
-from llama_index.indices.tree import TreeIndex, GPTTreeIndex
-from llama_index.indices.vector_store import VectorStoreIndex, GPTVectorStoreIndex
-from llama_index.indices.document_summary import (
-    DocumentSummaryIndex,
-    GPTDocumentSummaryIndex,
-)
-from llama_index.indices.empty import EmptyIndex, GPTEmptyIndex
-from llama_index.indices.struct_store.pandas import PandasIndex, GPTPandasIndex
-from llama_index.indices.struct_store.sql import (
-    SQLStructStoreIndex,
-    GPTSQLStructStoreIndex,
-)
-
-# structured
-from llama_index.indices.common.struct_store.base import SQLDocumentContextBuilder
-
-# for composability
-from llama_index.indices.composability.graph import ComposableGraph
-
-# loading
-from llama_index.indices.loading import (
-    load_graph_from_storage,
-    load_index_from_storage,
-    load_indices_from_storage,
-)
-
-# prompt helper
-from llama_index.indices.prompt_helper import PromptHelper
-
-# Response Synthesizer
-from llama_index.response_synthesizers.factory import get_response_synthesizer
-
-# QueryBundle
-from llama_index.indices.query.schema import QueryBundle
-
-from llama_index.indices.service_context import (
-    ServiceContext,
-    set_global_service_context,
-)
-
-# langchain helper
-from llama_index.llm_predictor import LLMPredictor
-from llama_index.langchain_helpers.memory_wrapper import GPTIndexMemory
-from llama_index.langchain_helpers.sql_wrapper import SQLDatabase
-
-# prompts
-from llama_index.prompts import (
-    BasePromptTemplate,
-    PromptTemplate,
-    ChatPromptTemplate,
-    SelectorPromptTemplate,
-    # backwards compatibility
-    Prompt,
-)
-from llama_index.prompts.prompts import (
-    KeywordExtractPrompt,
-    QueryKeywordExtractPrompt,
-    QuestionAnswerPrompt,
-    RefinePrompt,
-    SummaryPrompt,
-    TreeInsertPrompt,
-    TreeSelectMultiplePrompt,
-    TreeSelectPrompt,
-)
-
-# readers
-from llama_index.schema import Document
-from llama_index.readers import (
-    BeautifulSoupWebReader,
-    ChromaReader,
-    DeepLakeReader,
-    DiscordReader,
-    FaissReader,
-    GithubRepositoryReader,
-    GoogleDocsReader,
-    JSONReader,
-    MboxReader,
-    MilvusReader,
-    NotionPageReader,
-    ObsidianReader,
-    PineconeReader,
-    PsychicReader,
-    QdrantReader,
-    RssReader,
-    SimpleDirectoryReader,
-    SimpleMongoReader,
-    SimpleWebPageReader,
-    SlackReader,
-    StringIterableReader,
-    TrafilaturaWebReader,
-    TwitterTweetReader,
-    WeaviateReader,
-    WikipediaReader,
-)
-from llama_index.readers.download import download_loader
-
-# response
-from llama_index.response.schema import Response
-
-# storage
-from llama_index.storage.storage_context import StorageContext
-
-# token predictor
-from llama_index.llm_predictor.mock import MockLLMPredictor
-from llama_index.token_counter.mock_embed_model import MockEmbedding
-
-# vellum
-from llama_index.llm_predictor.vellum import VellumPredictor, VellumPromptRegistry
-
-# import global eval handler
-from llama_index.callbacks.global_handlers import set_global_handler
+from typing import TYPE_CHECKING, Optional
+
+from llama_index.utils import get_lazy_getattr
+
+if TYPE_CHECKING:
+    from llama_index.data_structs.struct_type import IndexStructType
+
+    # embeddings
+    from llama_index.embeddings.langchain import LangchainEmbedding
+    from llama_index.embeddings.openai import OpenAIEmbedding
+
+    # indices
+    from llama_index.indices.keyword_table import (
+        KeywordTableIndex,
+        RAKEKeywordTableIndex,
+        SimpleKeywordTableIndex,
+        GPTKeywordTableIndex,
+        GPTRAKEKeywordTableIndex,
+        GPTSimpleKeywordTableIndex,
+    )
+    from llama_index.indices.knowledge_graph import (
+        KnowledgeGraphIndex,
+        GPTKnowledgeGraphIndex,
+    )
+    from llama_index.indices.list import ListIndex, GPTListIndex
+    from llama_index.indices.tree import TreeIndex, GPTTreeIndex
+    from llama_index.indices.vector_store import VectorStoreIndex, GPTVectorStoreIndex
+    from llama_index.indices.document_summary import (
+        DocumentSummaryIndex,
+        GPTDocumentSummaryIndex,
+    )
+    from llama_index.indices.empty import EmptyIndex, GPTEmptyIndex
+    from llama_index.indices.struct_store.pandas import PandasIndex, GPTPandasIndex
+    from llama_index.indices.struct_store.sql import (
+        SQLStructStoreIndex,
+        GPTSQLStructStoreIndex,
+    )
+
+    # structured
+    from llama_index.indices.common.struct_store.base import SQLDocumentContextBuilder
+
+    # for composability
+    from llama_index.indices.composability.graph import ComposableGraph
+
+    # loading
+    from llama_index.indices.loading import (
+        load_graph_from_storage,
+        load_index_from_storage,
+        load_indices_from_storage,
+    )
+
+    # prompt helper
+    from llama_index.indices.prompt_helper import PromptHelper
+
+    # Response Synthesizer
+    from llama_index.response_synthesizers.factory import get_response_synthesizer
+
+    # QueryBundle
+    from llama_index.indices.query.schema import QueryBundle
+
+    from llama_index.indices.service_context import (
+        ServiceContext,
+        set_global_service_context,
+    )
+
+    # langchain helper
+    from llama_index.llm_predictor import LLMPredictor
+    from llama_index.langchain_helpers.memory_wrapper import GPTIndexMemory
+    from llama_index.langchain_helpers.sql_wrapper import SQLDatabase
+
+    # prompts
+    from llama_index.prompts import (
+        BasePromptTemplate,
+        PromptTemplate,
+        ChatPromptTemplate,
+        SelectorPromptTemplate,
+        # backwards compatibility
+        Prompt,
+    )
+    from llama_index.prompts.prompts import (
+        KeywordExtractPrompt,
+        QueryKeywordExtractPrompt,
+        QuestionAnswerPrompt,
+        RefinePrompt,
+        SummaryPrompt,
+        TreeInsertPrompt,
+        TreeSelectMultiplePrompt,
+        TreeSelectPrompt,
+    )
+
+    # readers
+    from llama_index.schema import Document
+    from llama_index.readers import (
+        BeautifulSoupWebReader,
+        ChromaReader,
+        DeepLakeReader,
+        DiscordReader,
+        FaissReader,
+        GithubRepositoryReader,
+        GoogleDocsReader,
+        JSONReader,
+        MboxReader,
+        MilvusReader,
+        NotionPageReader,
+        ObsidianReader,
+        PineconeReader,
+        PsychicReader,
+        QdrantReader,
+        RssReader,
+        SimpleDirectoryReader,
+        SimpleMongoReader,
+        SimpleWebPageReader,
+        SlackReader,
+        StringIterableReader,
+        TrafilaturaWebReader,
+        TwitterTweetReader,
+        WeaviateReader,
+        WikipediaReader,
+    )
+    from llama_index.readers.download import download_loader
+
+    # response
+    from llama_index.response.schema import Response
+
+    # storage
+    from llama_index.storage.storage_context import StorageContext
+
+    # token predictor
+    from llama_index.llm_predictor.mock import MockLLMPredictor
+    from llama_index.token_counter.mock_embed_model import MockEmbedding
+
+    # vellum
+    from llama_index.llm_predictor.vellum import VellumPredictor, VellumPromptRegistry
+
+    # import global eval handler
+    from llama_index.callbacks.global_handlers import set_global_handler
+    from llama_index.callbacks.base_handler import BaseCallbackHandler
+
+    # NOTE: keep for backwards compatibility
+    SQLContextBuilder = SQLDocumentContextBuilder
+
+_LAZY_IMPORTS = {
+    "IndexStructType": "llama_index.data_structs.struct_type",
+    "LangchainEmbedding": "llama_index.embeddings.langchain",
+    "OpenAIEmbedding": "llama_index.embeddings.openai",
+    "KeywordTableIndex": "llama_index.indices.keyword_table",
+    "RAKEKeywordTableIndex": "llama_index.indices.keyword_table",
+    "SimpleKeywordTableIndex": "llama_index.indices.keyword_table",
+    "GPTKeywordTableIndex": "llama_index.indices.keyword_table",
+    "GPTRAKEKeywordTableIndex": "llama_index.indices.keyword_table",
+    "GPTSimpleKeywordTableIndex": "llama_index.indices.keyword_table",
+    "KnowledgeGraphIndex": "llama_index.indices.knowledge_graph",
+    "GPTKnowledgeGraphIndex": "llama_index.indices.knowledge_graph",
+    "ListIndex": "llama_index.indices.list",
+    "GPTListIndex": "llama_index.indices.list",
+    "TreeIndex": "llama_index.indices.tree",
+    "GPTTreeIndex": "llama_index.indices.tree",
+    "VectorStoreIndex": "llama_index.indices.vector_store",
+    "GPTVectorStoreIndex": "llama_index.indices.vector_store",
+    "DocumentSummaryIndex": "llama_index.indices.document_summary",
+    "GPTDocumentSummaryIndex": "llama_index.indices.document_summary",
+    "EmptyIndex": "llama_index.indices.empty",
+    "GPTEmptyIndex": "llama_index.indices.empty",
+    "PandasIndex": "llama_index.indices.struct_store.pandas",
+    "GPTPandasIndex": "llama_index.indices.struct_store.pandas",
+    "SQLStructStoreIndex": "llama_index.indices.struct_store.sql",
+    "GPTSQLStructStoreIndex": "llama_index.indices.struct_store.sql",
+    "SQLDocumentContextBuilder": "llama_index.indices.common.struct_store.base",
+    "ComposableGraph": "llama_index.indices.composability.graph",
+    "load_graph_from_storage": "llama_index.indices.loading",
+    "load_index_from_storage": "llama_index.indices.loading",
+    "load_indices_from_storage": "llama_index.indices.loading",
+    "PromptHelper": "llama_index.indices.prompt_helper",
+    "get_response_synthesizer": "llama_index.response_synthesizers.factory",
+    "QueryBundle": "llama_index.indices.query.schema",
+    "ServiceContext": "llama_index.indices.service_context",
+    "set_global_service_context": "llama_index.indices.service_context",
+    "LLMPredictor": "llama_index.llm_predictor",
+    "GPTIndexMemory": "llama_index.langchain_helpers.memory_wrapper",
+    "SQLDatabase": "llama_index.langchain_helpers.sql_wrapper",
+    "BasePromptTemplate": "llama_index.prompts",
+    "PromptTemplate": "llama_index.prompts",
+    "ChatPromptTemplate": "llama_index.prompts",
+    "SelectorPromptTemplate": "llama_index.prompts",
+    "Prompt": "llama_index.prompts",
+    "KeywordExtractPrompt": "llama_index.prompts.prompts",
+    "QueryKeywordExtractPrompt": "llama_index.prompts.prompts",
+    "QuestionAnswerPrompt": "llama_index.prompts.prompts",
+    "RefinePrompt": "llama_index.prompts.prompts",
+    "SummaryPrompt": "llama_index.prompts.prompts",
+    "TreeInsertPrompt": "llama_index.prompts.prompts",
+    "TreeSelectMultiplePrompt": "llama_index.prompts.prompts",
+    "TreeSelectPrompt": "llama_index.prompts.prompts",
+    "Document": "llama_index.schema",
+    "BeautifulSoupWebReader": "llama_index.readers",
+    "ChromaReader": "llama_index.readers",
+    "DeepLakeReader": "llama_index.readers",
+    "DiscordReader": "llama_index.readers",
+    "FaissReader": "llama_index.readers",
+    "GithubRepositoryReader": "llama_index.readers",
+    "GoogleDocsReader": "llama_index.readers",
+    "JSONReader": "llama_index.readers",
+    "MboxReader": "llama_index.readers",
+    "MilvusReader": "llama_index.readers",
+    "NotionPageReader": "llama_index.readers",
+    "ObsidianReader": "llama_index.readers",
+    "PineconeReader": "llama_index.readers",
+    "PsychicReader": "llama_index.readers",
+    "QdrantReader": "llama_index.readers",
+    "RssReader": "llama_index.readers",
+    "SimpleDirectoryReader": "llama_index.readers",
+    "SimpleMongoReader": "llama_index.readers",
+    "SimpleWebPageReader": "llama_index.readers",
+    "SlackReader": "llama_index.readers",
+    "StringIterableReader": "llama_index.readers",
+    "TrafilaturaWebReader": "llama_index.readers",
+    "TwitterTweetReader": "llama_index.readers",
+    "WeaviateReader": "llama_index.readers",
+    "WikipediaReader": "llama_index.readers",
+    "download_loader": "llama_index.readers.download",
+    "Response": "llama_index.response.schema",
+    "StorageContext": "llama_index.storage.storage_context",
+    "MockLLMPredictor": "llama_index.llm_predictor.mock",
+    "MockEmbedding": "llama_index.token_counter.mock_embed_model",
+    "VellumPredictor": "llama_index.llm_predictor.vellum",
+    "VellumPromptRegistry": "llama_index.llm_predictor.vellum",
+    "set_global_handler": "llama_index.callbacks.global_handlers",
+    "BaseCallbackHandler": "llama_index.callbacks.base_handler",
+    "SQLContextBuilder": (
+        "llama_index.indices.common.struct_store.base:SQLDocumentContextBuilder"
+    ),
+}
 
 # best practices for library logging:
 # https://docs.python.org/3/howto/logging.html#configuring-logging-for-a-library
@@ -237,13 +340,11 @@ __all__ = [
     "set_global_handler",
 ]
 
-# eval global toggle
-from llama_index.callbacks.base_handler import BaseCallbackHandler  # noqa: E402
 
-global_handler: Optional[BaseCallbackHandler] = None
+__getattr__ = get_lazy_getattr(__name__, _LAZY_IMPORTS)
 
-# NOTE: keep for backwards compatibility
-SQLContextBuilder = SQLDocumentContextBuilder
+# eval global toggle
+global_handler: Optional["BaseCallbackHandler"] = None
 
 # global service context for ServiceContext.from_defaults()
-global_service_context: Optional[ServiceContext] = None
+global_service_context: Optional["ServiceContext"] = None
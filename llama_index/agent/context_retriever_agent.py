@@ -27,7 +27,7 @@ DEFAULT_QA_PROMPT_TMPL = (
     "---------------------\ n"
     "<{context_str}>\n"
     "---------------------\ n"
-    "Учитывая контекстную информацию, а не предварительные знания",
+    "Учитывая контекстную информацию, а не предварительные знания, "
     "ответьте на вопрос в []: [{query_str}]\n"
 )
 DEFAULT_QA_PROMPT = PromptTemplate(DEFAULT_QA_PROMPT_TMPL)
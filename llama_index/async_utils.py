@@ -1,7 +1,71 @@
 """Async utils."""
 import asyncio
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from itertools import zip_longest
-from typing import Any, Coroutine, Iterable, List
+from typing import Any, Coroutine, Iterable, List, Optional
+
+DEFAULT_NUM_WORKERS = 8
+
+
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_thread: Optional[threading.Thread] = None
+_background_lock = threading.Lock()
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """Get the long-lived event loop that runs coroutines for sync callers.
+
+    The loop runs forever in a daemon thread, started on first use.
+
+    """
+    global _background_loop, _background_thread
+
+    with _background_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="llama_index_async", daemon=True
+            )
+            thread.start()
+            _background_loop, _background_thread = loop, thread
+        return _background_loop
+
+
+def asyncio_run(coro: Coroutine, timeout: Optional[float] = None) -> Any:
+    """Run a coroutine from sync code and return its result.
+
+    The coroutine runs on the background loop, so this works whether or not the
+    calling thread already runs an event loop (e.g. in a notebook), and no loop is
+    created per call. Context variables of the caller are visible to the
+    coroutine.
+
+    If `timeout` (in seconds) expires, or the caller is interrupted, the
+    coroutine is cancelled and the error is raised.
+
+    """
+    if threading.current_thread() is _background_thread:
+        # blocking the background loop on itself would deadlock, run the
+        # coroutine on a loop of its own instead
+        context = contextvars.copy_context()
+
+        def _run_in_new_loop() -> Any:
+            return asyncio.run(asyncio.wait_for(coro, timeout))
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(lambda: context.run(_run_in_new_loop)).result()
+
+    future = asyncio.run_coroutine_threadsafe(coro, get_background_loop())
+    try:
+        return future.result(timeout)
+    except FutureTimeoutError:
+        future.cancel()
+        raise asyncio.TimeoutError()
+    except BaseException:
+        future.cancel()
+        raise
 
 
 def run_async_tasks(
@@ -9,35 +73,62 @@ def run_async_tasks(
     show_progress: bool = False,
     progress_bar_desc: str = "Running async tasks",
 ) -> List[Any]:
-    """Run a list of async tasks."""
+    """Run a list of async tasks from sync code.
+
+    NOTE: kept for backwards compatibility, prefer `asyncio_run(run_jobs(...))`,
+    which bounds the number of tasks running at once.
+
+    """
+    return asyncio_run(
+        run_jobs(
+            tasks,
+            show_progress=show_progress,
+            workers=max(len(tasks), 1),
+            progress_bar_desc=progress_bar_desc,
+        )
+    )
 
-    tasks_to_execute: List[Any] = tasks
-    if show_progress:
+
+async def run_jobs(
+    jobs: List[Coroutine],
+    show_progress: bool = False,
+    workers: int = DEFAULT_NUM_WORKERS,
+    progress_bar_desc: str = "Running async jobs",
+    timeout: Optional[float] = None,
+) -> List[Any]:
+    """Run jobs with at most `workers` running concurrently.
+
+    Results are returned in the same order as `jobs`. Each job can take at most
+    `timeout` seconds (once started) before it is cancelled with an
+    `asyncio.TimeoutError`. If a job fails, or `run_jobs` itself is cancelled,
+    the other jobs are cancelled too.
+
+    """
+    semaphore = asyncio.Semaphore(workers)
+
+    async def worker(job: Coroutine) -> Any:
         try:
-            import nest_asyncio
-            from tqdm.asyncio import tqdm
-
-            # jupyter notebooks already have an event loop running
-            # we need to reuse it instead of creating a new one
-            nest_asyncio.apply()
-            loop = asyncio.get_event_loop()
-
-            async def _tqdm_gather() -> List[Any]:
-                return await tqdm.gather(*tasks_to_execute, desc=progress_bar_desc)
-
-            tqdm_outputs: List[Any] = loop.run_until_complete(_tqdm_gather())
-            return tqdm_outputs
-        # run the operation w/o tqdm on hitting a fatal
-        # may occur in some environments where tqdm.asyncio
-        # is not supported
-        except Exception:
-            pass
-
-    async def _gather() -> List[Any]:
-        return await asyncio.gather(*tasks_to_execute)
-
-    outputs: List[Any] = asyncio.run(_gather())
-    return outputs
+            async with semaphore:
+                return await asyncio.wait_for(job, timeout)
+        finally:
+            # don't leave jobs cancelled before they started un-awaited
+            if asyncio.iscoroutine(job):
+                job.close()
+
+    pool_jobs = [asyncio.ensure_future(worker(job)) for job in jobs]
+    try:
+        if show_progress:
+            try:
+                from tqdm.asyncio import tqdm
+
+                return await tqdm.gather(*pool_jobs, desc=progress_bar_desc)
+            except ImportError:
+                pass
+
+        return await asyncio.gather(*pool_jobs)
+    finally:
+        for pool_job in pool_jobs:
+            pool_job.cancel()
 
 
 def chunks(iterable: Iterable, size: int) -> Iterable:
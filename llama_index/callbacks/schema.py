@@ -25,6 +25,9 @@ class CBEventType(str, Enum):
         SYNTHESIZE: Logs for the result for synthesize calls.
         TREE: Logs for the summary and level of summaries generated.
         SUB_QUESTION: Logs for a generated sub question and answer.
+        QUERY_PLAN: Logs for an executed query plan node and its duration.
+        DELETE: Logs for a ref doc deleted from an index.
+        CACHE: Logs for a response cache lookup: hit or miss, and saved LLM tokens.
     """
 
     CHUNKING = "chunking"
@@ -36,6 +39,9 @@ class CBEventType(str, Enum):
     SYNTHESIZE = "synthesize"
     TREE = "tree"
     SUB_QUESTION = "sub_question"
+    QUERY_PLAN = "query_plan"
+    DELETE = "delete"
+    CACHE = "cache"
 
 
 class EventPayload(str, Enum):
@@ -50,10 +56,20 @@ class EventPayload(str, Enum):
     QUERY_STR = "query_str"  # query used for query engine
     SUB_QUESTION = "sub_question"  # a sub question & answer + sources
     EMBEDDINGS = "embeddings"  # list of embeddings
+    QUERY_PLAN_NODE = "query_plan_node"  # a query plan node being executed
+    DURATION = "duration"  # seconds spent in the event
+    REF_DOC_ID = "ref_doc_id"  # id of a ref doc
+    CACHE_HIT = "cache_hit"  # whether a response was served from a cache
+    SAVED_TOKENS = "saved_tokens"  # LLM tokens saved by a cache hit
 
 
 # events that will never have children events
-LEAF_EVENTS = (CBEventType.CHUNKING, CBEventType.LLM, CBEventType.EMBEDDING)
+LEAF_EVENTS = (
+    CBEventType.CHUNKING,
+    CBEventType.LLM,
+    CBEventType.EMBEDDING,
+    CBEventType.CACHE,
+)
 
 
 @dataclass
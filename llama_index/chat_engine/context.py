@@ -250,11 +250,8 @@ class ContextChatEngine(BaseChatEngine):
             ],
             source_nodes=nodes,
         )
-        thread = Thread(
-            target=lambda x: asyncio.run(chat_response.awrite_response_to_history(x)),
-            args=(self._memory,),
-        )
-        thread.start()
+        # write the response to history on the caller's event loop
+        asyncio.create_task(chat_response.awrite_response_to_history(self._memory))
 
         return chat_response
 
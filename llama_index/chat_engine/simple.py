@@ -130,11 +130,8 @@ class SimpleChatEngine(BaseChatEngine):
         chat_response = StreamingAgentChatResponse(
             achat_stream=await self._llm.astream_chat(all_messages)
         )
-        thread = Thread(
-            target=lambda x: asyncio.run(chat_response.awrite_response_to_history(x)),
-            args=(self._memory,),
-        )
-        thread.start()
+        # write the response to history on the caller's event loop
+        asyncio.create_task(chat_response.awrite_response_to_history(self._memory))
 
         return chat_response
 
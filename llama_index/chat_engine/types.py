@@ -1,6 +1,5 @@
 import asyncio
 import logging
-import queue
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
@@ -10,6 +9,11 @@ from typing import AsyncGenerator, Generator, List, Optional, Union
 from llama_index.llms.base import ChatMessage, ChatResponseAsyncGen, ChatResponseGen
 from llama_index.memory import BaseMemory
 from llama_index.response.schema import Response, StreamingResponse
+from llama_index.response.streaming import (
+    AsyncTokenQueue,
+    StreamingMetrics,
+    TokenQueue,
+)
 from llama_index.schema import NodeWithScore
 from llama_index.tools import ToolOutput
 
@@ -49,21 +53,25 @@ class AgentChatResponse:
 
 @dataclass
 class StreamingAgentChatResponse:
-    """Streaming chat response to user and writing to chat history."""
+    """Streaming chat response to user and writing to chat history.
+
+    Deltas are passed from the writer to `response_gen` (or
+    `async_response_gen`) through a token queue that consumers block on, see
+    `metrics` for the first-token latency and tokens/sec of the stream.
+
+    """
 
     response: str = ""
     sources: List[ToolOutput] = field(default_factory=list)
     chat_stream: Optional[ChatResponseGen] = None
     achat_stream: Optional[ChatResponseAsyncGen] = None
     source_nodes: List[NodeWithScore] = field(default_factory=list)
-    _queue: queue.Queue = field(default_factory=queue.Queue)
-    _aqueue: asyncio.Queue = field(default_factory=asyncio.Queue)
+    _queue: TokenQueue = field(default_factory=TokenQueue)
+    _aqueue: AsyncTokenQueue = field(default_factory=AsyncTokenQueue)
     # flag when chat message is a function call
     _is_function: Optional[bool] = None
     # flag when processing done
     _is_done = False
-    # signal when a new item is added to the queue
-    _new_item_event: asyncio.Event = field(default_factory=asyncio.Event)
     # NOTE: async code uses two events rather than one since it yields
     # control when waiting for queue item
     # signal when the OpenAI functions stop executing
@@ -78,18 +86,31 @@ class StreamingAgentChatResponse:
                     self.source_nodes.extend(tool_output.raw_output.source_nodes)
 
     def __str__(self) -> str:
-        if self._is_done and not self._queue.empty() and not self._is_function:
-            for delta in self._queue.queue:
+        if self._is_done and not self._is_function:
+            # consume the deltas that were not streamed, from the queue of the
+            # stream that was written (without blocking on the other one)
+            token_queue: Union[TokenQueue, AsyncTokenQueue] = self._queue
+            if self.achat_stream is not None:
+                token_queue = self._aqueue
+            for delta in token_queue.drain():
                 self.response += delta
         return self.response
 
+    @property
+    def metrics(self) -> StreamingMetrics:
+        """First-token latency and tokens/sec of the response stream."""
+        if self.achat_stream is not None:
+            return self._aqueue.metrics
+        return self._queue.metrics
+
     def put_in_queue(self, delta: Optional[str]) -> None:
-        self._queue.put_nowait(delta)
+        if delta is not None:
+            self._queue.put(delta)
         self._is_function_not_none_thread_event.set()
 
     def aput_in_queue(self, delta: Optional[str]) -> None:
-        self._aqueue.put_nowait(delta)
-        self._new_item_event.set()
+        if delta is not None:
+            self._aqueue.put(delta)
 
     def write_response_to_history(self, memory: BaseMemory) -> None:
         if self.chat_stream is None:
@@ -113,6 +134,9 @@ class StreamingAgentChatResponse:
             logger.warning(f"Encountered exception writing response to history: {e}")
 
         self._is_done = True
+        # end of stream for any consumers waiting
+        self._queue.close()
+        self._is_function_not_none_thread_event.set()
 
     async def awrite_response_to_history(
         self,
@@ -144,28 +168,18 @@ class StreamingAgentChatResponse:
 
         # These act as is_done events for any consumers waiting
         self._is_function_false_event.set()
-        self._new_item_event.set()
+        self._aqueue.close()
 
     @property
     def response_gen(self) -> Generator[str, None, None]:
-        while not self._is_done or not self._queue.empty():
-            try:
-                delta = self._queue.get(block=False)
-                self.response += delta
-                yield delta
-            except queue.Empty:
-                # Queue is empty, but we're not done yet
-                continue
+        for delta in self._queue:
+            self.response += delta
+            yield delta
 
     async def async_response_gen(self) -> AsyncGenerator[str, None]:
-        while not self._is_done or not self._aqueue.empty():
-            if not self._aqueue.empty():
-                delta = self._aqueue.get_nowait()
-                self.response += delta
-                yield delta
-            else:
-                await self._new_item_event.wait()  # Wait until a new item is added
-                self._new_item_event.clear()  # Clear the event for the next wait
+        async for delta in self._aqueue:
+            self.response += delta
+            yield delta
 
     def print_response_stream(self) -> None:
         for token in self.response_gen:
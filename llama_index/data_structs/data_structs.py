@@ -7,8 +7,18 @@ Nodes are decoupled from the indices.
 import uuid
 from abc import abstractmethod
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Sequence, Set
-
+from typing import (
+    AbstractSet,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    cast,
+)
+
+import numpy as np
 from dataclasses_json import DataClassJsonMixin
 
 from llama_index.schema import BaseNode, TextNode
@@ -46,6 +56,8 @@ class IndexGraph(IndexStruct):
     all_nodes: Dict[int, str] = field(default_factory=dict)
     root_nodes: Dict[int, str] = field(default_factory=dict)
     node_id_to_children_ids: Dict[str, List[str]] = field(default_factory=dict)
+    # mapping from Node doc id to the embedding of its text.
+    node_id_to_embedding: Dict[str, List[float]] = field(default_factory=dict)
 
     @property
     def node_id_to_index(self) -> Dict[str, int]:
@@ -115,10 +127,43 @@ class IndexGraph(IndexStruct):
 
 @dataclass
 class KeywordTable(IndexStruct):
-    """A table of keywords mapping keywords to text chunks."""
+    """A table of keywords mapping keywords to text chunks.
+
+    Alongside the serialized ``table``, an in-memory postings view is kept:
+    every node id is assigned an integer id in insertion order and each
+    keyword maps to a sorted integer array of the nodes it appears in. The
+    view is built lazily on first lookup and kept up to date by
+    ``add_node`` / ``delete_node``, so the table should be mutated through
+    those methods.
+
+    """
 
     table: Dict[str, Set[str]] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        """Initialize in-memory (non-serialized) lookup structures."""
+        self._postings: Optional[Dict[str, np.ndarray]] = None
+        self._int_to_node_id: List[Optional[str]] = []
+        self._node_id_to_int: Dict[str, int] = {}
+
+    def _build_postings(self) -> Dict[str, np.ndarray]:
+        """Build postings from the keyword table."""
+        self._int_to_node_id = []
+        self._node_id_to_int = {}
+        postings = {}
+        for keyword, node_ids in self.table.items():
+            int_ids = [self._get_or_add_int_id(node_id) for node_id in sorted(node_ids)]
+            postings[keyword] = np.unique(np.array(int_ids, dtype=np.int64))
+        self._postings = postings
+        return postings
+
+    def _get_or_add_int_id(self, node_id: str) -> int:
+        """Get integer id of node, assigning a new one if needed."""
+        if node_id not in self._node_id_to_int:
+            self._node_id_to_int[node_id] = len(self._int_to_node_id)
+            self._int_to_node_id.append(node_id)
+        return self._node_id_to_int[node_id]
+
     def add_node(self, keywords: List[str], node: BaseNode) -> None:
         """Add text to table."""
         for keyword in keywords:
@@ -126,15 +171,109 @@ class KeywordTable(IndexStruct):
                 self.table[keyword] = set()
             self.table[keyword].add(node.node_id)
 
+        if self._postings is not None:
+            # new nodes get the largest integer id, so appending keeps
+            # postings sorted
+            int_id = self._get_or_add_int_id(node.node_id)
+            for keyword in keywords:
+                posting = self._postings.get(keyword)
+                if posting is None:
+                    self._postings[keyword] = np.array([int_id], dtype=np.int64)
+                    continue
+                pos = np.searchsorted(posting, int_id)
+                if pos == len(posting) or posting[pos] != int_id:
+                    self._postings[keyword] = np.insert(posting, pos, int_id)
+
+    def add_nodes(
+        self, keywords_list: Sequence[List[str]], nodes: Sequence[BaseNode]
+    ) -> None:
+        """Add a batch of nodes to the table.
+
+        Equivalent to calling ``add_node`` per node, but postings of each
+        keyword are extended once per batch.
+
+        """
+        if len(keywords_list) != len(nodes):
+            raise ValueError("Must provide one list of keywords per node.")
+
+        new_int_ids: Dict[str, List[int]] = {}
+        for keywords, node in zip(keywords_list, nodes):
+            for keyword in keywords:
+                if keyword not in self.table:
+                    self.table[keyword] = set()
+                self.table[keyword].add(node.node_id)
+
+            if self._postings is not None:
+                int_id = self._get_or_add_int_id(node.node_id)
+                for keyword in keywords:
+                    new_int_ids.setdefault(keyword, []).append(int_id)
+
+        if self._postings is None:
+            return
+        for keyword, int_ids in new_int_ids.items():
+            new_posting = np.array(int_ids, dtype=np.int64)
+            if keyword in self._postings:
+                new_posting = np.concatenate([self._postings[keyword], new_posting])
+            self._postings[keyword] = np.unique(new_posting)
+
+    def delete_node(self, node_id: str) -> None:
+        """Delete node from table, dropping keywords with no remaining nodes."""
+        keywords_to_delete = set()
+        for keyword, existing_node_ids in self.table.items():
+            if node_id in existing_node_ids:
+                existing_node_ids.remove(node_id)
+                if len(existing_node_ids) == 0:
+                    keywords_to_delete.add(keyword)
+
+        # delete keywords that have zero nodes
+        for keyword in keywords_to_delete:
+            del self.table[keyword]
+
+        if self._postings is not None:
+            int_id = self._node_id_to_int.pop(node_id, None)
+            if int_id is None:
+                return
+            # keep the integer id slot so existing ids stay valid
+            self._int_to_node_id[int_id] = None
+            for keyword in list(self._postings.keys()):
+                if keyword not in self.table:
+                    del self._postings[keyword]
+                    continue
+                posting = self._postings[keyword]
+                pos = np.searchsorted(posting, int_id)
+                if pos < len(posting) and posting[pos] == int_id:
+                    self._postings[keyword] = np.delete(posting, pos)
+
+    def get_node_scores(self, keywords: Sequence[str]) -> List[Tuple[str, int]]:
+        """Get nodes matching any of the keywords, with their match counts.
+
+        Nodes are sorted by number of matched keywords (descending), with ties
+        broken by integer id so the order is deterministic.
+
+        """
+        postings = self._postings
+        if postings is None:
+            postings = self._build_postings()
+
+        matched = [postings[k] for k in set(keywords) if k in postings]
+        if len(matched) == 0:
+            return []
+
+        int_ids, counts = np.unique(np.concatenate(matched), return_counts=True)
+        order = np.argsort(-counts, kind="stable")
+        return [
+            (cast(str, self._int_to_node_id[int_ids[i]]), int(counts[i])) for i in order
+        ]
+
     @property
     def node_ids(self) -> Set[str]:
         """Get all node ids."""
         return set.union(*self.table.values())
 
     @property
-    def keywords(self) -> Set[str]:
-        """Get all keywords in the table."""
-        return set(self.table.keys())
+    def keywords(self) -> AbstractSet[str]:
+        """Get all keywords in the table (a live view, not a copy)."""
+        return self.table.keys()
 
     @property
     def size(self) -> int:
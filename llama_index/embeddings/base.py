@@ -114,6 +114,67 @@ class BaseEmbedding(BaseComponent):
             )
         return query_embedding
 
+    def _get_query_embeddings(self, queries: List[str]) -> List[List[float]]:
+        """Get query embeddings.
+
+        By default, this is a wrapper around _get_query_embedding.
+        Meant to be overriden for batch queries.
+
+        """
+        return [self._get_query_embedding(query) for query in queries]
+
+    async def _aget_query_embeddings(self, queries: List[str]) -> List[List[float]]:
+        """Asynchronously get query embeddings.
+
+        By default, this is a wrapper around _aget_query_embedding.
+        Meant to be overriden for batch queries.
+
+        """
+        return await asyncio.gather(
+            *[self._aget_query_embedding(query) for query in queries]
+        )
+
+    def get_query_embeddings(self, queries: List[str]) -> List[List[float]]:
+        """Get query embeddings, in batches of `embed_batch_size` queries."""
+        query_embeddings: List[List[float]] = []
+        for start in range(0, len(queries), self.embed_batch_size):
+            cur_batch = queries[start : start + self.embed_batch_size]
+            with self.callback_manager.event(CBEventType.EMBEDDING) as event:
+                embeddings = self._get_query_embeddings(cur_batch)
+                query_embeddings.extend(embeddings)
+                event.on_end(
+                    payload={
+                        EventPayload.CHUNKS: cur_batch,
+                        EventPayload.EMBEDDINGS: embeddings,
+                    },
+                )
+        return query_embeddings
+
+    async def aget_query_embeddings(self, queries: List[str]) -> List[List[float]]:
+        """Asynchronously get query embeddings, batches are embedded in parallel."""
+        batches = [
+            queries[start : start + self.embed_batch_size]
+            for start in range(0, len(queries), self.embed_batch_size)
+        ]
+        event_ids = [
+            self.callback_manager.on_event_start(CBEventType.EMBEDDING) for _ in batches
+        ]
+        nested_embeddings = await asyncio.gather(
+            *[self._aget_query_embeddings(batch) for batch in batches]
+        )
+        for event_id, batch, embeddings in zip(event_ids, batches, nested_embeddings):
+            self.callback_manager.on_event_end(
+                CBEventType.EMBEDDING,
+                payload={
+                    EventPayload.CHUNKS: batch,
+                    EventPayload.EMBEDDINGS: embeddings,
+                },
+                event_id=event_id,
+            )
+        return [
+            embedding for embeddings in nested_embeddings for embedding in embeddings
+        ]
+
     def get_agg_embedding_from_queries(
         self,
         queries: List[str],
@@ -316,6 +316,24 @@ class OpenAIEmbedding(BaseEmbedding):
             **self.openai_kwargs,
         )
 
+    def _get_query_embeddings(self, queries: List[str]) -> List[List[float]]:
+        """Get query embeddings."""
+        return get_embeddings(
+            queries,
+            engine=self._query_engine,
+            deployment_id=self.deployment_name,
+            **self.openai_kwargs,
+        )
+
+    async def _aget_query_embeddings(self, queries: List[str]) -> List[List[float]]:
+        """Asynchronously get query embeddings."""
+        return await aget_embeddings(
+            queries,
+            engine=self._query_engine,
+            deployment_id=self.deployment_name,
+            **self.openai_kwargs,
+        )
+
     def _get_text_embedding(self, text: str) -> List[float]:
         """Get text embedding."""
         return get_embedding(
@@ -0,0 +1,113 @@
+"""Embedding model simulating the latency and rate limits of a remote provider."""
+import asyncio
+import time
+import zlib
+from typing import Any, List, Optional
+
+import numpy as np
+
+try:
+    from pydantic.v1 import Field
+except ImportError:
+    from pydantic import Field
+
+from llama_index.callbacks import CallbackManager
+from llama_index.embeddings.base import DEFAULT_EMBED_BATCH_SIZE, BaseEmbedding
+from llama_index.llms.simulated import LatencyProfile
+from llama_index.utils import globals_helper
+
+DEFAULT_EMBED_DIM = 64
+
+
+class SimulatedEmbedding(BaseEmbedding):
+    """Simulated embedding model.
+
+    Embeds without any model or network access, into random vectors that are
+    deterministic per text, but takes the time a remote provider would, as set
+    by its latency profile: a batch of texts is a single call, whose latency is
+    proportional to the number of its tokens, if configured. Calls can be rate
+    limited, with a `RateLimitError`.
+
+    Args:
+        embed_dim (int): Dimension of the embeddings.
+        profile (Optional[LatencyProfile]): Latency profile of the calls.
+    """
+
+    embed_dim: int = Field(
+        default=DEFAULT_EMBED_DIM, description="Dimension of the embeddings."
+    )
+    profile: LatencyProfile = Field(
+        default_factory=LatencyProfile, description="Latency profile of the calls."
+    )
+
+    def __init__(
+        self,
+        embed_dim: int = DEFAULT_EMBED_DIM,
+        profile: Optional[LatencyProfile] = None,
+        embed_batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
+        callback_manager: Optional[CallbackManager] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(
+            embed_dim=embed_dim,
+            profile=profile or LatencyProfile(per_output_token=0.0),
+            embed_batch_size=embed_batch_size,
+            callback_manager=callback_manager,
+            model_name="simulated",
+            **kwargs,
+        )
+
+    @classmethod
+    def class_name(cls) -> str:
+        """Get class name."""
+        return "SimulatedEmbedding"
+
+    def _get_embedding(self, text: str) -> List[float]:
+        rng = np.random.default_rng(zlib.crc32(text.encode("utf-8")))
+        return rng.standard_normal(self.embed_dim).tolist()
+
+    def _start_call(self, texts: List[str]) -> float:
+        """Start a call, returning its latency."""
+        self.profile.check_rate_limit()
+        num_tokens = sum(len(globals_helper.tokenizer(text)) for text in texts)
+        return self.profile.get_latency(num_tokens)
+
+    def _get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        time.sleep(self._start_call(texts))
+        return [self._get_embedding(text) for text in texts]
+
+    async def _aget_embeddings(self, texts: List[str]) -> List[List[float]]:
+        await asyncio.sleep(self._start_call(texts))
+        return [self._get_embedding(text) for text in texts]
+
+    def _get_query_embedding(self, query: str) -> List[float]:
+        """Get query embedding."""
+        return self._get_embeddings([query])[0]
+
+    async def _aget_query_embedding(self, query: str) -> List[float]:
+        """Asynchronously get query embedding."""
+        return (await self._aget_embeddings([query]))[0]
+
+    def _get_query_embeddings(self, queries: List[str]) -> List[List[float]]:
+        """Get query embeddings, in a single call."""
+        return self._get_embeddings(queries)
+
+    async def _aget_query_embeddings(self, queries: List[str]) -> List[List[float]]:
+        """Asynchronously get query embeddings, in a single call."""
+        return await self._aget_embeddings(queries)
+
+    def _get_text_embedding(self, text: str) -> List[float]:
+        """Get text embedding."""
+        return self._get_embeddings([text])[0]
+
+    async def _aget_text_embedding(self, text: str) -> List[float]:
+        """Asynchronously get text embedding."""
+        return (await self._aget_embeddings([text]))[0]
+
+    def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Get text embeddings, in a single call."""
+        return self._get_embeddings(texts)
+
+    async def _aget_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Asynchronously get text embeddings, in a single call."""
+        return await self._aget_embeddings(texts)
@@ -1,6 +1,7 @@
 """Evaluation modules."""
 
 from llama_index.evaluation.base import ResponseEvaluator, QueryResponseEvaluator
+from llama_index.evaluation.batch_runner import BatchEvalRunner, BatchEvalStats
 from llama_index.evaluation.dataset_generation import DatasetGenerator
 from llama_index.evaluation.guideline_eval import GuidelineEvaluator
 
@@ -9,4 +10,6 @@ __all__ = [
     "QueryResponseEvaluator",
     "DatasetGenerator",
     "GuidelineEvaluator",
+    "BatchEvalRunner",
+    "BatchEvalStats",
 ]
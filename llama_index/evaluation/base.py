@@ -5,9 +5,10 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import List, Optional
 
+from llama_index.async_utils import DEFAULT_NUM_WORKERS, asyncio_run, run_jobs
 from llama_index.indices.base import ServiceContext
-from llama_index.indices.list.base import ListIndex
 from llama_index.prompts import PromptTemplate
+from llama_index.response_synthesizers import BaseSynthesizer, get_response_synthesizer
 from llama_index.schema import Document
 from llama_index.response.schema import Response
 
@@ -30,6 +31,15 @@ class BaseEvaluator(ABC):
         """Evaluate the response for a query and return an Evaluation."""
         raise NotImplementedError
 
+    async def aevaluate_response(self, query: str, response: Response) -> Evaluation:
+        """Asynchronously evaluate the response for a query.
+
+        Defaults to `evaluate_response`, evaluators override it to evaluate
+        concurrently.
+
+        """
+        return self.evaluate_response(query, response)
+
 
 DEFAULT_EVAL_PROMPT = (
     "Пожалуйста, сообщите, соответствует ли данная информация "
@@ -108,6 +118,8 @@ class ResponseEvaluator:
 
     Args:
         service_context (Optional[ServiceContext]): ServiceContext object
+        raise_error (bool): Whether to raise an error if the response is invalid.
+        num_workers (int): Maximum number of source nodes to evaluate at once.
 
     """
 
@@ -115,10 +127,12 @@ class ResponseEvaluator:
         self,
         service_context: Optional[ServiceContext] = None,
         raise_error: bool = False,
+        num_workers: int = DEFAULT_NUM_WORKERS,
     ) -> None:
         """Init params."""
         self.service_context = service_context or ServiceContext.from_defaults()
         self.raise_error = raise_error
+        self.num_workers = num_workers
 
     def get_context(self, response: Response) -> List[Document]:
         """Get context information from given Response object using source nodes.
@@ -137,6 +151,20 @@ class ResponseEvaluator:
 
         return context
 
+    def _get_synthesizer(self) -> BaseSynthesizer:
+        return get_response_synthesizer(
+            service_context=self.service_context,
+            text_qa_template=PromptTemplate(DEFAULT_EVAL_PROMPT),
+            refine_template=PromptTemplate(DEFAULT_REFINE_PROMPT),
+        )
+
+    def _get_response_txt(self, raw_response_txt: str) -> str:
+        if "yes" in raw_response_txt.lower():
+            return "YES"
+        if self.raise_error:
+            raise ValueError("The response is invalid")
+        return "NO"
+
     def evaluate(self, response: Response) -> str:
         """Evaluate the response from an index.
 
@@ -150,30 +178,27 @@ class ResponseEvaluator:
                     or If Query, answer and context information are not matching.
         """
         answer = str(response)
+        text_chunks = [context.get_content() for context in self.get_context(response)]
+        raw_response_txt = self._get_synthesizer().get_response(answer, text_chunks)
+        return self._get_response_txt(str(raw_response_txt))
 
-        context = self.get_context(response)
-        index = ListIndex.from_documents(context, service_context=self.service_context)
-        response_txt = ""
-
-        EVAL_PROMPT_TMPL = PromptTemplate(DEFAULT_EVAL_PROMPT)
-        REFINE_PROMPT_TMPL = PromptTemplate(DEFAULT_REFINE_PROMPT)
-
-        query_engine = index.as_query_engine(
-            text_qa_template=EVAL_PROMPT_TMPL,
-            refine_template=REFINE_PROMPT_TMPL,
-        )
-        response_obj = query_engine.query(answer)
-
-        raw_response_txt = str(response_obj)
+    async def aevaluate_source_nodes(self, response: Response) -> List[str]:
+        """Asynchronously evaluate if each source node contains the answer.
 
-        if "yes" in raw_response_txt.lower():
-            response_txt = "YES"
-        else:
-            response_txt = "NO"
-            if self.raise_error:
-                raise ValueError("The response is invalid")
+        At most `num_workers` source nodes are evaluated at once.
 
-        return response_txt
+        """
+        answer = str(response)
+        synthesizer = self._get_synthesizer()
+        jobs = [
+            synthesizer.aget_response(answer, [context.get_content()])
+            for context in self.get_context(response)
+        ]
+        raw_response_txts = await run_jobs(jobs, workers=self.num_workers)
+        return [
+            self._get_response_txt(str(raw_response_txt))
+            for raw_response_txt in raw_response_txts
+        ]
 
     def evaluate_source_nodes(self, response: Response) -> List[str]:
         """Function to evaluate if each source node contains the answer \
@@ -187,38 +212,7 @@ class ResponseEvaluator:
             Yes -> If response and context information are matching.
             No -> If response and context information are not matching.
         """
-        answer = str(response)
-
-        context_list = self.get_context(response)
-
-        response_texts = []
-
-        for context in context_list:
-            index = ListIndex.from_documents(
-                [context], service_context=self.service_context
-            )
-            response_txt = ""
-
-            EVAL_PROMPT_TMPL = PromptTemplate(DEFAULT_EVAL_PROMPT)
-            REFINE_PROMPT_TMPL = PromptTemplate(DEFAULT_REFINE_PROMPT)
-
-            query_engine = index.as_query_engine(
-                text_qa_template=EVAL_PROMPT_TMPL,
-                refine_template=REFINE_PROMPT_TMPL,
-            )
-            response_obj = query_engine.query(answer)
-            raw_response_txt = str(response_obj)
-
-            if "yes" in raw_response_txt.lower():
-                response_txt = "YES"
-            else:
-                response_txt = "NO"
-                if self.raise_error:
-                    raise ValueError("The response is invalid")
-
-            response_texts.append(response_txt)
-
-        return response_texts
+        return asyncio_run(self.aevaluate_source_nodes(response))
 
 
 class QueryResponseEvaluator(BaseEvaluator):
@@ -228,6 +222,8 @@ class QueryResponseEvaluator(BaseEvaluator):
 
     Args:
         service_context (Optional[ServiceContext]): ServiceContext object
+        raise_error (bool): Whether to raise an error if the response is invalid.
+        num_workers (int): Maximum number of source nodes to evaluate at once.
 
     """
 
@@ -235,10 +231,12 @@ class QueryResponseEvaluator(BaseEvaluator):
         self,
         service_context: Optional[ServiceContext] = None,
         raise_error: bool = False,
+        num_workers: int = DEFAULT_NUM_WORKERS,
     ) -> None:
         """Init params."""
         super().__init__(service_context)
         self.raise_error = raise_error
+        self.num_workers = num_workers
 
     def get_context(self, response: Response) -> List[Document]:
         """Get context information from given Response object using source nodes.
@@ -257,6 +255,20 @@ class QueryResponseEvaluator(BaseEvaluator):
 
         return context
 
+    def _get_synthesizer(self) -> BaseSynthesizer:
+        return get_response_synthesizer(
+            service_context=self.service_context,
+            text_qa_template=PromptTemplate(QUERY_RESPONSE_EVAL_PROMPT),
+            refine_template=PromptTemplate(QUERY_RESPONSE_REFINE_PROMPT),
+        )
+
+    def _get_response_txt(self, raw_response_txt: str) -> str:
+        if "yes" in raw_response_txt.lower():
+            return "YES"
+        if self.raise_error:
+            raise ValueError("The response is invalid")
+        return "NO"
+
     def evaluate(self, query: str, response: Response) -> str:
         """Evaluate the response from an index.
 
@@ -280,30 +292,41 @@ class QueryResponseEvaluator(BaseEvaluator):
         Returns:
             Evaluation object with passing boolean and feedback "YES" or "NO".
         """
-        answer = str(response)
-
-        context = self.get_context(response)
-        index = ListIndex.from_documents(context, service_context=self.service_context)
-
-        QUERY_RESPONSE_EVAL_PROMPT_TMPL = PromptTemplate(QUERY_RESPONSE_EVAL_PROMPT)
-        QUERY_RESPONSE_REFINE_PROMPT_TMPL = PromptTemplate(QUERY_RESPONSE_REFINE_PROMPT)
-
-        query_response = f"Question: {query}\nResponse: {answer}"
-
-        query_engine = index.as_query_engine(
-            text_qa_template=QUERY_RESPONSE_EVAL_PROMPT_TMPL,
-            refine_template=QUERY_RESPONSE_REFINE_PROMPT_TMPL,
+        query_response = f"Question: {query}\nResponse: {response}"
+        text_chunks = [context.get_content() for context in self.get_context(response)]
+        raw_response_txt = self._get_synthesizer().get_response(
+            query_response, text_chunks
         )
-        response_obj = query_engine.query(query_response)
+        response_txt = self._get_response_txt(str(raw_response_txt))
+        return Evaluation(query, response, response_txt == "YES", response_txt)
+
+    async def aevaluate_response(self, query: str, response: Response) -> Evaluation:
+        """Asynchronously evaluate the response from an index."""
+        query_response = f"Question: {query}\nResponse: {response}"
+        text_chunks = [context.get_content() for context in self.get_context(response)]
+        raw_response_txt = await self._get_synthesizer().aget_response(
+            query_response, text_chunks
+        )
+        response_txt = self._get_response_txt(str(raw_response_txt))
+        return Evaluation(query, response, response_txt == "YES", response_txt)
 
-        raw_response_txt = str(response_obj)
+    async def aevaluate_source_nodes(self, query: str, response: Response) -> List[str]:
+        """Asynchronously evaluate if each source node contains the answer.
 
-        if "yes" in raw_response_txt.lower():
-            return Evaluation(query, response, True, "YES")
-        else:
-            if self.raise_error:
-                raise ValueError("The response is invalid")
-            return Evaluation(query, response, False, "NO")
+        At most `num_workers` source nodes are evaluated at once.
+
+        """
+        query_response = f"Question: {query}\nResponse: {response}"
+        synthesizer = self._get_synthesizer()
+        jobs = [
+            synthesizer.aget_response(query_response, [context.get_content()])
+            for context in self.get_context(response)
+        ]
+        raw_response_txts = await run_jobs(jobs, workers=self.num_workers)
+        return [
+            self._get_response_txt(str(raw_response_txt))
+            for raw_response_txt in raw_response_txts
+        ]
 
     def evaluate_source_nodes(self, query: str, response: Response) -> List[str]:
         """Function to evaluate if each source node contains the answer \
@@ -323,39 +346,4 @@ class QueryResponseEvaluator(BaseEvaluator):
                     or If Query, answer and context information are not matching \
                         for a source node.
         """
-        answer = str(response)
-
-        context_list = self.get_context(response)
-
-        response_texts = []
-
-        for context in context_list:
-            index = ListIndex.from_documents(
-                [context], service_context=self.service_context
-            )
-            response_txt = ""
-
-            QUERY_RESPONSE_EVAL_PROMPT_TMPL = PromptTemplate(QUERY_RESPONSE_EVAL_PROMPT)
-            QUERY_RESPONSE_REFINE_PROMPT_TMPL = PromptTemplate(
-                QUERY_RESPONSE_REFINE_PROMPT
-            )
-
-            query_response = f"Question: {query}\nResponse: {answer}"
-
-            query_engine = index.as_query_engine(
-                text_qa_template=QUERY_RESPONSE_EVAL_PROMPT_TMPL,
-                refine_template=QUERY_RESPONSE_REFINE_PROMPT_TMPL,
-            )
-            response_obj = query_engine.query(query_response)
-            raw_response_txt = str(response_obj)
-
-            if "yes" in raw_response_txt.lower():
-                response_txt = "YES"
-            else:
-                response_txt = "NO"
-                if self.raise_error:
-                    raise ValueError("The response is invalid")
-
-            response_texts.append(response_txt)
-
-        return response_texts
+        return asyncio_run(self.aevaluate_source_nodes(query, response))
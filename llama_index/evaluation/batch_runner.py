@@ -0,0 +1,363 @@
+"""Batch evaluation runner."""
+import asyncio
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from llama_index.async_utils import DEFAULT_NUM_WORKERS, asyncio_run, run_jobs
+from llama_index.evaluation.base import BaseEvaluator, Evaluation
+from llama_index.indices.query.base import BaseQueryEngine
+from llama_index.response.schema import Response
+from llama_index.schema import NodeWithScore
+from llama_index.storage.docstore.utils import doc_to_json, json_to_doc
+from llama_index.storage.kvstore.simple_kvstore import SimpleKVStore
+from llama_index.storage.kvstore.types import BaseKVStore
+
+DEFAULT_NAMESPACE = "batch_eval"
+# number of completed queries between two checkpoints
+DEFAULT_CHECKPOINT_INTERVAL = 10
+DEFAULT_PERCENTILES = (50, 90, 99)
+
+
+def _hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _response_to_json(response: Response) -> dict:
+    return {
+        "response": response.response,
+        "source_nodes": [
+            {"node": doc_to_json(source_node.node), "score": source_node.score}
+            for source_node in response.source_nodes
+        ],
+        "metadata": response.metadata,
+    }
+
+
+def _json_to_response(response_dict: dict) -> Response:
+    return Response(
+        response=response_dict["response"],
+        source_nodes=[
+            NodeWithScore(
+                node=json_to_doc(source_node["node"]), score=source_node["score"]
+            )
+            for source_node in response_dict["source_nodes"]
+        ],
+        metadata=response_dict["metadata"],
+    )
+
+
+def _get_evaluator_config(evaluator: BaseEvaluator) -> Dict[str, Any]:
+    """Get the config of an evaluator its verdicts depend on, for cache keys."""
+    config: Dict[str, Any] = {"class_name": type(evaluator).__name__}
+    service_context = getattr(evaluator, "service_context", None)
+    if service_context is not None:
+        config["model_name"] = service_context.llm_predictor.metadata.model_name
+    for name in ("guidelines", "eval_template"):
+        if hasattr(evaluator, name):
+            config[name] = getattr(evaluator, name)
+    return config
+
+
+class _RateLimiter:
+    """Spaces out the calls it is acquired for, to a rate per minute."""
+
+    def __init__(self, requests_per_minute: float) -> None:
+        self._interval = 60.0 / requests_per_minute
+        self._next_time = 0.0
+
+    async def acquire(self) -> None:
+        now = time.monotonic()
+        start_time = max(now, self._next_time)
+        self._next_time = start_time + self._interval
+        if start_time > now:
+            await asyncio.sleep(start_time - now)
+
+
+@dataclass
+class BatchEvalStats:
+    """Stats of a batch evaluation run.
+
+    Latencies (in seconds) are only recorded for the calls actually made, not for
+    the responses resumed from a checkpoint or the cached evaluations.
+
+    """
+
+    num_queries: int = 0
+    num_resumed: int = 0  # responses resumed from the checkpoint
+    num_cached: int = 0  # evaluations served from the cache
+    elapsed: float = 0.0
+    query_latencies: List[float] = field(default_factory=list)
+    eval_latencies: List[float] = field(default_factory=list)
+
+    @property
+    def throughput(self) -> float:
+        """Queries evaluated per second."""
+        return self.num_queries / self.elapsed if self.elapsed > 0 else 0.0
+
+    @staticmethod
+    def get_percentiles(
+        latencies: List[float], percentiles: Sequence[int] = DEFAULT_PERCENTILES
+    ) -> Dict[str, float]:
+        """Get percentiles of latencies, e.g. {"p50": ..., "p90": ...}."""
+        if len(latencies) == 0:
+            return {}
+        values = np.percentile(latencies, percentiles)
+        return {
+            f"p{percentile}": float(value)
+            for percentile, value in zip(percentiles, values)
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "num_queries": self.num_queries,
+            "num_resumed": self.num_resumed,
+            "num_cached": self.num_cached,
+            "elapsed": self.elapsed,
+            "throughput": self.throughput,
+            "query_latency": self.get_percentiles(self.query_latencies),
+            "eval_latency": self.get_percentiles(self.eval_latencies),
+        }
+
+    def __str__(self) -> str:
+        def format_percentiles(latencies: List[float]) -> str:
+            percentiles = self.get_percentiles(latencies)
+            if len(percentiles) == 0:
+                return "-"
+            return ", ".join(
+                f"{name}={value:.3f}s" for name, value in percentiles.items()
+            )
+
+        return (
+            f"{self.num_queries} queries in {self.elapsed:.2f}s "
+            f"({self.throughput:.2f} queries/s), "
+            f"{self.num_resumed} resumed, {self.num_cached} cached evaluations\n"
+            f"query latency: {format_percentiles(self.query_latencies)}\n"
+            f"eval latency: {format_percentiles(self.eval_latencies)}"
+        )
+
+
+class BatchEvalRunner:
+    """Batch evaluation runner.
+
+    Runs queries through a query engine and evaluates the responses, with at most
+    `workers` queries in flight at once, and optionally at most
+    `requests_per_minute` query and evaluator calls started per minute.
+
+    Evaluations are cached by evaluator (its class, LLM, and guidelines and
+    template if any), query, response and source nodes content, so that
+    unchanged responses aren't evaluated again.
+
+    With a `checkpoint_path`, the responses of the queries (and, unless another
+    cache is given, the evaluations) are checkpointed to that file every
+    `checkpoint_interval` completed queries and at the end of a run, including a
+    failed one. A run over the same queries resumes from the checkpoint, without
+    querying again.
+
+    After a run, `stats` has its throughput and latency percentiles.
+
+    Args:
+        evaluator (BaseEvaluator): Evaluator of the responses.
+        query_engine (Optional[BaseQueryEngine]): Query engine to run the queries
+            with, for `evaluate_queries`.
+        workers (int): Maximum number of queries to run and evaluate at once.
+        requests_per_minute (Optional[float]): Maximum number of query and
+            evaluator calls to start per minute.
+        cache (Optional[BaseKVStore]): Key-value store to cache the evaluations
+            in. Defaults to the checkpoint, if any.
+        checkpoint_path (Optional[str]): File to checkpoint the run to, and
+            resume it from.
+        checkpoint_interval (int): Number of completed queries between two
+            checkpoints.
+        namespace (str): Namespace of the cache and the checkpoint in their
+            key-value stores.
+        show_progress (bool): Whether to show a progress bar.
+    """
+
+    def __init__(
+        self,
+        evaluator: BaseEvaluator,
+        query_engine: Optional[BaseQueryEngine] = None,
+        workers: int = DEFAULT_NUM_WORKERS,
+        requests_per_minute: Optional[float] = None,
+        cache: Optional[BaseKVStore] = None,
+        checkpoint_path: Optional[str] = None,
+        checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+        namespace: str = DEFAULT_NAMESPACE,
+        show_progress: bool = False,
+    ) -> None:
+        self._evaluator = evaluator
+        self._query_engine = query_engine
+        self._workers = workers
+        self._requests_per_minute = requests_per_minute
+        self._checkpoint_path = checkpoint_path
+        self._checkpoint_interval = checkpoint_interval
+        self._show_progress = show_progress
+
+        self._checkpoint: Optional[SimpleKVStore] = None
+        if checkpoint_path is not None:
+            if os.path.exists(checkpoint_path):
+                self._checkpoint = SimpleKVStore.from_persist_path(checkpoint_path)
+            else:
+                self._checkpoint = SimpleKVStore()
+        self._cache = cache or self._checkpoint
+        self._response_collection = f"{namespace}/responses"
+        self._cache_collection = f"{namespace}/data"
+
+        self._evaluator_config = json.dumps(_get_evaluator_config(evaluator))
+        self._stats = BatchEvalStats()
+        self._num_uncheckpointed = 0
+
+    @property
+    def stats(self) -> BatchEvalStats:
+        """Stats of the last run."""
+        return self._stats
+
+    def _get_cache_key(self, query: str, response: Response) -> str:
+        contexts = [
+            source_node.node.get_content() for source_node in response.source_nodes
+        ]
+        return _hash(
+            json.dumps(
+                [
+                    self._evaluator_config,
+                    query,
+                    _hash(str(response)),
+                    _hash(json.dumps(contexts)),
+                ]
+            )
+        )
+
+    async def _aquery(
+        self, query: str, rate_limiter: Optional[_RateLimiter]
+    ) -> Response:
+        """Run a query, resuming its response from the checkpoint if any."""
+        assert self._query_engine is not None
+        key = _hash(query)
+        if self._checkpoint is not None:
+            response_dict = self._checkpoint.get(
+                key, collection=self._response_collection
+            )
+            if response_dict is not None:
+                self._stats.num_resumed += 1
+                return _json_to_response(response_dict)
+
+        if rate_limiter is not None:
+            await rate_limiter.acquire()
+        start_time = time.perf_counter()
+        response = await self._query_engine.aquery(query)
+        self._stats.query_latencies.append(time.perf_counter() - start_time)
+        if not isinstance(response, Response):
+            raise ValueError("Only (non-streaming) Response objects can be evaluated.")
+
+        if self._checkpoint is not None:
+            self._checkpoint.put(
+                key, _response_to_json(response), collection=self._response_collection
+            )
+        return response
+
+    async def _aevaluate(
+        self, query: str, response: Response, rate_limiter: Optional[_RateLimiter]
+    ) -> Evaluation:
+        """Evaluate a response, through the cache if any."""
+        key = None
+        if self._cache is not None:
+            key = self._get_cache_key(query, response)
+            cached = self._cache.get(key, collection=self._cache_collection)
+            if cached is not None:
+                self._stats.num_cached += 1
+                return Evaluation(
+                    query, response, cached["passing"], cached["feedback"]
+                )
+
+        if rate_limiter is not None:
+            await rate_limiter.acquire()
+        start_time = time.perf_counter()
+        evaluation = await self._evaluator.aevaluate_response(query, response)
+        self._stats.eval_latencies.append(time.perf_counter() - start_time)
+
+        if self._cache is not None and key is not None:
+            self._cache.put(
+                key,
+                {"passing": evaluation.passing, "feedback": evaluation.feedback},
+                collection=self._cache_collection,
+            )
+        return evaluation
+
+    async def _arun(
+        self,
+        query: str,
+        response: Optional[Response],
+        rate_limiter: Optional[_RateLimiter],
+    ) -> Evaluation:
+        if response is None:
+            response = await self._aquery(query, rate_limiter)
+        evaluation = await self._aevaluate(query, response, rate_limiter)
+
+        self._num_uncheckpointed += 1
+        if self._num_uncheckpointed >= self._checkpoint_interval:
+            self.persist_checkpoint()
+        return evaluation
+
+    async def _arun_all(
+        self, queries: Sequence[str], responses: Sequence[Optional[Response]]
+    ) -> List[Evaluation]:
+        self._stats = BatchEvalStats(num_queries=len(queries))
+        rate_limiter = None
+        if self._requests_per_minute is not None:
+            rate_limiter = _RateLimiter(self._requests_per_minute)
+
+        jobs = [
+            self._arun(query, response, rate_limiter)
+            for query, response in zip(queries, responses)
+        ]
+        start_time = time.perf_counter()
+        try:
+            return await run_jobs(
+                jobs,
+                show_progress=self._show_progress,
+                workers=self._workers,
+                progress_bar_desc="Evaluating",
+            )
+        finally:
+            self._stats.elapsed = time.perf_counter() - start_time
+            self.persist_checkpoint()
+
+    def persist_checkpoint(self) -> None:
+        """Write the checkpoint to its file, if checkpointing."""
+        self._num_uncheckpointed = 0
+        if self._checkpoint is None or self._checkpoint_path is None:
+            return
+        # write a complete file before replacing the previous checkpoint
+        tmp_path = f"{self._checkpoint_path}.tmp"
+        self._checkpoint.persist(tmp_path)
+        os.replace(tmp_path, self._checkpoint_path)
+
+    async def aevaluate_queries(self, queries: Sequence[str]) -> List[Evaluation]:
+        """Asynchronously run queries and evaluate their responses."""
+        if self._query_engine is None:
+            raise ValueError("A query engine is required to evaluate queries.")
+        return await self._arun_all(queries, [None] * len(queries))
+
+    def evaluate_queries(self, queries: Sequence[str]) -> List[Evaluation]:
+        """Run queries and evaluate their responses, in the order of the queries."""
+        return asyncio_run(self.aevaluate_queries(queries))
+
+    async def aevaluate_responses(
+        self, queries: Sequence[str], responses: Sequence[Response]
+    ) -> List[Evaluation]:
+        """Asynchronously evaluate the responses to queries."""
+        if len(queries) != len(responses):
+            raise ValueError("There must be as many responses as queries.")
+        return await self._arun_all(queries, responses)
+
+    def evaluate_responses(
+        self, queries: Sequence[str], responses: Sequence[Response]
+    ) -> List[Evaluation]:
+        """Evaluate the responses to queries, in the order of the queries."""
+        return asyncio_run(self.aevaluate_responses(queries, responses))
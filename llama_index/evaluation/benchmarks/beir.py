@@ -1,9 +1,9 @@
 from typing import Callable, List, Dict
+from llama_index.async_utils import DEFAULT_NUM_WORKERS, asyncio_run, run_jobs
 from llama_index.utils import get_cache_dir
 from llama_index.schema import Document
 from llama_index.indices.base_retriever import BaseRetriever
 import os
-import tqdm
 from shutil import rmtree
 
 
@@ -50,7 +50,13 @@ class BeirEvaluator:
         create_retriever: Callable[[List[Document]], BaseRetriever],
         datasets: List[str] = ["nfcorpus"],
         metrics_k_values: List[int] = [3, 10],
+        workers: int = DEFAULT_NUM_WORKERS,
     ) -> None:
+        """Evaluate retrievers on BEIR datasets.
+
+        Queries are retrieved for concurrently, at most `workers` at once.
+
+        """
         from beir.datasets.data_loader import GenericDataLoader
         from beir.retrieval.evaluation import EvaluateRetrieval
 
@@ -77,13 +83,17 @@ class BeirEvaluator:
 
             print("Evaluating retriever on questions against qrels")
 
-            results = {}
-            for key, query in tqdm.tqdm(queries.items()):
-                nodes_with_score = retriever.retrieve(query)
-                results[key] = {
+            jobs = [retriever.aretrieve(query) for query in queries.values()]
+            nodes_with_score_list = asyncio_run(
+                run_jobs(jobs, show_progress=True, workers=workers)
+            )
+            results = {
+                key: {
                     node.node.metadata["doc_id"]: node.score
                     for node in nodes_with_score
                 }
+                for key, nodes_with_score in zip(queries, nodes_with_score_list)
+            }
 
             ndcg, map_, recall, precision = EvaluateRetrieval.evaluate(
                 qrels, results, metrics_k_values
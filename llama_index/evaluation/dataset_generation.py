@@ -1,19 +1,22 @@
 """Dataset generation from documents"""
 from __future__ import annotations
 
+import hashlib
+import json
 import re
-from typing import List, Optional
+from typing import Generator, List, Optional
 
 
 from llama_index import (
     Document,
-    ListIndex,
     ServiceContext,
 )
+from llama_index.async_utils import DEFAULT_NUM_WORKERS, asyncio_run, run_jobs
 from llama_index.llms.openai import OpenAI
 from llama_index.prompts.base import BasePromptTemplate, PromptTemplate
 from llama_index.schema import BaseNode, NodeWithScore, MetadataMode
 from llama_index.indices.postprocessor.node import KeywordNodePostprocessor
+from llama_index.storage.kvstore.types import BaseKVStore
 
 
 DEFAULT_QUESTION_GENERATION_PROMPT = """Контекстная информация приведена ниже.\n"
@@ -24,6 +27,18 @@ DEFAULT_QUESTION_GENERATION_PROMPT = """Контекстная информац
 """
 
 
+DEFAULT_CACHE_COLLECTION = "dataset_generator_cache/data"
+
+
+def _parse_questions(text: str) -> List[str]:
+    """Parse the questions of an LLM output, one per line, without numbering."""
+    questions = [
+        re.sub(r"^\d+[\).\s]", "", question).strip()
+        for question in text.strip().split("\n")
+    ]
+    return [question for question in questions if question != ""]
+
+
 def _get_default_service_context() -> ServiceContext:
     """Get default service context."""
     llm = OpenAI(temperature=0, model="gpt-3.5-turbo")
@@ -43,6 +58,13 @@ class DatasetGenerator:
         num_questions_per_chunk: number of question to be \
         generated per chunk. Each document is chunked of size 512 words.
         text_question_template: Question generation template.
+        num_workers (int): Maximum number of LLM calls to make at once.
+        batch_nodes (bool): Whether to pack consecutive nodes into the same \
+        prompt, as many as the context window fits, for fewer LLM calls. \
+        `num_questions_per_chunk` questions are then generated per prompt.
+        cache (Optional[BaseKVStore]): Key-value store to cache the generated \
+        questions in, by prompt (i.e. by node content), so that questions are \
+        not generated again for unchanged nodes.
     """
 
     def __init__(
@@ -54,6 +76,9 @@ class DatasetGenerator:
         question_gen_query: Optional[str] = None,
         required_keywords: Optional[List[str]] = None,
         exclude_keywords: Optional[List[str]] = None,
+        num_workers: int = DEFAULT_NUM_WORKERS,
+        batch_nodes: bool = False,
+        cache: Optional[BaseKVStore] = None,
     ) -> None:
         """Init params."""
         if service_context is None:
@@ -71,6 +96,9 @@ class DatasetGenerator:
 предоставлена контекстная информация."
         )
         self.nodes = nodes
+        self.num_workers = num_workers
+        self.batch_nodes = batch_nodes
+        self.cache = cache
 
     @classmethod
     def from_documents(
@@ -82,6 +110,9 @@ class DatasetGenerator:
         question_gen_query: Optional[str] = None,
         required_keywords: Optional[List[str]] = None,
         exclude_keywords: Optional[List[str]] = None,
+        num_workers: int = DEFAULT_NUM_WORKERS,
+        batch_nodes: bool = False,
+        cache: Optional[BaseKVStore] = None,
     ) -> "DatasetGenerator":
         """Generate dataset from documents."""
         if service_context is None:
@@ -106,47 +137,109 @@ class DatasetGenerator:
             num_questions_per_chunk=num_questions_per_chunk,
             text_question_template=text_question_template,
             question_gen_query=question_gen_query,
+            num_workers=num_workers,
+            batch_nodes=batch_nodes,
+            cache=cache,
         )
 
-    def _node_question_generator(
-        self, nodes: List[BaseNode], num: Optional[int] = None
-    ) -> List[str]:
-        """Node question generator."""
-        questions: List[str] = []
-
-        for node in nodes:
-            if num is not None and len(questions) >= num:
-                break
-            index = ListIndex.from_documents(
-                [
-                    Document(
-                        text=node.get_content(metadata_mode=MetadataMode.NONE),
-                        metadata=node.metadata,
-                    )
-                ]
-            )
+    def _get_question_prompt(self) -> BasePromptTemplate:
+        return self.text_question_template.partial_format(
+            query_str=self.question_gen_query
+        )
 
-            query_engine = index.as_query_engine(
-                service_context=self.service_context,
-                text_qa_template=self.text_question_template,
-                use_async=True,
-            )
-            response = query_engine.query(
-                self.question_gen_query,
+    def _get_text_chunks(self, nodes: List[BaseNode]) -> List[str]:
+        """Get the contexts to generate questions from, fit to the prompt."""
+        prompt_helper = self.service_context.prompt_helper
+        prompt = self._get_question_prompt()
+        texts = [node.get_content(metadata_mode=MetadataMode.LLM) for node in nodes]
+        if self.batch_nodes:
+            return prompt_helper.repack(prompt, texts)
+
+        return [
+            text_chunk
+            for text in texts
+            for text_chunk in prompt_helper.repack(prompt, [text])
+        ]
+
+    async def _agenerate_questions(self, text_chunk: str) -> List[str]:
+        """Generate the questions of a context, through the cache if any."""
+        prompt = self._get_question_prompt()
+        key = None
+        if self.cache is not None:
+            key = hashlib.sha256(
+                json.dumps(
+                    [
+                        self.service_context.llm_predictor.metadata.model_name,
+                        prompt.format(context_str=""),
+                        text_chunk,
+                    ]
+                ).encode("utf-8")
+            ).hexdigest()
+            cached = self.cache.get(key, collection=DEFAULT_CACHE_COLLECTION)
+            if cached is not None:
+                return cached["questions"]
+
+        response = await self.service_context.llm_predictor.apredict(
+            prompt, context_str=text_chunk
+        )
+        questions = _parse_questions(response)
+        if self.cache is not None and key is not None:
+            self.cache.put(
+                key, {"questions": questions}, collection=DEFAULT_CACHE_COLLECTION
             )
+        return questions
 
-            result = str(response).strip().split("\n")
-            cleaned_questions = [
-                re.sub(r"^\d+[\).\s]", "", question).strip() for question in result
+    def iter_questions_from_nodes(
+        self, num: Optional[int] = None
+    ) -> Generator[str, None, None]:
+        """Generate questions for each node, yielding them as they are generated.
+
+        Questions are generated for `num_workers` contexts at a time, so that they
+        can be used (e.g. evaluated) before all of them are generated.
+
+        """
+        text_chunks = self._get_text_chunks(self.nodes)
+        num_questions = 0
+        for i in range(0, len(text_chunks), self.num_workers):
+            if num is not None and num_questions >= num:
+                return
+            jobs = [
+                self._agenerate_questions(text_chunk)
+                for text_chunk in text_chunks[i : i + self.num_workers]
             ]
-            questions.extend(cleaned_questions)
+            questions_list = asyncio_run(run_jobs(jobs, workers=self.num_workers))
+            for questions in questions_list:
+                for question in questions:
+                    if num is not None and num_questions >= num:
+                        return
+                    num_questions += 1
+                    yield question
+
+    async def agenerate_questions_from_nodes(
+        self, num: Optional[int] = None
+    ) -> List[str]:
+        """Asynchronously generate questions for each node.
 
-        questions = [question for question in questions if question != ""]
+        Like `iter_questions_from_nodes`, questions are generated for
+        `num_workers` contexts at a time, stopping once there are `num` of them.
 
+        """
+        text_chunks = self._get_text_chunks(self.nodes)
+        questions: List[str] = []
+        for i in range(0, len(text_chunks), self.num_workers):
+            if num is not None and len(questions) >= num:
+                break
+            jobs = [
+                self._agenerate_questions(text_chunk)
+                for text_chunk in text_chunks[i : i + self.num_workers]
+            ]
+            questions_list = await run_jobs(jobs, workers=self.num_workers)
+            for window_questions in questions_list:
+                questions.extend(window_questions)
         if num is not None:
             questions = questions[:num]
         return questions
 
     def generate_questions_from_nodes(self, num: Optional[int] = None) -> List[str]:
         """Generates questions for each document."""
-        return self._node_question_generator(self.nodes, num)
+        return list(self.iter_questions_from_nodes(num))
@@ -34,27 +34,39 @@ class GuidelineEvaluator(BaseEvaluator):
         self.guidelines = guidelines or DEFAULT_GUIDELINES
         self.eval_template = eval_template or DEFAULT_EVAL_TEMPLATE
 
-    def evaluate_response(self, query: str, response: Response) -> Evaluation:
-        """Evaluate the response for a query and an Evaluation."""
-        parser: PydanticOutputParser[EvaluationData] = PydanticOutputParser(
-            pydantic_object=EvaluationData
-        )
-        format_instructions = parser.get_format_instructions()
+    def _get_prompt_args(self, query: str, response: Response) -> dict:
+        format_instructions = self._get_parser().get_format_instructions()
         response_str = response.response
-        prompt = PromptTemplate(self.eval_template)
-        logger.debug("prompt: %s", prompt)
         logger.debug("query: %s", query)
         logger.debug("response: %s", response_str)
         logger.debug("guidelines: %s", self.guidelines)
         logger.debug("format_instructions: %s", format_instructions)
+        return {
+            "query": query,
+            "response": response_str,
+            "guidelines": self.guidelines,
+            "format_instructions": format_instructions,
+        }
+
+    def _get_parser(self) -> "PydanticOutputParser[EvaluationData]":
+        return PydanticOutputParser(pydantic_object=EvaluationData)
+
+    def evaluate_response(self, query: str, response: Response) -> Evaluation:
+        """Evaluate the response for a query and an Evaluation."""
         eval_response = self.service_context.llm_predictor.predict(
-            prompt,
-            query=query,
-            response=response_str,
-            guidelines=self.guidelines,
-            format_instructions=format_instructions,
+            PromptTemplate(self.eval_template),
+            **self._get_prompt_args(query, response),
+        )
+        eval_data = self._get_parser().parse(eval_response)
+        return Evaluation(query, response, eval_data.passing, eval_data.feedback)
+
+    async def aevaluate_response(self, query: str, response: Response) -> Evaluation:
+        """Asynchronously evaluate the response for a query."""
+        eval_response = await self.service_context.llm_predictor.apredict(
+            PromptTemplate(self.eval_template),
+            **self._get_prompt_args(query, response),
         )
-        eval_data = parser.parse(eval_response)
+        eval_data = self._get_parser().parse(eval_response)
         return Evaluation(query, response, eval_data.passing, eval_data.feedback)
 
 
@@ -1,20 +1,38 @@
 """LlamaIndex data structures."""
 
-# indices
-from llama_index.indices.keyword_table.base import (
-    KeywordTableIndex,
-    GPTKeywordTableIndex,
-)
-from llama_index.indices.keyword_table.rake_base import (
-    RAKEKeywordTableIndex,
-    GPTRAKEKeywordTableIndex,
-)
-from llama_index.indices.keyword_table.simple_base import (
-    SimpleKeywordTableIndex,
-    GPTSimpleKeywordTableIndex,
-)
-from llama_index.indices.list.base import GPTListIndex, ListIndex
-from llama_index.indices.tree.base import TreeIndex, GPTTreeIndex
+from typing import TYPE_CHECKING
+
+from llama_index.utils import get_lazy_getattr
+
+if TYPE_CHECKING:
+    # indices
+    from llama_index.indices.keyword_table.base import (
+        KeywordTableIndex,
+        GPTKeywordTableIndex,
+    )
+    from llama_index.indices.keyword_table.rake_base import (
+        RAKEKeywordTableIndex,
+        GPTRAKEKeywordTableIndex,
+    )
+    from llama_index.indices.keyword_table.simple_base import (
+        SimpleKeywordTableIndex,
+        GPTSimpleKeywordTableIndex,
+    )
+    from llama_index.indices.list.base import GPTListIndex, ListIndex
+    from llama_index.indices.tree.base import TreeIndex, GPTTreeIndex
+
+_LAZY_IMPORTS = {
+    "KeywordTableIndex": "llama_index.indices.keyword_table.base",
+    "GPTKeywordTableIndex": "llama_index.indices.keyword_table.base",
+    "RAKEKeywordTableIndex": "llama_index.indices.keyword_table.rake_base",
+    "GPTRAKEKeywordTableIndex": "llama_index.indices.keyword_table.rake_base",
+    "SimpleKeywordTableIndex": "llama_index.indices.keyword_table.simple_base",
+    "GPTSimpleKeywordTableIndex": "llama_index.indices.keyword_table.simple_base",
+    "GPTListIndex": "llama_index.indices.list.base",
+    "ListIndex": "llama_index.indices.list.base",
+    "TreeIndex": "llama_index.indices.tree.base",
+    "GPTTreeIndex": "llama_index.indices.tree.base",
+}
 
 __all__ = [
     "KeywordTableIndex",
@@ -29,3 +47,5 @@ __all__ = [
     "GPTListIndex",
     "GPTTreeIndex",
 ]
+
+__getattr__ = get_lazy_getattr(__name__, _LAZY_IMPORTS)
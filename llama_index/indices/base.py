@@ -3,6 +3,7 @@ import logging
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Generic, List, Optional, Sequence, Type, TypeVar, cast
 
+from llama_index.callbacks.schema import CBEventType, EventPayload
 from llama_index.chat_engine.types import BaseChatEngine, ChatMode
 from llama_index.data_structs.data_structs import IndexStruct
 from llama_index.indices.base_retriever import BaseRetriever
@@ -236,14 +237,19 @@ class BaseIndex(Generic[IS], ABC):
             logger.warning(f"ref_doc_id {ref_doc_id} not found, nothing deleted.")
             return
 
-        self.delete_nodes(
-            ref_doc_info.node_ids,
-            delete_from_docstore=False,
-            **delete_kwargs,
-        )
+        with self._service_context.callback_manager.event(
+            CBEventType.DELETE, payload={EventPayload.REF_DOC_ID: ref_doc_id}
+        ) as event:
+            self.delete_nodes(
+                ref_doc_info.node_ids,
+                delete_from_docstore=False,
+                **delete_kwargs,
+            )
+
+            if delete_from_docstore:
+                self.docstore.delete_ref_doc(ref_doc_id, raise_error=False)
 
-        if delete_from_docstore:
-            self.docstore.delete_ref_doc(ref_doc_id, raise_error=False)
+            event.on_end(payload={EventPayload.REF_DOC_ID: ref_doc_id})
 
     def update(self, document: Document, **update_kwargs: Any) -> None:
         """Update a document and it's corresponding nodes.
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+import asyncio
+from typing import List, Optional, Sequence
 
 from llama_index.indices.query.schema import QueryBundle, QueryType
 from llama_index.indices.service_context import ServiceContext
@@ -27,6 +28,26 @@ class BaseRetriever(ABC):
         nodes = await self._aretrieve(str_or_query_bundle)
         return nodes
 
+    def retrieve_batch(
+        self, str_or_query_bundles: Sequence[QueryType]
+    ) -> List[List[NodeWithScore]]:
+        """Retrieve nodes given several queries.
+
+        Retrievers that can share work between the queries (e.g. embedding them in
+        a single call) override `_retrieve_batch`.
+
+        Args:
+            str_or_query_bundles (Sequence[QueryType]): Query strings or
+                QueryBundle objects.
+
+        """
+        return self._retrieve_batch(_to_query_bundles(str_or_query_bundles))
+
+    async def aretrieve_batch(
+        self, str_or_query_bundles: Sequence[QueryType]
+    ) -> List[List[NodeWithScore]]:
+        return await self._aretrieve_batch(_to_query_bundles(str_or_query_bundles))
+
     @abstractmethod
     def _retrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
         """Retrieve nodes given query.
@@ -46,6 +67,28 @@ class BaseRetriever(ABC):
         """
         return self._retrieve(query_bundle)
 
+    def _retrieve_batch(
+        self, query_bundles: List[QueryBundle]
+    ) -> List[List[NodeWithScore]]:
+        """Retrieve nodes given several queries.
+
+        By default, each query is retrieved on its own.
+
+        """
+        return [self._retrieve(query_bundle) for query_bundle in query_bundles]
+
+    async def _aretrieve_batch(
+        self, query_bundles: List[QueryBundle]
+    ) -> List[List[NodeWithScore]]:
+        """Asyncronously retrieve nodes given several queries.
+
+        By default, the queries are retrieved concurrently.
+
+        """
+        return await asyncio.gather(
+            *[self._aretrieve(query_bundle) for query_bundle in query_bundles]
+        )
+
     def get_service_context(self) -> Optional[ServiceContext]:
         """Attempts to resolve a service context.
         Short-circuits at self.service_context, self._service_context,
@@ -58,3 +101,10 @@ class BaseRetriever(ABC):
         elif hasattr(self, "_index") and hasattr(self._index, "service_context"):
             return self._index.service_context
         return None
+
+
+def _to_query_bundles(str_or_query_bundles: Sequence[QueryType]) -> List[QueryBundle]:
+    return [
+        QueryBundle(query) if isinstance(query, str) else query
+        for query in str_or_query_bundles
+    ]
@@ -3,9 +3,10 @@
 
 import asyncio
 import logging
+from hashlib import sha256
 from typing import Dict, List, Optional, Sequence, Tuple
 
-from llama_index.async_utils import run_async_tasks
+from llama_index.async_utils import asyncio_run, run_jobs
 from llama_index.callbacks.schema import CBEventType, EventPayload
 from llama_index.data_structs.data_structs import IndexGraph
 from llama_index.indices.service_context import ServiceContext
@@ -14,10 +15,133 @@ from llama_index.prompts import BasePromptTemplate
 from llama_index.schema import BaseNode, MetadataMode, TextNode
 from llama_index.storage.docstore import BaseDocumentStore
 from llama_index.storage.docstore.registry import get_default_docstore
+from llama_index.storage.kvstore.types import BaseKVStore
 from llama_index.utils import get_tqdm_iterable
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_SUMMARY_CACHE_COLLECTION = "tree_summaries"
+
+
+def get_summary_cache_key(summary_prompt: BasePromptTemplate, text_chunk: str) -> str:
+    """Get the summary cache key of a chunk of (concatenated) children text."""
+    prompt_str = summary_prompt.format(context_str=text_chunk)
+    return sha256(prompt_str.encode("utf-8")).hexdigest()
+
+
+def _get_cached_summaries(
+    summary_prompt: BasePromptTemplate,
+    text_chunks: Sequence[str],
+    summary_cache: Optional[BaseKVStore],
+) -> List[Optional[str]]:
+    """Get cached summaries, `None` for text chunks that are not cached."""
+    if summary_cache is None:
+        return [None] * len(text_chunks)
+
+    summaries: List[Optional[str]] = []
+    for text_chunk in text_chunks:
+        cached = summary_cache.get(
+            get_summary_cache_key(summary_prompt, text_chunk),
+            collection=DEFAULT_SUMMARY_CACHE_COLLECTION,
+        )
+        summaries.append(cached["summary"] if cached is not None else None)
+    return summaries
+
+
+def _merge_and_cache_summaries(
+    summary_prompt: BasePromptTemplate,
+    text_chunks: Sequence[str],
+    cached_summaries: List[Optional[str]],
+    new_summaries: Sequence[str],
+    summary_cache: Optional[BaseKVStore],
+) -> List[str]:
+    """Fill in missing summaries (in order) and add them to the cache."""
+    new_summaries_iter = iter(new_summaries)
+    summaries = []
+    for text_chunk, summary in zip(text_chunks, cached_summaries):
+        if summary is None:
+            summary = next(new_summaries_iter)
+            if summary_cache is not None:
+                summary_cache.put(
+                    get_summary_cache_key(summary_prompt, text_chunk),
+                    {"summary": summary},
+                    collection=DEFAULT_SUMMARY_CACHE_COLLECTION,
+                )
+        summaries.append(summary)
+    return summaries
+
+
+def summarize_text_chunks(
+    service_context: ServiceContext,
+    summary_prompt: BasePromptTemplate,
+    text_chunks: Sequence[str],
+    summary_cache: Optional[BaseKVStore] = None,
+    use_async: bool = False,
+    show_progress: bool = False,
+) -> List[str]:
+    """Summarize text chunks, skipping the LLM for cached ones.
+
+    With `use_async`, all uncached chunks are summarized concurrently.
+
+    """
+    cached_summaries = _get_cached_summaries(summary_prompt, text_chunks, summary_cache)
+    missing_chunks = [
+        text_chunk
+        for text_chunk, summary in zip(text_chunks, cached_summaries)
+        if summary is None
+    ]
+
+    new_summaries: List[str] = []
+    if len(missing_chunks) > 0 and use_async:
+        tasks = [
+            service_context.llm_predictor.apredict(
+                summary_prompt, context_str=text_chunk
+            )
+            for text_chunk in missing_chunks
+        ]
+        new_summaries = asyncio_run(
+            run_jobs(
+                tasks,
+                show_progress=show_progress,
+                progress_bar_desc="Generating summaries",
+            )
+        )
+    elif len(missing_chunks) > 0:
+        text_chunks_progress = get_tqdm_iterable(
+            missing_chunks,
+            show_progress=show_progress,
+            desc="Generating summaries",
+        )
+        new_summaries = [
+            service_context.llm_predictor.predict(
+                summary_prompt, context_str=text_chunk
+            )
+            for text_chunk in text_chunks_progress
+        ]
+
+    return _merge_and_cache_summaries(
+        summary_prompt, text_chunks, cached_summaries, new_summaries, summary_cache
+    )
+
+
+async def asummarize_text_chunks(
+    service_context: ServiceContext,
+    summary_prompt: BasePromptTemplate,
+    text_chunks: Sequence[str],
+    summary_cache: Optional[BaseKVStore] = None,
+) -> List[str]:
+    """Summarize text chunks concurrently, skipping the LLM for cached ones."""
+    cached_summaries = _get_cached_summaries(summary_prompt, text_chunks, summary_cache)
+    tasks = [
+        service_context.llm_predictor.apredict(summary_prompt, context_str=text_chunk)
+        for text_chunk, summary in zip(text_chunks, cached_summaries)
+        if summary is None
+    ]
+    new_summaries = await asyncio.gather(*tasks)
+    return _merge_and_cache_summaries(
+        summary_prompt, text_chunks, cached_summaries, new_summaries, summary_cache
+    )
+
 
 class GPTTreeIndexBuilder:
     """GPT tree index builder.
@@ -35,6 +159,7 @@ class GPTTreeIndexBuilder:
         docstore: Optional[BaseDocumentStore] = None,
         show_progress: bool = False,
         use_async: bool = False,
+        summary_cache: Optional[BaseKVStore] = None,
     ) -> None:
         """Initialize with params."""
         if num_children < 2:
@@ -45,6 +170,7 @@ class GPTTreeIndexBuilder:
         self._use_async = use_async
         self._show_progress = show_progress
         self._docstore = docstore or get_default_docstore()
+        self._summary_cache = summary_cache
 
     @property
     def docstore(self) -> BaseDocumentStore:
@@ -147,31 +273,14 @@ class GPTTreeIndexBuilder:
         with self._service_context.callback_manager.event(
             CBEventType.TREE, payload={EventPayload.CHUNKS: text_chunks}
         ) as event:
-            if self._use_async:
-                tasks = [
-                    self._service_context.llm_predictor.apredict(
-                        self.summary_prompt, context_str=text_chunk
-                    )
-                    for text_chunk in text_chunks
-                ]
-                outputs: List[Tuple[str, str]] = run_async_tasks(
-                    tasks,
-                    show_progress=self._show_progress,
-                    progress_bar_desc="Generating summaries",
-                )
-                summaries = [output[0] for output in outputs]
-            else:
-                text_chunks_progress = get_tqdm_iterable(
-                    text_chunks,
-                    show_progress=self._show_progress,
-                    desc="Generating summaries",
-                )
-                summaries = [
-                    self._service_context.llm_predictor.predict(
-                        self.summary_prompt, context_str=text_chunk
-                    )
-                    for text_chunk in text_chunks_progress
-                ]
+            summaries = summarize_text_chunks(
+                self._service_context,
+                self.summary_prompt,
+                text_chunks,
+                summary_cache=self._summary_cache,
+                use_async=self._use_async,
+                show_progress=self._show_progress,
+            )
             self._service_context.llama_logger.add_log(
                 {"summaries": summaries, "level": level}
             )
@@ -211,19 +320,12 @@ class GPTTreeIndexBuilder:
         with self._service_context.callback_manager.event(
             CBEventType.TREE, payload={EventPayload.CHUNKS: text_chunks}
         ) as event:
-            text_chunks_progress = get_tqdm_iterable(
+            summaries = await asummarize_text_chunks(
+                self._service_context,
+                self.summary_prompt,
                 text_chunks,
-                show_progress=self._show_progress,
-                desc="Generating summaries",
+                summary_cache=self._summary_cache,
             )
-            tasks = [
-                self._service_context.llm_predictor.apredict(
-                    self.summary_prompt, context_str=text_chunk
-                )
-                for text_chunk in text_chunks_progress
-            ]
-            outputs: List[Tuple[str, str]] = await asyncio.gather(*tasks)
-            summaries = [output[0] for output in outputs]
             self._service_context.llama_logger.add_log(
                 {"summaries": summaries, "level": level}
             )
@@ -10,16 +10,20 @@ existing keywords in the table.
 
 from abc import abstractmethod
 from enum import Enum
-from typing import Any, Dict, Optional, Sequence, Set, Union
+from typing import Any, Dict, List, Optional, Sequence, Set, Union
 
-from llama_index.async_utils import run_async_tasks
+from llama_index.async_utils import DEFAULT_NUM_WORKERS, asyncio_run, run_jobs
 from llama_index.data_structs.data_structs import KeywordTable
 from llama_index.indices.base import BaseIndex
 from llama_index.indices.base_retriever import BaseRetriever
-from llama_index.indices.keyword_table.utils import extract_keywords_given_response
+from llama_index.indices.keyword_table.utils import (
+    extract_batch_keywords_given_response,
+    extract_keywords_given_response,
+)
 from llama_index.indices.service_context import ServiceContext
 from llama_index.prompts import BasePromptTemplate
 from llama_index.prompts.default_prompts import (
+    DEFAULT_KEYWORD_BATCH_EXTRACT_TEMPLATE,
     DEFAULT_KEYWORD_EXTRACT_TEMPLATE,
     DEFAULT_QUERY_KEYWORD_EXTRACT_TEMPLATE,
 )
@@ -54,6 +58,8 @@ class BaseKeywordTableIndex(BaseIndex[KeywordTable]):
             (see :ref:`Prompt-Templates`).
         use_async (bool): Whether to use asynchronous calls. Defaults to False.
         show_progress (bool): Whether to show tqdm progress bars. Defaults to False.
+        max_concurrency (int): Maximum number of concurrent keyword extraction
+            calls when `use_async` is set.
 
     """
 
@@ -68,11 +74,13 @@ class BaseKeywordTableIndex(BaseIndex[KeywordTable]):
         max_keywords_per_chunk: int = 10,
         use_async: bool = False,
         show_progress: bool = False,
+        max_concurrency: int = DEFAULT_NUM_WORKERS,
         **kwargs: Any,
     ) -> None:
         """Initialize params."""
         # need to set parameters before building index in base class.
         self.max_keywords_per_chunk = max_keywords_per_chunk
+        self._max_concurrency = max_concurrency
         self.keyword_extract_template = (
             keyword_extract_template or DEFAULT_KEYWORD_EXTRACT_TEMPLATE
         )
@@ -121,6 +129,17 @@ class BaseKeywordTableIndex(BaseIndex[KeywordTable]):
         # by default just call sync version
         return self._extract_keywords(text)
 
+    def _get_node_batches(self, nodes: Sequence[BaseNode]) -> List[Sequence[BaseNode]]:
+        """Split nodes into batches that share a keyword extraction call."""
+        # by default extract keywords from every node separately
+        return [[n] for n in nodes]
+
+    async def _async_extract_keywords_batch(
+        self, texts: Sequence[str]
+    ) -> List[Set[str]]:
+        """Extract keywords from a batch of texts."""
+        return [await self._async_extract_keywords(text) for text in texts]
+
     def _add_nodes_to_index(
         self,
         index_struct: KeywordTable,
@@ -143,25 +162,42 @@ class BaseKeywordTableIndex(BaseIndex[KeywordTable]):
         nodes: Sequence[BaseNode],
         show_progress: bool = False,
     ) -> None:
-        """Add document to index."""
-        nodes_with_progress = get_tqdm_iterable(
-            nodes, show_progress, "Extracting keywords from nodes"
-        )
-        for n in nodes_with_progress:
-            keywords = await self._async_extract_keywords(
-                n.get_content(metadata_mode=MetadataMode.LLM)
+        """Add document to index.
+
+        Keywords are extracted concurrently (bounded by `max_concurrency`) and
+        written to the keyword table in a single batch.
+
+        """
+        node_batches = self._get_node_batches(nodes)
+        jobs = [
+            self._async_extract_keywords_batch(
+                [n.get_content(metadata_mode=MetadataMode.LLM) for n in batch]
             )
-            index_struct.add_node(list(keywords), n)
+            for batch in node_batches
+        ]
+        keywords_per_batch = await run_jobs(
+            jobs,
+            show_progress=show_progress,
+            workers=self._max_concurrency,
+            progress_bar_desc="Extracting keywords from nodes",
+        )
+
+        keywords_list = [
+            list(keywords)
+            for batch_keywords in keywords_per_batch
+            for keywords in batch_keywords
+        ]
+        batched_nodes = [n for batch in node_batches for n in batch]
+        index_struct.add_nodes(keywords_list, batched_nodes)
 
     def _build_index_from_nodes(self, nodes: Sequence[BaseNode]) -> KeywordTable:
         """Build the index from nodes."""
         # do simple concatenation
         index_struct = KeywordTable(table={})
         if self._use_async:
-            tasks = [
+            asyncio_run(
                 self._async_add_nodes_to_index(index_struct, nodes, self._show_progress)
-            ]
-            run_async_tasks(tasks)
+            )
         else:
             self._add_nodes_to_index(index_struct, nodes, self._show_progress)
 
@@ -169,25 +205,14 @@ class BaseKeywordTableIndex(BaseIndex[KeywordTable]):
 
     def _insert(self, nodes: Sequence[BaseNode], **insert_kwargs: Any) -> None:
         """Insert nodes."""
-        for n in nodes:
-            keywords = self._extract_keywords(
-                n.get_content(metadata_mode=MetadataMode.LLM)
-            )
-            self._index_struct.add_node(list(keywords), n)
+        if self._use_async:
+            asyncio_run(self._async_add_nodes_to_index(self._index_struct, nodes))
+        else:
+            self._add_nodes_to_index(self._index_struct, nodes)
 
     def _delete_node(self, node_id: str, **delete_kwargs: Any) -> None:
         """Delete a node."""
-        # delete node from the keyword table
-        keywords_to_delete = set()
-        for keyword, existing_node_ids in self._index_struct.table.items():
-            if node_id in existing_node_ids:
-                existing_node_ids.remove(node_id)
-                if len(existing_node_ids) == 0:
-                    keywords_to_delete.add(keyword)
-
-        # delete keywords that have zero nodes
-        for keyword in keywords_to_delete:
-            del self._index_struct.table[keyword]
+        self._index_struct.delete_node(node_id)
 
     @property
     def ref_doc_info(self) -> Dict[str, RefDocInfo]:
@@ -215,8 +240,45 @@ class KeywordTableIndex(BaseKeywordTableIndex):
 
     This index uses a GPT model to extract keywords from the text.
 
+    Args:
+        keyword_batch_extract_template (Optional[BasePromptTemplate]): A Keyword
+            Extraction Prompt for several numbered texts at once. Only used when
+            `keyword_extract_batch_size` > 1. If a custom
+            `keyword_extract_template` is given without a batch template,
+            keywords are extracted one node at a time.
+        keyword_extract_batch_size (int): Number of nodes to extract keywords
+            from per LLM call when `use_async` is set. Defaults to 1.
+
     """
 
+    def __init__(
+        self,
+        nodes: Optional[Sequence[BaseNode]] = None,
+        index_struct: Optional[KeywordTable] = None,
+        service_context: Optional[ServiceContext] = None,
+        keyword_extract_template: Optional[BasePromptTemplate] = None,
+        keyword_batch_extract_template: Optional[BasePromptTemplate] = None,
+        keyword_extract_batch_size: int = 1,
+        max_keywords_per_chunk: int = 10,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize params."""
+        if keyword_batch_extract_template is None and keyword_extract_template:
+            # a custom single-text prompt can't be reused for several texts
+            keyword_extract_batch_size = 1
+        self._keyword_extract_batch_size = keyword_extract_batch_size
+        self.keyword_batch_extract_template = (
+            keyword_batch_extract_template or DEFAULT_KEYWORD_BATCH_EXTRACT_TEMPLATE
+        ).partial_format(max_keywords=max_keywords_per_chunk)
+        super().__init__(
+            nodes=nodes,
+            index_struct=index_struct,
+            service_context=service_context,
+            keyword_extract_template=keyword_extract_template,
+            max_keywords_per_chunk=max_keywords_per_chunk,
+            **kwargs,
+        )
+
     def _extract_keywords(self, text: str) -> Set[str]:
         """Extract keywords from text."""
         response = self._service_context.llm_predictor.predict(
@@ -235,6 +297,33 @@ class KeywordTableIndex(BaseKeywordTableIndex):
         keywords = extract_keywords_given_response(response, start_token="KEYWORDS:")
         return keywords
 
+    def _get_node_batches(self, nodes: Sequence[BaseNode]) -> List[Sequence[BaseNode]]:
+        """Split nodes into batches that share a keyword extraction call."""
+        batch_size = self._keyword_extract_batch_size
+        return [nodes[i : i + batch_size] for i in range(0, len(nodes), batch_size)]
+
+    async def _async_extract_keywords_batch(
+        self, texts: Sequence[str]
+    ) -> List[Set[str]]:
+        """Extract keywords from a batch of texts with a single LLM call."""
+        if len(texts) == 1:
+            return [await self._async_extract_keywords(texts[0])]
+
+        numbered_texts = "\n\n".join(f"{i + 1}: {text}" for i, text in enumerate(texts))
+        response = await self._service_context.llm_predictor.apredict(
+            self.keyword_batch_extract_template,
+            text=numbered_texts,
+        )
+        batch_keywords = extract_batch_keywords_given_response(response, len(texts))
+
+        # fall back to one call per text for texts missing from the response
+        results = []
+        for text, keywords in zip(texts, batch_keywords):
+            if keywords is None:
+                keywords = await self._async_extract_keywords(text)
+            results.append(keywords)
+        return results
+
 
 # legacy
 GPTKeywordTableIndex = KeywordTableIndex
@@ -1,8 +1,7 @@
 """Query for KeywordTableIndex."""
 import logging
 from abc import abstractmethod
-from collections import defaultdict
-from typing import Any, Dict, List, Optional
+from typing import Any, List, Optional
 
 from llama_index.indices.base_retriever import BaseRetriever
 from llama_index.indices.keyword_table.base import BaseKeywordTableIndex
@@ -82,18 +81,12 @@ class BaseKeywordTableRetriever(BaseRetriever):
         logger.info(f"query keywords: {keywords}")
 
         # go through text chunks in order of most matching keywords
-        chunk_indices_count: Dict[str, int] = defaultdict(int)
         keywords = [k for k in keywords if k in self._index_struct.keywords]
         logger.info(f"> Extracted keywords: {keywords}")
-        for k in keywords:
-            for node_id in self._index_struct.table[k]:
-                chunk_indices_count[node_id] += 1
-        sorted_chunk_indices = sorted(
-            list(chunk_indices_count.keys()),
-            key=lambda x: chunk_indices_count[x],
-            reverse=True,
-        )
-        sorted_chunk_indices = sorted_chunk_indices[: self.num_chunks_per_query]
+        node_scores = self._index_struct.get_node_scores(keywords)
+        sorted_chunk_indices = [
+            node_id for node_id, _ in node_scores[: self.num_chunks_per_query]
+        ]
         sorted_nodes = self._docstore.get_nodes(sorted_chunk_indices)
 
         if logging.getLogger(__name__).getEffectiveLevel() == logging.DEBUG:
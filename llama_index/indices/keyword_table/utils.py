@@ -1,9 +1,8 @@
 """Utils for keyword table."""
 
 import re
-from typing import Optional, Set
-
-import pandas as pd
+from collections import Counter
+from typing import List, Optional, Set
 
 from llama_index.indices.utils import expand_tokens_with_subtokens
 from llama_index.utils import globals_helper
@@ -15,9 +14,10 @@ def simple_extract_keywords(
     """Extract keywords with simple algorithm."""
     tokens = [t.strip().lower() for t in re.findall(r"\w+", text_chunk)]
     if filter_stopwords:
-        tokens = [t for t in tokens if t not in globals_helper.stopwords]
-    value_counts = pd.Series(tokens).value_counts()
-    keywords = value_counts.index.tolist()[:max_keywords]
+        stopwords = globals_helper.stopwords_set
+        tokens = [t for t in tokens if t not in stopwords]
+    value_counts = Counter(tokens)
+    keywords = [k for k, _ in value_counts.most_common(max_keywords)]
     return set(keywords)
 
 
@@ -72,3 +72,25 @@ def extract_keywords_given_response(
     # if keyword consists of multiple words, split into subwords
     # (removing stopwords)
     return expand_tokens_with_subtokens(set(results))
+
+
+def extract_batch_keywords_given_response(
+    response: str, num_texts: int, lowercase: bool = True
+) -> List[Optional[Set[str]]]:
+    """Extract keywords for several texts given the GPT-generated response.
+
+    Used by keyword table indices when extracting keywords for a batch of texts.
+    Parses one line per text of the form <number>: <word1>, <word2>, ...
+    (numbers start at 1). Texts without a line in the response get `None`.
+    """
+    results: List[Optional[Set[str]]] = [None] * num_texts
+    for line in response.strip().splitlines():
+        match = re.match(r"^\s*\(?(\d+)[\.\):]\s*(.*)$", line)
+        if match is None:
+            continue
+        text_idx = int(match.group(1)) - 1
+        if 0 <= text_idx < num_texts:
+            results[text_idx] = extract_keywords_given_response(
+                match.group(2), lowercase=lowercase
+            )
+    return results
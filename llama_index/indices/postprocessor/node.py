@@ -287,7 +287,7 @@ DEFAULT_REFINE_INFER_PREV_NEXT_TMP = (
     "Также приведен существующий ответ.\n"
     "Вы являетесь поисковым агентом, решающим, следует ли проводить поиск в "
     "хранилище документов для получения дополнительного предыдущего контекста или будущего контекста. \n"
-    "Учитывая контекст, вопрос и предыдущий ответ",
+    "Учитывая контекст, вопрос и предыдущий ответ, "
     "вернуть ПРЕДЫДУЩЕЕ, или СЛЕДУЮЩЕЕ, или НИЧЕГО.\n"
     "Примеры: \n\n"
     "Контекст: {context_msg}\n"
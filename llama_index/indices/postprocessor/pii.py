@@ -46,14 +46,14 @@ DEFAULT_PII_TMPL = (
     "Верните выходные данные задачи в формате JSON. \n"
     "Контекст:\n"
     "Привет, Чжан Вэй, я Джон."
-    "Финансовые услуги вашей любой компании",
+    "Финансовые услуги вашей любой компании, "
     "Счет кредитной карты ООО 1111-0000-1111-0008 "
     "должен быть произведен минимальный платеж в размере 24,53 доллара США "
     "к 31 июля. Основываясь на ваших настройках автоплатежа, мы снимем ваш платеж. "
     "Задача: Замаскируйте PII, замените каждый PII тегом и верните текст. Верните отображение в формате JSON. \n" # noqa: E501
     "Вывод: \n"
     "Привет [ИМЯ 1], я [ИМЯ 2]."
-    "Финансовые услуги вашей любой компании",
+    "Финансовые услуги вашей любой компании, "
     "Счет кредитной карты ООО [CREDIT_CARD_NUMBER] "
     "должен быть произведен минимальный платеж в размере 24,53 доллара США "
     "по [ДАТЕ_ТАЙМУ]. Основываясь на ваших настройках автоплатежа, мы снимем ваш платеж. "
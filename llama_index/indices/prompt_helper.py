@@ -8,8 +8,9 @@ make use of the available context window (and thereby reducing the number of LLM
 needed), or truncating them so that they fit in a single LLM call.
 """
 
+import hashlib
 import logging
-from typing import Callable, List, Optional, Sequence
+from typing import Callable, Dict, List, Optional, Sequence
 
 try:
     from pydantic.v1 import Field, PrivateAttr
@@ -29,6 +30,8 @@ from llama_index.utils import globals_helper
 
 DEFAULT_PADDING = 5
 DEFAULT_CHUNK_OVERLAP_RATIO = 0.1
+# maximum number of token counts (of prompts and text chunks) cached
+DEFAULT_TOKEN_COUNT_CACHE_SIZE = 10000
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +77,8 @@ class PromptHelper(BaseComponent):
     )
 
     _tokenizer: Callable[[str], List] = PrivateAttr()
+    # token counts by hash of the text, so that the texts aren't kept in memory
+    _token_counts: Dict[bytes, int] = PrivateAttr(default_factory=dict)
 
     def __init__(
         self,
@@ -138,6 +143,22 @@ class PromptHelper(BaseComponent):
         """Get class name."""
         return "PromptHelper"
 
+    def get_token_count(self, text: str) -> int:
+        """Get the number of tokens of text.
+
+        Counts are cached, so prompt templates and text chunks that are packed
+        repeatedly (e.g. by refine) are tokenized once.
+
+        """
+        key = hashlib.sha256(text.encode("utf-8")).digest()
+        num_tokens = self._token_counts.get(key)
+        if num_tokens is None:
+            num_tokens = len(self._tokenizer(text))
+            if len(self._token_counts) >= DEFAULT_TOKEN_COUNT_CACHE_SIZE:
+                self._token_counts.clear()
+            self._token_counts[key] = num_tokens
+        return num_tokens
+
     def _get_available_context_size(self, prompt: BasePromptTemplate) -> int:
         """Get available context size.
 
@@ -147,8 +168,7 @@ class PromptHelper(BaseComponent):
                 - output (room reserved for response)
         """
         empty_prompt_txt = get_empty_prompt_txt(prompt)
-        prompt_tokens = self._tokenizer(empty_prompt_txt)
-        num_prompt_tokens = len(prompt_tokens)
+        num_prompt_tokens = self.get_token_count(empty_prompt_txt)
 
         return self.context_window - num_prompt_tokens - self.num_output
 
@@ -197,6 +217,7 @@ class PromptHelper(BaseComponent):
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
             tokenizer=self._tokenizer,
+            token_counter=self.get_token_count,
         )
         return text_splitter
 
@@ -206,7 +227,11 @@ class PromptHelper(BaseComponent):
         text_chunks: Sequence[str],
         padding: int = DEFAULT_PADDING,
     ) -> List[str]:
-        """Truncate text chunks to fit available context window."""
+        """Truncate text chunks to fit available context window.
+
+        Only the first chunk of each text chunk is computed.
+
+        """
         text_splitter = self.get_text_splitter_given_prompt(
             prompt,
             num_chunks=len(text_chunks),
@@ -225,6 +250,10 @@ class PromptHelper(BaseComponent):
         This will combine text chunks into consolidated chunks
         that more fully "pack" the prompt template given the context_window.
 
+        Splits are filled into consecutive chunks up to the token budget, each
+        split is tokenized once, and the token counts of the template and of
+        already seen text are reused.
+
         """
         text_splitter = self.get_text_splitter_given_prompt(prompt, padding=padding)
         combined_str = "\n\n".join([c.strip() for c in text_chunks if c.strip()])
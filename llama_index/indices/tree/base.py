@@ -10,6 +10,7 @@ from llama_index.indices.base_retriever import BaseRetriever
 from llama_index.indices.common_tree.base import GPTTreeIndexBuilder
 from llama_index.indices.service_context import ServiceContext
 from llama_index.indices.tree.inserter import TreeIndexInserter
+from llama_index.indices.tree.utils import embed_nodes
 from llama_index.prompts import BasePromptTemplate
 from llama_index.prompts.default_prompts import (
     DEFAULT_INSERT_PROMPT,
@@ -17,6 +18,8 @@ from llama_index.prompts.default_prompts import (
 )
 from llama_index.schema import BaseNode
 from llama_index.storage.docstore.types import RefDocInfo
+from llama_index.storage.kvstore.simple_kvstore import SimpleKVStore
+from llama_index.storage.kvstore.types import BaseKVStore
 
 
 class TreeRetrieverMode(str, Enum):
@@ -51,7 +54,20 @@ class TreeIndex(BaseIndex[IndexGraph]):
             (see :ref:`Prompt-Templates`).
         num_children (int): The number of children each node should have.
         build_tree (bool): Whether to build the tree during index construction.
+        use_async (bool): Whether to summarize nodes of the same level
+            concurrently, during both construction and insertion.
+            Defaults to False.
         show_progress (bool): Whether to show progress bars. Defaults to False.
+        summary_cache (Optional[BaseKVStore]): Key-value store caching summaries
+            by the hash of the (prompt-formatted) children text, so
+            re-summarizing unchanged children makes no LLM call. Pass a
+            persisted store to reuse summaries across index rebuilds.
+            Defaults to an in-memory store.
+        build_embeddings (bool): Whether to embed every node of the tree, in
+            batched calls, during construction and insertion. The embeddings are
+            stored in the index graph and used by the `select_leaf_embedding`
+            retriever. Otherwise they are computed lazily at query time.
+            Defaults to False.
 
     """
 
@@ -68,15 +84,19 @@ class TreeIndex(BaseIndex[IndexGraph]):
         build_tree: bool = True,
         use_async: bool = False,
         show_progress: bool = False,
+        summary_cache: Optional[BaseKVStore] = None,
+        build_embeddings: bool = False,
         **kwargs: Any,
     ) -> None:
         """Initialize params."""
         # need to set parameters before building index in base class.
         self.num_children = num_children
+        self._summary_cache = summary_cache or SimpleKVStore()
         self.summary_template = summary_template or DEFAULT_SUMMARY_PROMPT
         self.insert_prompt: BasePromptTemplate = insert_prompt or DEFAULT_INSERT_PROMPT
         self.build_tree = build_tree
         self._use_async = use_async
+        self._build_embeddings = build_embeddings
         super().__init__(
             nodes=nodes,
             index_struct=index_struct,
@@ -130,10 +150,27 @@ class TreeIndex(BaseIndex[IndexGraph]):
             use_async=self._use_async,
             show_progress=self._show_progress,
             docstore=self._docstore,
+            summary_cache=self._summary_cache,
         )
         index_graph = index_builder.build_from_nodes(nodes, build_tree=self.build_tree)
+        if self._build_embeddings:
+            self._embed_missing_nodes(index_graph)
         return index_graph
 
+    def _embed_missing_nodes(self, index_graph: IndexGraph) -> None:
+        """Embed, in batches, the nodes of the graph without a stored embedding."""
+        node_ids = [
+            node_id
+            for node_id in index_graph.all_nodes.values()
+            if node_id not in index_graph.node_id_to_embedding
+        ]
+        embed_nodes(
+            self._docstore.get_nodes(node_ids),
+            index_graph,
+            self._service_context.embed_model,
+            show_progress=self._show_progress,
+        )
+
     def _insert(self, nodes: Sequence[BaseNode], **insert_kwargs: Any) -> None:
         """Insert a document."""
         # TODO: allow to customize insert prompt
@@ -144,8 +181,12 @@ class TreeIndex(BaseIndex[IndexGraph]):
             summary_prompt=self.summary_template,
             service_context=self._service_context,
             docstore=self._docstore,
+            use_async=self._use_async,
+            summary_cache=self._summary_cache,
         )
         inserter.insert(nodes)
+        if self._build_embeddings:
+            self._embed_missing_nodes(self.index_struct)
 
     def _delete_node(self, node_id: str, **delete_kwargs: Any) -> None:
         """Delete a node."""
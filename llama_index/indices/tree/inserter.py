@@ -1,11 +1,13 @@
 """Tree Index inserter."""
 
-from typing import Optional, Sequence
+from typing import Dict, List, Optional, Sequence
 
 from llama_index.data_structs.data_structs import IndexGraph
+from llama_index.indices.common_tree.base import summarize_text_chunks
 from llama_index.indices.tree.utils import get_numbered_text_from_nodes
 from llama_index.storage.docstore import BaseDocumentStore
 from llama_index.storage.docstore.registry import get_default_docstore
+from llama_index.storage.kvstore.types import BaseKVStore
 from llama_index.indices.service_context import ServiceContext
 from llama_index.indices.utils import (
     extract_numbers_given_response,
@@ -20,7 +22,18 @@ from llama_index.schema import BaseNode, TextNode, MetadataMode
 
 
 class TreeIndexInserter:
-    """LlamaIndex inserter."""
+    """LlamaIndex inserter.
+
+    Summaries of the parents of inserted nodes are not updated after each
+    node. Instead, every affected parent is re-summarized once per call to
+    `insert`, bottom-up, so that a parent's summary is built from its
+    children's updated summaries. With `use_async`, the parents at the same
+    depth are re-summarized concurrently.
+
+    NOTE: nodes inserted in the same batch are routed using the summaries
+    from before the batch.
+
+    """
 
     def __init__(
         self,
@@ -30,6 +43,8 @@ class TreeIndexInserter:
         insert_prompt: BasePromptTemplate = DEFAULT_INSERT_PROMPT,
         summary_prompt: BasePromptTemplate = DEFAULT_SUMMARY_PROMPT,
         docstore: Optional[BaseDocumentStore] = None,
+        use_async: bool = False,
+        summary_cache: Optional[BaseKVStore] = None,
     ) -> None:
         """Initialize with params."""
         if num_children < 2:
@@ -40,6 +55,29 @@ class TreeIndexInserter:
         self.index_graph = index_graph
         self._service_context = service_context
         self._docstore = docstore or get_default_docstore()
+        self._use_async = use_async
+        self._summary_cache = summary_cache
+
+    def _summarize_nodes(self, node_lists: Sequence[List[BaseNode]]) -> List[str]:
+        """Summarize each list of nodes (concurrently if `use_async`)."""
+        text_chunks = []
+        for node_list in node_lists:
+            truncated_chunks = self._service_context.prompt_helper.truncate(
+                prompt=self.summary_prompt,
+                text_chunks=[
+                    node.get_content(metadata_mode=MetadataMode.LLM)
+                    for node in node_list
+                ],
+            )
+            text_chunks.append("\n".join(truncated_chunks))
+
+        return summarize_text_chunks(
+            self._service_context,
+            self.summary_prompt,
+            text_chunks,
+            summary_cache=self._summary_cache,
+            use_async=self._use_async,
+        )
 
     def _insert_under_parent_and_consolidate(
         self, text_node: BaseNode, parent_node: Optional[BaseNode]
@@ -67,30 +105,9 @@ class TreeIndexInserter:
             half1 = cur_graph_node_list[: len(cur_graph_nodes) // 2]
             half2 = cur_graph_node_list[len(cur_graph_nodes) // 2 :]
 
-            truncated_chunks = self._service_context.prompt_helper.truncate(
-                prompt=self.summary_prompt,
-                text_chunks=[
-                    node.get_content(metadata_mode=MetadataMode.LLM) for node in half1
-                ],
-            )
-            text_chunk1 = "\n".join(truncated_chunks)
-
-            summary1 = self._service_context.llm_predictor.predict(
-                self.summary_prompt, context_str=text_chunk1
-            )
+            summary1, summary2 = self._summarize_nodes([half1, half2])
             node1 = TextNode(text=summary1)
             self.index_graph.insert(node1, children_nodes=half1)
-
-            truncated_chunks = self._service_context.prompt_helper.truncate(
-                prompt=self.summary_prompt,
-                text_chunks=[
-                    node.get_content(metadata_mode=MetadataMode.LLM) for node in half2
-                ],
-            )
-            text_chunk2 = "\n".join(truncated_chunks)
-            summary2 = self._service_context.llm_predictor.predict(
-                self.summary_prompt, context_str=text_chunk2
-            )
             node2 = TextNode(text=summary2)
             self.index_graph.insert(node2, children_nodes=half2)
 
@@ -110,9 +127,18 @@ class TreeIndexInserter:
             self._docstore.add_documents([node2], allow_update=False)
 
     def _insert_node(
-        self, node: BaseNode, parent_node: Optional[BaseNode] = None
+        self,
+        node: BaseNode,
+        parent_node: Optional[BaseNode] = None,
+        depth: int = 0,
+        affected_parents: Optional[Dict[str, int]] = None,
     ) -> None:
-        """Insert node."""
+        """Insert node.
+
+        Every parent on the insertion path is recorded in `affected_parents`
+        (node id -> depth) so its summary can be updated afterwards.
+
+        """
         cur_graph_node_ids = self.index_graph.get_children(parent_node)
         cur_graph_nodes = self._docstore.get_node_dict(cur_graph_node_ids)
         cur_graph_node_list = get_sorted_node_list(cur_graph_nodes)
@@ -149,30 +175,48 @@ class TreeIndexInserter:
                 self._insert_under_parent_and_consolidate(node, parent_node)
             else:
                 selected_node = cur_graph_node_list[int(numbers[0]) - 1]
-                self._insert_node(node, selected_node)
+                self._insert_node(
+                    node,
+                    selected_node,
+                    depth=depth + 1,
+                    affected_parents=affected_parents,
+                )
 
-        # now we need to update summary for parent node, since we
+        # we need to update summary for parent node, since we
         # need to bubble updated summaries up the tree
         if parent_node is not None:
-            # refetch children
-            cur_graph_node_ids = self.index_graph.get_children(parent_node)
-            cur_graph_nodes = self._docstore.get_node_dict(cur_graph_node_ids)
-            cur_graph_node_list = get_sorted_node_list(cur_graph_nodes)
-            truncated_chunks = self._service_context.prompt_helper.truncate(
-                prompt=self.summary_prompt,
-                text_chunks=[
-                    node.get_content(metadata_mode=MetadataMode.LLM)
-                    for node in cur_graph_node_list
-                ],
-            )
-            text_chunk = "\n".join(truncated_chunks)
-            new_summary = self._service_context.llm_predictor.predict(
-                self.summary_prompt, context_str=text_chunk
+            if affected_parents is None:
+                self._update_summaries({parent_node.node_id: depth})
+            else:
+                affected_parents[parent_node.node_id] = depth
+
+    def _update_summaries(self, affected_parents: Dict[str, int]) -> None:
+        """Re-summarize affected parents, deepest first, once each."""
+        for depth in sorted(set(affected_parents.values()), reverse=True):
+            parent_nodes = self._docstore.get_nodes(
+                [
+                    node_id
+                    for node_id, node_depth in affected_parents.items()
+                    if node_depth == depth
+                ]
             )
-
-            parent_node.set_content(new_summary)
+            children_lists = []
+            for parent_node in parent_nodes:
+                # refetch children
+                cur_graph_node_ids = self.index_graph.get_children(parent_node)
+                cur_graph_nodes = self._docstore.get_node_dict(cur_graph_node_ids)
+                children_lists.append(get_sorted_node_list(cur_graph_nodes))
+
+            new_summaries = self._summarize_nodes(children_lists)
+            for parent_node, new_summary in zip(parent_nodes, new_summaries):
+                parent_node.set_content(new_summary)
+                self._docstore.add_documents([parent_node], allow_update=True)
+                # the stored embedding is of the old summary
+                self.index_graph.node_id_to_embedding.pop(parent_node.node_id, None)
 
     def insert(self, nodes: Sequence[BaseNode]) -> None:
         """Insert into index_graph."""
+        affected_parents: Dict[str, int] = {}
         for node in nodes:
-            self._insert_node(node)
+            self._insert_node(node, affected_parents=affected_parents)
+        self._update_summaries(affected_parents)
@@ -3,19 +3,38 @@
 import logging
 from typing import Dict, List, Tuple, cast
 
+import numpy as np
+
 from llama_index.indices.query.schema import QueryBundle
 from llama_index.indices.tree.select_leaf_retriever import TreeSelectLeafRetriever
+from llama_index.indices.tree.utils import async_embed_nodes, embed_nodes
 from llama_index.indices.utils import get_sorted_node_list
-from llama_index.schema import BaseNode, MetadataMode
+from llama_index.schema import BaseNode
 
 logger = logging.getLogger(__name__)
 
 
+def get_cosine_similarities(
+    query_embedding: List[float], embeddings: List[List[float]]
+) -> List[float]:
+    """Get the cosine similarity of the query to each row of `embeddings`."""
+    if len(embeddings) == 0:
+        return []
+    query_arr = np.asarray(query_embedding, dtype=float)
+    embeddings_arr = np.asarray(embeddings, dtype=float)
+    norms = np.linalg.norm(embeddings_arr, axis=1) * np.linalg.norm(query_arr)
+    # zero vectors are not similar to anything
+    norms[norms == 0] = 1.0
+    return (embeddings_arr @ query_arr / norms).tolist()
+
+
 class TreeSelectLeafEmbeddingRetriever(TreeSelectLeafRetriever):
     """Tree select leaf embedding retriever.
 
     This class traverses the index graph using the embedding similarity between the
-    query and the node text.
+    query and the node text. Node embeddings are read from the index graph (see
+    `build_embeddings` in TreeIndex); missing ones are embedded in a batch per
+    level and stored there.
 
     Args:
         query_template (Optional[BasePromptTemplate]): Tree Select Query Prompt
@@ -68,52 +87,59 @@ class TreeSelectLeafEmbeddingRetriever(TreeSelectLeafRetriever):
 
         return cast(str, result_response)
 
+    def _get_query_embedding(self, query_bundle: QueryBundle) -> List[float]:
+        """Get (and cache) the query embedding."""
+        if query_bundle.embedding is None:
+            query_bundle.embedding = (
+                self._service_context.embed_model.get_agg_embedding_from_queries(
+                    query_bundle.embedding_strs
+                )
+            )
+        return query_bundle.embedding
+
     def _get_query_text_embedding_similarities(
         self, query_bundle: QueryBundle, nodes: List[BaseNode]
     ) -> List[float]:
         """
         Get query text embedding similarity.
 
-        Cache the query embedding and the node text embedding.
+        Cache the query embedding. Node embeddings are taken from the index graph;
+        missing ones are embedded in a batch and stored there.
 
         """
-        if query_bundle.embedding is None:
-            query_bundle.embedding = (
-                self._service_context.embed_model.get_agg_embedding_from_queries(
-                    query_bundle.embedding_strs
-                )
-            )
-        similarities = []
-        for node in nodes:
-            if node.embedding is None:
-                node.embedding = self._service_context.embed_model.get_text_embedding(
-                    node.get_content(metadata_mode=MetadataMode.EMBED)
-                )
+        query_embedding = self._get_query_embedding(query_bundle)
+        node_embeddings = embed_nodes(
+            nodes, self._index_struct, self._service_context.embed_model
+        )
+        return get_cosine_similarities(query_embedding, node_embeddings)
 
-            similarity = self._service_context.embed_model.similarity(
-                query_bundle.embedding, node.embedding
-            )
-            similarities.append(similarity)
-        return similarities
+    async def _aget_query_text_embedding_similarities(
+        self, query_bundle: QueryBundle, nodes: List[BaseNode]
+    ) -> List[float]:
+        """Asynchronously get query text embedding similarity."""
+        query_embedding = self._get_query_embedding(query_bundle)
+        node_embeddings = await async_embed_nodes(
+            nodes, self._index_struct, self._service_context.embed_model
+        )
+        return get_cosine_similarities(query_embedding, node_embeddings)
+
+    def _get_top_nodes(
+        self, nodes: List[BaseNode], similarities: List[float]
+    ) -> Tuple[List[BaseNode], List[int]]:
+        """Get the `child_branch_factor` nodes with the highest similarity."""
+        # stable sort, so that ties keep the order of the nodes
+        top_indices = np.argsort(-np.asarray(similarities), kind="stable")[
+            : self.child_branch_factor
+        ]
+        selected_indices = [int(index) for index in top_indices]
+        return [nodes[index] for index in selected_indices], selected_indices
 
     def _get_most_similar_nodes(
         self, nodes: List[BaseNode], query_bundle: QueryBundle
     ) -> Tuple[List[BaseNode], List[int]]:
         """Get the node with the highest similarity to the query."""
         similarities = self._get_query_text_embedding_similarities(query_bundle, nodes)
-
-        selected_nodes: List[BaseNode] = []
-        selected_indices: List[int] = []
-        for node, _ in sorted(
-            zip(nodes, similarities), key=lambda x: x[1], reverse=True
-        ):
-            if len(selected_nodes) < self.child_branch_factor:
-                selected_nodes.append(node)
-                selected_indices.append(nodes.index(node))
-            else:
-                break
-
-        return selected_nodes, selected_indices
+        return self._get_top_nodes(nodes, similarities)
 
     def _select_nodes(
         self,
@@ -123,3 +149,15 @@ class TreeSelectLeafEmbeddingRetriever(TreeSelectLeafRetriever):
     ) -> List[BaseNode]:
         selected_nodes, _ = self._get_most_similar_nodes(cur_node_list, query_bundle)
         return selected_nodes
+
+    async def _aselect_nodes(
+        self,
+        cur_node_list: List[BaseNode],
+        query_bundle: QueryBundle,
+        level: int = 0,
+    ) -> List[BaseNode]:
+        similarities = await self._aget_query_text_embedding_similarities(
+            query_bundle, cur_node_list
+        )
+        selected_nodes, _ = self._get_top_nodes(cur_node_list, similarities)
+        return selected_nodes
@@ -1,7 +1,8 @@
 """Leaf query mechanism."""
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional, Tuple, cast
 
 from llama_index.bridge.langchain import print_text
 from llama_index.indices.base_retriever import BaseRetriever
@@ -266,54 +267,43 @@ class TreeSelectLeafRetriever(BaseRetriever):
         # TODO: fix source nodes
         return Response(response_str, source_nodes=[])
 
-    def _select_nodes(
+    def _get_select_prompt_args(
         self,
         cur_node_list: List[BaseNode],
         query_bundle: QueryBundle,
-        level: int = 0,
-    ) -> List[BaseNode]:
+    ) -> Tuple[BasePromptTemplate, str]:
+        """Get select prompt and numbered node text for a list of candidates."""
         query_str = query_bundle.query_str
 
         if self.child_branch_factor == 1:
             query_template = self.query_template.partial_format(
                 num_chunks=len(cur_node_list), query_str=query_str
             )
-            text_splitter = (
-                self._service_context.prompt_helper.get_text_splitter_given_prompt(
-                    prompt=query_template,
-                    num_chunks=len(cur_node_list),
-                )
-            )
-            numbered_node_text = get_numbered_text_from_nodes(
-                cur_node_list, text_splitter=text_splitter
-            )
-
-            response = self._service_context.llm_predictor.predict(
-                query_template,
-                context_list=numbered_node_text,
-            )
         else:
-            query_template_multiple = self.query_template_multiple.partial_format(
+            query_template = self.query_template_multiple.partial_format(
                 num_chunks=len(cur_node_list),
                 query_str=query_str,
                 branching_factor=self.child_branch_factor,
             )
 
-            text_splitter = (
-                self._service_context.prompt_helper.get_text_splitter_given_prompt(
-                    prompt=query_template_multiple,
-                    num_chunks=len(cur_node_list),
-                )
-            )
-            numbered_node_text = get_numbered_text_from_nodes(
-                cur_node_list, text_splitter=text_splitter
-            )
-
-            response = self._service_context.llm_predictor.predict(
-                query_template_multiple,
-                context_list=numbered_node_text,
+        text_splitter = (
+            self._service_context.prompt_helper.get_text_splitter_given_prompt(
+                prompt=query_template,
+                num_chunks=len(cur_node_list),
             )
+        )
+        numbered_node_text = get_numbered_text_from_nodes(
+            cur_node_list, text_splitter=text_splitter
+        )
+        return query_template, numbered_node_text
 
+    def _parse_selected_nodes(
+        self,
+        response: str,
+        cur_node_list: List[BaseNode],
+        level: int = 0,
+    ) -> List[BaseNode]:
+        """Parse the nodes selected in a select response."""
         debug_str = f">[Level {level}] Current response: {response}"
         logger.debug(debug_str)
         if self._verbose:
@@ -365,6 +355,36 @@ class TreeSelectLeafRetriever(BaseRetriever):
 
         return selected_nodes
 
+    def _select_nodes(
+        self,
+        cur_node_list: List[BaseNode],
+        query_bundle: QueryBundle,
+        level: int = 0,
+    ) -> List[BaseNode]:
+        query_template, numbered_node_text = self._get_select_prompt_args(
+            cur_node_list, query_bundle
+        )
+        response = self._service_context.llm_predictor.predict(
+            query_template,
+            context_list=numbered_node_text,
+        )
+        return self._parse_selected_nodes(response, cur_node_list, level=level)
+
+    async def _aselect_nodes(
+        self,
+        cur_node_list: List[BaseNode],
+        query_bundle: QueryBundle,
+        level: int = 0,
+    ) -> List[BaseNode]:
+        query_template, numbered_node_text = self._get_select_prompt_args(
+            cur_node_list, query_bundle
+        )
+        response = await self._service_context.llm_predictor.apredict(
+            query_template,
+            context_list=numbered_node_text,
+        )
+        return self._parse_selected_nodes(response, cur_node_list, level=level)
+
     def _retrieve_level(
         self,
         cur_node_ids: Dict[int, str],
@@ -409,3 +429,53 @@ class TreeSelectLeafRetriever(BaseRetriever):
             level=0,
         )
         return [NodeWithScore(node=node) for node in nodes]
+
+    async def _aselect_children(
+        self,
+        cur_node_ids: Dict[int, str],
+        query_bundle: QueryBundle,
+        level: int = 0,
+    ) -> List[BaseNode]:
+        """Select among the children of a single branch."""
+        cur_nodes = self._docstore.get_node_dict(cur_node_ids)
+        cur_node_list = get_sorted_node_list(cur_nodes)
+
+        if len(cur_node_list) > self.child_branch_factor:
+            return await self._aselect_nodes(cur_node_list, query_bundle, level=level)
+        else:
+            return cur_node_list
+
+    async def _aretrieve(
+        self,
+        query_bundle: QueryBundle,
+    ) -> List[NodeWithScore]:
+        """Get nodes for response.
+
+        Traverses the tree level by level. Unlike the sync path, which selects
+        among the union of the children of all selected nodes, every selected
+        branch is explored on its own, and all branches of a level are queried
+        concurrently.
+
+        """
+        branches: List[Dict[int, str]] = [self._index_struct.root_nodes]
+        leaf_nodes: List[BaseNode] = []
+        level = 0
+        while len(branches) > 0:
+            selections = await asyncio.gather(
+                *[
+                    self._aselect_children(node_ids, query_bundle, level=level)
+                    for node_ids in branches
+                ]
+            )
+            branches = []
+            for selected_nodes in selections:
+                for node in selected_nodes:
+                    children = self._index_struct.get_children(node)
+                    if len(children) == 0:
+                        # NOTE: leaf level
+                        leaf_nodes.append(node)
+                    else:
+                        branches.append(children)
+            level += 1
+
+        return [NodeWithScore(node=node) for node in leaf_nodes]
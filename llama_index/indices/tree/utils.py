@@ -1,6 +1,8 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 
-from llama_index.schema import BaseNode
+from llama_index.data_structs.data_structs import IndexGraph
+from llama_index.embeddings.base import BaseEmbedding
+from llama_index.schema import BaseNode, MetadataMode
 from llama_index.text_splitter import TokenTextSplitter
 from llama_index.text_splitter.utils import truncate_text
 
@@ -24,3 +26,57 @@ def get_numbered_text_from_nodes(
         results.append(text)
         number += 1
     return "\n\n".join(results)
+
+
+def embed_nodes(
+    nodes: Sequence[BaseNode],
+    index_graph: IndexGraph,
+    embed_model: BaseEmbedding,
+    show_progress: bool = False,
+) -> List[List[float]]:
+    """Get the embeddings of tree nodes.
+
+    Embeddings already stored in the index graph are reused; the missing ones
+    are computed in batched calls and stored in the index graph.
+
+    """
+    id_to_embed_map = index_graph.node_id_to_embedding
+    for node in nodes:
+        if node.node_id not in id_to_embed_map:
+            if node.embedding is not None:
+                id_to_embed_map[node.node_id] = node.embedding
+            else:
+                embed_model.queue_text_for_embedding(
+                    node.node_id, node.get_content(metadata_mode=MetadataMode.EMBED)
+                )
+
+    result_ids, result_embeddings = embed_model.get_queued_text_embeddings(
+        show_progress
+    )
+    id_to_embed_map.update(zip(result_ids, result_embeddings))
+    return [id_to_embed_map[node.node_id] for node in nodes]
+
+
+async def async_embed_nodes(
+    nodes: Sequence[BaseNode],
+    index_graph: IndexGraph,
+    embed_model: BaseEmbedding,
+    show_progress: bool = False,
+) -> List[List[float]]:
+    """Asynchronously get the embeddings of tree nodes."""
+    id_to_embed_map = index_graph.node_id_to_embedding
+    text_queue: List[Tuple[str, str]] = []
+    for node in nodes:
+        if node.node_id not in id_to_embed_map:
+            if node.embedding is not None:
+                id_to_embed_map[node.node_id] = node.embedding
+            else:
+                text_queue.append(
+                    (node.node_id, node.get_content(metadata_mode=MetadataMode.EMBED))
+                )
+
+    result_ids, result_embeddings = await embed_model.aget_queued_text_embeddings(
+        text_queue, show_progress
+    )
+    id_to_embed_map.update(zip(result_ids, result_embeddings))
+    return [id_to_embed_map[node.node_id] for node in nodes]
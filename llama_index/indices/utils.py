@@ -32,11 +32,12 @@ def extract_numbers_given_response(response: str, n: int = 1) -> Optional[List[i
 def expand_tokens_with_subtokens(tokens: Set[str]) -> Set[str]:
     """Get subtokens from a list of tokens., filtering for stopwords."""
     results = set()
+    stopwords = globals_helper.stopwords_set
     for token in tokens:
         results.add(token)
         sub_tokens = re.findall(r"\w+", token)
         if len(sub_tokens) > 1:
-            results.update({w for w in sub_tokens if w not in globals_helper.stopwords})
+            results.update({w for w in sub_tokens if w not in stopwords})
 
     return results
 
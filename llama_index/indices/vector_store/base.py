@@ -6,7 +6,8 @@ An index that that is built on top of an existing vector store.
 
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from llama_index.async_utils import run_async_tasks
+from llama_index.async_utils import asyncio_run
+from llama_index.callbacks.schema import CBEventType, EventPayload
 from llama_index.data_structs.data_structs import IndexDict
 from llama_index.indices.base import BaseIndex
 from llama_index.indices.base_retriever import BaseRetriever
@@ -219,12 +220,11 @@ class VectorStoreIndex(BaseIndex[IndexDict]):
         """Build index from nodes."""
         index_struct = self.index_struct_cls()
         if self._use_async:
-            tasks = [
+            asyncio_run(
                 self._async_add_nodes_to_index(
                     index_struct, nodes, show_progress=self._show_progress
                 )
-            ]
-            run_async_tasks(tasks)
+            )
         else:
             self._add_nodes_to_index(
                 index_struct, nodes, show_progress=self._show_progress
@@ -278,22 +278,27 @@ class VectorStoreIndex(BaseIndex[IndexDict]):
         self, ref_doc_id: str, delete_from_docstore: bool = False, **delete_kwargs: Any
     ) -> None:
         """Delete a document and it's nodes by using ref_doc_id."""
-        self._vector_store.delete(ref_doc_id)
-
-        # delete from index_struct only if needed
-        if not self._vector_store.stores_text or self._store_nodes_override:
-            ref_doc_info = self._docstore.get_ref_doc_info(ref_doc_id)
-            if ref_doc_info is not None:
-                for node_id in ref_doc_info.node_ids:
-                    self._index_struct.delete(node_id)
-
-        # delete from docstore only if needed
-        if (
-            not self._vector_store.stores_text or self._store_nodes_override
-        ) and delete_from_docstore:
-            self._docstore.delete_ref_doc(ref_doc_id, raise_error=False)
-
-        self._storage_context.index_store.add_index_struct(self._index_struct)
+        with self._service_context.callback_manager.event(
+            CBEventType.DELETE, payload={EventPayload.REF_DOC_ID: ref_doc_id}
+        ) as event:
+            self._vector_store.delete(ref_doc_id)
+
+            # delete from index_struct only if needed
+            if not self._vector_store.stores_text or self._store_nodes_override:
+                ref_doc_info = self._docstore.get_ref_doc_info(ref_doc_id)
+                if ref_doc_info is not None:
+                    for node_id in ref_doc_info.node_ids:
+                        self._index_struct.delete(node_id)
+
+            # delete from docstore only if needed
+            if (
+                not self._vector_store.stores_text or self._store_nodes_override
+            ) and delete_from_docstore:
+                self._docstore.delete_ref_doc(ref_doc_id, raise_error=False)
+
+            self._storage_context.index_store.add_index_struct(self._index_struct)
+
+            event.on_end(payload={EventPayload.REF_DOC_ID: ref_doc_id})
 
     @property
     def ref_doc_info(self) -> Dict[str, RefDocInfo]:
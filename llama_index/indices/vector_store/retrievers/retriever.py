@@ -1,10 +1,12 @@
 """Base vector store index query."""
 
 
+import asyncio
 from typing import Any, Dict, List, Optional
 
 from llama_index.constants import DEFAULT_SIMILARITY_TOP_K
 from llama_index.data_structs.data_structs import IndexDict
+from llama_index.embeddings.base import mean_agg
 from llama_index.indices.base_retriever import BaseRetriever
 from llama_index.indices.query.schema import QueryBundle
 from llama_index.indices.utils import log_vector_store_query_result
@@ -86,6 +88,56 @@ class VectorIndexRetriever(BaseRetriever):
 
         return await self._aget_nodes_with_embeddings(query_bundle)
 
+    def _retrieve_batch(
+        self, query_bundles: List[QueryBundle]
+    ) -> List[List[NodeWithScore]]:
+        if self._vector_store.is_embedding_query:
+            embed_strs = self._get_batch_embed_strs(query_bundles)
+            embeddings = self._service_context.embed_model.get_query_embeddings(
+                embed_strs
+            )
+            self._set_batch_embeddings(query_bundles, embeddings)
+        return [
+            self._get_nodes_with_embeddings(query_bundle)
+            for query_bundle in query_bundles
+        ]
+
+    async def _aretrieve_batch(
+        self, query_bundles: List[QueryBundle]
+    ) -> List[List[NodeWithScore]]:
+        if self._vector_store.is_embedding_query:
+            embed_strs = self._get_batch_embed_strs(query_bundles)
+            embeddings = await self._service_context.embed_model.aget_query_embeddings(
+                embed_strs
+            )
+            self._set_batch_embeddings(query_bundles, embeddings)
+        return await asyncio.gather(
+            *[
+                self._aget_nodes_with_embeddings(query_bundle)
+                for query_bundle in query_bundles
+            ]
+        )
+
+    def _get_batch_embed_strs(self, query_bundles: List[QueryBundle]) -> List[str]:
+        """Get the strings to embed of all the queries with no embedding."""
+        return [
+            embed_str
+            for query_bundle in query_bundles
+            if query_bundle.embedding is None
+            for embed_str in query_bundle.embedding_strs
+        ]
+
+    def _set_batch_embeddings(
+        self, query_bundles: List[QueryBundle], embeddings: List[List[float]]
+    ) -> None:
+        """Set the embeddings of the queries from their embedded strings."""
+        embeddings_iter = iter(embeddings)
+        for query_bundle in query_bundles:
+            if query_bundle.embedding is None:
+                query_bundle.embedding = mean_agg(
+                    [next(embeddings_iter) for _ in query_bundle.embedding_strs]
+                )
+
     def _build_vector_store_query(
         self, query_bundle_with_embeddings: QueryBundle
     ) -> VectorStoreQuery:
@@ -1,37 +1,35 @@
-from queue import Queue
-from threading import Event
 from typing import Any, Generator, Union
 
 from llama_index.bridge.langchain import BaseCallbackHandler, LLMResult
+from llama_index.response.streaming import StreamingMetrics, TokenQueue
 
 
 class StreamingGeneratorCallbackHandler(BaseCallbackHandler):
     """Streaming callback handler."""
 
     def __init__(self) -> None:
-        self._token_queue: Queue = Queue()
-        self._done = Event()
+        self._token_queue = TokenQueue()
 
     def __deepcopy__(self, memo: Any) -> "StreamingGeneratorCallbackHandler":
         # NOTE: hack to bypass deepcopy in langchain
         return self
 
+    @property
+    def metrics(self) -> StreamingMetrics:
+        """First-token latency and tokens/sec of the stream."""
+        return self._token_queue.metrics
+
     def on_llm_new_token(self, token: str, **kwargs: Any) -> Any:
         """Run on new LLM token. Only available when streaming is enabled."""
-        self._token_queue.put_nowait(token)
+        self._token_queue.put(token)
 
     def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
-        self._done.set()
+        self._token_queue.close()
 
     def on_llm_error(
         self, error: Union[Exception, KeyboardInterrupt], **kwargs: Any
     ) -> None:
-        self._done.set()
+        self._token_queue.close()
 
     def get_response_gen(self) -> Generator:
-        while True:
-            if not self._token_queue.empty():
-                token = self._token_queue.get_nowait()
-                yield token
-            elif self._done.is_set():
-                break
+        yield from self._token_queue
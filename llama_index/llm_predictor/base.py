@@ -182,35 +182,62 @@ class LLMPredictor(BaseLLMPredictor):
         return stream_tokens
 
     def _extend_prompt(self, prompt: BasePromptTemplate) -> BasePromptTemplate:
-        """Add system and query wrapper prompts to base prompt"""
-        # TODO: avoid mutating prompt attributes
+        """Add system and query wrapper prompts to base prompt.
+
+        The prompt is not mutated, an extended copy is returned.
+
+        """
         if self.system_prompt:
             if isinstance(prompt, SelectorPromptTemplate):
                 default_template = prompt.default_template
                 if isinstance(default_template, PromptTemplate):
-                    default_template.template = (
-                        self.system_prompt + "\n\n" + default_template.template
+                    prompt = prompt.copy(
+                        update={
+                            "default_template": default_template.copy(
+                                update={
+                                    "template": self.system_prompt
+                                    + "\n\n"
+                                    + default_template.template
+                                }
+                            )
+                        }
                     )
                 else:
                     raise ValueError("PromptTemplate expected as default_template")
             elif isinstance(prompt, ChatPromptTemplate):
-                prompt.message_templates = [
-                    ChatMessage(role=MessageRole.SYSTEM, content=self.system_prompt)
-                ] + prompt.message_templates
+                prompt = prompt.copy(
+                    update={
+                        "message_templates": [
+                            ChatMessage(
+                                role=MessageRole.SYSTEM, content=self.system_prompt
+                            )
+                        ]
+                        + prompt.message_templates
+                    }
+                )
             elif isinstance(prompt, PromptTemplate):
-                prompt.template = self.system_prompt + "\n\n" + prompt.template
+                prompt = prompt.copy(
+                    update={"template": self.system_prompt + "\n\n" + prompt.template}
+                )
 
         if self.query_wrapper_prompt:
             if isinstance(prompt, (PromptTemplate, ChatPromptTemplate)):
-                prompt.kwargs["query_str"] = self.query_wrapper_prompt.format(
-                    query_str=prompt.kwargs["query_str"]
+                prompt = prompt.partial_format(
+                    query_str=self.query_wrapper_prompt.format(
+                        query_str=prompt.kwargs["query_str"]
+                    )
                 )
             elif isinstance(prompt, SelectorPromptTemplate):
+                default_template = prompt.default_template
                 if isinstance(default_template, PromptTemplate):
-                    prompt.default_template.kwargs[
-                        "query_str"
-                    ] = self.query_wrapper_prompt.format(
-                        query_str=prompt.default_template.kwargs["query_str"]
+                    prompt = prompt.copy(
+                        update={
+                            "default_template": default_template.partial_format(
+                                query_str=self.query_wrapper_prompt.format(
+                                    query_str=default_template.kwargs["query_str"]
+                                )
+                            )
+                        }
                     )
                 else:
                     raise ValueError("PromptTemplate expected as default_template")
@@ -1,27 +1,60 @@
-from llama_index.llms.anthropic import Anthropic
-from llama_index.llms.azure_openai import AzureOpenAI
-from llama_index.llms.base import (
-    ChatMessage,
-    ChatResponse,
-    ChatResponseAsyncGen,
-    ChatResponseGen,
-    CompletionResponse,
-    CompletionResponseAsyncGen,
-    CompletionResponseGen,
-    LLMMetadata,
-    MessageRole,
-)
-from llama_index.llms.custom import CustomLLM
-from llama_index.llms.huggingface import HuggingFaceLLM
-from llama_index.llms.langchain import LangChainLLM
-from llama_index.llms.llama_cpp import LlamaCPP
-from llama_index.llms.mock import MockLLM
-from llama_index.llms.monsterapi import MonsterLLM
-from llama_index.llms.openai import OpenAI
-from llama_index.llms.palm import PaLM
-from llama_index.llms.predibase import PredibaseLLM
-from llama_index.llms.replicate import Replicate
-from llama_index.llms.xinference import Xinference
+from typing import TYPE_CHECKING
+
+from llama_index.utils import get_lazy_getattr
+
+if TYPE_CHECKING:
+    from llama_index.llms.anthropic import Anthropic
+    from llama_index.llms.azure_openai import AzureOpenAI
+    from llama_index.llms.base import (
+        ChatMessage,
+        ChatResponse,
+        ChatResponseAsyncGen,
+        ChatResponseGen,
+        CompletionResponse,
+        CompletionResponseAsyncGen,
+        CompletionResponseGen,
+        LLMMetadata,
+        MessageRole,
+    )
+    from llama_index.llms.custom import CustomLLM
+    from llama_index.llms.huggingface import HuggingFaceLLM
+    from llama_index.llms.langchain import LangChainLLM
+    from llama_index.llms.llama_cpp import LlamaCPP
+    from llama_index.llms.mock import MockLLM
+    from llama_index.llms.monsterapi import MonsterLLM
+    from llama_index.llms.openai import OpenAI
+    from llama_index.llms.palm import PaLM
+    from llama_index.llms.predibase import PredibaseLLM
+    from llama_index.llms.replicate import Replicate
+    from llama_index.llms.simulated import LatencyProfile, SimulatedLLM
+    from llama_index.llms.xinference import Xinference
+
+_LAZY_IMPORTS = {
+    "Anthropic": "llama_index.llms.anthropic",
+    "AzureOpenAI": "llama_index.llms.azure_openai",
+    "ChatMessage": "llama_index.llms.base",
+    "ChatResponse": "llama_index.llms.base",
+    "ChatResponseAsyncGen": "llama_index.llms.base",
+    "ChatResponseGen": "llama_index.llms.base",
+    "CompletionResponse": "llama_index.llms.base",
+    "CompletionResponseAsyncGen": "llama_index.llms.base",
+    "CompletionResponseGen": "llama_index.llms.base",
+    "LLMMetadata": "llama_index.llms.base",
+    "MessageRole": "llama_index.llms.base",
+    "CustomLLM": "llama_index.llms.custom",
+    "HuggingFaceLLM": "llama_index.llms.huggingface",
+    "LangChainLLM": "llama_index.llms.langchain",
+    "LlamaCPP": "llama_index.llms.llama_cpp",
+    "MockLLM": "llama_index.llms.mock",
+    "MonsterLLM": "llama_index.llms.monsterapi",
+    "OpenAI": "llama_index.llms.openai",
+    "PaLM": "llama_index.llms.palm",
+    "PredibaseLLM": "llama_index.llms.predibase",
+    "Replicate": "llama_index.llms.replicate",
+    "LatencyProfile": "llama_index.llms.simulated",
+    "SimulatedLLM": "llama_index.llms.simulated",
+    "Xinference": "llama_index.llms.xinference",
+}
 
 __all__ = [
     "OpenAI",
@@ -35,6 +68,8 @@ __all__ = [
     "LlamaCPP",
     "CustomLLM",
     "MockLLM",
+    "SimulatedLLM",
+    "LatencyProfile",
     "ChatMessage",
     "MessageRole",
     "ChatResponse",
@@ -47,3 +82,5 @@ __all__ = [
     "Xinference",
     "MonsterLLM",
 ]
+
+__getattr__ = get_lazy_getattr(__name__, _LAZY_IMPORTS)
@@ -0,0 +1,248 @@
+"""LLM simulating the latency, pacing and rate limits of a remote provider."""
+import asyncio
+import math
+import random
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Deque, Optional, Sequence
+
+try:
+    from pydantic.v1 import BaseModel, Field, PrivateAttr
+except ImportError:
+    from pydantic import BaseModel, Field, PrivateAttr
+
+from llama_index.callbacks import CallbackManager
+from llama_index.constants import DEFAULT_CONTEXT_WINDOW
+from llama_index.llms.base import (
+    ChatMessage,
+    ChatResponse,
+    ChatResponseAsyncGen,
+    CompletionResponse,
+    CompletionResponseAsyncGen,
+    CompletionResponseGen,
+    LLMMetadata,
+    llm_chat_callback,
+    llm_completion_callback,
+)
+from llama_index.llms.custom import CustomLLM
+from llama_index.llms.generic_utils import (
+    acompletion_to_chat_decorator,
+    astream_completion_to_chat_decorator,
+)
+from llama_index.utils import globals_helper
+
+DEFAULT_NUM_OUTPUT_TOKENS = 64
+
+
+class RateLimitError(Exception):
+    """Raised by simulated providers when a call is rate limited."""
+
+
+class LatencyDistribution(str, Enum):
+    """Distribution of the latency of simulated calls.
+
+    Attributes:
+        CONSTANT ("constant"): Always the median latency.
+        UNIFORM ("uniform"): Uniform within `spread` (relative) of the median.
+        LOGNORMAL ("lognormal"): Lognormal around the median, with sigma `spread`,
+            i.e. with a long tail, like remote providers.
+    """
+
+    CONSTANT = "constant"
+    UNIFORM = "uniform"
+    LOGNORMAL = "lognormal"
+
+
+class LatencyProfile(BaseModel):
+    """Latency profile of a simulated provider.
+
+    The latency of a call, before its first token, is sampled from a
+    distribution, plus a delay per input token. Output tokens are then generated
+    at a delay each. Calls can fail with a `RateLimitError`, at random or when
+    more than `requests_per_minute` calls were made in the last minute.
+
+    Sampling is thread-safe, and reproducible given a seed.
+    """
+
+    distribution: LatencyDistribution = Field(
+        default=LatencyDistribution.LOGNORMAL,
+        description="Distribution of the latency of calls.",
+    )
+    latency: float = Field(
+        default=0.5, description="Median latency of calls, in seconds."
+    )
+    spread: float = Field(
+        default=0.5, description="Spread of the latency around its median."
+    )
+    per_input_token: float = Field(
+        default=0.0, description="Latency per input token, in seconds."
+    )
+    per_output_token: float = Field(
+        default=0.02, description="Time to generate an output token, in seconds."
+    )
+    requests_per_minute: Optional[float] = Field(
+        default=None, description="Maximum number of calls per minute."
+    )
+    rate_limit_error_rate: float = Field(
+        default=0.0, description="Probability of a call to be rate limited."
+    )
+    seed: Optional[int] = Field(default=None, description="Seed of the sampling.")
+
+    _random: random.Random = PrivateAttr()
+    _call_times: Deque[float] = PrivateAttr()
+    _lock: threading.Lock = PrivateAttr()
+
+    def __init__(self, **data: Any) -> None:
+        super().__init__(**data)
+        self._random = random.Random(self.seed)
+        self._call_times = deque()
+        self._lock = threading.Lock()
+
+    def get_latency(self, num_input_tokens: int = 0) -> float:
+        """Sample the latency of a call, before its first token."""
+        with self._lock:
+            if self.distribution == LatencyDistribution.UNIFORM:
+                latency = self.latency * self._random.uniform(
+                    1 - self.spread, 1 + self.spread
+                )
+            elif self.distribution == LatencyDistribution.LOGNORMAL:
+                latency = self.latency * math.exp(self._random.gauss(0, self.spread))
+            else:
+                latency = self.latency
+        return max(latency, 0.0) + self.per_input_token * num_input_tokens
+
+    def check_rate_limit(self) -> None:
+        """Record a call, raising a RateLimitError if it is rate limited."""
+        with self._lock:
+            if self._random.random() < self.rate_limit_error_rate:
+                raise RateLimitError("Rate limit reached (simulated).")
+            if self.requests_per_minute is None:
+                return
+
+            now = time.monotonic()
+            while self._call_times and self._call_times[0] <= now - 60:
+                self._call_times.popleft()
+            if len(self._call_times) >= self.requests_per_minute:
+                raise RateLimitError(
+                    f"Rate limit of {self.requests_per_minute} requests per minute "
+                    "reached (simulated)."
+                )
+            self._call_times.append(now)
+
+
+class SimulatedLLM(CustomLLM):
+    """Simulated LLM.
+
+    Like `MockLLM`, answers without any model or network access, but takes the
+    time a remote provider would, as set by its latency profile: the latency of
+    a call before its first token (proportional to the number of prompt tokens,
+    if configured), then `num_output_tokens` tokens paced at a delay each, both
+    when streaming and not. Calls can be rate limited, with a `RateLimitError`.
+
+    Args:
+        profile (Optional[LatencyProfile]): Latency profile of the calls.
+        num_output_tokens (int): Number of tokens of each response.
+        context_window (int): Context window of the LLM.
+    """
+
+    profile: LatencyProfile = Field(
+        default_factory=LatencyProfile, description="Latency profile of the calls."
+    )
+    num_output_tokens: int = Field(
+        default=DEFAULT_NUM_OUTPUT_TOKENS, description="Number of response tokens."
+    )
+    context_window: int = Field(
+        default=DEFAULT_CONTEXT_WINDOW, description="Context window of the LLM."
+    )
+
+    def __init__(
+        self,
+        profile: Optional[LatencyProfile] = None,
+        num_output_tokens: int = DEFAULT_NUM_OUTPUT_TOKENS,
+        context_window: int = DEFAULT_CONTEXT_WINDOW,
+        callback_manager: Optional[CallbackManager] = None,
+    ) -> None:
+        super().__init__(
+            profile=profile or LatencyProfile(),
+            num_output_tokens=num_output_tokens,
+            context_window=context_window,
+            callback_manager=callback_manager,
+        )
+
+    @classmethod
+    def class_name(cls) -> str:
+        """Get class name."""
+        return "SimulatedLLM"
+
+    @property
+    def metadata(self) -> LLMMetadata:
+        return LLMMetadata(
+            context_window=self.context_window,
+            num_output=self.num_output_tokens,
+            model_name="simulated",
+        )
+
+    def _start_call(self, prompt: str) -> float:
+        """Start a call, returning its latency before the first token."""
+        self.profile.check_rate_limit()
+        return self.profile.get_latency(len(globals_helper.tokenizer(prompt)))
+
+    def _get_generation_time(self) -> float:
+        return self.profile.per_output_token * self.num_output_tokens
+
+    def _generate_text(self, length: int) -> str:
+        return " ".join(["text" for _ in range(length)])
+
+    @llm_completion_callback()
+    def complete(self, prompt: str, **kwargs: Any) -> CompletionResponse:
+        latency = self._start_call(prompt)
+        time.sleep(latency + self._get_generation_time())
+        return CompletionResponse(text=self._generate_text(self.num_output_tokens))
+
+    @llm_completion_callback()
+    def stream_complete(self, prompt: str, **kwargs: Any) -> CompletionResponseGen:
+        latency = self._start_call(prompt)
+
+        def gen() -> CompletionResponseGen:
+            time.sleep(latency)
+            for i in range(1, self.num_output_tokens + 1):
+                time.sleep(self.profile.per_output_token)
+                yield CompletionResponse(text=self._generate_text(i), delta="text ")
+
+        return gen()
+
+    @llm_completion_callback()
+    async def acomplete(self, prompt: str, **kwargs: Any) -> CompletionResponse:
+        latency = self._start_call(prompt)
+        await asyncio.sleep(latency + self._get_generation_time())
+        return CompletionResponse(text=self._generate_text(self.num_output_tokens))
+
+    @llm_completion_callback()
+    async def astream_complete(
+        self, prompt: str, **kwargs: Any
+    ) -> CompletionResponseAsyncGen:
+        latency = self._start_call(prompt)
+
+        async def gen() -> CompletionResponseAsyncGen:
+            await asyncio.sleep(latency)
+            for i in range(1, self.num_output_tokens + 1):
+                await asyncio.sleep(self.profile.per_output_token)
+                yield CompletionResponse(text=self._generate_text(i), delta="text ")
+
+        return gen()
+
+    @llm_chat_callback()
+    async def achat(
+        self, messages: Sequence[ChatMessage], **kwargs: Any
+    ) -> ChatResponse:
+        achat_fn = acompletion_to_chat_decorator(self.acomplete)
+        return await achat_fn(messages, **kwargs)
+
+    @llm_chat_callback()
+    async def astream_chat(
+        self, messages: Sequence[ChatMessage], **kwargs: Any
+    ) -> ChatResponseAsyncGen:
+        astream_chat_fn = astream_completion_to_chat_decorator(self.astream_complete)
+        return await astream_chat_fn(messages, **kwargs)
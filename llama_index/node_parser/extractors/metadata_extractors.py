@@ -19,9 +19,10 @@ The prompts used to generate the metadata are specifically aimed to help
 disambiguate the document or subsection from other similar documents or subsections.
 (similar with contrastive learning)
 """
+import hashlib
+import json
 from abc import abstractmethod
 from functools import reduce
-from copy import deepcopy
 from typing import Any, Callable, Dict, List, Optional, Sequence, cast
 
 try:
@@ -29,18 +30,33 @@ try:
 except ImportError:
     from pydantic import Field, PrivateAttr
 
+from llama_index.async_utils import DEFAULT_NUM_WORKERS, asyncio_run, run_jobs
 from llama_index.llm_predictor.base import BaseLLMPredictor, LLMPredictor
 from llama_index.llms.base import LLM
 from llama_index.node_parser.interface import BaseExtractor
 from llama_index.prompts import PromptTemplate
 from llama_index.schema import BaseNode, TextNode, MetadataMode
-from llama_index.utils import get_tqdm_iterable
+from llama_index.storage.kvstore.types import BaseKVStore
+
+DEFAULT_CACHE_COLLECTION = "metadata_extractor_cache/data"
 
 
 class MetadataFeatureExtractor(BaseExtractor):
     is_text_node_only: bool = True
     show_progress: bool = True
     metadata_mode: MetadataMode = MetadataMode.ALL
+    num_workers: int = Field(
+        default=DEFAULT_NUM_WORKERS,
+        description="The maximum number of LLM calls to make at once.",
+    )
+    cache: Optional[BaseKVStore] = Field(
+        default=None,
+        exclude=True,
+        description=(
+            "Key-value store to cache LLM outputs in, by extractor prompt and node "
+            "content, so that unchanged nodes are not extracted again."
+        ),
+    )
 
     @abstractmethod
     def extract(self, nodes: Sequence[BaseNode]) -> List[Dict]:
@@ -52,6 +68,56 @@ class MetadataFeatureExtractor(BaseExtractor):
 
         """
 
+    async def aextract(self, nodes: Sequence[BaseNode]) -> List[Dict]:
+        """Asynchronously extracts metadata for a sequence of nodes.
+
+        Args:
+            nodes (Sequence[Document]): nodes to extract metadata from
+
+        """
+        return self.extract(nodes)
+
+    async def _apredict(
+        self, llm_predictor: BaseLLMPredictor, template: str, **prompt_args: Any
+    ) -> str:
+        """Predict with a prompt template, through the cache if any."""
+        if self.cache is None:
+            return await llm_predictor.apredict(
+                PromptTemplate(template=template), **prompt_args
+            )
+
+        key = hashlib.sha256(
+            json.dumps(
+                [
+                    self.class_name(),
+                    llm_predictor.metadata.model_name,
+                    template,
+                    prompt_args,
+                ],
+                sort_keys=True,
+            ).encode("utf-8")
+        ).hexdigest()
+        cached = self.cache.get(key, collection=DEFAULT_CACHE_COLLECTION)
+        if cached is not None:
+            return cached["output"]
+
+        output = await llm_predictor.apredict(
+            PromptTemplate(template=template), **prompt_args
+        )
+        self.cache.put(key, {"output": output}, collection=DEFAULT_CACHE_COLLECTION)
+        return output
+
+
+def _copy_node(node: BaseNode) -> BaseNode:
+    """Copy a node, with its own metadata and metadata key lists."""
+    return node.copy(
+        update={
+            "metadata": dict(node.metadata),
+            "excluded_embed_metadata_keys": list(node.excluded_embed_metadata_keys),
+            "excluded_llm_metadata_keys": list(node.excluded_llm_metadata_keys),
+        }
+    )
+
 
 DEFAULT_NODE_TEXT_TEMPLATE = """\
 [Excerpt from document]\n{metadata_str}\n\
@@ -63,7 +129,16 @@ DEFAULT_NODE_TEXT_TEMPLATE = """\
 
 
 class MetadataExtractor(BaseExtractor):
-    """Metadata extractor."""
+    """Metadata extractor.
+
+    Extractors are applied one after another, so that each one sees the metadata
+    of the previous ones in the node content. Each extractor makes its LLM calls
+    for the nodes concurrently (at most `num_workers` at once), and can cache
+    them (see `MetadataFeatureExtractor.cache`).
+
+    When not in place, the nodes are shallow-copied (with their own metadata),
+    rather than deep-copied.
+    """
 
     extractors: Sequence[MetadataFeatureExtractor] = Field(
         default_factory=list,
@@ -101,6 +176,21 @@ class MetadataExtractor(BaseExtractor):
 
         return metadata_list
 
+    async def aextract(self, nodes: Sequence[BaseNode]) -> List[Dict]:
+        """Asynchronously extract metadata from a document.
+
+        Args:
+            nodes (Sequence[BaseNode]): nodes to extract metadata from
+
+        """
+        metadata_list: List[Dict] = [{} for _ in nodes]
+        for extractor in self.extractors:
+            cur_metadata_list = await extractor.aextract(nodes)
+            for i, metadata in enumerate(metadata_list):
+                metadata.update(cur_metadata_list[i])
+
+        return metadata_list
+
     def process_nodes(
         self,
         nodes: List[BaseNode],
@@ -121,12 +211,52 @@ class MetadataExtractor(BaseExtractor):
         if self.in_place:
             new_nodes = nodes
         else:
-            new_nodes = [deepcopy(node) for node in nodes]
+            new_nodes = [_copy_node(node) for node in nodes]
         for extractor in self.extractors:
             cur_metadata_list = extractor.extract(new_nodes)
             for idx, node in enumerate(new_nodes):
                 node.metadata.update(cur_metadata_list[idx])
 
+        return self._finalize_nodes(
+            new_nodes, excluded_embed_metadata_keys, excluded_llm_metadata_keys
+        )
+
+    async def aprocess_nodes(
+        self,
+        nodes: List[BaseNode],
+        excluded_embed_metadata_keys: Optional[List[str]] = None,
+        excluded_llm_metadata_keys: Optional[List[str]] = None,
+    ) -> List[BaseNode]:
+        """Asynchronously post process nodes parsed from documents.
+
+        Allows extractors to be chained.
+
+        Args:
+            nodes (List[BaseNode]): nodes to post-process
+            excluded_embed_metadata_keys (Optional[List[str]]):
+                keys to exclude from embed metadata
+            excluded_llm_metadata_keys (Optional[List[str]]):
+                keys to exclude from llm metadata
+        """
+        if self.in_place:
+            new_nodes = nodes
+        else:
+            new_nodes = [_copy_node(node) for node in nodes]
+        for extractor in self.extractors:
+            cur_metadata_list = await extractor.aextract(new_nodes)
+            for idx, node in enumerate(new_nodes):
+                node.metadata.update(cur_metadata_list[idx])
+
+        return self._finalize_nodes(
+            new_nodes, excluded_embed_metadata_keys, excluded_llm_metadata_keys
+        )
+
+    def _finalize_nodes(
+        self,
+        new_nodes: List[BaseNode],
+        excluded_embed_metadata_keys: Optional[List[str]],
+        excluded_llm_metadata_keys: Optional[List[str]],
+    ) -> List[BaseNode]:
         for idx, node in enumerate(new_nodes):
             if excluded_embed_metadata_keys is not None:
                 node.excluded_embed_metadata_keys.extend(excluded_embed_metadata_keys)
@@ -216,6 +346,9 @@ class TitleExtractor(MetadataFeatureExtractor):
         return "TitleExtractor"
 
     def extract(self, nodes: Sequence[BaseNode]) -> List[Dict]:
+        return asyncio_run(self.aextract(nodes))
+
+    async def aextract(self, nodes: Sequence[BaseNode]) -> List[Dict]:
         nodes_to_extract_title: List[BaseNode] = []
         for node in nodes:
             if len(nodes_to_extract_title) >= self.nodes:
@@ -228,20 +361,23 @@ class TitleExtractor(MetadataFeatureExtractor):
             # Could not extract title
             return []
 
-        title_candidates = [
-            self.llm_predictor.predict(
-                PromptTemplate(template=self.node_template),
+        jobs = [
+            self._apredict(
+                self.llm_predictor,
+                self.node_template,
                 context_str=cast(TextNode, node).text,
             )
             for node in nodes_to_extract_title
         ]
+        title_candidates: List[str] = await run_jobs(jobs, workers=self.num_workers)
         if len(nodes_to_extract_title) > 1:
             titles = reduce(
                 lambda x, y: x + "," + y, title_candidates[1:], title_candidates[0]
             )
 
-            title = self.llm_predictor.predict(
-                PromptTemplate(template=self.combine_template),
+            title = await self._apredict(
+                self.llm_predictor,
+                self.combine_template,
                 context_str=titles,
             )
         else:
@@ -291,24 +427,26 @@ class KeywordExtractor(MetadataFeatureExtractor):
         return "KeywordExtractor"
 
     def extract(self, nodes: Sequence[BaseNode]) -> List[Dict]:
-        metadata_list: List[Dict] = []
-        for node in nodes:
+        return asyncio_run(self.aextract(nodes))
+
+    async def aextract(self, nodes: Sequence[BaseNode]) -> List[Dict]:
+        async def extract_node(node: BaseNode) -> Dict:
             if self.is_text_node_only and not isinstance(node, TextNode):
-                metadata_list.append({})
-                continue
+                return {}
 
             # TODO: figure out a good way to allow users to customize keyword template
-            keywords = self.llm_predictor.predict(
-                PromptTemplate(
-                    template=f"""\
+            keywords = await self._apredict(
+                self.llm_predictor,
+                f"""\
 {{context_str}}. Укажите {self.keywords} уникальные ключевые слова для этого \
-документа. Форматировать через запятую. Ключевые слова: """
-                ),
+документа. Форматировать через запятую. Ключевые слова: """,
                 context_str=cast(TextNode, node).text,
             )
             # node.metadata["excerpt_keywords"] = keywords
-            metadata_list.append({"excerpt_keywords": keywords.strip()})
-        return metadata_list
+            return {"excerpt_keywords": keywords.strip()}
+
+        jobs = [extract_node(node) for node in nodes]
+        return await run_jobs(jobs, workers=self.num_workers)
 
 
 DEFAULT_QUESTION_GEN_TMPL = """\
@@ -397,27 +535,32 @@ class QuestionsAnsweredExtractor(MetadataFeatureExtractor):
         return "QuestionsAnsweredExtractor"
 
     def extract(self, nodes: Sequence[BaseNode]) -> List[Dict]:
-        metadata_list: List[Dict] = []
-        nodes_queue = get_tqdm_iterable(
-            nodes, self.show_progress, "Extracting questions"
-        )
-        for node in nodes_queue:
+        return asyncio_run(self.aextract(nodes))
+
+    async def aextract(self, nodes: Sequence[BaseNode]) -> List[Dict]:
+        async def extract_node(node: BaseNode) -> Dict:
             if self.is_text_node_only and not isinstance(node, TextNode):
-                metadata_list.append({})
-                continue
+                return {}
 
             context_str = node.get_content(metadata_mode=self.metadata_mode)
-            prompt = PromptTemplate(template=self.prompt_template)
-            questions = self.llm_predictor.predict(
-                prompt, num_questions=self.questions, context_str=context_str
+            questions = await self._apredict(
+                self.llm_predictor,
+                self.prompt_template,
+                num_questions=self.questions,
+                context_str=context_str,
             )
 
             if self.embedding_only:
                 node.excluded_llm_metadata_keys = ["questions_this_excerpt_can_answer"]
-            metadata_list.append(
-                {"questions_this_excerpt_can_answer": questions.strip()}
-            )
-        return metadata_list
+            return {"questions_this_excerpt_can_answer": questions.strip()}
+
+        jobs = [extract_node(node) for node in nodes]
+        return await run_jobs(
+            jobs,
+            show_progress=self.show_progress,
+            workers=self.num_workers,
+            progress_bar_desc="Extracting questions",
+        )
 
 
 DEFAULT_SUMMARY_EXTRACT_TEMPLATE = """\
@@ -496,21 +639,28 @@ class SummaryExtractor(MetadataFeatureExtractor):
         return "SummaryExtractor"
 
     def extract(self, nodes: Sequence[BaseNode]) -> List[Dict]:
+        return asyncio_run(self.aextract(nodes))
+
+    async def aextract(self, nodes: Sequence[BaseNode]) -> List[Dict]:
         if not all([isinstance(node, TextNode) for node in nodes]):
             raise ValueError("Only `TextNode` is allowed for `Summary` extractor")
-        nodes_queue = get_tqdm_iterable(
-            nodes, self.show_progress, "Extracting summaries"
-        )
-        node_summaries = []
-        for node in nodes_queue:
-            node_context = cast(TextNode, node).get_content(
-                metadata_mode=self.metadata_mode
+        jobs = [
+            self._apredict(
+                self.llm_predictor,
+                self.prompt_template,
+                context_str=cast(TextNode, node).get_content(
+                    metadata_mode=self.metadata_mode
+                ),
             )
-            summary = self.llm_predictor.predict(
-                PromptTemplate(template=self.prompt_template),
-                context_str=node_context,
-            ).strip()
-            node_summaries.append(summary)
+            for node in nodes
+        ]
+        summaries = await run_jobs(
+            jobs,
+            show_progress=self.show_progress,
+            workers=self.num_workers,
+            progress_bar_desc="Extracting summaries",
+        )
+        node_summaries = [summary.strip() for summary in summaries]
 
         # Extract node-level summary metadata
         metadata_list: List[Dict] = [{} for _ in nodes]
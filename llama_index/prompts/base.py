@@ -2,7 +2,6 @@
 
 
 from abc import ABC, abstractmethod
-from copy import deepcopy
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 try:
@@ -17,7 +16,7 @@ from llama_index.llms.generic_utils import messages_to_prompt, prompt_to_message
 from llama_index.llms.langchain import LangChainLLM
 from llama_index.llms.langchain_utils import from_lc_messages
 from llama_index.prompts.prompt_type import PromptType
-from llama_index.prompts.utils import get_template_vars
+from llama_index.prompts.utils import get_compiled_template, get_template_vars
 from llama_index.types import BaseOutputParser
 
 
@@ -72,9 +71,13 @@ class PromptTemplate(BasePromptTemplate):
 
     def partial_format(self, **kwargs: Any) -> "PromptTemplate":
         """Partially format the prompt."""
-        prompt = deepcopy(self)
-        prompt.kwargs.update(kwargs)
-        return prompt
+        # NOTE: a shallow copy, the template itself is immutable
+        return self.copy(
+            update={
+                "kwargs": {**self.kwargs, **kwargs},
+                "metadata": dict(self.metadata),
+            }
+        )
 
     def format(self, llm: Optional[LLM] = None, **kwargs: Any) -> str:
         """Format the prompt into a string."""
@@ -83,7 +86,7 @@ class PromptTemplate(BasePromptTemplate):
             **self.kwargs,
             **kwargs,
         }
-        return self.template.format(**all_kwargs)
+        return get_compiled_template(self.template).format(**all_kwargs)
 
     def format_messages(
         self, llm: Optional[LLM] = None, **kwargs: Any
@@ -122,9 +125,13 @@ class ChatPromptTemplate(BasePromptTemplate):
         )
 
     def partial_format(self, **kwargs: Any) -> "ChatPromptTemplate":
-        prompt = deepcopy(self)
-        prompt.kwargs.update(kwargs)
-        return prompt
+        # NOTE: a shallow copy, the message templates are copied when formatted
+        return self.copy(
+            update={
+                "kwargs": {**self.kwargs, **kwargs},
+                "metadata": dict(self.metadata),
+            }
+        )
 
     def format(self, llm: Optional[LLM] = None, **kwargs: Any) -> str:
         del llm  # unused
@@ -144,12 +151,8 @@ class ChatPromptTemplate(BasePromptTemplate):
 
         messages = []
         for message_template in self.message_templates:
-            template_vars = get_template_vars(message_template.content or "")
-            relevant_kwargs = {
-                k: v for k, v in all_kwargs.items() if k in template_vars
-            }
             content_template = message_template.content or ""
-            content = content_template.format(**relevant_kwargs)
+            content = get_compiled_template(content_template).format(**all_kwargs)
 
             message = message_template.copy()
             message.content = content
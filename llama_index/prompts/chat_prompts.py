@@ -7,7 +7,7 @@ from llama_index.prompts.base import ChatPromptTemplate
 TEXT_QA_SYSTEM_PROMPT = ChatMessage(
     content=(
         "Вы являетесь экспертом в системе вопросов и ответов, которой доверяют во всем мире.\n"
-        "Всегда отвечайте на запрос, используя предоставленную контекстную информацию",
+        "Всегда отвечайте на запрос, используя предоставленную контекстную информацию, "
         "и без предварительного знания.\n"
         "Некоторые правила, которым следует следовать:\n"
         "1. Никогда не ссылайтесь напрямую на данный контекст в своем ответе.\n"
@@ -26,7 +26,7 @@ TEXT_QA_PROMPT_TMPL_MSGS = [
             "---------------------\ n"
             "{context_str}\n"
             "---------------------\ n"
-            "Учитывая контекстную информацию, а не предварительные знания",
+            "Учитывая контекстную информацию, а не предварительные знания, "
             "ответьте на запрос.\n"
             "Запрос: {query_str}\n"
             "Ответ: "
@@ -46,7 +46,7 @@ TREE_SUMMARIZE_PROMPT_TMPL_MSGS = [
             "---------------------\ n"
             "{context_str}\n"
             "---------------------\ n"
-            "Учитывая информацию из нескольких источников, а не предварительные знания",
+            "Учитывая информацию из нескольких источников, а не предварительные знания, "
             "ответьте на запрос.\n"
             "Запрос: {query_str}\n"
             "Ответ: "
@@ -96,7 +96,7 @@ CHAT_REFINE_TABLE_CONTEXT_TMPL_MSGS = [
             "Мы также предоставили некоторую контекстную информацию ниже."
             "{context_msg}\n"
             "---------------------\ n"
-            "Учитывая контекстную информацию и схему таблицы",
+            "Учитывая контекстную информацию и схему таблицы, "
             "доработайте первоначальный ответ, чтобы он стал лучше "
             " отвечай на вопрос."
             "Если контекст бесполезен, верните исходный ответ."
@@ -63,7 +63,7 @@ DEFAULT_QUERY_PROMPT = PromptTemplate(
 DEFAULT_QUERY_PROMPT_MULTIPLE_TMPL = (
 
     "Ниже приведены некоторые варианты. Он представлен в пронумерованном "
-    "список (от 1 до {num_chunks})",
+    "список (от 1 до {num_chunks})"
     "где каждому элементу в списке соответствует краткое описание.\n"
     "---------------------\ n"
     "{context_list}"
@@ -106,7 +106,7 @@ DEFAULT_TEXT_QA_PROMPT_TMPL = (
 "---------------------\ n"
 "{context_str}\n"
 "---------------------\ n"
-"Учитывая контекстную информацию, а не предварительные знания",
+"Учитывая контекстную информацию, а не предварительные знания, "
 "ответьте на запрос.\n"
 "Запрос: {query_str}\n"
 "Ответ: "
@@ -122,7 +122,7 @@ DEFAULT_TREE_SUMMARIZE_TMPL = (
     "---------------------\ n"
     "{context_str}\n"
     "---------------------\ n"
-    "Учитывая информацию из нескольких источников, а не предварительные знания",
+    "Учитывая информацию из нескольких источников, а не предварительные знания, "
     "ответьте на запрос.\n"
     "Запрос: {query_str}\n"
     "Ответ: "
@@ -149,6 +149,22 @@ DEFAULT_KEYWORD_EXTRACT_TEMPLATE = PromptTemplate(
 )
 
 
+# NOTE: used to extract keywords from several texts with a single LLM call
+DEFAULT_KEYWORD_BATCH_EXTRACT_TEMPLATE_TMPL = (
+    "Ниже приведены несколько пронумерованных текстов. Для каждого текста извлеките "
+    "до {max_keywords} ключевых слов. Избегайте стоп-слов.\n"
+    "---------------------\n"
+    "{text}\n"
+    "---------------------\n"
+    "Укажите ключевые слова для каждого текста на отдельной строке в следующем "
+    "формате, разделенном запятыми: '<номер текста>: <ключевые слова>'\n"
+)
+DEFAULT_KEYWORD_BATCH_EXTRACT_TEMPLATE = PromptTemplate(
+    DEFAULT_KEYWORD_BATCH_EXTRACT_TEMPLATE_TMPL,
+    prompt_type=PromptType.KEYWORD_EXTRACT,
+)
+
+
 # NOTE: the keyword extraction for queries can be the same as
 # the one used to build the index, but here we tune it to see if performance is better.
 DEFAULT_QUERY_KEYWORD_EXTRACT_TEMPLATE_TMPL = (
@@ -234,12 +250,12 @@ DEFAULT_TABLE_CONTEXT_TMPL = (
     "Мы также предоставили контекстную информацию ниже."
     "{context_str}\n"
     "---------------------\ n"
-    "Учитывая контекстную информацию и схему таблицы",
+    "Учитывая контекстную информацию и схему таблицы, "
     "дайте ответ на следующую задачу: {query_str}"
 )
 
 DEFAULT_TABLE_CONTEXT_QUERY = (
-    "Предоставьте высокоуровневое описание таблицы",
+    "Предоставьте высокоуровневое описание таблицы, "
     "а также описание каждого столбца в таблице."
     "Предоставьте ответы в следующем формате:\n"
     "Описание таблицы: <описание>\n"
@@ -263,7 +279,7 @@ DEFAULT_REFINE_TABLE_CONTEXT_TMPL = (
     "Мы также предоставили некоторую контекстную информацию ниже."
     "{context_msg}\n"
     "---------------------\ n"
-    "Учитывая контекстную информацию и схему таблицы",
+    "Учитывая контекстную информацию и схему таблицы, "
     "дайте ответ на следующую задачу: {query_str}\n"
     "Мы предоставили существующий ответ: {existing_answer}\n"
     "Учитывая новый контекст, уточните первоначальный ответ, чтобы он стал лучше "
@@ -1,5 +1,15 @@
-from typing import List
-from llama_index.prompts.base import BasePromptTemplate
+from functools import lru_cache
+from typing import Any, List, Tuple
+
+from llama_index.prompts.base import (
+    BasePromptTemplate,
+    PromptTemplate,
+    SelectorPromptTemplate,
+)
+from llama_index.prompts.utils import (
+    DEFAULT_COMPILED_TEMPLATE_CACHE_SIZE,
+    get_compiled_template,
+)
 
 
 def get_empty_prompt_txt(prompt: BasePromptTemplate) -> str:
@@ -9,7 +19,22 @@ def get_empty_prompt_txt(prompt: BasePromptTemplate) -> str:
     not yet been filled out. Skip variables that have already
     been partially formatted. This is used to compute the initial tokens.
 
+    The empty text of a string template is cached per template and partial
+    variables.
+
     """
+    if isinstance(prompt, SelectorPromptTemplate):
+        # formatting without an LLM uses the default template
+        return get_empty_prompt_txt(prompt.default_template)
+    if isinstance(prompt, PromptTemplate):
+        try:
+            return _get_empty_template_txt(
+                prompt.template, tuple(sorted(prompt.kwargs.items()))
+            )
+        except TypeError:
+            # unhashable partial variables
+            pass
+
     partial_kargs = prompt.kwargs
     empty_kwargs = {v: "" for v in prompt.template_vars if v not in partial_kargs}
     all_kwargs = {**partial_kargs, **empty_kwargs}
@@ -17,6 +42,16 @@ def get_empty_prompt_txt(prompt: BasePromptTemplate) -> str:
     return empty_prompt_txt
 
 
+@lru_cache(maxsize=DEFAULT_COMPILED_TEMPLATE_CACHE_SIZE)
+def _get_empty_template_txt(
+    template_str: str, partial_kwargs: Tuple[Tuple[str, Any], ...]
+) -> str:
+    compiled_template = get_compiled_template(template_str).partial_format(
+        **dict(partial_kwargs)
+    )
+    return compiled_template.format(**{v: "" for v in compiled_template.template_vars})
+
+
 def get_biggest_prompt(prompts: List[BasePromptTemplate]) -> BasePromptTemplate:
     """Get biggest prompt.
 
@@ -1,11 +1,135 @@
+from functools import lru_cache
 from string import Formatter
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
 
 from llama_index.llms.base import LLM
 
+# number of distinct template strings to keep compiled
+DEFAULT_COMPILED_TEMPLATE_CACHE_SIZE = 1024
 
-def get_template_vars(template_str: str) -> List[str]:
-    """Get template variables from a template string."""
+# (name, conversion, format spec) of a template field
+_Field = Tuple[str, Optional[str], str]
+
+
+class CompiledTemplate:
+    """A template string, parsed once.
+
+    The template is split into literal segments and the fields between them, so
+    that formatting only joins the segments with the field values, instead of
+    parsing the template again as `str.format` does.
+
+    Templates with fields `str.format` supports but that aren't plain variables
+    (e.g. "{0}", "{obj.attr}" or nested format specs) are formatted with
+    `str.format`.
+
+    """
+
+    def __init__(
+        self,
+        segments: List[str],
+        fields: List[_Field],
+        fallback_template: Optional[str] = None,
+        fallback_kwargs: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Init params.
+
+        Args:
+            segments (List[str]): Literal text around the fields, one more than
+                there are fields.
+            fields (List[_Field]): Fields of the template.
+            fallback_template (Optional[str]): Template to format with `str.format`
+                instead.
+            fallback_kwargs (Optional[Dict[str, Any]]): Partial variables of the
+                fallback template.
+
+        """
+        self._segments = segments
+        self._fields = fields
+        self._fallback_template = fallback_template
+        self._fallback_kwargs = fallback_kwargs or {}
+        self._template_vars = [name for name, _, _ in fields]
+
+    @classmethod
+    def from_template(cls, template: str) -> "CompiledTemplate":
+        """Compile a template string."""
+        segments = [""]
+        fields: List[_Field] = []
+        for literal, field_name, format_spec, conversion in Formatter().parse(template):
+            segments[-1] += literal
+            if field_name is None:
+                continue
+            format_spec = format_spec or ""
+            if not field_name.isidentifier() or "{" in format_spec:
+                return cls(
+                    segments=[],
+                    fields=[
+                        (name, None, "") for name in _parse_template_vars(template)
+                    ],
+                    fallback_template=template,
+                )
+            fields.append((field_name, conversion, format_spec))
+            segments.append("")
+        return cls(segments=segments, fields=fields)
+
+    @property
+    def template_vars(self) -> List[str]:
+        """Variables left to format, in order (with repeats)."""
+        return self._template_vars
+
+    def format(self, **kwargs: Any) -> str:
+        """Format the template, like `str.format`."""
+        if self._fallback_template is not None:
+            return self._fallback_template.format(**{**kwargs, **self._fallback_kwargs})
+
+        parts = [self._segments[0]]
+        for (name, conversion, format_spec), literal in zip(
+            self._fields, self._segments[1:]
+        ):
+            parts.append(_format_field(kwargs[name], conversion, format_spec))
+            parts.append(literal)
+        return "".join(parts)
+
+    def partial_format(self, **kwargs: Any) -> "CompiledTemplate":
+        """Fill in some variables, merging them into the literal segments.
+
+        Unlike the partial variables of a prompt, they can't be overridden when
+        formatting.
+
+        """
+        if self._fallback_template is not None:
+            return CompiledTemplate(
+                segments=[],
+                fields=[field for field in self._fields if field[0] not in kwargs],
+                fallback_template=self._fallback_template,
+                fallback_kwargs={**self._fallback_kwargs, **kwargs},
+            )
+
+        segments = [self._segments[0]]
+        fields: List[_Field] = []
+        for field, literal in zip(self._fields, self._segments[1:]):
+            name, conversion, format_spec = field
+            if name in kwargs:
+                segments[-1] += _format_field(kwargs[name], conversion, format_spec)
+                segments[-1] += literal
+            else:
+                fields.append(field)
+                segments.append(literal)
+        return CompiledTemplate(segments=segments, fields=fields)
+
+
+def _format_field(value: Any, conversion: Optional[str], format_spec: str) -> str:
+    if conversion == "r":
+        value = repr(value)
+    elif conversion == "s":
+        value = str(value)
+    elif conversion == "a":
+        value = ascii(value)
+    if isinstance(value, str) and not format_spec:
+        return value
+    return format(value, format_spec)
+
+
+def _parse_template_vars(template_str: str) -> List[str]:
     variables = []
     formatter = Formatter()
 
@@ -16,5 +140,20 @@ def get_template_vars(template_str: str) -> List[str]:
     return variables
 
 
+@lru_cache(maxsize=DEFAULT_COMPILED_TEMPLATE_CACHE_SIZE)
+def get_compiled_template(template_str: str) -> CompiledTemplate:
+    """Get a template string compiled (cached per template string).
+
+    NOTE: the compiled template is shared, don't mutate it.
+
+    """
+    return CompiledTemplate.from_template(template_str)
+
+
+def get_template_vars(template_str: str) -> List[str]:
+    """Get template variables from a template string."""
+    return list(get_compiled_template(template_str).template_vars)
+
+
 def is_chat_model(llm: LLM) -> bool:
     return llm.metadata.is_chat_model
@@ -17,6 +17,9 @@ from llama_index.query_engine.router_query_engine import (
     RouterQueryEngine,
     ToolRetrieverRouterQueryEngine,
 )
+from llama_index.query_engine.semantic_cache_query_engine import (
+    SemanticCacheQueryEngine,
+)
 from llama_index.query_engine.sql_join_query_engine import SQLJoinQueryEngine
 from llama_index.query_engine.sql_vector_query_engine import SQLAutoVectorQueryEngine
 from llama_index.query_engine.sub_question_query_engine import (
@@ -44,4 +47,5 @@ __all__ = [
     "FLAREInstructQueryEngine",
     "PandasQueryEngine",
     "KnowledgeGraphQueryEngine",
+    "SemanticCacheQueryEngine",
 ]
@@ -22,7 +22,7 @@ from llama_index.text_splitter.types import TextSplitter
 CITATION_QA_TEMPLATE = PromptTemplate(
 
     "Пожалуйста, дайте ответ, основанный исключительно на предоставленных источниках."
-    "Когда ссылаешься на информацию из источника",
+    "Когда ссылаешься на информацию из источника, "
     "процитируйте соответствующий источник (источники), используя их соответствующие номера."
     "Каждый ответ должен включать по крайней мере одну цитату из источника."
     "Цитируйте источник только тогда, когда вы явно ссылаетесь на него. "
@@ -33,7 +33,7 @@ CITATION_QA_TEMPLATE = PromptTemplate(
     "Источник 2:\n"
     "Вода мокрая, когда небо красное.\n"
     "Запрос: Когда вода становится влажной?\n"
-    "Ответ: Вода будет влажной, когда небо станет красным [2]",
+    "Ответ: Вода будет влажной, когда небо станет красным [2], "
     "который происходит вечером [1].\n"
     "- Теперь твоя очередь. Ниже приведены несколько пронумерованных источников информации:"
     "\n-------\n"
@@ -46,7 +46,7 @@ CITATION_QA_TEMPLATE = PromptTemplate(
 CITATION_REFINE_TEMPLATE = PromptTemplate(
 
     "Пожалуйста, дайте ответ, основанный исключительно на предоставленных источниках."
-"Когда ссылаешься на информацию из источника",
+"Когда ссылаешься на информацию из источника, "
 "процитируйте соответствующий источник (источники), используя их соответствующие номера."
 "Каждый ответ должен включать по крайней мере одну цитату из источника."
 "Цитируйте источник только тогда, когда вы явно ссылаетесь на него. "
@@ -57,7 +57,7 @@ CITATION_REFINE_TEMPLATE = PromptTemplate(
 "Источник 2:\n"
 "Вода мокрая, когда небо красное.\n"
 "Запрос: Когда вода становится влажной?\n"
-"Ответ: Вода будет влажной, когда небо станет красным [2]",
+"Ответ: Вода будет влажной, когда небо станет красным [2], "
 "который происходит вечером [1].\n"
 "Теперь твоя очередь."
 "Мы предоставили существующий ответ: {existing_answer}"
@@ -121,6 +121,25 @@ class RetrieverQueryEngine(BaseQueryEngine):
 
         return nodes
 
+    def retrieve_batch(
+        self, query_bundles: List[QueryBundle]
+    ) -> List[List[NodeWithScore]]:
+        """Retrieve nodes for several queries, sharing work where the retriever can."""
+        nodes_batch = self._retriever.retrieve_batch(query_bundles)
+        return [
+            self._apply_node_postprocessors(nodes, query_bundle=query_bundle)
+            for nodes, query_bundle in zip(nodes_batch, query_bundles)
+        ]
+
+    async def aretrieve_batch(
+        self, query_bundles: List[QueryBundle]
+    ) -> List[List[NodeWithScore]]:
+        nodes_batch = await self._retriever.aretrieve_batch(query_bundles)
+        return [
+            self._apply_node_postprocessors(nodes, query_bundle=query_bundle)
+            for nodes, query_bundle in zip(nodes_batch, query_bundles)
+        ]
+
     def with_retriever(self, retriever: BaseRetriever) -> "RetrieverQueryEngine":
         return RetrieverQueryEngine(
             retriever=retriever,
@@ -1,7 +1,7 @@
 import logging
 from typing import Callable, List, Optional, Sequence
 
-from llama_index.async_utils import run_async_tasks
+from llama_index.async_utils import run_jobs
 from llama_index.callbacks.base import CallbackManager
 from llama_index.callbacks.schema import CBEventType, EventPayload
 from llama_index.indices.base_retriever import BaseRetriever
@@ -180,7 +180,7 @@ class RouterQueryEngine(BaseQueryEngine):
                     selected_query_engine = self._query_engines[engine_ind]
                     tasks.append(selected_query_engine.aquery(query_bundle))
 
-                responses = run_async_tasks(tasks)
+                responses = await run_jobs(tasks)
                 if len(responses) > 1:
                     final_response = await acombine_responses(
                         self._summarizer, responses, query_bundle
@@ -320,7 +320,7 @@ class ToolRetrieverRouterQueryEngine(BaseQueryEngine):
             for query_engine_tool in query_engine_tools:
                 query_engine = query_engine_tool.query_engine
                 tasks.append(query_engine.aquery(query_bundle))
-            responses = run_async_tasks(tasks)
+            responses = await run_jobs(tasks)
             if len(responses) > 1:
                 final_response = await acombine_responses(
                     self._summarizer, responses, query_bundle
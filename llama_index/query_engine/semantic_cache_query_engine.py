@@ -0,0 +1,324 @@
+"""Semantic response cache for query engines."""
+import hashlib
+from typing import Any, Dict, List, Optional
+
+from llama_index.callbacks.base import CallbackManager
+from llama_index.callbacks.base_handler import BaseCallbackHandler
+from llama_index.callbacks.schema import CBEventType, EventPayload
+from llama_index.embeddings.base import BaseEmbedding
+from llama_index.indices.query.base import BaseQueryEngine
+from llama_index.indices.query.schema import QueryBundle
+from llama_index.response.schema import RESPONSE_TYPE, Response
+from llama_index.schema import (
+    NodeRelationship,
+    NodeWithScore,
+    RelatedNodeInfo,
+    TextNode,
+)
+from llama_index.storage.docstore.utils import doc_to_json, json_to_doc
+from llama_index.storage.kvstore.simple_kvstore import SimpleKVStore
+from llama_index.storage.kvstore.types import BaseKVStore
+from llama_index.utils import globals_helper
+from llama_index.vector_stores.simple import SimpleVectorStore
+from llama_index.vector_stores.types import (
+    NodeWithEmbedding,
+    VectorStore,
+    VectorStoreQuery,
+)
+
+DEFAULT_NAMESPACE = "semantic_cache"
+DEFAULT_SIMILARITY_THRESHOLD = 0.95
+
+
+class _CacheInvalidationHandler(BaseCallbackHandler):
+    """Invalidates cached responses when a ref doc is deleted from an index."""
+
+    def __init__(self, cache: "SemanticCacheQueryEngine") -> None:
+        self._cache = cache
+        event_types = [
+            event_type for event_type in CBEventType if event_type != CBEventType.DELETE
+        ]
+        super().__init__(
+            event_starts_to_ignore=list(CBEventType),
+            event_ends_to_ignore=event_types,
+        )
+
+    def on_event_start(
+        self,
+        event_type: CBEventType,
+        payload: Optional[Dict[str, Any]] = None,
+        event_id: str = "",
+        **kwargs: Any,
+    ) -> str:
+        return event_id
+
+    def on_event_end(
+        self,
+        event_type: CBEventType,
+        payload: Optional[Dict[str, Any]] = None,
+        event_id: str = "",
+        **kwargs: Any,
+    ) -> None:
+        if payload is not None and EventPayload.REF_DOC_ID in payload:
+            self._cache.invalidate_ref_doc(payload[EventPayload.REF_DOC_ID])
+
+    def start_trace(self, trace_id: Optional[str] = None) -> None:
+        return
+
+    def end_trace(
+        self,
+        trace_id: Optional[str] = None,
+        trace_map: Optional[Dict[str, List[str]]] = None,
+    ) -> None:
+        return
+
+
+class SemanticCacheQueryEngine(BaseQueryEngine):
+    """Semantic cache query engine.
+
+    Wraps a query engine to serve repeated and paraphrased queries from a cache of
+    its responses. A query is first looked up by its exact text, then by the
+    similarity of its embedding to the embeddings of the cached queries: if the
+    most similar one is at least `similarity_threshold` similar, its response is
+    served.
+
+    Responses are stored, with their source nodes, in a key-value store, and the
+    query embeddings in a vector store. A response is invalidated when the ref doc
+    of any of its source nodes is updated or deleted through an index sharing the
+    callback manager of the cache (or one passed to `watch_callback_manager`).
+
+    Each lookup is reported as a CACHE callback event, with whether it was a hit
+    and the LLM tokens it saved: the tokens of the query, source nodes and
+    response, i.e. the least a synthesis over the sources costs.
+
+    Args:
+        query_engine (BaseQueryEngine): The query engine to cache responses of.
+        embed_model (BaseEmbedding): An embedding model, for the queries.
+        kvstore (Optional[BaseKVStore]): Key-value store for the responses.
+            Defaults to an in-memory store.
+        vector_store (Optional[VectorStore]): Vector store for the query
+            embeddings. Defaults to an in-memory store.
+        similarity_threshold (float): Minimum similarity of a cached query to a
+            query, for its response to be served.
+        namespace (str): Namespace of the cache in the key-value store.
+        callback_manager (Optional[CallbackManager]): A callback manager. Defaults
+            to the callback manager of the query engine.
+    """
+
+    def __init__(
+        self,
+        query_engine: BaseQueryEngine,
+        embed_model: BaseEmbedding,
+        kvstore: Optional[BaseKVStore] = None,
+        vector_store: Optional[VectorStore] = None,
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        namespace: str = DEFAULT_NAMESPACE,
+        callback_manager: Optional[CallbackManager] = None,
+    ) -> None:
+        self._query_engine = query_engine
+        self._embed_model = embed_model
+        self._kvstore = kvstore or SimpleKVStore()
+        self._vector_store = vector_store or SimpleVectorStore()
+        self._similarity_threshold = similarity_threshold
+        self._response_collection = f"{namespace}/data"
+        self._ref_doc_collection = f"{namespace}/ref_doc_info"
+
+        self._num_hits = 0
+        self._num_misses = 0
+        self._saved_tokens = 0
+
+        super().__init__(callback_manager or query_engine.callback_manager)
+        self._invalidation_handler = _CacheInvalidationHandler(self)
+        self.watch_callback_manager(self.callback_manager)
+
+    def watch_callback_manager(self, callback_manager: CallbackManager) -> None:
+        """Invalidate responses on the ref doc deletions reported to a manager."""
+        if self._invalidation_handler not in callback_manager.handlers:
+            callback_manager.add_handler(self._invalidation_handler)
+
+    @property
+    def num_hits(self) -> int:
+        """Number of queries served from the cache."""
+        return self._num_hits
+
+    @property
+    def num_misses(self) -> int:
+        """Number of queries passed to the query engine."""
+        return self._num_misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of the queries served from the cache."""
+        num_queries = self._num_hits + self._num_misses
+        return self._num_hits / num_queries if num_queries > 0 else 0.0
+
+    @property
+    def saved_tokens(self) -> int:
+        """LLM tokens saved by the cache hits (estimated)."""
+        return self._saved_tokens
+
+    def invalidate_ref_doc(self, ref_doc_id: str) -> None:
+        """Invalidate the responses with a source node from a ref doc."""
+        ref_doc_info = self._kvstore.get(
+            ref_doc_id, collection=self._ref_doc_collection
+        )
+        if ref_doc_info is None:
+            return
+
+        for entry_id in ref_doc_info["entry_ids"]:
+            self._kvstore.delete(entry_id, collection=self._response_collection)
+            self._vector_store.delete(entry_id)
+        self._kvstore.delete(ref_doc_id, collection=self._ref_doc_collection)
+
+    def _query(self, query_bundle: QueryBundle) -> RESPONSE_TYPE:
+        entry = self._lookup_exact(query_bundle)
+        if entry is not None:
+            return self._on_hit(entry)
+
+        query_embedding = query_bundle.embedding
+        if query_embedding is None:
+            query_embedding = self._embed_model.get_agg_embedding_from_queries(
+                query_bundle.embedding_strs
+            )
+        entry = self._lookup_similar(query_embedding)
+        if entry is not None:
+            return self._on_hit(entry)
+
+        response = self._query_engine.query(query_bundle)
+        self._on_miss(query_bundle, query_embedding, response)
+        return response
+
+    async def _aquery(self, query_bundle: QueryBundle) -> RESPONSE_TYPE:
+        entry = self._lookup_exact(query_bundle)
+        if entry is not None:
+            return self._on_hit(entry)
+
+        query_embedding = query_bundle.embedding
+        if query_embedding is None:
+            query_embedding = await self._embed_model.aget_agg_embedding_from_queries(
+                query_bundle.embedding_strs
+            )
+        entry = self._lookup_similar(query_embedding)
+        if entry is not None:
+            return self._on_hit(entry)
+
+        response = await self._query_engine.aquery(query_bundle)
+        self._on_miss(query_bundle, query_embedding, response)
+        return response
+
+    def _lookup_exact(self, query_bundle: QueryBundle) -> Optional[dict]:
+        return self._kvstore.get(
+            _get_entry_id(query_bundle.query_str),
+            collection=self._response_collection,
+        )
+
+    def _lookup_similar(self, query_embedding: List[float]) -> Optional[dict]:
+        query_result = self._vector_store.query(
+            VectorStoreQuery(query_embedding=query_embedding, similarity_top_k=1)
+        )
+        if not query_result.ids or not query_result.similarities:
+            return None
+        if query_result.similarities[0] < self._similarity_threshold:
+            return None
+        return self._kvstore.get(
+            query_result.ids[0], collection=self._response_collection
+        )
+
+    def _on_hit(self, entry: dict) -> Response:
+        self._num_hits += 1
+        self._saved_tokens += entry["num_tokens"]
+        self._report(cache_hit=True, saved_tokens=entry["num_tokens"])
+        return Response(
+            response=entry["response"],
+            source_nodes=[
+                NodeWithScore(
+                    node=json_to_doc(source_node["node"]), score=source_node["score"]
+                )
+                for source_node in entry["source_nodes"]
+            ],
+            metadata=entry["metadata"],
+        )
+
+    def _on_miss(
+        self,
+        query_bundle: QueryBundle,
+        query_embedding: List[float],
+        response: RESPONSE_TYPE,
+    ) -> None:
+        self._num_misses += 1
+        self._report(cache_hit=False, saved_tokens=0)
+        # streaming and structured responses aren't cached
+        if isinstance(response, Response):
+            self._add(query_bundle, query_embedding, response)
+
+    def _add(
+        self,
+        query_bundle: QueryBundle,
+        query_embedding: List[float],
+        response: Response,
+    ) -> None:
+        """Cache a response, indexed by the embedding of its query."""
+        entry_id = _get_entry_id(query_bundle.query_str)
+        tokenizer = globals_helper.tokenizer
+        num_tokens = len(tokenizer(query_bundle.query_str)) + len(
+            tokenizer(response.response or "")
+        )
+        for source_node in response.source_nodes:
+            num_tokens += len(tokenizer(source_node.node.get_content()))
+
+        self._kvstore.put(
+            entry_id,
+            {
+                "query_str": query_bundle.query_str,
+                "response": response.response,
+                "source_nodes": [
+                    {"node": doc_to_json(source_node.node), "score": source_node.score}
+                    for source_node in response.source_nodes
+                ],
+                "metadata": response.metadata,
+                "num_tokens": num_tokens,
+            },
+            collection=self._response_collection,
+        )
+
+        ref_doc_ids = {
+            source_node.node.ref_doc_id
+            for source_node in response.source_nodes
+            if source_node.node.ref_doc_id is not None
+        }
+        for ref_doc_id in ref_doc_ids:
+            ref_doc_info = self._kvstore.get(
+                ref_doc_id, collection=self._ref_doc_collection
+            ) or {"entry_ids": []}
+            if entry_id not in ref_doc_info["entry_ids"]:
+                ref_doc_info["entry_ids"].append(entry_id)
+            self._kvstore.put(
+                ref_doc_id, ref_doc_info, collection=self._ref_doc_collection
+            )
+
+        # the entry is its own ref doc, to delete its embedding by entry id
+        query_node = TextNode(
+            id_=entry_id,
+            text=query_bundle.query_str,
+            relationships={NodeRelationship.SOURCE: RelatedNodeInfo(node_id=entry_id)},
+        )
+        self._vector_store.delete(entry_id)
+        self._vector_store.add(
+            [NodeWithEmbedding(node=query_node, embedding=query_embedding)]
+        )
+
+    def _report(self, cache_hit: bool, saved_tokens: int) -> None:
+        payload: Dict[str, Any] = {
+            EventPayload.CACHE_HIT: cache_hit,
+            EventPayload.SAVED_TOKENS: saved_tokens,
+        }
+        event_id = self.callback_manager.on_event_start(
+            CBEventType.CACHE, payload=payload
+        )
+        self.callback_manager.on_event_end(
+            CBEventType.CACHE, payload=payload, event_id=event_id
+        )
+
+
+def _get_entry_id(query_str: str) -> str:
+    return hashlib.sha256(query_str.encode("utf-8")).hexdigest()
@@ -1,19 +1,20 @@
-import asyncio
 import logging
-from typing import List, Optional, Sequence, cast
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, cast
 
 try:
     from pydantic.v1 import BaseModel
 except ImportError:
     from pydantic import BaseModel
 
-from llama_index.async_utils import run_async_tasks
+from llama_index.async_utils import DEFAULT_NUM_WORKERS, asyncio_run, run_jobs
 from llama_index.bridge.langchain import get_color_mapping, print_text
 from llama_index.callbacks.base import CallbackManager
 from llama_index.callbacks.schema import CBEventType, EventPayload
 from llama_index.indices.query.base import BaseQueryEngine
 from llama_index.indices.query.schema import QueryBundle
 from llama_index.indices.service_context import ServiceContext
+from llama_index.query_engine.retriever_query_engine import RetrieverQueryEngine
 from llama_index.question_gen.llm_generators import LLMQuestionGenerator
 from llama_index.question_gen.openai_generator import OpenAIQuestionGenerator
 from llama_index.question_gen.types import BaseQuestionGenerator, SubQuestion
@@ -54,6 +55,14 @@ class SubQuestionQueryEngine(BaseQueryEngine):
             Defaults to True
         use_async (bool): whether to execute the sub questions with asyncio.
             Defaults to True
+        use_batch (bool): whether to execute the sub questions in batches.
+            Sub questions are grouped by tool, and those of a tool backed by a
+            retriever query engine are retrieved in a single batched call (so
+            that their queries are embedded together), then synthesized
+            concurrently. The response also lists the nodes retrieved for the
+            sub questions as sources, once each. Defaults to False
+        max_concurrency (int): maximum number of sub questions executed at
+            once with asyncio or in batches.
     """
 
     def __init__(
@@ -64,6 +73,8 @@ class SubQuestionQueryEngine(BaseQueryEngine):
         callback_manager: Optional[CallbackManager] = None,
         verbose: bool = True,
         use_async: bool = False,
+        use_batch: bool = False,
+        max_concurrency: int = DEFAULT_NUM_WORKERS,
     ) -> None:
         self._question_gen = question_gen
         self._response_synthesizer = response_synthesizer
@@ -73,6 +84,8 @@ class SubQuestionQueryEngine(BaseQueryEngine):
         }
         self._verbose = verbose
         self._use_async = use_async
+        self._use_batch = use_batch
+        self._max_concurrency = max_concurrency
         super().__init__(callback_manager)
 
     @classmethod
@@ -84,6 +97,8 @@ class SubQuestionQueryEngine(BaseQueryEngine):
         service_context: Optional[ServiceContext] = None,
         verbose: bool = True,
         use_async: bool = True,
+        use_batch: bool = False,
+        max_concurrency: int = DEFAULT_NUM_WORKERS,
     ) -> "SubQuestionQueryEngine":
         callback_manager = None
         if service_context is not None:
@@ -120,6 +135,8 @@ class SubQuestionQueryEngine(BaseQueryEngine):
             callback_manager=callback_manager,
             verbose=verbose,
             use_async=use_async,
+            use_batch=use_batch,
+            max_concurrency=max_concurrency,
         )
 
     def _query(self, query_bundle: QueryBundle) -> RESPONSE_TYPE:
@@ -133,13 +150,19 @@ class SubQuestionQueryEngine(BaseQueryEngine):
             if self._verbose:
                 print_text(f"Generated {len(sub_questions)} sub questions.\n")
 
-            if self._use_async:
+            if self._use_batch:
+                qa_pairs_all = asyncio_run(
+                    self._abatch_query_subqs(sub_questions, colors=colors)
+                )
+            elif self._use_async:
                 tasks = [
                     self._aquery_subq(sub_q, color=colors[str(ind)])
                     for ind, sub_q in enumerate(sub_questions)
                 ]
 
-                qa_pairs_all = run_async_tasks(tasks)
+                qa_pairs_all = asyncio_run(
+                    run_jobs(tasks, workers=self._max_concurrency)
+                )
                 qa_pairs_all = cast(List[Optional[SubQuestionAnswerPair]], qa_pairs_all)
             else:
                 qa_pairs_all = [
@@ -155,6 +178,7 @@ class SubQuestionQueryEngine(BaseQueryEngine):
             response = self._response_synthesizer.synthesize(
                 query=query_bundle,
                 nodes=nodes,
+                additional_source_nodes=self._get_additional_source_nodes(qa_pairs),
             )
 
             query_event.on_end(payload={EventPayload.RESPONSE: response})
@@ -174,13 +198,18 @@ class SubQuestionQueryEngine(BaseQueryEngine):
             if self._verbose:
                 print_text(f"Generated {len(sub_questions)} sub questions.\n")
 
-            tasks = [
-                self._aquery_subq(sub_q, color=colors[str(ind)])
-                for ind, sub_q in enumerate(sub_questions)
-            ]
+            if self._use_batch:
+                qa_pairs_all = await self._abatch_query_subqs(
+                    sub_questions, colors=colors
+                )
+            else:
+                tasks = [
+                    self._aquery_subq(sub_q, color=colors[str(ind)])
+                    for ind, sub_q in enumerate(sub_questions)
+                ]
 
-            qa_pairs_all = await asyncio.gather(*tasks)
-            qa_pairs_all = cast(List[Optional[SubQuestionAnswerPair]], qa_pairs_all)
+                qa_pairs_all = await run_jobs(tasks, workers=self._max_concurrency)
+                qa_pairs_all = cast(List[Optional[SubQuestionAnswerPair]], qa_pairs_all)
 
             # filter out sub questions that failed
             qa_pairs: List[SubQuestionAnswerPair] = list(filter(None, qa_pairs_all))
@@ -190,6 +219,7 @@ class SubQuestionQueryEngine(BaseQueryEngine):
             response = await self._response_synthesizer.asynthesize(
                 query=query_bundle,
                 nodes=nodes,
+                additional_source_nodes=self._get_additional_source_nodes(qa_pairs),
             )
 
             query_event.on_end(payload={EventPayload.RESPONSE: response})
@@ -202,6 +232,140 @@ class SubQuestionQueryEngine(BaseQueryEngine):
         )
         return NodeWithScore(node=TextNode(text=node_text))
 
+    def _get_additional_source_nodes(
+        self, qa_pairs: List[SubQuestionAnswerPair]
+    ) -> Optional[List[NodeWithScore]]:
+        """Get the nodes retrieved for the sub questions, without duplicates.
+
+        A node retrieved for several sub questions is kept once, with its best
+        score. Only used when executing the sub questions in batches.
+
+        """
+        if not self._use_batch:
+            return None
+
+        source_nodes: Dict[str, NodeWithScore] = {}
+        for qa_pair in qa_pairs:
+            for source_node in qa_pair.sources or []:
+                node_id = source_node.node.node_id
+                existing = source_nodes.get(node_id)
+                if existing is None or (source_node.score or 0.0) > (
+                    existing.score or 0.0
+                ):
+                    source_nodes[node_id] = source_node
+        return list(source_nodes.values())
+
+    async def _abatch_query_subqs(
+        self, sub_questions: List[SubQuestion], colors: Dict[str, str]
+    ) -> List[Optional[SubQuestionAnswerPair]]:
+        """Execute the sub questions in batches.
+
+        Sub questions are grouped by tool. Those of a tool backed by a retriever
+        query engine are retrieved together, and answered by synthesizing over
+        the retrieved nodes; the others are queried. At most `max_concurrency`
+        tools are retrieved from, or sub questions answered, at once.
+
+        """
+        sub_q_inds_by_tool: Dict[str, List[int]] = defaultdict(list)
+        for ind, sub_q in enumerate(sub_questions):
+            sub_q_inds_by_tool[sub_q.tool_name].append(ind)
+
+        retrieve_jobs = [
+            self._aretrieve_subqs(
+                [sub_questions[ind] for ind in inds],
+                colors=[colors[str(ind)] for ind in inds],
+            )
+            for inds in sub_q_inds_by_tool.values()
+        ]
+        nodes_by_tool = await run_jobs(retrieve_jobs, workers=self._max_concurrency)
+
+        nodes_by_sub_q: Dict[int, Optional[List[NodeWithScore]]] = {}
+        for inds, nodes_batch in zip(sub_q_inds_by_tool.values(), nodes_by_tool):
+            if nodes_batch is not None:
+                nodes_by_sub_q.update(zip(inds, nodes_batch))
+
+        jobs = []
+        for ind, sub_q in enumerate(sub_questions):
+            color = colors[str(ind)]
+            if ind not in nodes_by_sub_q:
+                jobs.append(self._aquery_subq(sub_q, color=color))
+            else:
+                jobs.append(
+                    self._asynthesize_subq(sub_q, nodes_by_sub_q[ind], color=color)
+                )
+        return await run_jobs(jobs, workers=self._max_concurrency)
+
+    async def _aretrieve_subqs(
+        self, sub_qs: List[SubQuestion], colors: List[str]
+    ) -> Optional[List[Optional[List[NodeWithScore]]]]:
+        """Retrieve nodes for sub questions of the same tool, in a single batch.
+
+        Returns None if the tool can't retrieve, and no nodes for each sub
+        question if the retrieval failed.
+
+        """
+        tool_name = sub_qs[0].tool_name
+        query_engine = self._query_engines[tool_name]
+        if not isinstance(query_engine, RetrieverQueryEngine):
+            return None
+
+        if self._verbose:
+            for sub_q, color in zip(sub_qs, colors):
+                print_text(f"[{tool_name}] Q: {sub_q.sub_question}\n", color=color)
+
+        try:
+            with self.callback_manager.event(CBEventType.RETRIEVE) as event:
+                nodes_batch = await query_engine.aretrieve_batch(
+                    [QueryBundle(sub_q.sub_question) for sub_q in sub_qs]
+                )
+                event.on_end(
+                    payload={
+                        EventPayload.NODES: [
+                            node for nodes in nodes_batch for node in nodes
+                        ]
+                    }
+                )
+        except ValueError:
+            logger.warn(f"[{tool_name}] Failed to retrieve {len(sub_qs)} questions")
+            return [None for _ in sub_qs]
+        return cast(List[Optional[List[NodeWithScore]]], nodes_batch)
+
+    async def _asynthesize_subq(
+        self,
+        sub_q: SubQuestion,
+        nodes: Optional[List[NodeWithScore]],
+        color: Optional[str] = None,
+    ) -> Optional[SubQuestionAnswerPair]:
+        """Answer a sub question given the nodes retrieved for it."""
+        if nodes is None:
+            # the retrieval failed
+            return None
+
+        query_engine = cast(RetrieverQueryEngine, self._query_engines[sub_q.tool_name])
+        try:
+            with self.callback_manager.event(
+                CBEventType.SUB_QUESTION,
+                payload={EventPayload.SUB_QUESTION: SubQuestionAnswerPair(sub_q=sub_q)},
+            ) as event:
+                response = await query_engine.asynthesize(
+                    QueryBundle(sub_q.sub_question), nodes
+                )
+                response_text = str(response)
+
+                if self._verbose:
+                    print_text(f"[{sub_q.tool_name}] A: {response_text}\n", color=color)
+
+                qa_pair = SubQuestionAnswerPair(
+                    sub_q=sub_q, answer=response_text, sources=response.source_nodes
+                )
+
+                event.on_end(payload={EventPayload.SUB_QUESTION: qa_pair})
+
+            return qa_pair
+        except ValueError:
+            logger.warn(f"[{sub_q.tool_name}] Failed to run {sub_q.sub_question}")
+            return None
+
     async def _aquery_subq(
         self, sub_q: SubQuestion, color: Optional[str] = None
     ) -> Optional[SubQuestionAnswerPair]:
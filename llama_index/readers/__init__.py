@@ -10,46 +10,90 @@ definition of a Document - the bare minimum is a `text` property.
 
 """
 
-from llama_index.readers.bagel import BagelReader
-from llama_index.readers.chatgpt_plugin import ChatGPTRetrievalPluginReader
-from llama_index.readers.chroma import ChromaReader
-from llama_index.readers.deeplake import DeepLakeReader
-from llama_index.readers.discord_reader import DiscordReader
-from llama_index.readers.elasticsearch import ElasticsearchReader
-from llama_index.readers.faiss import FaissReader
+from typing import TYPE_CHECKING
 
-# readers
-from llama_index.readers.file.base import SimpleDirectoryReader
-from llama_index.readers.github_readers.github_repository_reader import (
-    GithubRepositoryReader,
-)
-from llama_index.readers.google_readers.gdocs import GoogleDocsReader
-from llama_index.readers.json import JSONReader
-from llama_index.readers.make_com.wrapper import MakeWrapper
-from llama_index.readers.mbox import MboxReader
-from llama_index.readers.milvus import MilvusReader
-from llama_index.readers.mongo import SimpleMongoReader
-from llama_index.readers.metal import MetalReader
-from llama_index.readers.myscale import MyScaleReader
-from llama_index.readers.notion import NotionPageReader
-from llama_index.readers.obsidian import ObsidianReader
-from llama_index.readers.pinecone import PineconeReader
-from llama_index.readers.psychic import PsychicReader
-from llama_index.readers.qdrant import QdrantReader
-from llama_index.schema import Document
-from llama_index.readers.slack import SlackReader
-from llama_index.readers.steamship.file_reader import SteamshipFileReader
-from llama_index.readers.string_iterable import StringIterableReader
-from llama_index.readers.twitter import TwitterTweetReader
-from llama_index.readers.weaviate.reader import WeaviateReader
-from llama_index.readers.web import (
-    BeautifulSoupWebReader,
-    RssReader,
-    SimpleWebPageReader,
-    TrafilaturaWebReader,
-)
-from llama_index.readers.wikipedia import WikipediaReader
-from llama_index.readers.youtube_transcript import YoutubeTranscriptReader
+from llama_index.utils import get_lazy_getattr
+
+if TYPE_CHECKING:
+    from llama_index.readers.bagel import BagelReader
+    from llama_index.readers.chatgpt_plugin import ChatGPTRetrievalPluginReader
+    from llama_index.readers.chroma import ChromaReader
+    from llama_index.readers.deeplake import DeepLakeReader
+    from llama_index.readers.discord_reader import DiscordReader
+    from llama_index.readers.elasticsearch import ElasticsearchReader
+    from llama_index.readers.faiss import FaissReader
+
+    # readers
+    from llama_index.readers.file.base import SimpleDirectoryReader
+    from llama_index.readers.github_readers.github_repository_reader import (
+        GithubRepositoryReader,
+    )
+    from llama_index.readers.google_readers.gdocs import GoogleDocsReader
+    from llama_index.readers.json import JSONReader
+    from llama_index.readers.make_com.wrapper import MakeWrapper
+    from llama_index.readers.mbox import MboxReader
+    from llama_index.readers.milvus import MilvusReader
+    from llama_index.readers.mongo import SimpleMongoReader
+    from llama_index.readers.metal import MetalReader
+    from llama_index.readers.myscale import MyScaleReader
+    from llama_index.readers.notion import NotionPageReader
+    from llama_index.readers.obsidian import ObsidianReader
+    from llama_index.readers.pinecone import PineconeReader
+    from llama_index.readers.psychic import PsychicReader
+    from llama_index.readers.qdrant import QdrantReader
+    from llama_index.schema import Document
+    from llama_index.readers.slack import SlackReader
+    from llama_index.readers.steamship.file_reader import SteamshipFileReader
+    from llama_index.readers.string_iterable import StringIterableReader
+    from llama_index.readers.twitter import TwitterTweetReader
+    from llama_index.readers.weaviate.reader import WeaviateReader
+    from llama_index.readers.web import (
+        BeautifulSoupWebReader,
+        RssReader,
+        SimpleWebPageReader,
+        TrafilaturaWebReader,
+    )
+    from llama_index.readers.wikipedia import WikipediaReader
+    from llama_index.readers.youtube_transcript import YoutubeTranscriptReader
+
+_LAZY_IMPORTS = {
+    "BagelReader": "llama_index.readers.bagel",
+    "ChatGPTRetrievalPluginReader": "llama_index.readers.chatgpt_plugin",
+    "ChromaReader": "llama_index.readers.chroma",
+    "DeepLakeReader": "llama_index.readers.deeplake",
+    "DiscordReader": "llama_index.readers.discord_reader",
+    "ElasticsearchReader": "llama_index.readers.elasticsearch",
+    "FaissReader": "llama_index.readers.faiss",
+    "SimpleDirectoryReader": "llama_index.readers.file.base",
+    "GithubRepositoryReader": (
+        "llama_index.readers.github_readers.github_repository_reader"
+    ),
+    "GoogleDocsReader": "llama_index.readers.google_readers.gdocs",
+    "JSONReader": "llama_index.readers.json",
+    "MakeWrapper": "llama_index.readers.make_com.wrapper",
+    "MboxReader": "llama_index.readers.mbox",
+    "MilvusReader": "llama_index.readers.milvus",
+    "SimpleMongoReader": "llama_index.readers.mongo",
+    "MetalReader": "llama_index.readers.metal",
+    "MyScaleReader": "llama_index.readers.myscale",
+    "NotionPageReader": "llama_index.readers.notion",
+    "ObsidianReader": "llama_index.readers.obsidian",
+    "PineconeReader": "llama_index.readers.pinecone",
+    "PsychicReader": "llama_index.readers.psychic",
+    "QdrantReader": "llama_index.readers.qdrant",
+    "Document": "llama_index.schema",
+    "SlackReader": "llama_index.readers.slack",
+    "SteamshipFileReader": "llama_index.readers.steamship.file_reader",
+    "StringIterableReader": "llama_index.readers.string_iterable",
+    "TwitterTweetReader": "llama_index.readers.twitter",
+    "WeaviateReader": "llama_index.readers.weaviate.reader",
+    "BeautifulSoupWebReader": "llama_index.readers.web",
+    "RssReader": "llama_index.readers.web",
+    "SimpleWebPageReader": "llama_index.readers.web",
+    "TrafilaturaWebReader": "llama_index.readers.web",
+    "WikipediaReader": "llama_index.readers.wikipedia",
+    "YoutubeTranscriptReader": "llama_index.readers.youtube_transcript",
+}
 
 __all__ = [
     "WikipediaReader",
@@ -87,3 +131,5 @@ __all__ = [
     "ChatGPTRetrievalPluginReader",
     "BagelReader",
 ]
+
+__getattr__ = get_lazy_getattr(__name__, _LAZY_IMPORTS)
@@ -1,11 +1,12 @@
 """Base reader class."""
 from abc import abstractmethod
-from typing import Any, List
-
-from llama_index.bridge.langchain import Document as LCDocument
+from typing import TYPE_CHECKING, Any, Iterable, List
 
 from llama_index.schema import Document
 
+if TYPE_CHECKING:
+    from llama_index.bridge.langchain import Document as LCDocument
+
 
 class BaseReader:
     """Utilities for loading data from a directory."""
@@ -14,7 +15,16 @@ class BaseReader:
     def load_data(self, *args: Any, **load_kwargs: Any) -> List[Document]:
         """Load data from the input directory."""
 
-    def load_langchain_documents(self, **load_kwargs: Any) -> List[LCDocument]:
+    def lazy_load_data(self, *args: Any, **load_kwargs: Any) -> Iterable[Document]:
+        """Load data lazily.
+
+        Readers that can stream their documents override this, so that they are
+        not held in memory at once.
+
+        """
+        return iter(self.load_data(*args, **load_kwargs))
+
+    def load_langchain_documents(self, **load_kwargs: Any) -> List["LCDocument"]:
         """Load data in LangChain document format."""
         docs = self.load_data(**load_kwargs)
         return [d.to_langchain_format() for d in docs]
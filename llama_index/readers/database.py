@@ -1,15 +1,23 @@
 """Database Reader."""
 
-from typing import Any, List, Optional
+from typing import Any, Dict, Generator, List, Optional, Sequence
 
 from sqlalchemy import text
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Connection, Engine, Row
 
 from llama_index.langchain_helpers.sql_wrapper import SQLDatabase
 from llama_index.readers.base import BaseReader
 from llama_index.schema import Document
 
 
+# number of rows fetched per round trip when streaming
+DEFAULT_BATCH_SIZE = 1000
+
+
+def _row_to_text(row: Sequence[Any]) -> str:
+    return ", ".join([str(entry) for entry in row])
+
+
 class DatabaseReader(BaseReader):
     """Simple Database reader.
 
@@ -56,6 +64,7 @@ class DatabaseReader(BaseReader):
         **kwargs: Any,
     ) -> None:
         """Initialize with parameters."""
+        self.last_keyset_value: Optional[Any] = None
         if sql_database:
             self.sql_database = sql_database
         elif engine:
@@ -92,6 +101,103 @@ class DatabaseReader(BaseReader):
 
             for item in result.fetchall():
                 # fetch each item
-                doc_str = ", ".join([str(entry) for entry in item])
+                doc_str = _row_to_text(item)
                 documents.append(Document(text=doc_str))
         return documents
+
+    def iter_data(
+        self,
+        query: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        rows_per_document: int = 1,
+        keyset_column: Optional[str] = None,
+        start_after: Optional[Any] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Generator[List[Document], None, None]:
+        """Query the Database, yielding the Documents in batches.
+
+        Rows are streamed with a server-side cursor (where the driver supports
+        it), `batch_size` rows at a time, so that the result is never held in
+        memory at once. Each batch of Documents can be inserted into an index at
+        once, e.g. with `index.insert_nodes` on the nodes parsed from them.
+
+        With a `keyset_column`, the query is instead read in pages of
+        `batch_size` rows ordered by that column, each page a query of its own
+        starting after the last value of the previous one. Keyset values must
+        be unique. After each batch is consumed, `last_keyset_value` is its
+        last value, to resume an interrupted load from with `start_after`.
+
+        Args:
+            query (str): Query parameter to filter tables and rows.
+            batch_size (int): Number of rows fetched at a time, rounded up to a
+                multiple of `rows_per_document`.
+            rows_per_document (int): Number of rows per Document, one per line.
+            keyset_column (Optional[str]): A column of the query to page by.
+            start_after (Optional[Any]): Keyset value to start after.
+            params (Optional[Dict[str, Any]]): Parameters of the query.
+
+        Yields:
+            List[Document]: Batches of Document objects.
+        """
+        if rows_per_document < 1:
+            raise ValueError("rows_per_document must be at least 1.")
+        # a Document never spans batches
+        batch_size = -(-batch_size // rows_per_document) * rows_per_document
+
+        self.last_keyset_value = start_after
+        if keyset_column is None:
+            with self.sql_database.engine.connect() as connection:
+                result = connection.execution_options(stream_results=True).execute(
+                    text(query), params or {}
+                )
+                while True:
+                    rows = result.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield self._rows_to_documents(rows, rows_per_document)
+            return
+
+        while True:
+            with self.sql_database.engine.connect() as connection:
+                rows = self._fetch_page(
+                    connection, query, keyset_column, batch_size, params
+                )
+            if not rows:
+                break
+            yield self._rows_to_documents(rows, rows_per_document)
+            self.last_keyset_value = rows[-1]._mapping[keyset_column]
+            if len(rows) < batch_size:
+                break
+
+    def _fetch_page(
+        self,
+        connection: Connection,
+        query: str,
+        keyset_column: str,
+        page_size: int,
+        params: Optional[Dict[str, Any]],
+    ) -> List[Row]:
+        """Fetch the page of rows after the last keyset value."""
+        column = connection.dialect.identifier_preparer.quote(keyset_column)
+        where = ""
+        page_params = {**(params or {}), "_page_size": page_size}
+        if self.last_keyset_value is not None:
+            where = f"WHERE _keyset_page.{column} > :_start_after "
+            page_params["_start_after"] = self.last_keyset_value
+        page_query = (
+            f"SELECT * FROM ({query}) AS _keyset_page {where}"
+            f"ORDER BY _keyset_page.{column} LIMIT :_page_size"
+        )
+        return list(connection.execute(text(page_query), page_params).fetchall())
+
+    def _rows_to_documents(
+        self, rows: Sequence[Row], rows_per_document: int
+    ) -> List[Document]:
+        return [
+            Document(
+                text="\n".join(
+                    _row_to_text(row) for row in rows[i : i + rows_per_document]
+                )
+            )
+            for i in range(0, len(rows), rows_per_document)
+        ]
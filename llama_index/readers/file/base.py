@@ -1,14 +1,29 @@
 """Simple reader that reads files of different formats from a directory."""
 import logging
 import os
+from collections import deque
+from itertools import islice
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, Dict, Generator, List, Optional, Type
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.file.docs_reader import DocxReader, PDFReader
 from llama_index.readers.file.epub_reader import EpubReader
 from llama_index.readers.file.image_reader import ImageReader
 from llama_index.readers.file.ipynb_reader import IPYNBReader
+from llama_index.readers.file.manifest import FileManifest
 from llama_index.readers.file.markdown_reader import MarkdownReader
 from llama_index.readers.file.mbox_reader import MboxReader
 from llama_index.readers.file.slides_reader import PptxReader
@@ -32,9 +47,60 @@ DEFAULT_FILE_READER_CLS: Dict[str, Type[BaseReader]] = {
     ".ipynb": IPYNBReader,
 }
 
+# extensions of the files parsed by CPU-bound readers, read in worker processes
+DEFAULT_PROCESS_POOL_EXTS: Set[str] = {".pdf", ".docx", ".epub"}
+
 logger = logging.getLogger(__name__)
 
 
+def _iter_file(
+    input_file: Path,
+    reader: Optional[BaseReader],
+    metadata: Optional[dict],
+    filename_as_id: bool,
+    encoding: str,
+    errors: str,
+) -> Iterator[Document]:
+    """Load the documents of a file lazily, with a file reader or as plain text."""
+    if reader is not None:
+        docs = reader.lazy_load_data(input_file, extra_info=metadata)
+
+        # iterate over docs if needed
+        for i, doc in enumerate(docs):
+            if filename_as_id:
+                doc.id_ = f"{str(input_file)}_part_{i}"
+            yield doc
+        return
+
+    # do standard read
+    with open(input_file, "r", errors=errors, encoding=encoding) as f:
+        data = f.read()
+
+    doc = Document(text=data, metadata=metadata or {})
+    if filename_as_id:
+        doc.id_ = str(input_file)
+
+    yield doc
+
+
+def _load_file(
+    input_file: Path,
+    reader: Optional[BaseReader],
+    metadata: Optional[dict],
+    filename_as_id: bool,
+    encoding: str,
+    errors: str,
+) -> List[Document]:
+    """Load the documents of a file, with a file reader or as plain text.
+
+    Module-level so that it can run in worker processes.
+
+    """
+    return list(
+        _iter_file(input_file, reader, metadata, filename_as_id, encoding, errors)
+    )
+
+
 class SimpleDirectoryReader(BaseReader):
     """Simple directory reader.
 
@@ -65,6 +131,18 @@ class SimpleDirectoryReader(BaseReader):
         file_metadata (Optional[Callable[str, Dict]]): A function that takes
             in a filename and returns a Dict of metadata for the Document.
             Default is None.
+        raise_on_error (bool): Whether to raise the error of a file that fails to
+            load. Otherwise, the error is logged and the file skipped.
+            True by default.
+        process_pool_exts (Optional[Set[str]]): Extensions of the files to read in
+            worker processes rather than threads when loading with `num_workers`,
+            for CPU-bound readers. Their file readers must be picklable.
+            Default is DEFAULT_PROCESS_POOL_EXTS.
+        manifest (Optional[FileManifest]): A manifest of the files loaded by
+            previous runs, to load incrementally: only new or changed files are
+            loaded, and the manifest is updated as they are. Files of the manifest
+            that no longer exist are listed in `deleted_files`, whether or not
+            they are among the files to read. Default is None.
     """
 
     def __init__(
@@ -81,6 +159,9 @@ class SimpleDirectoryReader(BaseReader):
         file_extractor: Optional[Dict[str, BaseReader]] = None,
         num_files_limit: Optional[int] = None,
         file_metadata: Optional[Callable[[str], Dict]] = None,
+        raise_on_error: bool = True,
+        process_pool_exts: Optional[Set[str]] = None,
+        manifest: Optional[FileManifest] = None,
     ) -> None:
         """Initialize with parameters."""
         super().__init__()
@@ -119,6 +200,23 @@ class SimpleDirectoryReader(BaseReader):
         self.supported_suffix = list(DEFAULT_FILE_READER_CLS.keys())
         self.file_metadata = file_metadata
         self.filename_as_id = filename_as_id
+        self.raise_on_error = raise_on_error
+        self.process_pool_exts = (
+            DEFAULT_PROCESS_POOL_EXTS
+            if process_pool_exts is None
+            else process_pool_exts
+        )
+
+        self.manifest = manifest
+        self.deleted_files: List[str] = []
+        # ids of the documents that changed files no longer produce
+        self._stale_doc_ids: List[str] = []
+        if manifest is not None:
+            # not based on input_files, which can be a subset of the files (with
+            # num_files_limit, required_exts, exclude or an explicit list)
+            self.deleted_files = [
+                path for path in manifest.get_paths() if not os.path.isfile(path)
+            ]
 
     def _add_files(self, input_dir: Path) -> List[Path]:
         """Add files."""
@@ -177,48 +275,204 @@ class SimpleDirectoryReader(BaseReader):
 
         return new_input_files
 
-    def load_data(self) -> List[Document]:
+    def _get_reader(self, input_file: Path) -> Optional[BaseReader]:
+        """Get the file reader of a file, None to read it as plain text."""
+        file_suffix = input_file.suffix.lower()
+        if file_suffix not in self.supported_suffix and (
+            file_suffix not in self.file_extractor
+        ):
+            return None
+
+        # use file readers
+        if file_suffix not in self.file_extractor:
+            # instantiate file reader if not already
+            reader_cls = DEFAULT_FILE_READER_CLS[file_suffix]
+            self.file_extractor[file_suffix] = reader_cls()
+        return self.file_extractor[file_suffix]
+
+    def _get_load_args(self, input_file: Path) -> tuple:
+        """Get the arguments of `_load_file` for a file."""
+        metadata: Optional[dict] = None
+        if self.file_metadata is not None:
+            metadata = self.file_metadata(str(input_file))
+
+        return (
+            input_file,
+            self._get_reader(input_file),
+            metadata,
+            self.filename_as_id,
+            self.encoding,
+            self.errors,
+        )
+
+    def _on_error(self, input_file: Path, error: Exception) -> None:
+        if self.raise_on_error:
+            raise error
+        logger.warning(f"Failed to load file {input_file}: {error!r}, skipping.")
+
+    def _get_files_to_load(self) -> List[Tuple[Path, Optional[dict]]]:
+        """Get the files to load, with their fingerprints if there is a manifest."""
+        if self.manifest is None:
+            return [(input_file, None) for input_file in self.input_files]
+
+        files_to_load: List[Tuple[Path, Optional[dict]]] = []
+        for input_file in self.input_files:
+            fingerprint = self.manifest.get_changed_fingerprint(input_file)
+            if fingerprint is not None:
+                files_to_load.append((input_file, fingerprint))
+        return files_to_load
+
+    def _on_loaded(
+        self, input_file: Path, fingerprint: Optional[dict], doc_ids: List[str]
+    ) -> None:
+        if self.manifest is None or fingerprint is None:
+            return
+
+        self._stale_doc_ids.extend(
+            doc_id
+            for doc_id in self.manifest.get_doc_ids(input_file)
+            if doc_id not in doc_ids
+        )
+        self.manifest.put(input_file, fingerprint, doc_ids)
+
+    def pop_stale_ref_doc_ids(self) -> List[str]:
+        """Get the ids of the documents to delete from an index, after a load.
+
+        These are the documents of the deleted files, and the documents that
+        changed files no longer produce (e.g. with ids not based on filenames).
+        The deleted files are removed from the manifest.
+
+        """
+        stale_doc_ids = self._stale_doc_ids
+        if self.manifest is not None:
+            for path in self.deleted_files:
+                stale_doc_ids.extend(self.manifest.delete(path))
+        self.deleted_files = []
+        self._stale_doc_ids = []
+        return stale_doc_ids
+
+    def iter_data(
+        self,
+        num_workers: Optional[int] = None,
+        documents_per_batch: Optional[int] = None,
+    ) -> Generator[List[Document], None, None]:
+        """Load data from the input directory lazily.
+
+        Yields the documents of each file, in the order of the input files. With
+        `num_workers`, up to `num_workers` files are loaded at once: the files
+        with an extension in `process_pool_exts` in worker processes, the others
+        in worker threads. Files are loaded ahead of the consumer, by at most
+        twice `num_workers` files.
+
+        With `documents_per_batch`, the documents of each file are instead
+        yielded in batches of at most that many documents, as its file reader
+        loads them lazily: files streamed by their reader (e.g. CSV files read by
+        chunks) are loaded in constant memory.
+
+        With a manifest, only new or changed files are loaded, and each file is
+        recorded in the manifest once its documents have been consumed.
+
+        Args:
+            num_workers (Optional[int]): Number of workers per pool.
+                Default is None, to load the files one at a time.
+            documents_per_batch (Optional[int]): Maximum number of documents per
+                batch. Only supported when loading the files one at a time.
+                Default is None, to yield all the documents of a file at once.
+
+        """
+        files_to_load = self._get_files_to_load()
+        if num_workers is None or num_workers <= 1:
+            for input_file, fingerprint in files_to_load:
+                doc_ids: List[str] = []
+                try:
+                    for docs in self._iter_batches(input_file, documents_per_batch):
+                        yield docs
+                        doc_ids.extend(doc.id_ for doc in docs)
+                except Exception as e:
+                    self._on_error(input_file, e)
+                    continue
+                self._on_loaded(input_file, fingerprint, doc_ids)
+            return
+
+        if documents_per_batch is not None:
+            raise ValueError(
+                "documents_per_batch is only supported without num_workers."
+            )
+
+        thread_pool = ThreadPoolExecutor(max_workers=num_workers)
+        process_pool: Optional[ProcessPoolExecutor] = None
+        # futures of the files being loaded, in order
+        pending: Deque[Tuple[Path, Optional[dict], "Future[List[Document]]"]] = deque()
+        try:
+            for input_file, fingerprint in files_to_load:
+                executor: Executor = thread_pool
+                if input_file.suffix.lower() in self.process_pool_exts:
+                    if process_pool is None:
+                        process_pool = ProcessPoolExecutor(max_workers=num_workers)
+                    executor = process_pool
+                future: "Future[List[Document]]"
+                try:
+                    load_args = self._get_load_args(input_file)
+                except Exception as e:
+                    # reported in order, like the errors of loading files
+                    future = Future()
+                    future.set_exception(e)
+                else:
+                    future = executor.submit(_load_file, *load_args)
+                pending.append((input_file, fingerprint, future))
+
+                if len(pending) >= 2 * num_workers:
+                    yield from self._iter_result(*pending.popleft())
+
+            while pending:
+                yield from self._iter_result(*pending.popleft())
+        finally:
+            for _, _, future in pending:
+                future.cancel()
+            thread_pool.shutdown()
+            if process_pool is not None:
+                process_pool.shutdown()
+
+    def _iter_batches(
+        self, input_file: Path, documents_per_batch: Optional[int]
+    ) -> Iterator[List[Document]]:
+        if documents_per_batch is None:
+            yield _load_file(*self._get_load_args(input_file))
+            return
+
+        docs_iter = _iter_file(*self._get_load_args(input_file))
+        while True:
+            docs = list(islice(docs_iter, documents_per_batch))
+            if not docs:
+                break
+            yield docs
+
+    def _iter_result(
+        self,
+        input_file: Path,
+        fingerprint: Optional[dict],
+        future: "Future[List[Document]]",
+    ) -> Generator[List[Document], None, None]:
+        try:
+            docs = future.result()
+        except Exception as e:
+            self._on_error(input_file, e)
+            return
+        yield docs
+        self._on_loaded(input_file, fingerprint, [doc.id_ for doc in docs])
+
+    def load_data(self, num_workers: Optional[int] = None) -> List[Document]:
         """Load data from the input directory.
 
+        Args:
+            num_workers (Optional[int]): Number of workers per pool, see
+                `iter_data`. Default is None, to load the files one at a time.
+
         Returns:
             List[Document]: A list of documents.
         """
         documents = []
-        for input_file in self.input_files:
-            metadata: Optional[dict] = None
-            if self.file_metadata is not None:
-                metadata = self.file_metadata(str(input_file))
-
-            file_suffix = input_file.suffix.lower()
-            if (
-                file_suffix in self.supported_suffix
-                or file_suffix in self.file_extractor
-            ):
-                # use file readers
-                if file_suffix not in self.file_extractor:
-                    # instantiate file reader if not already
-                    reader_cls = DEFAULT_FILE_READER_CLS[file_suffix]
-                    self.file_extractor[file_suffix] = reader_cls()
-                reader = self.file_extractor[file_suffix]
-                docs = reader.load_data(input_file, extra_info=metadata)
-
-                # iterate over docs if needed
-                if self.filename_as_id:
-                    for i, doc in enumerate(docs):
-                        doc.id_ = f"{str(input_file)}_part_{i}"
-
-                documents.extend(docs)
-            else:
-                # do standard read
-                with open(
-                    input_file, "r", errors=self.errors, encoding=self.encoding
-                ) as f:
-                    data = f.read()
-
-                doc = Document(text=data, metadata=metadata or {})
-                if self.filename_as_id:
-                    doc.id_ = str(input_file)
-
-                documents.append(doc)
+        for docs in self.iter_data(num_workers=num_workers):
+            documents.extend(docs)
 
         return documents
@@ -0,0 +1,99 @@
+"""Manifest of the files loaded from a directory, for incremental loads."""
+import hashlib
+import os
+from pathlib import Path
+from typing import List, Optional
+
+from llama_index.storage.kvstore.simple_kvstore import SimpleKVStore
+from llama_index.storage.kvstore.types import BaseKVStore
+
+DEFAULT_NAMESPACE = "file_manifest"
+
+# size of the blocks files are hashed by
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def _hash_file(path: Path) -> str:
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+            sha256.update(block)
+    return sha256.hexdigest()
+
+
+class FileManifest:
+    """File manifest.
+
+    Records a fingerprint of each loaded file, its size, modification time and
+    content hash, with the ids of the documents loaded from it, in a key-value
+    store. A file is unchanged if its size and modification time are the
+    recorded ones, so unchanged files aren't read at all. Otherwise, its content
+    is hashed, so that files that were only touched aren't loaded again.
+
+    Use a namespace per directory: files recorded in the manifest but not found
+    by a reader are deleted files.
+
+    Args:
+        kvstore (Optional[BaseKVStore]): Key-value store for the fingerprints.
+            Defaults to an in-memory store.
+        namespace (str): Namespace of the manifest in the key-value store.
+    """
+
+    def __init__(
+        self,
+        kvstore: Optional[BaseKVStore] = None,
+        namespace: str = DEFAULT_NAMESPACE,
+    ) -> None:
+        self._kvstore = kvstore or SimpleKVStore()
+        self._collection = f"{namespace}/data"
+
+    @property
+    def kvstore(self) -> BaseKVStore:
+        return self._kvstore
+
+    def get_changed_fingerprint(self, path: Path) -> Optional[dict]:
+        """Get the fingerprint of a new or changed file, None if unchanged."""
+        stat = os.stat(path)
+        entry = self._kvstore.get(str(path), collection=self._collection)
+        if (
+            entry is not None
+            and entry["size"] == stat.st_size
+            and entry["mtime_ns"] == stat.st_mtime_ns
+        ):
+            return None
+
+        fingerprint = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "hash": _hash_file(path),
+        }
+        if entry is not None and entry["hash"] == fingerprint["hash"]:
+            # touched, but same content: skip hashing it next time
+            self._kvstore.put(
+                str(path), {**entry, **fingerprint}, collection=self._collection
+            )
+            return None
+        return fingerprint
+
+    def put(self, path: Path, fingerprint: dict, doc_ids: List[str]) -> None:
+        """Record a loaded file, with the ids of its documents."""
+        self._kvstore.put(
+            str(path), {**fingerprint, "doc_ids": doc_ids}, collection=self._collection
+        )
+
+    def get_doc_ids(self, path: Path) -> List[str]:
+        """Get the ids of the documents loaded from a file."""
+        entry = self._kvstore.get(str(path), collection=self._collection)
+        return [] if entry is None else entry["doc_ids"]
+
+    def get_paths(self) -> List[str]:
+        """Get the paths of the recorded files."""
+        return list(self._kvstore.get_all(collection=self._collection))
+
+    def delete(self, path: str) -> List[str]:
+        """Delete a file from the manifest, returning the ids of its documents."""
+        entry = self._kvstore.get(path, collection=self._collection)
+        if entry is None:
+            return []
+        self._kvstore.delete(path, collection=self._collection)
+        return entry["doc_ids"]
@@ -3,8 +3,9 @@
 Contains parsers for tabular data files.
 
 """
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 import pandas as pd
 
@@ -20,12 +21,23 @@ class CSVReader(BaseReader):
             If set to False, a Document will be created for each row.
             True by default.
 
+        chunksize (Optional[int]): Number of rows to read at a time. With
+            `concat_rows`, a Document is created for each chunk of rows.
+            Set to None by default, to read all rows at once.
+
     """
 
-    def __init__(self, *args: Any, concat_rows: bool = True, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        *args: Any,
+        concat_rows: bool = True,
+        chunksize: Optional[int] = None,
+        **kwargs: Any
+    ) -> None:
         """Init params."""
         super().__init__(*args, **kwargs)
         self._concat_rows = concat_rows
+        self._chunksize = chunksize
 
     def load_data(
         self, file: Path, extra_info: Optional[Dict] = None
@@ -36,19 +48,33 @@ class CSVReader(BaseReader):
             Union[str, List[str]]: a string or a List of strings.
 
         """
+        return list(self.lazy_load_data(file, extra_info=extra_info))
+
+    def lazy_load_data(
+        self, file: Path, extra_info: Optional[Dict] = None
+    ) -> Iterator[Document]:
+        """Parse file lazily, reading `chunksize` rows at a time."""
         try:
             import csv
         except ImportError:
             raise ImportError("csv module is required to read CSV files.")
-        text_list = []
         with open(file, "r") as fp:
             csv_reader = csv.reader(fp)
-            for row in csv_reader:
-                text_list.append(", ".join(row))
-        if self._concat_rows:
-            return [Document(text="\n".join(text_list), metadata=extra_info)]
-        else:
-            return [Document(text=text, metadata=extra_info) for text in text_list]
+            text_iter = (", ".join(row) for row in csv_reader)
+            if not self._concat_rows:
+                for text in text_iter:
+                    yield Document(text=text, metadata=extra_info or {})
+                return
+
+            if self._chunksize is None:
+                yield Document(text="\n".join(text_iter), metadata=extra_info or {})
+                return
+
+            while True:
+                text_list = list(islice(text_iter, self._chunksize))
+                if not text_list:
+                    break
+                yield Document(text="\n".join(text_list), metadata=extra_info or {})
 
 
 class PandasCSVReader(BaseReader):
@@ -75,6 +101,14 @@ class PandasCSVReader(BaseReader):
             Set to empty dict by default, this means pandas will try to figure
             out the separators, table head, etc. on its own.
 
+        chunksize (Optional[int]): Number of rows to read at a time, streaming
+            the file. With `concat_rows`, a Document is created for each chunk of
+            rows. Set to None by default, to read all rows at once.
+
+        metadata_columns (Optional[List[str]]): Columns to keep as metadata of
+            the row Documents, with their types, rather than in their text.
+            Only used when `concat_rows=False`. Set to None by default.
+
     """
 
     def __init__(
@@ -84,22 +118,48 @@ class PandasCSVReader(BaseReader):
         col_joiner: str = ", ",
         row_joiner: str = "\n",
         pandas_config: dict = {},
+        chunksize: Optional[int] = None,
+        metadata_columns: Optional[List[str]] = None,
         **kwargs: Any
     ) -> None:
         """Init params."""
         super().__init__(*args, **kwargs)
+        if concat_rows and metadata_columns:
+            raise ValueError("metadata_columns requires concat_rows=False.")
         self._concat_rows = concat_rows
         self._col_joiner = col_joiner
         self._row_joiner = row_joiner
         self._pandas_config = pandas_config
+        self._chunksize = chunksize
+        self._metadata_columns = metadata_columns or []
 
     def load_data(
         self, file: Path, extra_info: Optional[Dict] = None
     ) -> List[Document]:
         """Parse file."""
-        df = pd.read_csv(file, **self._pandas_config)
+        return list(self.lazy_load_data(file, extra_info=extra_info))
 
-        text_list = df.apply(
+    def lazy_load_data(
+        self, file: Path, extra_info: Optional[Dict] = None
+    ) -> Iterator[Document]:
+        """Parse file lazily, reading `chunksize` rows at a time."""
+        if self._chunksize is None:
+            yield from self._get_documents(
+                pd.read_csv(file, **self._pandas_config), extra_info
+            )
+            return
+
+        with pd.read_csv(
+            file, chunksize=self._chunksize, **self._pandas_config
+        ) as chunks:
+            for df in chunks:
+                yield from self._get_documents(df, extra_info)
+
+    def _get_documents(
+        self, df: pd.DataFrame, extra_info: Optional[Dict]
+    ) -> Iterable[Document]:
+        text_df = df.drop(columns=self._metadata_columns)
+        text_list = text_df.apply(
             lambda row: (self._col_joiner).join(row.astype(str).tolist()), axis=1
         ).tolist()
 
@@ -109,7 +169,13 @@ class PandasCSVReader(BaseReader):
                     text=(self._row_joiner).join(text_list), metadata=extra_info or {}
                 )
             ]
-        else:
-            return [
-                Document(text=text, metadata=extra_info or {}) for text in text_list
-            ]
+
+        metadata_list: List[Dict[str, Any]] = (
+            df[self._metadata_columns].to_dict("records")
+            if self._metadata_columns
+            else [{} for _ in text_list]
+        )
+        return [
+            Document(text=text, metadata={**(extra_info or {}), **metadata})
+            for text, metadata in zip(text_list, metadata_list)
+        ]
@@ -2,12 +2,36 @@
 
 import json
 import re
-from typing import Any, Generator, List, Optional
+from itertools import islice
+from typing import Any, Dict, Generator, Iterator, List, Optional
 
 from llama_index.readers.base import BaseReader
 from llama_index.schema import Document
 
 
+_USELESS_LINE_REGEX = re.compile(r"^[{}\[\],]*$")
+
+# number of documents per batch when loading in batches
+DEFAULT_BATCH_SIZE = 100
+
+
+def _get_path(json_data: Any, path: str) -> Any:
+    """Get the value at a dot-separated path, e.g. "user.tags.0".
+
+    Raises KeyError if there is no value at the path.
+
+    """
+    value = json_data
+    for key in path.split("."):
+        if isinstance(value, dict):
+            value = value[key]
+        elif isinstance(value, list) and key.isdigit() and int(key) < len(value):
+            value = value[int(key)]
+        else:
+            raise KeyError(path)
+    return value
+
+
 def _depth_first_yield(
     json_data: Any,
     levels_back: int,
@@ -65,6 +89,19 @@ class JSONReader(BaseReader):
           then a would be collapsed into one line, while b would not.
           Recommend starting around 100 and then adjusting from there.
 
+        is_jsonl (bool): whether the file is JSON Lines: a JSON value per line,
+          read line by line, each made into a Document.
+
+        items_path (Optional[str]): path of the items to make into Documents,
+          for files too large to load at once, in the prefix syntax of `ijson`
+          (e.g. "item" for the items of a top-level array, or "data.item" for
+          the items of the "data" array). The file is then parsed incrementally,
+          an item at a time. Requires `ijson`.
+
+        field_paths (Optional[List[str]]): dot-separated paths of the fields to
+          keep in each Document (e.g. ["title", "author.name", "tags.0"]), the
+          others are dropped. Missing fields are skipped.
+
     """
 
     def __init__(
@@ -72,36 +109,102 @@ class JSONReader(BaseReader):
         levels_back: Optional[int] = None,
         collapse_length: Optional[int] = None,
         ensure_ascii: bool = False,
+        is_jsonl: bool = False,
+        items_path: Optional[str] = None,
+        field_paths: Optional[List[str]] = None,
     ) -> None:
         """Initialize with arguments."""
         super().__init__()
+        if is_jsonl and items_path is not None:
+            raise ValueError("items_path is not supported for JSON Lines files.")
         self.levels_back = levels_back
         self.collapse_length = collapse_length
         self.ensure_ascii = ensure_ascii
+        self.is_jsonl = is_jsonl
+        self.items_path = items_path
+        self.field_paths = field_paths
 
-    def load_data(self, input_file: str) -> List[Document]:
+    def load_data(
+        self, input_file: str, extra_info: Optional[Dict] = None
+    ) -> List[Document]:
         """Load data from the input file."""
+        return list(self.lazy_load_data(input_file, extra_info=extra_info))
+
+    def lazy_load_data(
+        self, input_file: str, extra_info: Optional[Dict] = None
+    ) -> Iterator[Document]:
+        """Load data from the input file lazily, a JSON value at a time."""
         with open(input_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            if self.levels_back is None:
-                # If levels_back isn't set, we just format and make each
-                # line an embedding
-                json_output = json.dumps(data, indent=0, ensure_ascii=self.ensure_ascii)
-                lines = json_output.split("\n")
-                useful_lines = [
-                    line for line in lines if not re.match(r"^[{}\[\],]*$", line)
-                ]
-                return [Document(text="\n".join(useful_lines))]
-            elif self.levels_back is not None:
-                # If levels_back is set, we make the embeddings contain the labels
-                # from further up the JSON tree
-                lines = [
-                    *_depth_first_yield(
-                        data,
-                        self.levels_back,
-                        self.collapse_length,
-                        [],
-                        self.ensure_ascii,
-                    )
-                ]
-                return [Document(text="\n".join(lines))]
+            for data in self._iter_values(f):
+                yield Document(text=self._get_text(data), metadata=extra_info or {})
+
+    def iter_data(
+        self,
+        input_file: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        extra_info: Optional[Dict] = None,
+    ) -> Generator[List[Document], None, None]:
+        """Load data from the input file, yielding Documents in batches.
+
+        Args:
+            input_file (str): The input file.
+            batch_size (int): Maximum number of Documents per batch.
+            extra_info (Optional[Dict]): Metadata of the Documents.
+
+        """
+        docs_iter = self.lazy_load_data(input_file, extra_info=extra_info)
+        while True:
+            docs = list(islice(docs_iter, batch_size))
+            if not docs:
+                break
+            yield docs
+
+    def _iter_values(self, f: Any) -> Iterator[Any]:
+        """Iterate over the JSON values to make into Documents."""
+        if self.is_jsonl:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        elif self.items_path is not None:
+            try:
+                import ijson
+            except ImportError:
+                raise ImportError(
+                    "`ijson` package not found, please run `pip install ijson`"
+                )
+            yield from ijson.items(f, self.items_path, use_float=True)
+        else:
+            yield json.load(f)
+
+    def _get_text(self, data: Any) -> str:
+        if self.field_paths is not None:
+            fields = {}
+            for path in self.field_paths:
+                try:
+                    fields[path] = _get_path(data, path)
+                except KeyError:
+                    continue
+            data = fields
+
+        if self.levels_back is None:
+            # If levels_back isn't set, we just format and make each
+            # line an embedding
+            json_output = json.dumps(data, indent=0, ensure_ascii=self.ensure_ascii)
+            lines = json_output.split("\n")
+            useful_lines = [
+                line for line in lines if not _USELESS_LINE_REGEX.match(line)
+            ]
+            return "\n".join(useful_lines)
+        else:
+            # If levels_back is set, we make the embeddings contain the labels
+            # from further up the JSON tree
+            lines = [
+                *_depth_first_yield(
+                    data,
+                    self.levels_back,
+                    self.collapse_length,
+                    [],
+                    self.ensure_ascii,
+                )
+            ]
+            return "\n".join(lines)
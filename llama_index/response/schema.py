@@ -3,6 +3,7 @@
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Union
 
+from llama_index.response.streaming import StreamingMetrics, get_metered_token_gen
 from llama_index.schema import NodeWithScore
 from llama_index.types import TokenGen
 from llama_index.utils import truncate_text
@@ -46,6 +47,7 @@ class StreamingResponse:
 
     Attributes:
         response_gen: The response generator.
+        metrics: First-token latency and tokens/sec of the response generator.
 
     """
 
@@ -53,6 +55,11 @@ class StreamingResponse:
     source_nodes: List[NodeWithScore] = field(default_factory=list)
     metadata: Optional[Dict[str, Any]] = None
     response_txt: Optional[str] = None
+    metrics: StreamingMetrics = field(default_factory=StreamingMetrics)
+
+    def __post_init__(self) -> None:
+        if self.response_gen is not None:
+            self.response_gen = get_metered_token_gen(self.response_gen, self.metrics)
 
     def __str__(self) -> str:
         """Convert to string representation."""
@@ -0,0 +1,166 @@
+"""Token streaming transport.
+
+Consumers block (or await) on a queue until the next token arrives, and the end of
+the stream is signalled with a sentinel, so waiting on a slow LLM costs no CPU.
+
+"""
+import asyncio
+import queue
+import time
+from dataclasses import dataclass, field
+from typing import AsyncGenerator, Generator, Iterable, List, Optional, Union
+
+# marks the end of a token stream
+END_OF_STREAM = object()
+
+
+@dataclass
+class StreamingMetrics:
+    """Latency and throughput of a token stream.
+
+    Times are `time.perf_counter` values; `start_time` is when the stream was
+    created.
+
+    """
+
+    start_time: float = field(default_factory=time.perf_counter)
+    first_token_time: Optional[float] = None
+    end_time: Optional[float] = None
+    num_tokens: int = 0
+
+    def record_token(self) -> None:
+        """Record the arrival of a token."""
+        if self.first_token_time is None:
+            self.first_token_time = time.perf_counter()
+        self.num_tokens += 1
+
+    def record_end(self) -> None:
+        """Record the end of the stream."""
+        if self.end_time is None:
+            self.end_time = time.perf_counter()
+
+    @property
+    def first_token_latency(self) -> Optional[float]:
+        """Seconds from the start of the stream to its first token."""
+        if self.first_token_time is None:
+            return None
+        return self.first_token_time - self.start_time
+
+    @property
+    def tokens_per_second(self) -> Optional[float]:
+        """Tokens per second since the start of the stream (up to its end)."""
+        end_time = self.end_time or time.perf_counter()
+        elapsed = end_time - self.start_time
+        if self.num_tokens == 0 or elapsed <= 0:
+            return None
+        return self.num_tokens / elapsed
+
+
+def _drain(token_queue: Union[queue.Queue, asyncio.Queue]) -> List[str]:
+    """Get the tokens in a queue until it is empty or its end, without blocking."""
+    tokens: List[str] = []
+    while True:
+        try:
+            token = token_queue.get_nowait()
+        except (queue.Empty, asyncio.QueueEmpty):
+            return tokens
+        if token is END_OF_STREAM:
+            # leave the sentinel for any other consumer
+            token_queue.put_nowait(END_OF_STREAM)
+            return tokens
+        tokens.append(token)
+
+
+class TokenQueue:
+    """Thread-safe token queue.
+
+    Tokens are `put` by a producer thread and read by iterating the queue, which
+    blocks until the next token or the end of the stream.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize params."""
+        self._queue: queue.Queue = queue.Queue()
+        self._is_closed = False
+        self.metrics = StreamingMetrics()
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether the end of the stream was signalled."""
+        return self._is_closed
+
+    def put(self, token: str) -> None:
+        """Put a token in the queue."""
+        self.metrics.record_token()
+        self._queue.put_nowait(token)
+
+    def close(self) -> None:
+        """Signal the end of the stream."""
+        if not self._is_closed:
+            self._is_closed = True
+            self.metrics.record_end()
+            self._queue.put_nowait(END_OF_STREAM)
+
+    def drain(self) -> List[str]:
+        """Get the tokens already in the queue, without blocking."""
+        return _drain(self._queue)
+
+    def __iter__(self) -> Generator[str, None, None]:
+        while True:
+            token = self._queue.get()
+            if token is END_OF_STREAM:
+                # leave the sentinel for any other consumer
+                self._queue.put_nowait(END_OF_STREAM)
+                return
+            yield token
+
+
+class AsyncTokenQueue:
+    """Token queue for a producer and consumers running on the same event loop."""
+
+    def __init__(self) -> None:
+        """Initialize params."""
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._is_closed = False
+        self.metrics = StreamingMetrics()
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether the end of the stream was signalled."""
+        return self._is_closed
+
+    def put(self, token: str) -> None:
+        """Put a token in the queue."""
+        self.metrics.record_token()
+        self._queue.put_nowait(token)
+
+    def close(self) -> None:
+        """Signal the end of the stream."""
+        if not self._is_closed:
+            self._is_closed = True
+            self.metrics.record_end()
+            self._queue.put_nowait(END_OF_STREAM)
+
+    def drain(self) -> List[str]:
+        """Get the tokens already in the queue, without blocking."""
+        return _drain(self._queue)
+
+    async def __aiter__(self) -> AsyncGenerator[str, None]:
+        while True:
+            token = await self._queue.get()
+            if token is END_OF_STREAM:
+                # leave the sentinel for any other consumer
+                self._queue.put_nowait(END_OF_STREAM)
+                return
+            yield token
+
+
+def get_metered_token_gen(
+    token_gen: Iterable[str], metrics: StreamingMetrics
+) -> Generator[str, None, None]:
+    """Wrap a token generator to record its metrics."""
+    for token in token_gen:
+        metrics.record_token()
+        yield token
+    metrics.record_end()
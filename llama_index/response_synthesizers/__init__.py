@@ -5,6 +5,7 @@ from llama_index.response_synthesizers.base import BaseSynthesizer
 from llama_index.response_synthesizers.compact_and_refine import CompactAndRefine
 from llama_index.response_synthesizers.factory import get_response_synthesizer
 from llama_index.response_synthesizers.generation import Generation
+from llama_index.response_synthesizers.map_reduce import MapReduce
 from llama_index.response_synthesizers.refine import Refine
 from llama_index.response_synthesizers.simple_summarize import SimpleSummarize
 from llama_index.response_synthesizers.tree_summarize import TreeSummarize
@@ -19,5 +20,6 @@ __all__ = [
     "Generation",
     "CompactAndRefine",
     "Accumulate",
+    "MapReduce",
     "get_response_synthesizer",
 ]
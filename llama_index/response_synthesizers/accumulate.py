@@ -1,7 +1,7 @@
 import asyncio
 from typing import Any, List, Optional, Sequence
 
-from llama_index.async_utils import run_async_tasks
+from llama_index.async_utils import asyncio_run, run_jobs
 from llama_index.indices.service_context import ServiceContext
 from llama_index.prompts import BasePromptTemplate
 from llama_index.prompts.default_prompts import DEFAULT_TEXT_QA_PROMPT
@@ -80,7 +80,7 @@ class Accumulate(BaseSynthesizer):
         outputs = self.flatten_list(tasks)
 
         if self._use_async:
-            outputs = run_async_tasks(outputs)
+            outputs = asyncio_run(run_jobs(outputs))
 
         return self._format_response(outputs, separator)
 
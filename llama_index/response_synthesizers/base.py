@@ -8,6 +8,7 @@ Will support different modes, from 1) stuffing chunks into prompt,
 
 """
 import logging
+import time
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Generator, List, Optional, Sequence, Union
 
@@ -15,6 +16,7 @@ from llama_index.callbacks.schema import CBEventType, EventPayload
 from llama_index.indices.query.schema import QueryBundle
 from llama_index.indices.service_context import ServiceContext
 from llama_index.response.schema import RESPONSE_TYPE, Response, StreamingResponse
+from llama_index.response.streaming import StreamingMetrics
 from llama_index.schema import BaseNode, NodeWithScore, MetadataMode
 from llama_index.types import RESPONSE_TEXT_TYPE
 
@@ -87,8 +89,15 @@ class BaseSynthesizer(ABC):
         self,
         response_str: Optional[RESPONSE_TEXT_TYPE],
         source_nodes: List[NodeWithScore],
+        start_time: Optional[float] = None,
     ) -> RESPONSE_TYPE:
-        """Prepare response object from response string."""
+        """Prepare response object from response string.
+
+        `start_time` (a `time.perf_counter` value) is when synthesis started, so that
+        the first-token latency of a streaming response includes the LLM calls
+        made before the final one.
+
+        """
         response_metadata = self._get_metadata_for_response(
             [node_with_score.node for node_with_score in source_nodes]
         )
@@ -100,10 +109,16 @@ class BaseSynthesizer(ABC):
                 metadata=response_metadata,
             )
         elif response_str is None or isinstance(response_str, Generator):
+            metrics = (
+                StreamingMetrics()
+                if start_time is None
+                else StreamingMetrics(start_time=start_time)
+            )
             return StreamingResponse(
                 response_str,
                 source_nodes=source_nodes,
                 metadata=response_metadata,
+                metrics=metrics,
             )
         else:
             raise ValueError(
@@ -122,6 +137,7 @@ class BaseSynthesizer(ABC):
         with self._callback_manager.event(
             CBEventType.SYNTHESIZE, payload={EventPayload.QUERY_STR: query.query_str}
         ) as event:
+            start_time = time.perf_counter()
             response_str = self.get_response(
                 query_str=query.query_str,
                 text_chunks=[
@@ -132,7 +148,9 @@ class BaseSynthesizer(ABC):
             additional_source_nodes = additional_source_nodes or []
             source_nodes = list(nodes) + list(additional_source_nodes)
 
-            response = self._prepare_response_output(response_str, source_nodes)
+            response = self._prepare_response_output(
+                response_str, source_nodes, start_time=start_time
+            )
 
             event.on_end(payload={EventPayload.RESPONSE: response})
 
@@ -150,6 +168,7 @@ class BaseSynthesizer(ABC):
         with self._callback_manager.event(
             CBEventType.SYNTHESIZE, payload={EventPayload.QUERY_STR: query.query_str}
         ) as event:
+            start_time = time.perf_counter()
             response_str = await self.aget_response(
                 query_str=query.query_str,
                 text_chunks=[
@@ -160,7 +179,9 @@ class BaseSynthesizer(ABC):
             additional_source_nodes = additional_source_nodes or []
             source_nodes = list(nodes) + list(additional_source_nodes)
 
-            response = self._prepare_response_output(response_str, source_nodes)
+            response = self._prepare_response_output(
+                response_str, source_nodes, start_time=start_time
+            )
 
             event.on_end(payload={EventPayload.RESPONSE: response})
 
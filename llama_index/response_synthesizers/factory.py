@@ -1,5 +1,6 @@
 from typing import Optional, Callable
 
+from llama_index.async_utils import DEFAULT_NUM_WORKERS
 from llama_index.callbacks.base import CallbackManager
 from llama_index.indices.service_context import ServiceContext
 from llama_index.prompts import BasePromptTemplate
@@ -18,6 +19,7 @@ from llama_index.response_synthesizers.compact_and_accumulate import (
 )
 from llama_index.response_synthesizers.compact_and_refine import CompactAndRefine
 from llama_index.response_synthesizers.generation import Generation
+from llama_index.response_synthesizers.map_reduce import MapReduce
 from llama_index.response_synthesizers.no_text import NoText
 from llama_index.response_synthesizers.refine import Refine
 from llama_index.response_synthesizers.simple_summarize import SimpleSummarize
@@ -38,8 +40,14 @@ def get_response_synthesizer(
     structured_answer_filtering: bool = False,
     program_factory: Optional[Callable[[PromptTemplate], BasePydanticProgram]] = None,
     verbose: bool = False,
+    max_concurrency: int = DEFAULT_NUM_WORKERS,
 ) -> BaseSynthesizer:
-    """Get a response synthesizer."""
+    """Get a response synthesizer.
+
+    `max_concurrency` bounds the number of LLM calls in flight at once for the
+    response modes that make them concurrently (map-reduce, tree summarize).
+
+    """
 
     text_qa_template = text_qa_template or DEFAULT_TEXT_QA_PROMPT_SEL
     refine_template = refine_template or DEFAULT_REFINE_PROMPT_SEL
@@ -77,6 +85,18 @@ def get_response_synthesizer(
             streaming=streaming,
             use_async=use_async,
             verbose=verbose,
+            max_concurrency=max_concurrency,
+        )
+    elif response_mode == ResponseMode.MAP_REDUCE:
+        return MapReduce(
+            service_context=service_context,
+            text_qa_template=text_qa_template,
+            summary_template=summary_template,
+            streaming=streaming,
+            structured_answer_filtering=structured_answer_filtering,
+            program_factory=program_factory,
+            verbose=verbose,
+            max_concurrency=max_concurrency,
         )
     elif response_mode == ResponseMode.SIMPLE_SUMMARIZE:
         return SimpleSummarize(
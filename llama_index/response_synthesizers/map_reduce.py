@@ -0,0 +1,169 @@
+from typing import Any, Callable, Generator, List, Optional, Sequence, cast
+
+from llama_index.async_utils import DEFAULT_NUM_WORKERS, asyncio_run, run_jobs
+from llama_index.indices.service_context import ServiceContext
+from llama_index.program.base_program import BasePydanticProgram
+from llama_index.prompts import BasePromptTemplate, PromptTemplate
+from llama_index.prompts.default_prompt_selectors import (
+    DEFAULT_TEXT_QA_PROMPT_SEL,
+    DEFAULT_TREE_SUMMARIZE_PROMPT_SEL,
+)
+from llama_index.response_synthesizers.base import BaseSynthesizer
+from llama_index.response_synthesizers.refine import (
+    StructuredRefineResponse,
+    get_default_program,
+)
+from llama_index.types import RESPONSE_TEXT_TYPE
+
+
+def _get_single_token_gen(text: str) -> Generator[str, None, None]:
+    yield text
+
+
+class MapReduce(BaseSynthesizer):
+    """
+    Map-reduce response builder.
+
+    A parallel alternative to refine:
+    1. map: the text chunks are repacked to fill the context window, and each chunk
+       is answered independently and concurrently with the text QA prompt. With
+       `structured_answer_filtering`, chunks that do not answer the query are dropped.
+    2. reduce: the answers are repacked and merged with the summary prompt, level by
+       level, until a single answer is left. Merges of the same level run
+       concurrently, and the final merge is streamed if `streaming`.
+
+    At most `max_concurrency` LLM calls are in flight at once. Every call goes
+    through the LLM of the service context, so it is reported to its callback
+    manager.
+    """
+
+    def __init__(
+        self,
+        service_context: Optional[ServiceContext] = None,
+        text_qa_template: Optional[BasePromptTemplate] = None,
+        summary_template: Optional[BasePromptTemplate] = None,
+        streaming: bool = False,
+        verbose: bool = False,
+        structured_answer_filtering: bool = False,
+        program_factory: Optional[
+            Callable[[PromptTemplate], BasePydanticProgram]
+        ] = None,
+        max_concurrency: int = DEFAULT_NUM_WORKERS,
+    ) -> None:
+        super().__init__(service_context=service_context, streaming=streaming)
+        self._text_qa_template = text_qa_template or DEFAULT_TEXT_QA_PROMPT_SEL
+        self._summary_template = summary_template or DEFAULT_TREE_SUMMARIZE_PROMPT_SEL
+        self._verbose = verbose
+        self._structured_answer_filtering = structured_answer_filtering
+        self._max_concurrency = max_concurrency
+
+        if not self._structured_answer_filtering and program_factory is not None:
+            raise ValueError(
+                "Program factory not supported without structured answer filtering."
+            )
+        self._program_factory = program_factory or self._default_program_factory
+
+    def _default_program_factory(self, prompt: PromptTemplate) -> BasePydanticProgram:
+        return get_default_program(
+            prompt,
+            service_context=self._service_context,
+            structured_answer_filtering=self._structured_answer_filtering,
+            verbose=self._verbose,
+        )
+
+    def get_response(
+        self,
+        query_str: str,
+        text_chunks: Sequence[str],
+        **response_kwargs: Any,
+    ) -> RESPONSE_TEXT_TYPE:
+        """Get map-reduce response."""
+        return asyncio_run(self._aget_response(query_str, text_chunks))
+
+    async def aget_response(
+        self,
+        query_str: str,
+        text_chunks: Sequence[str],
+        **response_kwargs: Any,
+    ) -> RESPONSE_TEXT_TYPE:
+        """Get map-reduce response."""
+        return await self._aget_response(query_str, text_chunks)
+
+    async def _aget_response(
+        self, query_str: str, text_chunks: Sequence[str]
+    ) -> RESPONSE_TEXT_TYPE:
+        text_qa_template = self._text_qa_template.partial_format(query_str=query_str)
+        text_chunks = self._service_context.prompt_helper.repack(
+            text_qa_template, text_chunks
+        )
+        if len(text_chunks) == 1 and not self._structured_answer_filtering:
+            # nothing to map or reduce
+            return await self._agive_final_response(text_qa_template, text_chunks[0])
+
+        answers = await self._amap(text_qa_template, text_chunks)
+        if self._verbose:
+            print(f"> Mapped {len(text_chunks)} chunks to {len(answers)} answers")
+        if len(answers) == 0:
+            return "Empty Response"
+
+        return await self._areduce(query_str, answers)
+
+    async def _amap(
+        self, text_qa_template: BasePromptTemplate, text_chunks: Sequence[str]
+    ) -> List[str]:
+        """Answer each text chunk, dropping the chunks that do not answer."""
+        program = self._program_factory(cast(PromptTemplate, text_qa_template))
+        jobs = [program.acall(context_str=text_chunk) for text_chunk in text_chunks]
+        structured_responses = cast(
+            List[StructuredRefineResponse],
+            await run_jobs(jobs, workers=self._max_concurrency),
+        )
+        return [
+            structured_response.answer
+            for structured_response in structured_responses
+            if structured_response.query_satisfied
+        ]
+
+    async def _areduce(self, query_str: str, answers: List[str]) -> RESPONSE_TEXT_TYPE:
+        """Merge answers level by level until a single one is left."""
+        summary_template = self._summary_template.partial_format(query_str=query_str)
+        while len(answers) > 1:
+            text_chunks = self._service_context.prompt_helper.repack(
+                summary_template, answers
+            )
+            if self._verbose:
+                print(f"> Reducing {len(answers)} answers in {len(text_chunks)} chunks")
+            if len(text_chunks) == 1:
+                return await self._agive_final_response(
+                    summary_template, text_chunks[0]
+                )
+
+            jobs = [
+                self._service_context.llm_predictor.apredict(
+                    summary_template,
+                    context_str=text_chunk,
+                )
+                for text_chunk in text_chunks
+            ]
+            answers = await run_jobs(jobs, workers=self._max_concurrency)
+
+        if self._streaming:
+            return _get_single_token_gen(answers[0])
+        return answers[0] or "Empty Response"
+
+    async def _agive_final_response(
+        self, prompt: BasePromptTemplate, text_chunk: str
+    ) -> RESPONSE_TEXT_TYPE:
+        response: RESPONSE_TEXT_TYPE
+        if self._streaming:
+            response = self._service_context.llm_predictor.stream(
+                prompt,
+                context_str=text_chunk,
+            )
+        else:
+            response = await self._service_context.llm_predictor.apredict(
+                prompt,
+                context_str=text_chunk,
+            )
+            response = response or "Empty Response"
+        return response
@@ -71,6 +71,41 @@ class DefaultRefineProgram(BasePydanticProgram):
         return StructuredRefineResponse(answer=answer, query_satisfied=True)
 
 
+def get_default_program(
+    prompt: PromptTemplate,
+    service_context: ServiceContext,
+    structured_answer_filtering: bool = False,
+    verbose: bool = False,
+) -> BasePydanticProgram:
+    """Get the program answering a query with `prompt`.
+
+    With `structured_answer_filtering`, the program also reports whether the
+    context was enough to answer the query.
+
+    """
+    if structured_answer_filtering:
+        try:
+            return OpenAIPydanticProgram.from_defaults(
+                StructuredRefineResponse,
+                prompt=prompt,
+                llm=service_context.llm,
+                verbose=verbose,
+            )
+        except ValueError:
+            output_parser = PydanticOutputParser(StructuredRefineResponse)
+            return LLMTextCompletionProgram.from_defaults(
+                output_parser,
+                prompt=prompt,
+                llm=service_context.llm,
+                verbose=verbose,
+            )
+    else:
+        return DefaultRefineProgram(
+            prompt=prompt,
+            llm_predictor=service_context.llm_predictor,
+        )
+
+
 class Refine(BaseSynthesizer):
     """Refine a response to a query across text chunks."""
 
@@ -133,27 +168,12 @@ class Refine(BaseSynthesizer):
         return response
 
     def _default_program_factory(self, prompt: PromptTemplate) -> BasePydanticProgram:
-        if self._structured_answer_filtering:
-            try:
-                return OpenAIPydanticProgram.from_defaults(
-                    StructuredRefineResponse,
-                    prompt=prompt,
-                    llm=self._service_context.llm,
-                    verbose=self._verbose,
-                )
-            except ValueError:
-                output_parser = PydanticOutputParser(StructuredRefineResponse)
-                return LLMTextCompletionProgram.from_defaults(
-                    output_parser,
-                    prompt=prompt,
-                    llm=self._service_context.llm,
-                    verbose=self._verbose,
-                )
-        else:
-            return DefaultRefineProgram(
-                prompt=prompt,
-                llm_predictor=self._service_context.llm_predictor,
-            )
+        return get_default_program(
+            prompt,
+            service_context=self._service_context,
+            structured_answer_filtering=self._structured_answer_filtering,
+            verbose=self._verbose,
+        )
 
     def _give_response_single(
         self,
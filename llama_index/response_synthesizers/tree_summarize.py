@@ -1,7 +1,7 @@
 import asyncio
-from typing import Any, List, Optional, Sequence
+from typing import Any, AsyncIterator, List, Optional, Sequence, Tuple
 
-from llama_index.async_utils import run_async_tasks
+from llama_index.async_utils import DEFAULT_NUM_WORKERS, asyncio_run
 from llama_index.indices.service_context import ServiceContext
 from llama_index.prompts import BasePromptTemplate
 from llama_index.prompts.default_prompt_selectors import (
@@ -11,6 +11,19 @@ from llama_index.response_synthesizers.base import BaseSynthesizer
 from llama_index.types import RESPONSE_TEXT_TYPE
 
 
+async def _aiter_chunks(text_chunks: Sequence[str]) -> AsyncIterator[Tuple[str, bool]]:
+    for i, text_chunk in enumerate(text_chunks):
+        yield text_chunk, i == len(text_chunks) - 1
+
+
+async def _achain(
+    first: str, rest: AsyncIterator[Tuple[str, bool]]
+) -> AsyncIterator[str]:
+    yield first
+    async for text_chunk, _ in rest:
+        yield text_chunk
+
+
 class TreeSummarize(BaseSynthesizer):
     """
     Tree summarize response builder.
@@ -22,6 +35,11 @@ class TreeSummarize(BaseSynthesizer):
     1. we repack the text chunks so that each chunk fills the context window of the LLM
     2. if there is only one chunk, we give the final response
     3. otherwise, we summarize each chunk and recursively summarize the summaries.
+
+    When run async (`aget_response`, or `use_async`), the levels are pipelined:
+    summaries are packed into the next level as they complete (in order), and a
+    next-level chunk is summarized as soon as it is full, instead of waiting for the
+    whole level. At most `max_concurrency` summaries are generated at once.
     """
 
     def __init__(
@@ -31,11 +49,13 @@ class TreeSummarize(BaseSynthesizer):
         streaming: bool = False,
         use_async: bool = False,
         verbose: bool = False,
+        max_concurrency: int = DEFAULT_NUM_WORKERS,
     ) -> None:
         super().__init__(service_context=service_context, streaming=streaming)
         self._summary_template = summary_template or DEFAULT_TREE_SUMMARIZE_PROMPT_SEL
         self._use_async = use_async
         self._verbose = verbose
+        self._max_concurrency = max_concurrency
 
     async def aget_response(
         self,
@@ -53,38 +73,7 @@ class TreeSummarize(BaseSynthesizer):
         if self._verbose:
             print(f"{len(text_chunks)} text chunks after repacking")
 
-        # give final response if there is only one chunk
-        if len(text_chunks) == 1:
-            response: RESPONSE_TEXT_TYPE
-            if self._streaming:
-                response = self._service_context.llm_predictor.stream(
-                    summary_template,
-                    context_str=text_chunks[0],
-                )
-            else:
-                response = await self._service_context.llm_predictor.apredict(
-                    summary_template,
-                    context_str=text_chunks[0],
-                )
-            return response
-
-        else:
-            # summarize each chunk
-            tasks = [
-                self._service_context.llm_predictor.apredict(
-                    summary_template,
-                    context_str=text_chunk,
-                )
-                for text_chunk in text_chunks
-            ]
-
-            summaries: List[str] = await asyncio.gather(*tasks)
-
-            # recursively summarize the summaries
-            return await self.aget_response(
-                query_str=query_str,
-                text_chunks=summaries,
-            )
+        return await self._asummarize_tree(summary_template, text_chunks)
 
     def get_response(
         self,
@@ -102,6 +91,9 @@ class TreeSummarize(BaseSynthesizer):
         if self._verbose:
             print(f"{len(text_chunks)} text chunks after repacking")
 
+        if self._use_async:
+            return asyncio_run(self._asummarize_tree(summary_template, text_chunks))
+
         # give final response if there is only one chunk
         if len(text_chunks) == 1:
             response: RESPONSE_TEXT_TYPE
@@ -119,27 +111,121 @@ class TreeSummarize(BaseSynthesizer):
 
         else:
             # summarize each chunk
-            if self._use_async:
-                tasks = [
-                    self._service_context.llm_predictor.apredict(
-                        summary_template,
-                        context_str=text_chunk,
-                    )
-                    for text_chunk in text_chunks
-                ]
-
-                summaries: List[str] = run_async_tasks(tasks)
-            else:
-                summaries = [
-                    self._service_context.llm_predictor.predict(
-                        summary_template,
-                        context_str=text_chunk,
-                    )
-                    for text_chunk in text_chunks
-                ]
+            summaries = [
+                self._service_context.llm_predictor.predict(
+                    summary_template,
+                    context_str=text_chunk,
+                )
+                for text_chunk in text_chunks
+            ]
 
             # recursively summarize the summaries
             return self.get_response(
                 query_str=query_str,
                 text_chunks=summaries,
             )
+
+    async def _asummarize_tree(
+        self, summary_template: BasePromptTemplate, text_chunks: Sequence[str]
+    ) -> RESPONSE_TEXT_TYPE:
+        """Summarize repacked text chunks, pipelining the levels of the tree."""
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        tasks: List[asyncio.Future] = []
+        level_chunks = _aiter_chunks(text_chunks or [""])
+        try:
+            while True:
+                text_chunk, is_last = await level_chunks.__anext__()
+                # give final response if there is only one chunk
+                if is_last:
+                    return await self._agive_final_response(
+                        summary_template, text_chunk
+                    )
+
+                summaries = self._asummarize_chunks(
+                    summary_template,
+                    _achain(text_chunk, level_chunks),
+                    semaphore,
+                    tasks,
+                )
+                level_chunks = self._apack(summary_template, summaries)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _asummarize_chunks(
+        self,
+        summary_template: BasePromptTemplate,
+        text_chunks: AsyncIterator[str],
+        semaphore: asyncio.Semaphore,
+        tasks: List[asyncio.Future],
+    ) -> AsyncIterator[str]:
+        """Summarize text chunks as they arrive, yielding the summaries in order."""
+        pending: asyncio.Queue = asyncio.Queue()
+
+        async def summarize(text_chunk: str) -> str:
+            async with semaphore:
+                return await self._service_context.llm_predictor.apredict(
+                    summary_template,
+                    context_str=text_chunk,
+                )
+
+        async def schedule() -> None:
+            try:
+                async for text_chunk in text_chunks:
+                    task = asyncio.ensure_future(summarize(text_chunk))
+                    tasks.append(task)
+                    pending.put_nowait(task)
+            finally:
+                pending.put_nowait(None)
+
+        scheduler = asyncio.ensure_future(schedule())
+        tasks.append(scheduler)
+        while True:
+            task = await pending.get()
+            if task is None:
+                break
+            yield await task
+        # surface errors of the previous level
+        await scheduler
+
+    async def _apack(
+        self, summary_template: BasePromptTemplate, texts: AsyncIterator[str]
+    ) -> AsyncIterator[Tuple[str, bool]]:
+        """Repack texts as they arrive.
+
+        Yields each chunk once it is full, and whether it is the last chunk.
+
+        """
+        buffer: List[str] = []
+        num_chunks = 0
+        async for text in texts:
+            buffer.append(text)
+            text_chunks = self._service_context.prompt_helper.repack(
+                summary_template, text_chunks=buffer
+            )
+            # every chunk but the last is full, whatever comes next
+            for text_chunk in text_chunks[:-1]:
+                num_chunks += 1
+                yield text_chunk, False
+            buffer = text_chunks[-1:]
+
+        num_chunks += 1
+        if self._verbose:
+            print(f"{num_chunks} text chunks after repacking")
+        yield (buffer[0] if buffer else ""), True
+
+    async def _agive_final_response(
+        self, summary_template: BasePromptTemplate, text_chunk: str
+    ) -> RESPONSE_TEXT_TYPE:
+        response: RESPONSE_TEXT_TYPE
+        if self._streaming:
+            response = self._service_context.llm_predictor.stream(
+                summary_template,
+                context_str=text_chunk,
+            )
+        else:
+            response = await self._service_context.llm_predictor.apredict(
+                summary_template,
+                context_str=text_chunk,
+            )
+        return response
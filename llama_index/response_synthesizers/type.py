@@ -36,6 +36,14 @@ class ResponseMode(str, Enum):
     returned as the response
     """
 
+    MAP_REDUCE = "map_reduce"
+    """
+    Map-reduce mode first answers the query over each (compacted) text chunk \
+    concurrently, then merges the answers with the summary prompt in a bottoms-up \
+    fashion, concurrently within each level, until a single answer is left.
+    This mode is faster than compact since the LLM calls do not wait on each other.
+    """
+
     GENERATION = "generation"
     """Ignore context, just use LLM to generate a response."""
 
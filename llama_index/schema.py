@@ -4,7 +4,7 @@ import uuid
 from abc import abstractmethod
 from enum import Enum, auto
 from hashlib import sha256
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 from typing_extensions import Self
 
 try:
@@ -12,9 +12,11 @@ try:
 except ImportError:
     from pydantic import BaseModel, Field, root_validator
 
-from llama_index.bridge.langchain import Document as LCDocument
 from llama_index.utils import SAMPLE_TEXT
 
+if TYPE_CHECKING:
+    from llama_index.bridge.langchain import Document as LCDocument
+
 DEFAULT_TEXT_NODE_TMPL = "{metadata_str}\n\n{content}"
 DEFAULT_METADATA_TMPL = "{key}: {value}"
 
@@ -445,13 +447,15 @@ class Document(TextNode):
             name = self._compat_fields[name]
         super().__setattr__(name, value)
 
-    def to_langchain_format(self) -> LCDocument:
+    def to_langchain_format(self) -> "LCDocument":
         """Convert struct to LangChain document format."""
+        from llama_index.bridge.langchain import Document as LCDocument
+
         metadata = self.metadata or {}
         return LCDocument(page_content=self.text, metadata=metadata)
 
     @classmethod
-    def from_langchain_format(cls, doc: LCDocument) -> "Document":
+    def from_langchain_format(cls, doc: "LCDocument") -> "Document":
         """Convert struct from LangChain document format."""
         return cls(text=doc.page_content, metadata=doc.metadata)
 
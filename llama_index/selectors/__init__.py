@@ -1,9 +1,15 @@
 from llama_index.selectors.types import BaseSelector, SelectorResult
 from llama_index.selectors.llm_selectors import LLMSingleSelector, LLMMultiSelector
+from llama_index.selectors.embedding_selectors import (
+    EmbeddingSingleSelector,
+    EmbeddingMultiSelector,
+)
 
 __all__ = [
     "BaseSelector",
     "SelectorResult",
     "LLMSingleSelector",
     "LLMMultiSelector",
+    "EmbeddingSingleSelector",
+    "EmbeddingMultiSelector",
 ]
@@ -0,0 +1,258 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from llama_index.embeddings.base import BaseEmbedding
+from llama_index.indices.query.schema import QueryBundle
+from llama_index.indices.service_context import ServiceContext
+from llama_index.selectors.types import BaseSelector, SelectorResult, SingleSelection
+from llama_index.selectors.utils import get_selector_from_context
+from llama_index.tools.types import ToolMetadata
+
+# minimum similarity margin for a selection to be confident
+DEFAULT_MARGIN_THRESHOLD = 0.05
+
+
+def _normalize(embedding: List[float]) -> np.ndarray:
+    vector = np.array(embedding, dtype=np.float64)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm > 0 else vector
+
+
+def _select_by_similarity(
+    similarities: np.ndarray, max_outputs: int
+) -> Tuple[List[int], float]:
+    """Select the choices ranked before the largest drop in similarity.
+
+    At most `max_outputs` choices are selected. Returns the selected indices,
+    best first, and the margin between the last selected choice and the next one.
+
+    """
+    ranking = np.argsort(-similarities, kind="stable")
+    if len(ranking) == 1:
+        return [int(ranking[0])], float("inf")
+
+    ranked_similarities = similarities[ranking]
+    gaps = ranked_similarities[:-1] - ranked_similarities[1:]
+    num_selected = int(np.argmax(gaps[:max_outputs])) + 1
+    return [int(ind) for ind in ranking[:num_selected]], float(gaps[num_selected - 1])
+
+
+class BaseEmbeddingSelector(BaseSelector):
+    """Base embedding selector.
+
+    Selects the choices whose descriptions are the most similar to the query.
+    Descriptions are embedded once, and their embeddings cached by the selector.
+
+    When the selection isn't confident, that is when the similarity margin between
+    the selected choices and the others is below `margin_threshold`, the fallback
+    selector (e.g. an LLM selector) is used instead, if any.
+
+    Args:
+        embed_model (BaseEmbedding): An embedding model.
+        fallback_selector (Optional[BaseSelector]): A selector for the queries
+            that can't be confidently routed by similarity.
+        margin_threshold (float): Minimum similarity margin for a selection to be
+            confident.
+        max_outputs (int): Maximum number of choices to select.
+    """
+
+    def __init__(
+        self,
+        embed_model: BaseEmbedding,
+        fallback_selector: Optional[BaseSelector] = None,
+        margin_threshold: float = DEFAULT_MARGIN_THRESHOLD,
+        max_outputs: Optional[int] = None,
+    ) -> None:
+        self._embed_model = embed_model
+        self._fallback_selector = fallback_selector
+        self._margin_threshold = margin_threshold
+        self._max_outputs = max_outputs
+        self._description_embeddings: Dict[str, np.ndarray] = {}
+
+    def _get_choice_matrix(self, choices: Sequence[ToolMetadata]) -> np.ndarray:
+        return np.stack(
+            [self._description_embeddings[choice.description] for choice in choices]
+        )
+
+    def _embed_descriptions(self, choices: Sequence[ToolMetadata]) -> None:
+        """Embed the descriptions that aren't cached yet, in batches."""
+        descriptions = self._get_missing_descriptions(choices)
+        if len(descriptions) == 0:
+            return
+        for description in descriptions:
+            self._embed_model.queue_text_for_embedding(description, description)
+        result_ids, result_embeddings = self._embed_model.get_queued_text_embeddings()
+        self._cache_embeddings(result_ids, result_embeddings)
+
+    async def _aembed_descriptions(self, choices: Sequence[ToolMetadata]) -> None:
+        """Asynchronously embed the descriptions that aren't cached yet."""
+        descriptions = self._get_missing_descriptions(choices)
+        if len(descriptions) == 0:
+            return
+        text_queue = [(description, description) for description in descriptions]
+        (
+            result_ids,
+            result_embeddings,
+        ) = await self._embed_model.aget_queued_text_embeddings(text_queue)
+        self._cache_embeddings(result_ids, result_embeddings)
+
+    def _get_missing_descriptions(self, choices: Sequence[ToolMetadata]) -> List[str]:
+        # dict to dedupe, keeping the order
+        return list(
+            {
+                choice.description: None
+                for choice in choices
+                if choice.description not in self._description_embeddings
+            }
+        )
+
+    def _cache_embeddings(
+        self, descriptions: List[str], embeddings: List[List[float]]
+    ) -> None:
+        for description, embedding in zip(descriptions, embeddings):
+            self._description_embeddings[description] = _normalize(embedding)
+
+    def _get_query_embedding(self, query: QueryBundle) -> List[float]:
+        if query.embedding is not None:
+            return query.embedding
+        return self._embed_model.get_agg_embedding_from_queries(query.embedding_strs)
+
+    async def _aget_query_embedding(self, query: QueryBundle) -> List[float]:
+        if query.embedding is not None:
+            return query.embedding
+        return await self._embed_model.aget_agg_embedding_from_queries(
+            query.embedding_strs
+        )
+
+    def _select_by_embedding(
+        self, choices: Sequence[ToolMetadata], query_embedding: List[float]
+    ) -> Optional[SelectorResult]:
+        """Select by similarity, None if the selection isn't confident."""
+        similarities = self._get_choice_matrix(choices) @ _normalize(query_embedding)
+        inds, margin = _select_by_similarity(
+            similarities, self._max_outputs or len(choices)
+        )
+        if margin < self._margin_threshold and self._fallback_selector is not None:
+            return None
+
+        return SelectorResult(
+            selections=[
+                SingleSelection(
+                    index=ind,
+                    reason=(
+                        "Most similar description "
+                        f"(similarity {similarities[ind]:.3f})"
+                    ),
+                )
+                for ind in inds
+            ]
+        )
+
+    def _select(
+        self, choices: Sequence[ToolMetadata], query: QueryBundle
+    ) -> SelectorResult:
+        self._embed_descriptions(choices)
+        result = self._select_by_embedding(choices, self._get_query_embedding(query))
+        if result is None:
+            assert self._fallback_selector is not None
+            return self._fallback_selector.select(choices, query)
+        return result
+
+    async def _aselect(
+        self, choices: Sequence[ToolMetadata], query: QueryBundle
+    ) -> SelectorResult:
+        await self._aembed_descriptions(choices)
+        result = self._select_by_embedding(
+            choices, await self._aget_query_embedding(query)
+        )
+        if result is None:
+            assert self._fallback_selector is not None
+            return await self._fallback_selector.aselect(choices, query)
+        return result
+
+
+class EmbeddingSingleSelector(BaseEmbeddingSelector):
+    """Embedding single selector
+
+    Embedding-based selector that chooses one out of many options: the one whose
+    description is the most similar to the query. If the similarity margin with
+    the second best option is below `margin_threshold`, the fallback selector
+    chooses instead.
+
+    Args:
+        embed_model (BaseEmbedding): An embedding model.
+        fallback_selector (Optional[BaseSelector]): A selector for the queries
+            that can't be confidently routed by similarity.
+        margin_threshold (float): Minimum similarity margin for a selection to be
+            confident.
+    """
+
+    def __init__(
+        self,
+        embed_model: BaseEmbedding,
+        fallback_selector: Optional[BaseSelector] = None,
+        margin_threshold: float = DEFAULT_MARGIN_THRESHOLD,
+    ) -> None:
+        super().__init__(
+            embed_model,
+            fallback_selector=fallback_selector,
+            margin_threshold=margin_threshold,
+            max_outputs=1,
+        )
+
+    @classmethod
+    def from_defaults(
+        cls,
+        service_context: Optional[ServiceContext] = None,
+        fallback_selector: Optional[BaseSelector] = None,
+        use_llm_fallback: bool = True,
+        margin_threshold: float = DEFAULT_MARGIN_THRESHOLD,
+    ) -> "EmbeddingSingleSelector":
+        service_context = service_context or ServiceContext.from_defaults()
+        if fallback_selector is None and use_llm_fallback:
+            fallback_selector = get_selector_from_context(service_context)
+        return cls(
+            service_context.embed_model,
+            fallback_selector=fallback_selector,
+            margin_threshold=margin_threshold,
+        )
+
+
+class EmbeddingMultiSelector(BaseEmbeddingSelector):
+    """Embedding multi selector
+
+    Embedding-based selector that chooses multiple out of many options: the options
+    ranked by similarity to the query before the largest drop in similarity (among
+    the first `max_outputs`). If that drop is below `margin_threshold`, the
+    fallback selector chooses instead.
+
+    Args:
+        embed_model (BaseEmbedding): An embedding model.
+        fallback_selector (Optional[BaseSelector]): A selector for the queries
+            that can't be confidently routed by similarity.
+        margin_threshold (float): Minimum similarity margin for a selection to be
+            confident.
+        max_outputs (Optional[int]): Maximum number of options to select.
+    """
+
+    @classmethod
+    def from_defaults(
+        cls,
+        service_context: Optional[ServiceContext] = None,
+        fallback_selector: Optional[BaseSelector] = None,
+        use_llm_fallback: bool = True,
+        margin_threshold: float = DEFAULT_MARGIN_THRESHOLD,
+        max_outputs: Optional[int] = None,
+    ) -> "EmbeddingMultiSelector":
+        service_context = service_context or ServiceContext.from_defaults()
+        if fallback_selector is None and use_llm_fallback:
+            fallback_selector = get_selector_from_context(
+                service_context, is_multi=True
+            )
+        return cls(
+            service_context.embed_model,
+            fallback_selector=fallback_selector,
+            margin_threshold=margin_threshold,
+            max_outputs=max_outputs,
+        )
@@ -44,7 +44,7 @@ DEFAULT_SINGLE_SELECT_PROMPT = PromptTemplate(
 # multiple select
 DEFAULT_MULTI_SELECT_PROMPT_TMPL = (
 "Ниже приведены некоторые варианты. Он представлен в пронумерованном "
-    "список (от 1 до {num_choices})",
+    "список (от 1 до {num_choices}), "
     "где каждому элементу в списке соответствует краткое описание.\n"
     "---------------------\ n"
     "{context_list}"
@@ -77,7 +77,7 @@ DEFAULT_SINGLE_PYD_SELECT_PROMPT_TMPL = (
 # multiple pydantic select
 DEFAULT_MULTI_PYD_SELECT_PROMPT_TMPL = (
 "Ниже приведены некоторые варианты. Он представлен в пронумерованном "
-    "список (от 1 до {num_choices})",
+    "список (от 1 до {num_choices}), "
     "где каждому элементу в списке соответствует краткое описание.\n"
     "---------------------\ n"
     "{context_list}"
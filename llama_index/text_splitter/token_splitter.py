@@ -1,6 +1,7 @@
 """Token splitter."""
 import logging
-from typing import Callable, List, Optional
+from collections import deque
+from typing import Callable, Deque, Iterable, Iterator, List, Optional, Tuple
 
 try:
     from pydantic.v1 import Field, PrivateAttr
@@ -46,6 +47,7 @@ class TokenTextSplitter(MetadataAwareTextSplitter):
     )
 
     _split_fns: List[Callable] = PrivateAttr()
+    _token_counter: Callable[[str], int] = PrivateAttr()
 
     def __init__(
         self,
@@ -55,8 +57,14 @@ class TokenTextSplitter(MetadataAwareTextSplitter):
         callback_manager: Optional[CallbackManager] = None,
         separator: str = " ",
         backup_separators: Optional[List[str]] = ["\n"],
+        token_counter: Optional[Callable[[str], int]] = None,
     ):
-        """Initialize with parameters."""
+        """Initialize with parameters.
+
+        `token_counter` (e.g. a cached one) counts the tokens of whole input
+        texts, it defaults to the length of the tokenized text.
+
+        """
         if chunk_overlap > chunk_size:
             raise ValueError(
                 f"Got a larger chunk overlap ({chunk_overlap}) than chunk size "
@@ -67,6 +75,7 @@ class TokenTextSplitter(MetadataAwareTextSplitter):
 
         all_seps = [separator] + (backup_separators or [])
         self._split_fns = [split_by_sep(sep) for sep in all_seps] + [split_by_char()]
+        self._token_counter = token_counter or self._count_tokens
 
         super().__init__(
             chunk_size=chunk_size,
@@ -82,9 +91,13 @@ class TokenTextSplitter(MetadataAwareTextSplitter):
         """Get class name."""
         return "TokenTextSplitter"
 
+    def _count_tokens(self, text: str) -> int:
+        """Count the tokens of text."""
+        return len(self.tokenizer(text))
+
     def split_text_metadata_aware(self, text: str, metadata_str: str) -> List[str]:
         """Split text into chunks, reserving space required for metadata str."""
-        metadata_len = len(self.tokenizer(metadata_str)) + DEFAULT_METADATA_FORMAT_LEN
+        metadata_len = self._token_counter(metadata_str) + DEFAULT_METADATA_FORMAT_LEN
         effective_chunk_size = self.chunk_size - metadata_len
         return self._split_text(text, chunk_size=effective_chunk_size)
 
@@ -92,16 +105,23 @@ class TokenTextSplitter(MetadataAwareTextSplitter):
         """Split text into chunks."""
         return self._split_text(text, chunk_size=self.chunk_size)
 
-    def _split_text(self, text: str, chunk_size: int) -> List[str]:
-        """Split text into chunks up to chunk_size."""
+    def truncate_text(self, text: str) -> str:
+        """Truncate text to its first chunk, without splitting the rest of it."""
+        chunks = self._split_text(text, chunk_size=self.chunk_size, max_chunks=1)
+        return chunks[0] if chunks else ""
+
+    def _split_text(
+        self, text: str, chunk_size: int, max_chunks: Optional[int] = None
+    ) -> List[str]:
+        """Split text into (at most `max_chunks`) chunks up to chunk_size."""
         if text == "":
             return []
 
         with self.callback_manager.event(
             CBEventType.CHUNKING, payload={EventPayload.CHUNKS: [text]}
         ) as event:
-            splits = self._split(text, chunk_size)
-            chunks = self._merge(splits, chunk_size)
+            splits = self._split(text, chunk_size, self._token_counter(text))
+            chunks = self._merge(splits, chunk_size, max_chunks=max_chunks)
 
             event.on_end(
                 payload={EventPayload.CHUNKS: chunks},
@@ -109,35 +129,42 @@ class TokenTextSplitter(MetadataAwareTextSplitter):
 
         return chunks
 
-    def _split(self, text: str, chunk_size: int) -> List[str]:
-        """Break text into splits that are smaller than chunk size.
+    def _split(
+        self, text: str, chunk_size: int, text_len: int
+    ) -> Iterator[Tuple[str, int]]:
+        """Break text (of `text_len` tokens) into splits smaller than chunk size.
 
         The order of splitting is:
         1. split by separator
         2. split by backup separators (if any)
         3. split by characters
 
-        NOTE: the splits contain the separators.
+        NOTE: the splits contain the separators. They are yielded lazily, with
+        their number of tokens, so that each split is tokenized once.
         """
-        if len(self.tokenizer(text)) <= chunk_size:
-            return [text]
+        if text_len <= chunk_size:
+            yield text, text_len
+            return
 
         for split_fn in self._split_fns:
             splits = split_fn(text)
             if len(splits) > 1:
                 break
 
-        new_splits = []
         for split in splits:
-            split_len = len(self.tokenizer(split))
+            split_len = self._count_tokens(split)
             if split_len <= chunk_size:
-                new_splits.append(split)
+                yield split, split_len
             else:
                 # recursively split
-                new_splits.extend(self._split(split, chunk_size=chunk_size))
-        return new_splits
+                yield from self._split(split, chunk_size, split_len)
 
-    def _merge(self, splits: List[str], chunk_size: int) -> List[str]:
+    def _merge(
+        self,
+        splits: Iterable[Tuple[str, int]],
+        chunk_size: int,
+        max_chunks: Optional[int] = None,
+    ) -> List[str]:
         """Merge splits into chunks.
 
         The high-level idea is to keep adding splits to a chunk until we
@@ -148,38 +175,41 @@ class TokenTextSplitter(MetadataAwareTextSplitter):
         """
         chunks: List[str] = []
 
-        cur_chunk: List[str] = []
+        cur_chunk: Deque[Tuple[str, int]] = deque()
         cur_len = 0
-        for split in splits:
-            split_len = len(self.tokenizer(split))
+        for split, split_len in splits:
             if split_len > chunk_size:
                 _logger.warning(
-                    f"Got a split of size {split_len}, ",
-                    f"larger than chunk size {chunk_size}.",
+                    f"Got a split of size {split_len}, "
+                    f"larger than chunk size {chunk_size}."
                 )
 
             # if we exceed the chunk size after adding the new split, then
             # we need to end the current chunk and start a new one
             if cur_len + split_len > chunk_size:
                 # end the previous chunk
-                chunk = "".join(cur_chunk).strip()
+                chunk = "".join([text for text, _ in cur_chunk]).strip()
                 if chunk:
                     chunks.append(chunk)
+                    if max_chunks is not None and len(chunks) >= max_chunks:
+                        return chunks
 
                 # start a new chunk with overlap
                 # keep popping off the first element of the previous chunk until:
                 #   1. the current chunk length is less than chunk overlap
                 #   2. the total length is less than chunk size
-                while cur_len > self.chunk_overlap or cur_len + split_len > chunk_size:
+                while cur_chunk and (
+                    cur_len > self.chunk_overlap or cur_len + split_len > chunk_size
+                ):
                     # pop off the first element
-                    first_chunk = cur_chunk.pop(0)
-                    cur_len -= len(self.tokenizer(first_chunk))
+                    _, first_len = cur_chunk.popleft()
+                    cur_len -= first_len
 
-            cur_chunk.append(split)
+            cur_chunk.append((split, split_len))
             cur_len += split_len
 
         # handle the last chunk
-        chunk = "".join(cur_chunk).strip()
+        chunk = "".join([text for text, _ in cur_chunk]).strip()
         if chunk:
             chunks.append(chunk)
 
@@ -13,6 +13,10 @@ class TextSplitter(ABC, BaseComponent):
     def split_text(self, text: str) -> List[str]:
         ...
 
+    def truncate_text(self, text: str) -> str:
+        """Truncate text to its first chunk."""
+        return self.split_text(text)[0]
+
 
 class MetadataAwareTextSplitter(TextSplitter):
     @abstractmethod
@@ -5,8 +5,7 @@ from llama_index.text_splitter.types import TextSplitter
 
 def truncate_text(text: str, text_splitter: TextSplitter) -> str:
     """Truncate text to fit within the chunk size."""
-    chunks = text_splitter.split_text(text)
-    return chunks[0]
+    return text_splitter.truncate_text(text)
 
 
 def split_text_keep_separator(text: str, separator: str) -> List[str]:
@@ -1,5 +1,8 @@
 """Query plan tool."""
 
+import asyncio
+import contextvars
+import time
 from typing import Any, Dict, List, Optional
 
 try:
@@ -7,10 +10,13 @@ try:
 except ImportError:
     from pydantic import BaseModel, Field
 
+from llama_index.async_utils import DEFAULT_NUM_WORKERS, asyncio_run
 from llama_index.bridge.langchain import print_text
+from llama_index.callbacks.base import CallbackManager
+from llama_index.callbacks.schema import CBEventType, EventPayload
 from llama_index.response_synthesizers import BaseSynthesizer, get_response_synthesizer
 from llama_index.schema import NodeWithScore, TextNode
-from llama_index.tools.types import BaseTool, ToolMetadata, ToolOutput
+from llama_index.tools.types import AsyncBaseTool, BaseTool, ToolMetadata, ToolOutput
 
 DEFAULT_NAME = "query_plan_tool"
 
@@ -84,6 +90,18 @@ class QueryPlanTool(BaseTool):
     """Query plan tool.
 
     A tool that takes in a list of tools and executes a query plan.
+    Independent nodes of the plan are executed concurrently, and every node is
+    executed once. Each node execution is reported to the callback manager as
+    a `QUERY_PLAN` event, with its duration in seconds.
+
+    Args:
+        query_engine_tools (List[BaseTool]): Tools that the plan can use.
+        response_synthesizer (BaseSynthesizer): Synthesizer combining the
+            responses of the dependencies of a node.
+        name (str): Name of the tool.
+        description_prefix (str): Prefix of the tool description.
+        max_concurrency (int): Maximum number of nodes executed at once.
+        callback_manager (Optional[CallbackManager]): Callback manager.
 
     """
 
@@ -93,12 +111,16 @@ class QueryPlanTool(BaseTool):
         response_synthesizer: BaseSynthesizer,
         name: str,
         description_prefix: str,
+        max_concurrency: int = DEFAULT_NUM_WORKERS,
+        callback_manager: Optional[CallbackManager] = None,
     ) -> None:
         """Initialize."""
         self._query_tools_dict = {t.metadata.name: t for t in query_engine_tools}
         self._response_synthesizer = response_synthesizer
         self._name = name
         self._description_prefix = description_prefix
+        self._max_concurrency = max_concurrency
+        self._callback_manager = callback_manager or CallbackManager([])
 
     @classmethod
     def from_defaults(
@@ -107,6 +129,8 @@ class QueryPlanTool(BaseTool):
         response_synthesizer: Optional[BaseSynthesizer] = None,
         name: Optional[str] = None,
         description_prefix: Optional[str] = None,
+        max_concurrency: int = DEFAULT_NUM_WORKERS,
+        callback_manager: Optional[CallbackManager] = None,
     ) -> "QueryPlanTool":
         """Initialize from defaults."""
         name = name or DEFAULT_NAME
@@ -118,6 +142,8 @@ class QueryPlanTool(BaseTool):
             response_synthesizer=response_synthesizer,
             name=name,
             description_prefix=description_prefix,
+            max_concurrency=max_concurrency,
+            callback_manager=callback_manager,
         )
 
     @property
@@ -139,22 +165,44 @@ class QueryPlanTool(BaseTool):
 
         return metadata
 
-    def _execute_node(
-        self, node: QueryNode, nodes_dict: Dict[int, QueryNode]
+    def _get_topological_order(
+        self, root_node: QueryNode, nodes_dict: Dict[int, QueryNode]
+    ) -> List[QueryNode]:
+        """Get the nodes reachable from the root, dependencies first.
+
+        Raises a ValueError if the plan has a cycle.
+
+        """
+        order: List[QueryNode] = []
+        # node id -> True once visited, False while on the current path
+        visited: Dict[int, bool] = {}
+
+        def _visit(node: QueryNode) -> None:
+            if node.id in visited:
+                if not visited[node.id]:
+                    raise ValueError(f"Query plan has a cycle through node {node.id}.")
+                return
+            visited[node.id] = False
+            for dep in node.dependencies:
+                _visit(nodes_dict[dep])
+            visited[node.id] = True
+            order.append(node)
+
+        _visit(root_node)
+        return order
+
+    async def _aexecute_node(
+        self,
+        node: QueryNode,
+        nodes_dict: Dict[int, QueryNode],
+        child_responses: List[ToolOutput],
     ) -> ToolOutput:
-        """Execute node."""
+        """Execute node, given the responses of its dependencies."""
         print_text(f"Executing node {node.json()}\n", color="blue")
         if len(node.dependencies) > 0:
-            print_text(
-                f"Executing {len(node.dependencies)} child nodes\n", color="pink"
-            )
             child_query_nodes: List[QueryNode] = [
                 nodes_dict[dep] for dep in node.dependencies
             ]
-            # execute the child nodes first
-            child_responses: List[ToolOutput] = [
-                self._execute_node(child, nodes_dict) for child in child_query_nodes
-            ]
             # form the child Node/NodeWithScore objects
             child_nodes = []
             for child_query_node, child_response in zip(
@@ -170,7 +218,7 @@ class QueryPlanTool(BaseTool):
             child_nodes_with_scores = [
                 NodeWithScore(node=n, score=1.0) for n in child_nodes
             ]
-            response_obj = self._response_synthesizer.synthesize(
+            response_obj = await self._response_synthesizer.asynthesize(
                 query=node.query_str,
                 nodes=child_nodes_with_scores,
             )
@@ -185,7 +233,14 @@ class QueryPlanTool(BaseTool):
             # this is a leaf request, execute the query string using the specified tool
             tool = self._query_tools_dict[node.tool_name]
             print_text(f"Selected Tool: {tool.metadata}\n", color="pink")
-            response = tool(node.query_str)
+            if isinstance(tool, AsyncBaseTool):
+                response = await tool.acall(node.query_str)
+            else:
+                # run sync tools in a thread so they don't block the other nodes
+                context = contextvars.copy_context()
+                response = await asyncio.get_running_loop().run_in_executor(
+                    None, context.run, tool, node.query_str
+                )
         print_text(
             "Executed query, got response.\n"
             f"Query: {node.query_str}\n"
@@ -194,6 +249,50 @@ class QueryPlanTool(BaseTool):
         )
         return response
 
+    async def _aexecute_plan(
+        self, root_node: QueryNode, nodes_dict: Dict[int, QueryNode]
+    ) -> ToolOutput:
+        """Execute the plan rooted at `root_node`.
+
+        Nodes are scheduled in topological order: each node starts as soon as
+        all its dependencies are done, so independent nodes run concurrently
+        (at most `max_concurrency` at a time). Every node runs exactly once,
+        even if it is a dependency of several nodes.
+
+        """
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        node_tasks: Dict[int, "asyncio.Future[ToolOutput]"] = {}
+
+        async def _run_node(node: QueryNode) -> ToolOutput:
+            child_responses = await asyncio.gather(
+                *[node_tasks[dep] for dep in node.dependencies]
+            )
+            async with semaphore:
+                with self._callback_manager.event(
+                    CBEventType.QUERY_PLAN,
+                    payload={EventPayload.QUERY_PLAN_NODE: node},
+                ) as event:
+                    start_time = time.perf_counter()
+                    response = await self._aexecute_node(
+                        node, nodes_dict, list(child_responses)
+                    )
+                    event.on_end(
+                        payload={
+                            EventPayload.RESPONSE: response,
+                            EventPayload.DURATION: time.perf_counter() - start_time,
+                        }
+                    )
+            return response
+
+        try:
+            # dependencies come first, so their tasks exist when a node needs them
+            for node in self._get_topological_order(root_node, nodes_dict):
+                node_tasks[node.id] = asyncio.ensure_future(_run_node(node))
+            return await node_tasks[root_node.id]
+        finally:
+            for task in node_tasks.values():
+                task.cancel()
+
     def _find_root_nodes(self, nodes_dict: Dict[int, QueryNode]) -> List[QueryNode]:
         """Find root node."""
         # the root node is the one that isn't a dependency of any other node
@@ -217,4 +316,15 @@ class QueryPlanTool(BaseTool):
         if len(root_nodes) > 1:
             raise ValueError("Query plan should have exactly one root node.")
 
-        return self._execute_node(root_nodes[0], nodes_dict)
+        return asyncio_run(self._aexecute_plan(root_nodes[0], nodes_dict))
+
+    async def acall(self, *args: Any, **kwargs: Any) -> ToolOutput:
+        """Asynchronously call."""
+        query_plan = QueryPlan(**kwargs)
+
+        nodes_dict = {node.id: node for node in query_plan.nodes}
+        root_nodes = self._find_root_nodes(nodes_dict)
+        if len(root_nodes) > 1:
+            raise ValueError("Query plan should have exactly one root node.")
+
+        return await self._aexecute_plan(root_nodes[0], nodes_dict)
@@ -2,6 +2,7 @@
 
 
 from typing import List, Optional, Dict, Type, Union, Tuple, Callable, Awaitable, Any
+from llama_index.async_utils import asyncio_run
 from llama_index.tools.types import ToolMetadata
 from llama_index.tools.function_tool import FunctionTool
 from inspect import signature
@@ -105,7 +106,9 @@ class BaseToolSpec:
 
 def patch_sync(func_async: AsyncCallable) -> Callable:
     def patched_sync(*args: Any, **kwargs: Any) -> Any:
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(func_async(*args, **kwargs))
+        async def _call() -> Any:
+            return await func_async(*args, **kwargs)
+
+        return asyncio_run(_call())
 
     return patched_sync
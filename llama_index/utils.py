@@ -1,5 +1,6 @@
 """General utils functions."""
 
+import importlib
 import os
 import random
 import sys
@@ -14,6 +15,8 @@ from pathlib import Path
 from typing import (
     Any,
     Callable,
+    Dict,
+    FrozenSet,
     Generator,
     Iterable,
     List,
@@ -35,6 +38,7 @@ class GlobalsHelper:
 
     _tokenizer: Optional[Callable[[str], List]] = None
     _stopwords: Optional[List[str]] = None
+    _stopwords_set: Optional[FrozenSet[str]] = None
 
     @property
     def tokenizer(self) -> Callable[[str], List]:
@@ -80,6 +84,13 @@ class GlobalsHelper:
             self._stopwords = stopwords.words("english")
         return self._stopwords
 
+    @property
+    def stopwords_set(self) -> FrozenSet[str]:
+        """Get stopwords as a frozen set, for constant-time membership checks."""
+        if self._stopwords_set is None:
+            self._stopwords_set = frozenset(self.stopwords)
+        return self._stopwords_set
+
 
 globals_helper = GlobalsHelper()
 
@@ -280,6 +291,34 @@ def get_cache_dir() -> str:
     return str(path)
 
 
+def get_lazy_getattr(
+    module_name: str, lazy_imports: Dict[str, str]
+) -> Callable[[str], Any]:
+    """Get a module `__getattr__` that imports attributes on first access.
+
+    Importing a package then doesn't import the (possibly heavy) modules behind
+    its public names until they are used.
+
+    Args:
+        module_name (str): Name of the module to get `__getattr__` for.
+        lazy_imports (Dict[str, str]): Attribute name -> module to import it from.
+            Use "module:name" to import an attribute under another name.
+
+    """
+    module_dict = sys.modules[module_name].__dict__
+
+    def __getattr__(name: str) -> Any:
+        if name not in lazy_imports:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        import_path, _, attr_name = lazy_imports[name].partition(":")
+        value = getattr(importlib.import_module(import_path), attr_name or name)
+        # cache, so that `__getattr__` is only called once per name
+        module_dict[name] = value
+        return value
+
+    return __getattr__
+
+
 # Sample text from llama_index's readme
 SAMPLE_TEXT = """
 Context
@@ -1,35 +1,67 @@
 """Vector stores."""
 
+from typing import TYPE_CHECKING
 
-from llama_index.vector_stores.bagel import BagelVectorStore
-from llama_index.vector_stores.chatgpt_plugin import ChatGPTRetrievalPluginClient
-from llama_index.vector_stores.cassandra import CassandraVectorStore
-from llama_index.vector_stores.chroma import ChromaVectorStore
-from llama_index.vector_stores.deeplake import DeepLakeVectorStore
-from llama_index.vector_stores.faiss import FaissVectorStore
-from llama_index.vector_stores.lancedb import LanceDBVectorStore
-from llama_index.vector_stores.metal import MetalVectorStore
-from llama_index.vector_stores.milvus import MilvusVectorStore
-from llama_index.vector_stores.myscale import MyScaleVectorStore
-from llama_index.vector_stores.opensearch import (
-    OpensearchVectorClient,
-    OpensearchVectorStore,
-)
-from llama_index.vector_stores.pinecone import PineconeVectorStore
-from llama_index.vector_stores.qdrant import QdrantVectorStore
-from llama_index.vector_stores.redis import RedisVectorStore
-from llama_index.vector_stores.rocksetdb import RocksetVectorStore
-from llama_index.vector_stores.simple import SimpleVectorStore
-from llama_index.vector_stores.tair import TairVectorStore
-from llama_index.vector_stores.supabase import SupabaseVectorStore
-from llama_index.vector_stores.weaviate import WeaviateVectorStore
-from llama_index.vector_stores.postgres import PGVectorStore
-from llama_index.vector_stores.zep import ZepVectorStore
-from llama_index.vector_stores.docarray import (
-    DocArrayHnswVectorStore,
-    DocArrayInMemoryVectorStore,
-)
-from llama_index.vector_stores.awadb import AwaDBVectorStore
+from llama_index.utils import get_lazy_getattr
+
+if TYPE_CHECKING:
+    from llama_index.vector_stores.bagel import BagelVectorStore
+    from llama_index.vector_stores.chatgpt_plugin import ChatGPTRetrievalPluginClient
+    from llama_index.vector_stores.cassandra import CassandraVectorStore
+    from llama_index.vector_stores.chroma import ChromaVectorStore
+    from llama_index.vector_stores.deeplake import DeepLakeVectorStore
+    from llama_index.vector_stores.faiss import FaissVectorStore
+    from llama_index.vector_stores.lancedb import LanceDBVectorStore
+    from llama_index.vector_stores.metal import MetalVectorStore
+    from llama_index.vector_stores.milvus import MilvusVectorStore
+    from llama_index.vector_stores.myscale import MyScaleVectorStore
+    from llama_index.vector_stores.opensearch import (
+        OpensearchVectorClient,
+        OpensearchVectorStore,
+    )
+    from llama_index.vector_stores.pinecone import PineconeVectorStore
+    from llama_index.vector_stores.qdrant import QdrantVectorStore
+    from llama_index.vector_stores.redis import RedisVectorStore
+    from llama_index.vector_stores.rocksetdb import RocksetVectorStore
+    from llama_index.vector_stores.simple import SimpleVectorStore
+    from llama_index.vector_stores.tair import TairVectorStore
+    from llama_index.vector_stores.supabase import SupabaseVectorStore
+    from llama_index.vector_stores.weaviate import WeaviateVectorStore
+    from llama_index.vector_stores.postgres import PGVectorStore
+    from llama_index.vector_stores.zep import ZepVectorStore
+    from llama_index.vector_stores.docarray import (
+        DocArrayHnswVectorStore,
+        DocArrayInMemoryVectorStore,
+    )
+    from llama_index.vector_stores.awadb import AwaDBVectorStore
+
+_LAZY_IMPORTS = {
+    "BagelVectorStore": "llama_index.vector_stores.bagel",
+    "ChatGPTRetrievalPluginClient": "llama_index.vector_stores.chatgpt_plugin",
+    "CassandraVectorStore": "llama_index.vector_stores.cassandra",
+    "ChromaVectorStore": "llama_index.vector_stores.chroma",
+    "DeepLakeVectorStore": "llama_index.vector_stores.deeplake",
+    "FaissVectorStore": "llama_index.vector_stores.faiss",
+    "LanceDBVectorStore": "llama_index.vector_stores.lancedb",
+    "MetalVectorStore": "llama_index.vector_stores.metal",
+    "MilvusVectorStore": "llama_index.vector_stores.milvus",
+    "MyScaleVectorStore": "llama_index.vector_stores.myscale",
+    "OpensearchVectorClient": "llama_index.vector_stores.opensearch",
+    "OpensearchVectorStore": "llama_index.vector_stores.opensearch",
+    "PineconeVectorStore": "llama_index.vector_stores.pinecone",
+    "QdrantVectorStore": "llama_index.vector_stores.qdrant",
+    "RedisVectorStore": "llama_index.vector_stores.redis",
+    "RocksetVectorStore": "llama_index.vector_stores.rocksetdb",
+    "SimpleVectorStore": "llama_index.vector_stores.simple",
+    "TairVectorStore": "llama_index.vector_stores.tair",
+    "SupabaseVectorStore": "llama_index.vector_stores.supabase",
+    "WeaviateVectorStore": "llama_index.vector_stores.weaviate",
+    "PGVectorStore": "llama_index.vector_stores.postgres",
+    "ZepVectorStore": "llama_index.vector_stores.zep",
+    "DocArrayHnswVectorStore": "llama_index.vector_stores.docarray",
+    "DocArrayInMemoryVectorStore": "llama_index.vector_stores.docarray",
+    "AwaDBVectorStore": "llama_index.vector_stores.awadb",
+}
 
 __all__ = [
     "SimpleVectorStore",
@@ -58,3 +90,5 @@ __all__ = [
     "AwaDBVectorStore",
     "BagelVectorStore",
 ]
+
+__getattr__ = get_lazy_getattr(__name__, _LAZY_IMPORTS)
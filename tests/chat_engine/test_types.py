@@ -0,0 +1,74 @@
+from threading import Thread
+
+import pytest
+
+from llama_index.chat_engine.types import StreamingAgentChatResponse
+from llama_index.llms.base import (
+    ChatMessage,
+    ChatResponse,
+    ChatResponseAsyncGen,
+    ChatResponseGen,
+)
+from llama_index.memory import ChatMemoryBuffer
+
+
+def _get_chat_stream() -> ChatResponseGen:
+    text = ""
+    for delta in ["Hello", " world"]:
+        text += delta
+        yield ChatResponse(message=ChatMessage(content=text), delta=delta)
+
+
+async def _get_achat_stream() -> ChatResponseAsyncGen:
+    for response in _get_chat_stream():
+        yield response
+
+
+def test_streaming_agent_chat_response() -> None:
+    memory = ChatMemoryBuffer.from_defaults()
+    response = StreamingAgentChatResponse(chat_stream=_get_chat_stream())
+    thread = Thread(target=response.write_response_to_history, args=(memory,))
+    thread.start()
+
+    assert list(response.response_gen) == ["Hello", " world"]
+    thread.join()
+    assert str(response) == "Hello world"
+    assert memory.get()[-1].content == "Hello world"
+    assert response.metrics.num_tokens == 2
+    assert response.metrics.first_token_latency is not None
+
+
+def test_streaming_agent_chat_response_str() -> None:
+    memory = ChatMemoryBuffer.from_defaults()
+    response = StreamingAgentChatResponse(chat_stream=_get_chat_stream())
+    response.write_response_to_history(memory)
+
+    # deltas that were not streamed are consumed once
+    assert str(response) == "Hello world"
+    assert str(response) == "Hello world"
+
+
+@pytest.mark.asyncio
+async def test_streaming_agent_chat_response_async() -> None:
+    memory = ChatMemoryBuffer.from_defaults()
+    response = StreamingAgentChatResponse(achat_stream=_get_achat_stream())
+    await response.awrite_response_to_history(memory)
+
+    assert [delta async for delta in response.async_response_gen()] == [
+        "Hello",
+        " world",
+    ]
+    assert response.response == "Hello world"
+    assert response.metrics.num_tokens == 2
+    assert str(response) == "Hello world"
+
+
+@pytest.mark.asyncio
+async def test_streaming_agent_chat_response_async_str() -> None:
+    memory = ChatMemoryBuffer.from_defaults()
+    response = StreamingAgentChatResponse(achat_stream=_get_achat_stream())
+    await response.awrite_response_to_history(memory)
+
+    # deltas that were not streamed are consumed from the async queue
+    assert str(response) == "Hello world"
+    assert str(response) == "Hello world"
@@ -16,7 +16,10 @@ from tests.mock_utils.mock_predict import (
     patch_llmpredictor_apredict,
     patch_llmpredictor_predict,
 )
-from tests.mock_utils.mock_text_splitter import patch_token_splitter_newline
+from tests.mock_utils.mock_text_splitter import (
+    patch_token_splitter_newline,
+    patch_token_splitter_truncate_newline,
+)
 
 # @pytest.fixture(autouse=True)
 # def no_networking(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -41,6 +44,9 @@ def patch_token_text_splitter(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(
         TokenTextSplitter, "split_text_metadata_aware", patch_token_splitter_newline
     )
+    monkeypatch.setattr(
+        TokenTextSplitter, "truncate_text", patch_token_splitter_truncate_newline
+    )
 
 
 @pytest.fixture
@@ -143,3 +143,18 @@ def test_validates_api_key_format_in_library() -> None:
         set_library_key_to="api-hf47930g732gf372", set_library_type_to="azure"
     ):
         assert OpenAIEmbedding()
+
+
+@patch.object(
+    OpenAIEmbedding, "_get_query_embeddings", side_effect=mock_get_text_embeddings
+)
+def test_get_query_embeddings(_mock_get_query_embeddings: Any) -> None:
+    """Test that query embeddings are computed in batches."""
+    embed_model = OpenAIEmbedding(embed_batch_size=2)
+    queries = ["Hello world.", "This is a test.", "This is another test."]
+    embeddings = embed_model.get_query_embeddings(queries)
+    assert embeddings == [[1, 0, 0, 0, 0], [0, 1, 0, 0, 0], [0, 0, 1, 0, 0]]
+    assert [call.args[0] for call in _mock_get_query_embeddings.call_args_list] == [
+        ["Hello world.", "This is a test."],
+        ["This is another test."],
+    ]
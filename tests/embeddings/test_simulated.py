@@ -0,0 +1,21 @@
+import time
+
+from llama_index.embeddings.simulated import SimulatedEmbedding
+from llama_index.llms.simulated import LatencyDistribution, LatencyProfile
+
+
+def test_simulated_embedding() -> None:
+    profile = LatencyProfile(distribution=LatencyDistribution.CONSTANT, latency=0.05)
+    embed_model = SimulatedEmbedding(embed_dim=8, profile=profile, embed_batch_size=10)
+
+    # a single call per batch
+    time1 = time.perf_counter()
+    for i in range(10):
+        embed_model.queue_text_for_embedding(f"id{i}", f"text{i}")
+    _, embeddings = embed_model.get_queued_text_embeddings()
+    assert 0.05 <= time.perf_counter() - time1 < 0.3
+    assert len(embeddings) == 10
+    assert all(len(embedding) == 8 for embedding in embeddings)
+
+    # deterministic per text
+    assert embed_model.get_query_embedding("text0") == embeddings[0]
@@ -0,0 +1,49 @@
+"""Test response evaluators."""
+
+from typing import Any, List
+
+import pytest
+
+from llama_index.evaluation.base import QueryResponseEvaluator, ResponseEvaluator
+from llama_index.indices.service_context import ServiceContext
+from llama_index.llm_predictor.base import LLMPredictor
+from llama_index.llms.mock import MockLLM
+from llama_index.prompts.base import BasePromptTemplate
+from llama_index.response.schema import Response
+from llama_index.schema import NodeWithScore, TextNode
+from tests.indices.vector_store.mock_services import MockEmbedding
+
+
+def test_evaluate_source_nodes(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test evaluating each source node, with an LLM call per context."""
+    contexts: List[str] = []
+
+    async def apredict(
+        self: Any, prompt: BasePromptTemplate, **prompt_args: Any
+    ) -> str:
+        context_str = prompt_args["context_str"]
+        contexts.append(context_str)
+        return "YES" if "answer" in context_str else "NO"
+
+    monkeypatch.setattr(LLMPredictor, "apredict", apredict)
+
+    service_context = ServiceContext.from_defaults(
+        llm=MockLLM(), embed_model=MockEmbedding()
+    )
+    response = Response(
+        response="answer",
+        source_nodes=[
+            NodeWithScore(node=TextNode(text=text))
+            for text in ("the answer", "nothing", "an answer")
+        ],
+    )
+
+    evaluator = QueryResponseEvaluator(service_context=service_context)
+    assert evaluator.evaluate_source_nodes("query", response) == ["YES", "NO", "YES"]
+    assert sorted(contexts) == ["an answer", "nothing", "the answer"]
+
+    response_evaluator = ResponseEvaluator(
+        service_context=service_context, raise_error=True
+    )
+    with pytest.raises(ValueError):
+        response_evaluator.evaluate_source_nodes(response)
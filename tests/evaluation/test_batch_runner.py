@@ -0,0 +1,150 @@
+"""Test the batch evaluation runner."""
+
+import asyncio
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from llama_index.evaluation.base import BaseEvaluator, Evaluation
+from llama_index.evaluation.batch_runner import BatchEvalRunner
+from llama_index.evaluation.guideline_eval import GuidelineEvaluator
+from llama_index.indices.service_context import ServiceContext
+from llama_index.indices.query.base import BaseQueryEngine
+from llama_index.indices.query.schema import QueryBundle
+from llama_index.llms.mock import MockLLM
+from llama_index.response.schema import RESPONSE_TYPE, Response
+from llama_index.schema import NodeWithScore, TextNode
+from llama_index.storage.kvstore.simple_kvstore import SimpleKVStore
+from tests.indices.vector_store.mock_services import MockEmbedding
+
+
+class _MockQueryEngine(BaseQueryEngine):
+    def __init__(self) -> None:
+        super().__init__(callback_manager=None)
+        self.queries: List[str] = []
+
+    def _query(self, query_bundle: QueryBundle) -> RESPONSE_TYPE:
+        raise NotImplementedError
+
+    async def _aquery(self, query_bundle: QueryBundle) -> RESPONSE_TYPE:
+        self.queries.append(query_bundle.query_str)
+        await asyncio.sleep(0.01)
+        return Response(
+            response=f"answer to {query_bundle.query_str}",
+            source_nodes=[NodeWithScore(node=TextNode(text="context"), score=1.0)],
+        )
+
+
+class _MockEvaluator(BaseEvaluator):
+    def __init__(self, fail_on: str = "") -> None:
+        self.queries: List[str] = []
+        self.fail_on = fail_on
+
+    def evaluate_response(self, query: str, response: Response) -> Evaluation:
+        raise NotImplementedError
+
+    async def aevaluate_response(self, query: str, response: Response) -> Evaluation:
+        if query == self.fail_on:
+            raise ValueError("evaluation failed")
+        self.queries.append(query)
+        await asyncio.sleep(0.01)
+        return Evaluation(query, response, query != "q1", "feedback")
+
+
+def test_evaluate_queries(tmp_path: Path) -> None:
+    """Test evaluating queries, with a checkpoint to resume from."""
+    queries = [f"q{i}" for i in range(5)]
+    checkpoint_path = str(tmp_path / "checkpoint.json")
+
+    # fails on the last query, after checkpointing the others
+    query_engine = _MockQueryEngine()
+    runner = BatchEvalRunner(
+        _MockEvaluator(fail_on="q4"),
+        query_engine=query_engine,
+        workers=2,
+        checkpoint_path=checkpoint_path,
+    )
+    with pytest.raises(ValueError):
+        runner.evaluate_queries(queries)
+
+    # resumed from the checkpoint
+    query_engine = _MockQueryEngine()
+    evaluator = _MockEvaluator()
+    runner = BatchEvalRunner(
+        evaluator,
+        query_engine=query_engine,
+        workers=2,
+        requests_per_minute=60000,
+        checkpoint_path=checkpoint_path,
+    )
+    evaluations = runner.evaluate_queries(queries)
+    assert [evaluation.query for evaluation in evaluations] == queries
+    assert [evaluation.passing for evaluation in evaluations] == [
+        True,
+        False,
+        True,
+        True,
+        True,
+    ]
+    assert str(evaluations[0].response) == "answer to q0"
+    assert evaluations[0].response.source_nodes[0].node.get_content() == "context"
+    # the response to q4 was checkpointed before its evaluation failed
+    assert query_engine.queries == []
+    assert evaluator.queries == ["q4"]
+
+    stats = runner.stats
+    assert stats.num_queries == 5
+    assert stats.num_resumed == 5
+    assert stats.num_cached == 4
+    assert len(stats.query_latencies) == 0
+    assert len(stats.eval_latencies) == 1
+    assert stats.throughput > 0
+    assert set(stats.to_dict()["eval_latency"]) == {"p50", "p90", "p99"}
+    assert "5 queries" in str(stats)
+
+
+def test_evaluate_responses() -> None:
+    """Test evaluating responses, with cached evaluations."""
+    evaluator = _MockEvaluator()
+    runner = BatchEvalRunner(evaluator, workers=4)
+    responses = [Response(response="answer"), Response(response="other answer")]
+    runner.evaluate_responses(["q0", "q0"], responses)
+    # no cache
+    runner.evaluate_responses(["q0", "q0"], responses)
+    assert len(evaluator.queries) == 4
+
+    evaluator = _MockEvaluator()
+    runner = BatchEvalRunner(evaluator, cache=SimpleKVStore())
+    runner.evaluate_responses(["q0", "q0"], responses)
+    runner.evaluate_responses(["q0"], [Response(response="answer")])
+    assert len(evaluator.queries) == 2
+    assert runner.stats.num_cached == 1
+
+    with pytest.raises(ValueError):
+        runner.evaluate_queries(["q0"])
+
+
+def test_cache_key_evaluator_config(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that evaluators with different configs don't share evaluations."""
+    guidelines_list: List[str] = []
+
+    async def aevaluate_response(
+        self: GuidelineEvaluator, query: str, response: Response
+    ) -> Evaluation:
+        guidelines_list.append(self.guidelines)
+        return Evaluation(query, response, True, "feedback")
+
+    monkeypatch.setattr(GuidelineEvaluator, "aevaluate_response", aevaluate_response)
+
+    service_context = ServiceContext.from_defaults(
+        llm=MockLLM(), embed_model=MockEmbedding()
+    )
+    cache = SimpleKVStore()
+    responses = [Response(response="answer")]
+    for guidelines in ("guidelines", "guidelines", "other guidelines"):
+        evaluator = GuidelineEvaluator(
+            service_context=service_context, guidelines=guidelines
+        )
+        BatchEvalRunner(evaluator, cache=cache).evaluate_responses(["q0"], responses)
+    assert guidelines_list == ["guidelines", "other guidelines"]
@@ -0,0 +1,95 @@
+"""Test dataset generation."""
+
+import asyncio
+from typing import Any, List
+
+import pytest
+
+from llama_index.evaluation.dataset_generation import DatasetGenerator
+from llama_index.indices.service_context import ServiceContext
+from llama_index.llm_predictor.base import LLMPredictor
+from llama_index.prompts.base import BasePromptTemplate
+from llama_index.llms.mock import MockLLM
+from llama_index.schema import BaseNode, TextNode
+from llama_index.storage.kvstore.simple_kvstore import SimpleKVStore
+from tests.indices.vector_store.mock_services import MockEmbedding
+
+
+def test_generate_questions_from_nodes(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test generating questions, streamed and cached."""
+    contexts: List[str] = []
+
+    async def apredict(
+        self: Any, prompt: BasePromptTemplate, **prompt_args: Any
+    ) -> str:
+        context_str = prompt_args["context_str"]
+        contexts.append(context_str)
+        return f"1. What is {context_str}?\n\n2) Why {context_str}?\n"
+
+    monkeypatch.setattr(LLMPredictor, "apredict", apredict)
+
+    service_context = ServiceContext.from_defaults(
+        llm=MockLLM(), embed_model=MockEmbedding()
+    )
+    nodes: List[BaseNode] = [TextNode(text=f"text{i}") for i in range(5)]
+    cache = SimpleKVStore()
+    dataset_generator = DatasetGenerator(
+        nodes, service_context=service_context, num_workers=2, cache=cache
+    )
+    questions = dataset_generator.generate_questions_from_nodes()
+    assert questions == [
+        question
+        for i in range(5)
+        for question in (f"What is text{i}?", f"Why text{i}?")
+    ]
+    assert len(contexts) == 5
+
+    # streamed, stopping after the first window of contexts
+    questions_iter = dataset_generator.iter_questions_from_nodes(num=3)
+    assert next(questions_iter) == "What is text0?"
+    assert list(questions_iter) == ["Why text0?", "What is text1?"]
+    # all from the cache
+    assert len(contexts) == 5
+
+    dataset_generator = DatasetGenerator(
+        nodes,
+        service_context=service_context,
+        batch_nodes=True,
+    )
+    questions = dataset_generator.generate_questions_from_nodes(num=1)
+    assert len(contexts) == 6
+    # a single prompt for all the nodes
+    assert contexts[-1] == "\n\n".join(node.get_content() for node in nodes)
+    assert questions == ["What is text0"]
+
+
+def test_agenerate_questions_from_nodes(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that generating `num` questions asynchronously stops early."""
+    contexts: List[str] = []
+
+    async def apredict(
+        self: Any, prompt: BasePromptTemplate, **prompt_args: Any
+    ) -> str:
+        context_str = prompt_args["context_str"]
+        contexts.append(context_str)
+        return f"1. What is {context_str}?\n\n2) Why {context_str}?\n"
+
+    monkeypatch.setattr(LLMPredictor, "apredict", apredict)
+
+    service_context = ServiceContext.from_defaults(
+        llm=MockLLM(), embed_model=MockEmbedding()
+    )
+    nodes: List[BaseNode] = [TextNode(text=f"text{i}") for i in range(100)]
+    dataset_generator = DatasetGenerator(
+        nodes, service_context=service_context, num_workers=2
+    )
+    questions = asyncio.run(dataset_generator.agenerate_questions_from_nodes(num=5))
+    assert questions == [
+        "What is text0?",
+        "Why text0?",
+        "What is text1?",
+        "Why text1?",
+        "What is text2?",
+    ]
+    # only the windows of contexts needed for 5 questions
+    assert len(contexts) == 4
@@ -5,9 +5,17 @@ from unittest.mock import patch
 
 import pytest
 
+from llama_index.data_structs.data_structs import KeywordTable
+from llama_index.indices.keyword_table.base import KeywordTableIndex
 from llama_index.indices.keyword_table.simple_base import SimpleKeywordTableIndex
 from llama_index.indices.service_context import ServiceContext
-from llama_index.schema import Document
+from llama_index.llm_predictor.base import LLMPredictor
+from llama_index.prompts.base import PromptTemplate
+from llama_index.prompts.default_prompts import (
+    DEFAULT_KEYWORD_BATCH_EXTRACT_TEMPLATE_TMPL,
+)
+from llama_index.schema import Document, TextNode
+from llama_index.token_counter.utils import mock_extract_keywords_response
 from tests.mock_utils.mock_utils import mock_extract_keywords
 
 
@@ -197,3 +205,78 @@ def test_delete(
     nodes = table.docstore.get_nodes(list(table.index_struct.node_ids))
     node_texts = {n.get_content() for n in nodes}
     assert node_texts == {"Hello world.", "This is a test.", "This is a test v2."}
+
+
+def test_keyword_table_node_scores() -> None:
+    """Test keyword postings stay in sync with inserts and deletes."""
+    table = KeywordTable()
+    node1 = TextNode(text="hello world", id_="node1")
+    node2 = TextNode(text="hello", id_="node2")
+    table.add_node(["hello", "world"], node1)
+    table.add_node(["hello"], node2)
+
+    assert table.get_node_scores(["hello", "world"]) == [("node1", 2), ("node2", 1)]
+    assert table.get_node_scores(["foo"]) == []
+
+    # update postings after they have been built
+    node3 = TextNode(text="world", id_="node3")
+    table.add_node(["world", "foo"], node3)
+    assert table.get_node_scores(["world", "foo"]) == [("node3", 2), ("node1", 1)]
+
+    table.delete_node("node1")
+    assert "hello" in table.keywords
+    assert table.get_node_scores(["hello", "world"]) == [("node2", 1), ("node3", 1)]
+
+    table.delete_node("node2")
+    assert "hello" not in table.keywords
+    assert table.get_node_scores(["hello"]) == []
+
+    # postings are rebuilt from the table after a serialization round trip
+    loaded_table = KeywordTable.from_dict(table.to_dict())
+    assert loaded_table.get_node_scores(["world", "foo"]) == [("node3", 2)]
+
+
+def test_build_table_async_batched(
+    allow_networking: Any,
+    mock_service_context: ServiceContext,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test concurrent, batched keyword extraction matches the sync build."""
+    texts: List[str] = []
+
+    async def apredict(self: Any, prompt: PromptTemplate, **prompt_args: Any) -> str:
+        text = prompt_args["text"]
+        texts.append(text)
+        if prompt.template != DEFAULT_KEYWORD_BATCH_EXTRACT_TEMPLATE_TMPL:
+            return mock_extract_keywords_response(text)
+        # numbered texts, answered with numbered lines
+        return "\n".join(
+            f"{number}: {mock_extract_keywords_response(numbered_text)}"
+            for number, numbered_text in (
+                line.split(": ", 1) for line in text.split("\n\n")
+            )
+        )
+
+    monkeypatch.setattr(LLMPredictor, "apredict", apredict)
+
+    nodes = [
+        TextNode(text=f"This is test {i}, number {i}.", id_=f"node{i}")
+        for i in range(7)
+    ]
+    table = KeywordTableIndex(nodes, service_context=mock_service_context)
+    async_table = KeywordTableIndex(
+        nodes,
+        use_async=True,
+        max_concurrency=2,
+        keyword_extract_batch_size=3,
+        service_context=mock_service_context,
+    )
+    # one call per batch of 3 nodes (the last one, of a single node, unnumbered)
+    assert len(texts) == 3
+    assert texts[0].startswith("1: This is test 0")
+    assert async_table.index_struct.table == table.index_struct.table
+
+    # insert goes through the same concurrent path
+    async_table.insert(Document(text="Hello there."))
+    assert len(texts) == 4
+    assert "there" in async_table.index_struct.table
@@ -1,6 +1,9 @@
 """Test utils."""
 
-from llama_index.indices.keyword_table.utils import extract_keywords_given_response
+from llama_index.indices.keyword_table.utils import (
+    extract_batch_keywords_given_response,
+    extract_keywords_given_response,
+)
 
 
 def test_expand_tokens_with_subtokens() -> None:
@@ -36,3 +39,10 @@ def test_extract_keywords_with_start_delimiter() -> None:
         "bar",
         "foobar",
     }
+
+
+def test_extract_batch_keywords_given_response() -> None:
+    """Test extract keywords for several texts given response."""
+    response = "1: foo, bar\n2. baz\nsome other line\n"
+    keywords = extract_batch_keywords_given_response(response, num_texts=3)
+    assert keywords == [{"foo", "bar"}, {"baz"}, None]
@@ -1,6 +1,8 @@
 """Test tree summarize."""
 
-from typing import List, Sequence
+import asyncio
+import time
+from typing import Any, Generator, List, Sequence
 from unittest.mock import Mock
 
 import pytest
@@ -8,8 +10,11 @@ import pytest
 from llama_index.indices.prompt_helper import PromptHelper
 from llama_index.response_synthesizers import TreeSummarize
 from llama_index.indices.service_context import ServiceContext
-from llama_index.prompts.base import PromptTemplate
+from llama_index.llm_predictor import LLMPredictor
+from llama_index.prompts.base import BasePromptTemplate, PromptTemplate
 from llama_index.prompts.prompt_type import PromptType
+from llama_index.response.schema import StreamingResponse
+from llama_index.schema import NodeWithScore, TextNode
 
 
 @pytest.fixture()
@@ -20,8 +25,8 @@ def mock_service_context_merge_chunks(
         prompt_template: PromptTemplate, text_chunks: Sequence[str]
     ) -> List[str]:
         merged_chunks = []
-        for chunks in zip(*[iter(text_chunks)] * 2):
-            merged_chunks.append("\n".join(chunks))
+        for i in range(0, len(text_chunks), 2):
+            merged_chunks.append("\n".join(text_chunks[i : i + 2]))
         return merged_chunks
 
     mock_prompt_helper = Mock(spec=PromptHelper)
@@ -105,3 +110,79 @@ async def test_tree_summarize_async(
         text_chunks=texts, query_str=query_str
     )
     assert str(response) == "Text chunk 1\nText chunk 2\nText chunk 3\nText chunk 4"
+
+
+@pytest.fixture()
+def summary_calls() -> List[str]:
+    return []
+
+
+@pytest.fixture()
+def mock_service_context_two_lines(
+    mock_service_context: ServiceContext,
+    monkeypatch: pytest.MonkeyPatch,
+    summary_calls: List[str],
+) -> ServiceContext:
+    """Chunks fit two lines, and a summary is a single line."""
+
+    def mock_repack(
+        prompt_template: PromptTemplate, text_chunks: Sequence[str]
+    ) -> List[str]:
+        lines = "\n".join(text_chunks).split("\n")
+        return ["\n".join(lines[i : i + 2]) for i in range(0, len(lines), 2)]
+
+    mock_prompt_helper = Mock(spec=PromptHelper)
+    mock_prompt_helper.repack.side_effect = mock_repack
+    mock_service_context.prompt_helper = mock_prompt_helper
+
+    async def mock_apredict(
+        self: Any, prompt: BasePromptTemplate, context_str: str, **kwargs: Any
+    ) -> str:
+        # the last leaf is slow
+        await asyncio.sleep(0.1 if context_str == "7\n8" else 0)
+        summary = "(" + context_str.replace("\n", "+") + ")"
+        summary_calls.append(summary)
+        return summary
+
+    monkeypatch.setattr(LLMPredictor, "apredict", mock_apredict)
+    return mock_service_context
+
+
+@pytest.mark.asyncio
+async def test_tree_summarize_pipelined(
+    mock_service_context_two_lines: ServiceContext, summary_calls: List[str]
+) -> None:
+    """Test that a full chunk is summarized without waiting for its level."""
+    tree_summarize = TreeSummarize(service_context=mock_service_context_two_lines)
+    response = await tree_summarize.aget_response(
+        text_chunks=[str(i) for i in range(1, 9)], query_str="What is?"
+    )
+    assert response == "(((1+2)+(3+4))+((5+6)+(7+8)))"
+    # the first summary of the second level does not wait for the slow leaf
+    assert summary_calls.index("((1+2)+(3+4))") < summary_calls.index("(7+8)")
+
+
+def test_tree_summarize_first_token_latency(
+    mock_service_context_two_lines: ServiceContext, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the first-token latency includes the summaries before the root."""
+
+    def mock_stream(
+        self: Any, prompt: BasePromptTemplate, context_str: str, **kwargs: Any
+    ) -> Generator[str, None, None]:
+        yield from context_str.split("\n")
+
+    monkeypatch.setattr(LLMPredictor, "stream", mock_stream)
+    tree_summarize = TreeSummarize(
+        service_context=mock_service_context_two_lines,
+        streaming=True,
+        use_async=True,
+    )
+    nodes = [NodeWithScore(node=TextNode(text=str(i))) for i in range(1, 9)]
+    start_time = time.perf_counter()
+    response = tree_summarize.synthesize("What is?", nodes)
+    assert isinstance(response, StreamingResponse)
+    assert "".join(response.response_gen) == "((1+2)+(3+4))((5+6)+(7+8))"
+    first_token_latency = response.metrics.first_token_latency
+    assert first_token_latency is not None
+    assert 0.1 <= first_token_latency <= time.perf_counter() - start_time
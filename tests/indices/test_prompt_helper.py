@@ -1,4 +1,5 @@
 """Test PromptHelper."""
+from typing import List
 
 from llama_index.indices.prompt_helper import PromptHelper
 from llama_index.indices.tree.utils import get_numbered_text_from_nodes
@@ -170,6 +171,32 @@ def test_repack() -> None:
     assert compacted_chunks == ["Hello\n\nworld\n\nfoo", "Hello\n\nworld\n\nbar"]
 
 
+def test_repack_token_counts() -> None:
+    """Test that repack reuses the token counts of templates and chunks."""
+    tokenized_texts: List[str] = []
+
+    def _tokenizer(text: str) -> List[str]:
+        tokenized_texts.append(text)
+        return mock_tokenizer(text)
+
+    test_prompt = PromptTemplate("This is the prompt{text}")
+    prompt_helper = PromptHelper(
+        context_window=15, num_output=1, chunk_overlap_ratio=0, tokenizer=_tokenizer
+    )
+    text_chunks = ["Hello world", "foo bar"]
+    assert prompt_helper.repack(test_prompt, text_chunks) == ["Hello world\n\nfoo bar"]
+    assert tokenized_texts == ["This is the prompt", "Hello world\n\nfoo bar"]
+
+    tokenized_texts.clear()
+    assert prompt_helper.repack(test_prompt, text_chunks) == ["Hello world\n\nfoo bar"]
+    assert prompt_helper.truncate(test_prompt, ["Hello world\n\nfoo bar"]) == [
+        "Hello world\n\nfoo bar"
+    ]
+    assert tokenized_texts == []
+    # counts are cached by hash, not by text
+    assert "Hello world\n\nfoo bar" not in prompt_helper._token_counts
+
+
 def test_get_biggest_prompt() -> None:
     """Test get_biggest_prompt from PromptHelper."""
     prompt1 = PromptTemplate("This is the prompt{text}")
@@ -6,6 +6,7 @@ from unittest.mock import patch
 
 import pytest
 
+from llama_index.data_structs.data_structs import IndexGraph
 from llama_index.indices.query.schema import QueryBundle
 from llama_index.indices.service_context import ServiceContext
 from llama_index.indices.tree.select_leaf_embedding_retriever import (
@@ -13,7 +14,7 @@ from llama_index.indices.tree.select_leaf_embedding_retriever import (
 )
 from llama_index.indices.tree.base import TreeIndex
 from llama_index.schema import Document
-from llama_index.schema import BaseNode
+from llama_index.schema import BaseNode, TextNode
 from tests.mock_utils.mock_prompts import (
     MOCK_INSERT_PROMPT,
     MOCK_SUMMARY_PROMPT,
@@ -86,3 +87,58 @@ def test_embedding_query(
 def _mock_tokenizer(text: str) -> int:
     """Mock tokenizer that splits by spaces."""
     return len(text.split(" "))
+
+
+def test_build_embeddings(
+    index_kwargs: Dict,
+    documents: List[Document],
+    mock_service_context: ServiceContext,
+) -> None:
+    """Test embedding the tree at build time."""
+    tree = TreeIndex.from_documents(
+        documents,
+        service_context=mock_service_context,
+        build_embeddings=True,
+        **index_kwargs,
+    )
+    index_graph = tree.index_struct
+    assert set(index_graph.node_id_to_embedding.keys()) == set(
+        index_graph.all_nodes.values()
+    )
+
+    # embeddings are persisted with the index graph
+    loaded_graph = IndexGraph.from_dict(index_graph.to_dict())
+    assert loaded_graph.node_id_to_embedding == index_graph.node_id_to_embedding
+
+    # traversal uses the stored embeddings and makes no embedding calls
+    retriever = tree.as_retriever(retriever_mode="select_leaf_embedding")
+    embed_model = mock_service_context.embed_model
+    with patch.object(
+        type(embed_model), "_get_text_embeddings", side_effect=AssertionError
+    ):
+        nodes = retriever.retrieve("What is?")
+    assert len(nodes) == 1
+
+
+def test_get_most_similar_nodes(
+    index_kwargs: Dict,
+    documents: List[Document],
+    mock_service_context: ServiceContext,
+) -> None:
+    """Test selecting the most similar nodes, embedding missing ones in a batch."""
+    tree = TreeIndex.from_documents(
+        documents, service_context=mock_service_context, **index_kwargs
+    )
+    index_graph = tree.index_struct
+    assert index_graph.node_id_to_embedding == {}
+
+    nodes: List[BaseNode] = [
+        TextNode(text=str(i), embedding=[float(i), 1.0]) for i in range(4)
+    ]
+    retriever = TreeSelectLeafEmbeddingRetriever(tree, child_branch_factor=2)
+    selected_nodes, selected_indices = retriever._get_most_similar_nodes(
+        nodes, QueryBundle("What is?", embedding=[1.0, 0.0])
+    )
+    assert selected_indices == [3, 2]
+    assert selected_nodes == [nodes[3], nodes[2]]
+    assert len(index_graph.node_id_to_embedding) == 4
@@ -1,14 +1,18 @@
 """Test tree index."""
 
-from typing import Any, Dict, List, Optional
+from typing import Dict, List, Optional
 from unittest.mock import patch
 
 from llama_index.data_structs.data_structs import IndexGraph
+from llama_index.indices.common_tree.base import DEFAULT_SUMMARY_CACHE_COLLECTION
 from llama_index.indices.service_context import ServiceContext
+from llama_index.llm_predictor import LLMPredictor
 from llama_index.storage.docstore import BaseDocumentStore
 from llama_index.indices.tree.base import TreeIndex
 from llama_index.schema import Document
 from llama_index.schema import BaseNode
+from llama_index.storage.kvstore.simple_kvstore import SimpleKVStore
+from tests.mock_utils.mock_predict import patch_llmpredictor_predict
 
 
 def _get_left_or_right_node(
@@ -83,15 +87,7 @@ def test_build_tree_with_embed(
     assert all_nodes[5].get_content() == ("This is another test.\nThis is a test v2.")
 
 
-OUTPUTS = [
-    ("Hello world.\nThis is a test.", ""),
-    ("This is another test.\nThis is a test v2.", ""),
-]
-
-
-@patch("llama_index.indices.common_tree.base.run_async_tasks", side_effect=[OUTPUTS])
 def test_build_tree_async(
-    _mock_run_async_tasks: Any,
     documents: List[Document],
     mock_service_context: ServiceContext,
     struct_kwargs: Dict,
@@ -195,6 +191,66 @@ def test_insert(
     assert nodes[0].ref_doc_id == "new_doc_test"
 
 
+def test_build_tree_summary_cache(
+    documents: List[Document],
+    mock_service_context: ServiceContext,
+    struct_kwargs: Dict,
+) -> None:
+    """Test rebuilding a tree with a summary cache makes no LLM calls."""
+    index_kwargs, _ = struct_kwargs
+    summary_cache = SimpleKVStore()
+    tree = TreeIndex.from_documents(
+        documents,
+        service_context=mock_service_context,
+        summary_cache=summary_cache,
+        **index_kwargs,
+    )
+    assert len(summary_cache.get_all(DEFAULT_SUMMARY_CACHE_COLLECTION)) == 2
+
+    with patch.object(
+        LLMPredictor, "predict", autospec=True, side_effect=patch_llmpredictor_predict
+    ) as mock_predict:
+        new_tree = TreeIndex.from_documents(
+            documents,
+            service_context=mock_service_context,
+            summary_cache=summary_cache,
+            **index_kwargs,
+        )
+    assert mock_predict.call_count == 0
+
+    root_summaries = {
+        node.get_content()
+        for node in tree.docstore.get_node_dict(tree.index_struct.root_nodes).values()
+    }
+    new_root_summaries = {
+        node.get_content()
+        for node in new_tree.docstore.get_node_dict(
+            new_tree.index_struct.root_nodes
+        ).values()
+    }
+    assert new_root_summaries == root_summaries
+
+
+def test_insert_async(
+    documents: List[Document],
+    mock_service_context: ServiceContext,
+    struct_kwargs: Dict,
+) -> None:
+    """Test insert with use_async matches the sync insert."""
+    index_kwargs, _ = struct_kwargs
+    tree = TreeIndex.from_documents(
+        documents, use_async=True, service_context=mock_service_context, **index_kwargs
+    )
+    tree.insert(Document(text="This is a new doc.", id_="new_doc"))
+
+    left_root = _get_left_or_right_node(tree.docstore, tree.index_struct, None)
+    assert left_root.get_content() == "Hello world.\nThis is a test."
+    right_root2 = _get_left_or_right_node(
+        tree.docstore, tree.index_struct, left_root, left=False
+    )
+    assert right_root2.get_content() == "This is a test.\nThis is a new doc."
+
+
 def test_twice_insert_empty(
     mock_service_context: ServiceContext,
 ) -> None:
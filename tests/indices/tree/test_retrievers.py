@@ -1,5 +1,7 @@
 from typing import Dict, List
 
+import pytest
+
 from llama_index.indices.service_context import ServiceContext
 from llama_index.indices.tree.base import TreeIndex
 from llama_index.schema import Document
@@ -23,6 +25,30 @@ def test_query(
     assert len(nodes) == 1
 
 
+@pytest.mark.asyncio
+async def test_query_async(
+    documents: List[Document],
+    mock_service_context: ServiceContext,
+    struct_kwargs: Dict,
+) -> None:
+    """Test async query explores selected branches."""
+    index_kwargs, query_kwargs = struct_kwargs
+    tree = TreeIndex.from_documents(
+        documents, service_context=mock_service_context, **index_kwargs
+    )
+
+    query_str = "What is?"
+    retriever = tree.as_retriever()
+    nodes = await retriever.aretrieve(query_str)
+    assert len(nodes) == 1
+
+    # with a branch factor of 2, both root nodes and all their children
+    # are selected
+    retriever = tree.as_retriever(child_branch_factor=2)
+    nodes = await retriever.aretrieve(query_str)
+    assert len(nodes) == 4
+
+
 def test_summarize_query(
     documents: List[Document],
     mock_service_context: ServiceContext,
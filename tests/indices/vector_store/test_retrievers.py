@@ -1,4 +1,5 @@
 from typing import List, cast
+from unittest.mock import patch
 
 import pytest
 
@@ -8,6 +9,7 @@ from llama_index.indices.vector_store.base import VectorStoreIndex
 from llama_index.schema import Document, NodeRelationship, RelatedNodeInfo, TextNode
 from llama_index.storage.storage_context import StorageContext
 from llama_index.vector_stores.simple import SimpleVectorStore
+from tests.indices.vector_store.mock_services import MockEmbedding
 
 try:
     import faiss
@@ -150,3 +152,35 @@ def test_query(mock_service_context: ServiceContext) -> None:
     query_str = "What is?"
     retriever = index.as_retriever()
     _ = retriever.retrieve(QueryBundle(query_str))
+
+
+@pytest.mark.asyncio
+async def test_retrieve_batch(
+    documents: List[Document], mock_service_context: ServiceContext
+) -> None:
+    """Test that a batch of queries is embedded in a single call."""
+    index = VectorStoreIndex.from_documents(
+        documents, service_context=mock_service_context
+    )
+    retriever = index.as_retriever(similarity_top_k=2)
+    expected = [
+        retriever.retrieve("What is?"),
+        retriever.retrieve(QueryBundle("What is not?", embedding=[1, 0, 0, 0, 0])),
+    ]
+
+    with patch.object(
+        MockEmbedding,
+        "_get_query_embeddings",
+        side_effect=lambda queries: [[0, 0, 1, 0, 0] for _ in queries],
+    ) as mock_get_query_embeddings:
+        nodes_batch = retriever.retrieve_batch(
+            ["What is?", QueryBundle("What is not?", embedding=[1, 0, 0, 0, 0])]
+        )
+        # only the query without an embedding is embedded
+        mock_get_query_embeddings.assert_called_once_with(["What is?"])
+    assert nodes_batch == expected
+
+    nodes_batch = await retriever.aretrieve_batch(
+        ["What is?", QueryBundle("What is not?", embedding=[1, 0, 0, 0, 0])]
+    )
+    assert nodes_batch == expected
@@ -3,6 +3,7 @@ from typing import Any
 from unittest.mock import patch
 
 from llama_index.llm_predictor.structured import LLMPredictor, StructuredLLMPredictor
+from llama_index.llms.mock import MockLLM
 from llama_index.prompts import BasePromptTemplate
 from llama_index.prompts.base import PromptTemplate
 from llama_index.types import BaseOutputParser
@@ -80,3 +81,18 @@ def test_struct_llm_predictor(mock_init: Any, mock_predict: Any) -> None:
 #     llm.cache = False
 #     llm_prediction = predictor.predict(prompt, query_str="hello world")
 #     assert llm_prediction == "helloworld2"
+
+
+def test_extend_prompt_does_not_mutate() -> None:
+    """Test that system and query wrapper prompts extend a copy of the prompt."""
+    llm_predictor = LLMPredictor(
+        llm=MockLLM(),
+        system_prompt="Be brief.",
+        query_wrapper_prompt=PromptTemplate("[{query_str}]"),
+    )
+    prompt = PromptTemplate("{context_str} {query_str}").partial_format(
+        query_str="hello"
+    )
+    extended_prompt = llm_predictor._extend_prompt(prompt)
+    assert extended_prompt.format(context_str="ctx") == "Be brief.\n\nctx [hello]"
+    assert prompt.format(context_str="ctx") == "ctx hello"
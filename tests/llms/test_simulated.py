@@ -0,0 +1,77 @@
+import asyncio
+import time
+
+import pytest
+
+from llama_index.llms.base import ChatMessage
+from llama_index.llms.simulated import (
+    LatencyDistribution,
+    LatencyProfile,
+    RateLimitError,
+    SimulatedLLM,
+)
+
+
+def test_latency_profile() -> None:
+    profile = LatencyProfile(
+        distribution=LatencyDistribution.CONSTANT, latency=0.5, per_input_token=0.01
+    )
+    assert profile.get_latency(10) == pytest.approx(0.6)
+
+    latencies = [
+        LatencyProfile(seed=0).get_latency(),
+        LatencyProfile(seed=0).get_latency(),
+    ]
+    assert latencies[0] == latencies[1]
+
+    profile = LatencyProfile(distribution="uniform", latency=1.0, spread=0.1)
+    assert all(0.9 <= profile.get_latency() <= 1.1 for _ in range(100))
+
+
+def test_latency_profile_rate_limit() -> None:
+    profile = LatencyProfile(requests_per_minute=2)
+    profile.check_rate_limit()
+    profile.check_rate_limit()
+    with pytest.raises(RateLimitError):
+        profile.check_rate_limit()
+
+    profile = LatencyProfile(rate_limit_error_rate=1.0)
+    with pytest.raises(RateLimitError):
+        profile.check_rate_limit()
+
+
+def test_simulated_llm() -> None:
+    profile = LatencyProfile(
+        distribution=LatencyDistribution.CONSTANT,
+        latency=0.05,
+        per_output_token=0.03,
+        requests_per_minute=4,
+    )
+    llm = SimulatedLLM(profile=profile, num_output_tokens=4)
+
+    time1 = time.perf_counter()
+    assert llm.complete("prompt").text == "text text text text"
+    assert time.perf_counter() - time1 >= 0.17
+
+    # the first token takes the latency of the call, then tokens are paced
+    time1 = time.perf_counter()
+    stream = llm.stream_complete("prompt")
+    first_response = next(stream)
+    time2 = time.perf_counter()
+    assert time2 - time1 >= 0.08
+    assert first_response.delta == "text "
+    assert [response.text for response in stream][-1] == "text text text text"
+    assert time.perf_counter() - time2 >= 0.09
+
+    chat_response = asyncio.run(llm.achat([ChatMessage(content="prompt")]))
+    assert chat_response.message.content == "text text text text"
+
+    async def astream() -> list:
+        stream = await llm.astream_complete("prompt")
+        return [response.delta async for response in stream]
+
+    assert asyncio.run(astream()) == ["text "] * 4
+
+    # 4 requests per minute
+    with pytest.raises(RateLimitError):
+        llm.complete("prompt")
@@ -12,6 +12,11 @@ def patch_token_splitter_newline(
     return text.split("\n")
 
 
+def patch_token_splitter_truncate_newline(self: Any, text: str) -> str:
+    """Mock token splitter truncation by newline."""
+    return text.split("\n")[0]
+
+
 def mock_token_splitter_newline(
     text: str, metadata_str: Optional[str] = None
 ) -> List[str]:
@@ -0,0 +1,100 @@
+import asyncio
+from typing import Any, List
+
+import pytest
+
+from llama_index.llm_predictor.base import LLMPredictor
+from llama_index.node_parser import SimpleNodeParser
+from llama_index.node_parser.extractors import (
+    MetadataExtractor,
+    SummaryExtractor,
+    QuestionsAnsweredExtractor,
+    TitleExtractor,
+    KeywordExtractor,
+)
+from llama_index.indices.service_context import ServiceContext
+from llama_index import Document
+from llama_index.prompts.base import BasePromptTemplate
+from llama_index.schema import BaseNode, TextNode
+from llama_index.storage.kvstore.simple_kvstore import SimpleKVStore
+from tests.mock_utils.mock_predict import patch_llmpredictor_apredict
+
+
+def test_metadata_extractor(mock_service_context: ServiceContext) -> None:
+    metadata_extractor = MetadataExtractor(
+        extractors=[
+            TitleExtractor(nodes=5),
+            QuestionsAnsweredExtractor(questions=3),
+            SummaryExtractor(summaries=["prev", "self"]),
+            KeywordExtractor(keywords=10),
+        ],
+    )
+
+    node_parser = SimpleNodeParser.from_defaults(
+        metadata_extractor=metadata_extractor,
+    )
+
+    document = Document(
+        text="sample text",
+        metadata={"filename": "README.md", "category": "codebase"},
+    )
+
+    nodes = node_parser.get_nodes_from_documents([document])
+
+    assert "document_title" in nodes[0].metadata
+    assert "questions_this_excerpt_can_answer" in nodes[0].metadata
+    assert "section_summary" in nodes[0].metadata
+    assert "excerpt_keywords" in nodes[0].metadata
+
+
+def _get_nodes() -> List[BaseNode]:
+    return [TextNode(text=f"text {i}", metadata={"index": i}) for i in range(6)]
+
+
+def test_metadata_extractor_cache(
+    mock_service_context: ServiceContext, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test extracting concurrently, and from the cache for unchanged nodes."""
+    prompts: List[str] = []
+
+    async def apredict(
+        self: Any, prompt: BasePromptTemplate, **prompt_args: Any
+    ) -> str:
+        prompts.append(prompt.format(**prompt_args))
+        return await patch_llmpredictor_apredict(self, prompt, **prompt_args)
+
+    monkeypatch.setattr(LLMPredictor, "apredict", apredict)
+
+    cache = SimpleKVStore()
+    metadata_extractor = MetadataExtractor(
+        extractors=[
+            TitleExtractor(nodes=2, cache=cache, num_workers=2),
+            QuestionsAnsweredExtractor(questions=3, cache=cache, show_progress=False),
+            SummaryExtractor(summaries=["prev", "self"], cache=cache),
+            KeywordExtractor(keywords=10, cache=cache),
+        ],
+        in_place=False,
+    )
+    nodes = _get_nodes()
+    new_nodes = metadata_extractor.process_nodes(nodes)
+    # title: 2 candidates and their combination, then 3 calls per node
+    assert len(prompts) == 3 + 3 * len(nodes)
+    assert new_nodes[3].metadata["section_summary"]
+    assert new_nodes[3].metadata["prev_section_summary"]
+    assert new_nodes[3].metadata["excerpt_keywords"]
+    # nodes aren't processed in place
+    assert nodes[3].metadata == {"index": 3}
+    assert new_nodes[3].node_id == nodes[3].node_id
+
+    num_prompts = len(prompts)
+    cached_nodes = metadata_extractor.process_nodes(_get_nodes())
+    assert len(prompts) == num_prompts
+    assert [node.metadata for node in cached_nodes] == [
+        node.metadata for node in new_nodes
+    ]
+
+    async_nodes = asyncio.run(metadata_extractor.aprocess_nodes(_get_nodes()))
+    assert len(prompts) == num_prompts
+    assert [node.metadata for node in async_nodes] == [
+        node.metadata for node in new_nodes
+    ]
@@ -15,6 +15,7 @@ from llama_index.prompts import (
     SelectorPromptTemplate,
 )
 from llama_index.prompts.prompt_type import PromptType
+from llama_index.prompts.prompt_utils import get_empty_prompt_txt
 
 
 def test_template() -> None:
@@ -124,3 +125,14 @@ def test_langchain_selector_template() -> None:
     assert isinstance(template, LangchainPromptTemplate)
 
     assert template_fmt.format(llm=mock_llm, text="world") == "hello world bar mock"
+
+
+def test_get_empty_prompt_txt() -> None:
+    """Test empty prompt text of partially formatted and selector prompts."""
+    prompt = PromptTemplate("{foo} and {bar}").partial_format(foo="hello")
+    assert get_empty_prompt_txt(prompt) == "hello and "
+    # partial variables are part of the cached text
+    assert get_empty_prompt_txt(prompt.partial_format(foo="bye")) == "bye and "
+
+    selector_prompt = SelectorPromptTemplate(default_template=prompt)
+    assert get_empty_prompt_txt(selector_prompt) == "hello and "
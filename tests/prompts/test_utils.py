@@ -1,7 +1,51 @@
-from llama_index.prompts.utils import get_template_vars
+import pytest
+
+from llama_index.prompts.utils import (
+    CompiledTemplate,
+    get_compiled_template,
+    get_template_vars,
+)
 
 
 def test_get_template_vars() -> None:
     template = "hello {text} {foo}"
     template_vars = get_template_vars(template)
     assert template_vars == ["text", "foo"]
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "hello {text} {foo}",
+        "{text}{text} and {foo}",
+        "no variables",
+        "",
+        "{{escaped}} {text} }}{{",
+        "{text!r} {foo:>8} {num:.2f} {foo!s:<4}",
+        # fall back to str.format
+        "{text[0]} {foo}",
+        "{text:>{num}} {foo}",
+    ],
+)
+def test_compiled_template(template: str) -> None:
+    """Test that compiled templates format like str.format."""
+    kwargs = {"text": "world", "foo": "bar", "num": 8}
+    compiled_template = CompiledTemplate.from_template(template)
+    assert compiled_template.format(**kwargs) == template.format(**kwargs)
+
+    partial_template = compiled_template.partial_format(foo="bar")
+    assert "foo" not in partial_template.template_vars
+    assert partial_template.format(**kwargs) == template.format(**kwargs)
+
+
+def test_compiled_template_missing_var() -> None:
+    with pytest.raises(KeyError):
+        CompiledTemplate.from_template("hello {text}").format(foo="bar")
+    with pytest.raises(IndexError):
+        CompiledTemplate.from_template("hello {0}").format(foo="bar")
+
+
+def test_get_compiled_template_cached() -> None:
+    assert get_compiled_template("hello {text}") is get_compiled_template(
+        "hello {text}"
+    )
@@ -0,0 +1,141 @@
+"""Test semantic cache query engine."""
+from typing import Dict, List
+
+import pytest
+
+from llama_index.callbacks.llama_debug import LlamaDebugHandler
+from llama_index.callbacks.schema import CBEventType, EventPayload
+from llama_index.embeddings.base import BaseEmbedding
+from llama_index.indices.service_context import ServiceContext
+from llama_index.indices.vector_store.base import VectorStoreIndex
+from llama_index.query_engine.semantic_cache_query_engine import (
+    SemanticCacheQueryEngine,
+)
+from llama_index.response.schema import Response
+from llama_index.schema import Document
+
+QUERY_EMBEDDINGS: Dict[str, List[float]] = {
+    "What is foo?": [1, 0, 0],
+    "What's foo?": [0.99, 0.1, 0],
+    "What is bar?": [0, 1, 0],
+}
+
+
+class MockQueryEmbedding(BaseEmbedding):
+    num_queries_embedded: int = 0
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "MockQueryEmbedding"
+
+    def _get_query_embedding(self, query: str) -> List[float]:
+        self.num_queries_embedded += 1
+        return QUERY_EMBEDDINGS[query]
+
+    async def _aget_query_embedding(self, query: str) -> List[float]:
+        return self._get_query_embedding(query)
+
+    def _get_text_embedding(self, text: str) -> List[float]:
+        raise NotImplementedError
+
+
+@pytest.fixture()
+def index(mock_service_context: ServiceContext) -> VectorStoreIndex:
+    documents = [
+        Document(text="Hello world.", id_="doc1"),
+        Document(text="This is a test.", id_="doc2"),
+    ]
+    return VectorStoreIndex.from_documents(
+        documents, service_context=mock_service_context
+    )
+
+
+def test_semantic_cache(index: VectorStoreIndex) -> None:
+    """Test exact and similar hits."""
+    debug_handler = LlamaDebugHandler()
+    index.service_context.callback_manager.add_handler(debug_handler)
+    embed_model = MockQueryEmbedding()
+    query_engine = SemanticCacheQueryEngine(
+        index.as_query_engine(similarity_top_k=2), embed_model=embed_model
+    )
+
+    response = query_engine.query("What is foo?")
+    assert isinstance(response, Response)
+    assert query_engine.num_misses == 1
+
+    # exact match, the query isn't embedded
+    cached_response = query_engine.query("What is foo?")
+    assert isinstance(cached_response, Response)
+    assert cached_response.response == response.response
+    assert cached_response.source_nodes == response.source_nodes
+    assert embed_model.num_queries_embedded == 1
+
+    # paraphrase
+    cached_response = query_engine.query("What's foo?")
+    assert isinstance(cached_response, Response)
+    assert cached_response.response == response.response
+
+    query_engine.query("What is bar?")
+    assert query_engine.num_hits == 2
+    assert query_engine.num_misses == 2
+    assert query_engine.hit_rate == 0.5
+    assert query_engine.saved_tokens > 0
+
+    payloads = [
+        event_pair[1].payload or {}
+        for event_pair in debug_handler.get_event_pairs(CBEventType.CACHE)
+    ]
+    assert [payload[EventPayload.CACHE_HIT] for payload in payloads] == [
+        False,
+        True,
+        True,
+        False,
+    ]
+    assert (
+        sum(payload[EventPayload.SAVED_TOKENS] for payload in payloads)
+        == query_engine.saved_tokens
+    )
+
+
+@pytest.mark.asyncio
+async def test_semantic_cache_async(index: VectorStoreIndex) -> None:
+    query_engine = SemanticCacheQueryEngine(
+        index.as_query_engine(), embed_model=MockQueryEmbedding()
+    )
+    response = await query_engine.aquery("What is foo?")
+    cached_response = await query_engine.aquery("What's foo?")
+    assert str(cached_response) == str(response)
+    assert query_engine.num_hits == 1
+
+
+def test_semantic_cache_similarity_threshold(index: VectorStoreIndex) -> None:
+    query_engine = SemanticCacheQueryEngine(
+        index.as_query_engine(),
+        embed_model=MockQueryEmbedding(),
+        similarity_threshold=0.999,
+    )
+    query_engine.query("What is foo?")
+    query_engine.query("What's foo?")
+    assert query_engine.num_hits == 0
+
+
+def test_semantic_cache_invalidation(index: VectorStoreIndex) -> None:
+    """Test that responses are invalidated when a source ref doc changes."""
+    query_engine = SemanticCacheQueryEngine(
+        index.as_query_engine(similarity_top_k=1), embed_model=MockQueryEmbedding()
+    )
+    response = query_engine.query("What is foo?")
+    assert isinstance(response, Response)
+    source_ref_doc_id = response.source_nodes[0].node.ref_doc_id
+    other_ref_doc_id = "doc2" if source_ref_doc_id == "doc1" else "doc1"
+
+    # not a source of the response
+    index.delete_ref_doc(other_ref_doc_id)
+    query_engine.query("What is foo?")
+    assert query_engine.num_hits == 1
+
+    index.update_ref_doc(Document(text="Hello world v2.", id_=source_ref_doc_id))
+    query_engine.query("What is foo?")
+    query_engine.query("What's foo?")
+    assert query_engine.num_hits == 2
+    assert query_engine.num_misses == 2
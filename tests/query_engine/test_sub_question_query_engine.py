@@ -0,0 +1,118 @@
+"""Test sub question query engine."""
+from typing import Any, List, Sequence
+from unittest.mock import patch
+
+import pytest
+
+from llama_index.indices.list.base import ListIndex
+from llama_index.indices.query.schema import QueryBundle
+from llama_index.indices.service_context import ServiceContext
+from llama_index.indices.vector_store.base import VectorStoreIndex
+from llama_index.query_engine.sub_question_query_engine import SubQuestionQueryEngine
+from llama_index.question_gen.types import BaseQuestionGenerator, SubQuestion
+from llama_index.response.schema import Response
+from llama_index.schema import Document
+from llama_index.tools.query_engine import QueryEngineTool
+from llama_index.tools.types import ToolMetadata
+from tests.indices.vector_store.mock_services import MockEmbedding
+
+SUB_QUESTIONS = [
+    SubQuestion(sub_question="What is foo?", tool_name="vector"),
+    SubQuestion(sub_question="What is bar?", tool_name="list"),
+    SubQuestion(sub_question="What is not foo?", tool_name="vector"),
+]
+
+
+class MockQuestionGenerator(BaseQuestionGenerator):
+    def generate(
+        self, tools: Sequence[ToolMetadata], query: QueryBundle
+    ) -> List[SubQuestion]:
+        return SUB_QUESTIONS
+
+    async def agenerate(
+        self, tools: Sequence[ToolMetadata], query: QueryBundle
+    ) -> List[SubQuestion]:
+        return SUB_QUESTIONS
+
+
+def _get_query_engine(
+    service_context: ServiceContext, use_batch: bool
+) -> SubQuestionQueryEngine:
+    documents = [
+        Document(text="Hello world.", id_="doc1"),
+        Document(text="This is another test.", id_="doc2"),
+    ]
+    vector_index = VectorStoreIndex.from_documents(
+        documents, service_context=service_context
+    )
+    list_index = ListIndex.from_documents(documents, service_context=service_context)
+    return SubQuestionQueryEngine.from_defaults(
+        query_engine_tools=[
+            QueryEngineTool.from_defaults(
+                vector_index.as_query_engine(similarity_top_k=1), name="vector"
+            ),
+            QueryEngineTool.from_defaults(list_index.as_query_engine(), name="list"),
+        ],
+        question_gen=MockQuestionGenerator(),
+        service_context=service_context,
+        verbose=False,
+        use_batch=use_batch,
+        max_concurrency=2,
+    )
+
+
+def test_sub_question_query_engine(mock_service_context: ServiceContext) -> None:
+    """Test sub question query engine."""
+    query_engine = _get_query_engine(mock_service_context, use_batch=False)
+    response = query_engine.query("What are foo and bar?")
+    assert isinstance(response, Response)
+    # one source node per sub answer
+    assert [node.node.get_content() for node in response.source_nodes] == [
+        "Sub question: What is foo?\nResponse: What is foo?:This is another test.",
+        "Sub question: What is bar?\nResponse: "
+        "What is bar?:Hello world.:This is another test.",
+        "Sub question: What is not foo?\nResponse: "
+        "What is not foo?:This is another test.",
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_async", [False, True])
+async def test_sub_question_query_engine_batch(
+    mock_service_context: ServiceContext, use_async: bool
+) -> None:
+    """Test that sub questions are retrieved in a batch per tool."""
+    query_engine = _get_query_engine(mock_service_context, use_batch=True)
+    expected_response = _get_query_engine(mock_service_context, use_batch=False).query(
+        "What are foo and bar?"
+    )
+
+    async def mock_aget_query_embeddings(queries: List[str]) -> List[List[float]]:
+        return [[0, 0, 1, 0, 0] for _ in queries]
+
+    with patch.object(
+        MockEmbedding, "_aget_query_embeddings", side_effect=mock_aget_query_embeddings
+    ) as mock_aget_query_embeddings:
+        response: Any
+        if use_async:
+            response = await query_engine.aquery("What are foo and bar?")
+        else:
+            response = query_engine.query("What are foo and bar?")
+        # both sub questions of the vector tool are embedded in one call
+        mock_aget_query_embeddings.assert_called_once_with(
+            ["What is foo?", "What is not foo?"]
+        )
+
+    assert isinstance(response, Response)
+    assert str(response) == str(expected_response)
+    source_texts = [node.node.get_content() for node in response.source_nodes]
+    assert source_texts[:3] == [
+        node.node.get_content() for node in expected_response.source_nodes
+    ]
+    # then the retrieved nodes, once each: both vector sub questions retrieve the
+    # same node, the list index has nodes of its own
+    assert sorted(source_texts[3:]) == [
+        "Hello world.",
+        "This is another test.",
+        "This is another test.",
+    ]
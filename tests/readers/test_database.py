@@ -0,0 +1,67 @@
+"""Test database reader."""
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from llama_index.readers.database import DatabaseReader
+
+
+@pytest.fixture()
+def reader() -> DatabaseReader:
+    engine = create_engine("sqlite://")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE items (id INTEGER, name TEXT)"))
+        for i in range(1, 11):
+            connection.execute(
+                text("INSERT INTO items VALUES (:id, :name)"),
+                {"id": i, "name": f"item{i}"},
+            )
+    return DatabaseReader(engine=engine)
+
+
+def test_load_data(reader: DatabaseReader) -> None:
+    """Test loading all rows at once."""
+    documents = reader.load_data("SELECT id, name FROM items ORDER BY id")
+    assert [doc.text for doc in documents] == [f"{i}, item{i}" for i in range(1, 11)]
+
+
+def test_iter_data(reader: DatabaseReader) -> None:
+    """Test streaming rows in batches, grouped into documents."""
+    query = "SELECT id, name FROM items ORDER BY id"
+    batches = list(reader.iter_data(query, batch_size=4))
+    assert [len(documents) for documents in batches] == [4, 4, 2]
+    assert [doc.text for documents in batches for doc in documents] == [
+        doc.text for doc in reader.load_data(query)
+    ]
+
+    # batches are rounded up to whole documents
+    batches = list(reader.iter_data(query, batch_size=4, rows_per_document=3))
+    assert [len(documents) for documents in batches] == [2, 2]
+    assert batches[0][0].text == "1, item1\n2, item2\n3, item3"
+    assert batches[1][1].text == "10, item10"
+
+
+def test_iter_data_keyset(reader: DatabaseReader) -> None:
+    """Test paging by a keyset column, and resuming a load."""
+    query = "SELECT id, name FROM items WHERE id > :min_id"
+    params = {"min_id": 2}
+    batches = reader.iter_data(query, batch_size=3, keyset_column="id", params=params)
+    first_batch = next(batches)
+    assert [doc.text for doc in first_batch] == ["3, item3", "4, item4", "5, item5"]
+    next(batches)
+    # the second batch isn't consumed yet
+    assert reader.last_keyset_value == 5
+
+    resumed_batches = list(
+        reader.iter_data(
+            query,
+            batch_size=3,
+            keyset_column="id",
+            start_after=reader.last_keyset_value,
+            params=params,
+        )
+    )
+    assert [doc.text for documents in resumed_batches for doc in documents] == [
+        f"{i}, item{i}" for i in range(6, 11)
+    ]
+    assert reader.last_keyset_value == 10
@@ -1,11 +1,24 @@
 """Test file reader."""
 
+import os
+from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 import pytest
 
+from llama_index.readers.base import BaseReader
 from llama_index.readers.file.base import SimpleDirectoryReader
+from llama_index.readers.file.manifest import FileManifest
+from llama_index.readers.file.tabular_reader import CSVReader, PandasCSVReader
+from llama_index.schema import Document
+
+
+class _FailingReader(BaseReader):
+    def load_data(
+        self, file: Path, extra_info: Optional[Dict] = None
+    ) -> List[Document]:
+        raise ValueError(f"Can't read {file}")
 
 
 def test_recursive() -> None:
@@ -347,3 +360,236 @@ def test_error_if_not_dir_or_file() -> None:
     with TemporaryDirectory() as tmp_dir:
         with pytest.raises(ValueError, match="No files"):
             SimpleDirectoryReader(tmp_dir)
+
+
+def test_parallel_load_data() -> None:
+    """Test loading files with workers, in threads and processes."""
+    with TemporaryDirectory() as tmp_dir:
+        for i in range(10):
+            with open(f"{tmp_dir}/test{i}.txt", "w") as f:
+                f.write(f"test{i}")
+            with open(f"{tmp_dir}/test{i}.md", "w") as f:
+                f.write(f"# test{i}")
+
+        def file_metadata(filename: str) -> Dict[str, Any]:
+            return {"filename": filename}
+
+        reader = SimpleDirectoryReader(
+            tmp_dir,
+            filename_as_id=True,
+            file_metadata=file_metadata,
+            process_pool_exts={".txt"},
+        )
+        documents = reader.load_data()
+        for num_workers in (2, 4):
+            parallel_documents = reader.load_data(num_workers=num_workers)
+            assert [doc.id_ for doc in parallel_documents] == [
+                doc.id_ for doc in documents
+            ]
+            assert [doc.text for doc in parallel_documents] == [
+                doc.text for doc in documents
+            ]
+            assert [doc.metadata for doc in parallel_documents] == [
+                doc.metadata for doc in documents
+            ]
+
+
+def test_iter_data_raise_on_error() -> None:
+    """Test skipping the files that fail to load."""
+    with TemporaryDirectory() as tmp_dir:
+        with open(f"{tmp_dir}/test1.txt", "w") as f:
+            f.write("test1")
+        with open(f"{tmp_dir}/test2.bad", "w") as f:
+            f.write("test2")
+        with open(f"{tmp_dir}/test3.txt", "w") as f:
+            f.write("test3")
+
+        file_extractor: Dict[str, BaseReader] = {".bad": _FailingReader()}
+        reader = SimpleDirectoryReader(tmp_dir, file_extractor=file_extractor)
+        with pytest.raises(ValueError, match="Can't read"):
+            reader.load_data()
+        with pytest.raises(ValueError, match="Can't read"):
+            reader.load_data(num_workers=2)
+
+        reader = SimpleDirectoryReader(
+            tmp_dir, file_extractor=file_extractor, raise_on_error=False
+        )
+        for num_workers in (None, 2):
+            docs_per_file = list(reader.iter_data(num_workers=num_workers))
+            assert [[doc.text for doc in docs] for docs in docs_per_file] == [
+                ["test1"],
+                ["test3"],
+            ]
+
+
+def test_iter_data_file_metadata_error() -> None:
+    """Test that a failing file_metadata is handled like a failing reader."""
+
+    def file_metadata(file_path: str) -> Dict:
+        if file_path.endswith("test2.txt"):
+            raise ValueError(f"No metadata for {file_path}")
+        return {"file_path": file_path}
+
+    with TemporaryDirectory() as tmp_dir:
+        for i in range(1, 4):
+            with open(f"{tmp_dir}/test{i}.txt", "w") as f:
+                f.write(f"test{i}")
+
+        reader = SimpleDirectoryReader(tmp_dir, file_metadata=file_metadata)
+        for num_workers in (None, 2):
+            with pytest.raises(ValueError, match="No metadata"):
+                reader.load_data(num_workers=num_workers)
+
+        reader = SimpleDirectoryReader(
+            tmp_dir, file_metadata=file_metadata, raise_on_error=False
+        )
+        for num_workers in (None, 2):
+            docs_per_file = list(reader.iter_data(num_workers=num_workers))
+            assert [[doc.text for doc in docs] for docs in docs_per_file] == [
+                ["test1"],
+                ["test3"],
+            ]
+
+
+@pytest.mark.parametrize("num_workers", [None, 2])
+def test_incremental_load_data(num_workers: Optional[int]) -> None:
+    """Test loading only the new and changed files, with a manifest."""
+    manifest = FileManifest()
+    with TemporaryDirectory() as tmp_dir:
+        for i in range(1, 4):
+            with open(f"{tmp_dir}/test{i}.txt", "w") as f:
+                f.write(f"test{i}")
+
+        reader = SimpleDirectoryReader(tmp_dir, filename_as_id=True, manifest=manifest)
+        documents = reader.load_data(num_workers=num_workers)
+        assert [doc.text for doc in documents] == ["test1", "test2", "test3"]
+        assert reader.pop_stale_ref_doc_ids() == []
+
+        # nothing changed
+        reader = SimpleDirectoryReader(tmp_dir, filename_as_id=True, manifest=manifest)
+        assert reader.load_data(num_workers=num_workers) == []
+
+        # touched, changed, deleted and new files
+        os.utime(f"{tmp_dir}/test1.txt", ns=(0, 0))
+        with open(f"{tmp_dir}/test2.txt", "w") as f:
+            f.write("test2 changed")
+        os.remove(f"{tmp_dir}/test3.txt")
+        with open(f"{tmp_dir}/test4.txt", "w") as f:
+            f.write("test4")
+
+        reader = SimpleDirectoryReader(tmp_dir, filename_as_id=True, manifest=manifest)
+        assert reader.deleted_files == [f"{tmp_dir}/test3.txt"]
+        documents = reader.load_data(num_workers=num_workers)
+        assert [doc.text for doc in documents] == ["test2 changed", "test4"]
+        assert reader.pop_stale_ref_doc_ids() == [f"{tmp_dir}/test3.txt"]
+        assert sorted(manifest.get_paths()) == [
+            f"{tmp_dir}/test1.txt",
+            f"{tmp_dir}/test2.txt",
+            f"{tmp_dir}/test4.txt",
+        ]
+
+        # a changed file without filename ids gets new document ids
+        with open(f"{tmp_dir}/test4.txt", "w") as f:
+            f.write("test4 changed")
+        old_doc_ids = manifest.get_doc_ids(Path(f"{tmp_dir}/test4.txt"))
+        reader = SimpleDirectoryReader(tmp_dir, manifest=manifest)
+        documents = reader.load_data(num_workers=num_workers)
+        assert [doc.text for doc in documents] == ["test4 changed"]
+        assert reader.pop_stale_ref_doc_ids() == old_doc_ids
+
+
+def test_incremental_load_data_subset_of_files() -> None:
+    """Test that files of the manifest left out of a load aren't deleted."""
+    manifest = FileManifest()
+    with TemporaryDirectory() as tmp_dir:
+        for i in range(1, 5):
+            with open(f"{tmp_dir}/test{i}.txt", "w") as f:
+                f.write(f"test{i}")
+        reader = SimpleDirectoryReader(tmp_dir, filename_as_id=True, manifest=manifest)
+        assert len(reader.load_data()) == 4
+
+        # with num_files_limit
+        reader = SimpleDirectoryReader(
+            tmp_dir, filename_as_id=True, manifest=manifest, num_files_limit=1
+        )
+        assert reader.deleted_files == []
+        reader.load_data()
+        assert reader.pop_stale_ref_doc_ids() == []
+        assert len(manifest.get_paths()) == 4
+
+        # with an explicit list of files, one of the others being deleted
+        os.remove(f"{tmp_dir}/test4.txt")
+        reader = SimpleDirectoryReader(
+            input_files=[f"{tmp_dir}/test1.txt"],
+            filename_as_id=True,
+            manifest=manifest,
+        )
+        assert reader.deleted_files == [f"{tmp_dir}/test4.txt"]
+        reader.load_data()
+        assert reader.pop_stale_ref_doc_ids() == [f"{tmp_dir}/test4.txt"]
+        assert sorted(manifest.get_paths()) == [
+            f"{tmp_dir}/test{i}.txt" for i in range(1, 4)
+        ]
+
+
+def test_csv_readers_chunksize() -> None:
+    """Test reading CSV files by chunks of rows."""
+    with TemporaryDirectory() as tmp_dir:
+        with open(f"{tmp_dir}/test.csv", "w") as f:
+            f.write("id,name,score\n")
+            for i in range(5):
+                f.write(f"{i},name{i},{i / 2}\n")
+        file = Path(f"{tmp_dir}/test.csv")
+
+        for reader in (CSVReader(), PandasCSVReader()):
+            assert len(reader.load_data(file)) == 1
+
+        documents = CSVReader(chunksize=2).load_data(file)
+        assert [doc.text for doc in documents] == [
+            "id, name, score\n0, name0, 0.0",
+            "1, name1, 0.5\n2, name2, 1.0",
+            "3, name3, 1.5\n4, name4, 2.0",
+        ]
+
+        documents = PandasCSVReader(chunksize=2).load_data(file)
+        assert [doc.text for doc in documents] == [
+            "0, name0, 0.0\n1, name1, 0.5",
+            "2, name2, 1.0\n3, name3, 1.5",
+            "4, name4, 2.0",
+        ]
+
+        reader = PandasCSVReader(
+            concat_rows=False, chunksize=2, metadata_columns=["id", "score"]
+        )
+        documents = list(reader.lazy_load_data(file, extra_info={"file": "test"}))
+        assert [doc.text for doc in documents] == [f"name{i}" for i in range(5)]
+        assert documents[1].metadata == {"file": "test", "id": 1, "score": 0.5}
+        assert isinstance(documents[1].metadata["id"], int)
+
+        with pytest.raises(ValueError):
+            PandasCSVReader(metadata_columns=["id"])
+
+
+def test_iter_data_documents_per_batch() -> None:
+    """Test yielding the documents of a file in batches."""
+    with TemporaryDirectory() as tmp_dir:
+        with open(f"{tmp_dir}/test.csv", "w") as f:
+            f.write("id,name\n")
+            for i in range(5):
+                f.write(f"{i},name{i}\n")
+
+        reader = SimpleDirectoryReader(
+            tmp_dir,
+            filename_as_id=True,
+            file_extractor={".csv": PandasCSVReader(concat_rows=False, chunksize=2)},
+            manifest=FileManifest(),
+        )
+        batches = list(reader.iter_data(documents_per_batch=2))
+        assert [len(docs) for docs in batches] == [2, 2, 1]
+        doc_ids = [doc.id_ for docs in batches for doc in docs]
+        assert doc_ids == [f"{tmp_dir}/test.csv_part_{i}" for i in range(5)]
+        assert reader.manifest is not None
+        assert reader.manifest.get_doc_ids(Path(f"{tmp_dir}/test.csv")) == doc_ids
+
+        with pytest.raises(ValueError):
+            list(reader.iter_data(num_workers=2, documents_per_batch=2))
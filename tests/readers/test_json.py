@@ -1,9 +1,17 @@
 """Test file reader."""
 
+import json
 from tempfile import TemporaryDirectory
 
+import pytest
+
 from llama_index.readers.json import JSONReader
 
+try:
+    import ijson
+except ImportError:
+    ijson = None  # type: ignore
+
 
 def test_basic() -> None:
     """Test JSON reader in basic mode."""
@@ -52,3 +60,44 @@ def test_collapse_length() -> None:
         data2 = reader2.load_data(file_name)
         assert isinstance(data2[0].get_content(), str)
         assert data2[0].get_content().index("a ") is not None
+
+
+def test_jsonl() -> None:
+    """Test JSON reader in JSON Lines mode, selecting fields."""
+    with TemporaryDirectory() as tmp_dir:
+        file_name = f"{tmp_dir}/test4.jsonl"
+        with open(file_name, "w") as f:
+            for i in range(5):
+                record = {"id": i, "user": {"name": f"user{i}", "tags": ["a", "b"]}}
+                f.write(json.dumps(record) + "\n")
+            f.write("\n")
+
+        reader = JSONReader(is_jsonl=True, levels_back=0)
+        data = reader.load_data(file_name, extra_info={"source": "test"})
+        assert len(data) == 5
+        assert (
+            data[1].get_content() == "id 1\nuser name user1\nuser tags a\nuser tags b"
+        )
+        assert data[1].metadata == {"source": "test"}
+
+        reader = JSONReader(
+            is_jsonl=True, levels_back=0, field_paths=["user.name", "user.tags.1", "x"]
+        )
+        batches = list(reader.iter_data(file_name, batch_size=2))
+        assert [len(docs) for docs in batches] == [2, 2, 1]
+        assert batches[0][1].get_content() == "user.name user1\nuser.tags.1 b"
+
+
+@pytest.mark.skipif(ijson is None, reason="ijson not installed")
+def test_items_path() -> None:
+    """Test JSON reader parsing the items of a large document incrementally."""
+    with TemporaryDirectory() as tmp_dir:
+        file_name = f"{tmp_dir}/test5.json"
+        with open(file_name, "w") as f:
+            json.dump({"data": [{"id": i, "score": i / 2} for i in range(3)]}, f)
+
+        reader = JSONReader(items_path="data.item", levels_back=0)
+        data = reader.load_data(file_name)
+        assert [doc.get_content() for doc in data] == [
+            f"id {i}\nscore {i / 2}" for i in range(3)
+        ]
@@ -0,0 +1,64 @@
+"""Test token streaming transport."""
+import asyncio
+import time
+from threading import Thread
+from typing import List
+
+import pytest
+
+from llama_index.response.schema import StreamingResponse
+from llama_index.response.streaming import AsyncTokenQueue, TokenQueue
+
+
+def test_token_queue() -> None:
+    """Test that consumers block until tokens or the end of the stream arrive."""
+    token_queue = TokenQueue()
+
+    def _produce() -> None:
+        for token in ["a", "b", "c"]:
+            time.sleep(0.01)
+            token_queue.put(token)
+        token_queue.close()
+
+    thread = Thread(target=_produce)
+    thread.start()
+    assert list(token_queue) == ["a", "b", "c"]
+    thread.join()
+
+    # the end of the stream is seen by later consumers too
+    assert list(token_queue) == []
+    assert token_queue.is_closed
+
+    metrics = token_queue.metrics
+    assert metrics.num_tokens == 3
+    assert metrics.first_token_latency is not None
+    assert metrics.first_token_latency >= 0.01
+    assert metrics.tokens_per_second is not None
+
+
+@pytest.mark.asyncio
+async def test_async_token_queue() -> None:
+    """Test async token queue."""
+    token_queue = AsyncTokenQueue()
+
+    async def _produce() -> None:
+        for token in ["a", "b"]:
+            await asyncio.sleep(0.01)
+            token_queue.put(token)
+        token_queue.close()
+
+    task = asyncio.create_task(_produce())
+    tokens: List[str] = [token async for token in token_queue]
+    await task
+    assert tokens == ["a", "b"]
+    assert token_queue.metrics.num_tokens == 2
+
+
+def test_streaming_response_metrics() -> None:
+    """Test that streaming responses record their metrics."""
+    response = StreamingResponse(response_gen=(token for token in ["a", "b"]))
+    assert response.metrics.first_token_latency is None
+
+    assert str(response) == "ab"
+    assert response.metrics.num_tokens == 2
+    assert response.metrics.end_time is not None
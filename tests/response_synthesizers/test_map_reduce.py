@@ -0,0 +1,202 @@
+"""Test map-reduce."""
+
+from typing import Any, Dict, Generator, List, Optional, Sequence, Type, cast
+from unittest.mock import Mock
+
+try:
+    from pydantic.v1 import BaseModel
+except ImportError:
+    from pydantic import BaseModel
+
+import pytest
+
+from llama_index.indices.prompt_helper import PromptHelper
+from llama_index.indices.service_context import ServiceContext
+from llama_index.llm_predictor import LLMPredictor
+from llama_index.program.base_program import BasePydanticProgram
+from llama_index.prompts.base import BasePromptTemplate, PromptTemplate
+from llama_index.prompts.prompt_type import PromptType
+from llama_index.response_synthesizers import (
+    MapReduce,
+    ResponseMode,
+    get_response_synthesizer,
+)
+from llama_index.response_synthesizers.refine import StructuredRefineResponse
+from tests.mock_utils.mock_predict import patch_llmpredictor_predict
+
+QA_PROMPT = PromptTemplate(
+    "{query_str}:{context_str}", prompt_type=PromptType.QUESTION_ANSWER
+)
+SUMMARY_PROMPT = PromptTemplate(
+    "{context_str}{query_str}", prompt_type=PromptType.SUMMARY
+)
+TEXTS = [
+    "Text chunk 1",
+    "Text chunk 2",
+    "Text chunk 3",
+    "Text chunk 4",
+]
+
+
+class MockAnswerProgram(BasePydanticProgram):
+    """Answers with its input, if the input is in `answerable`."""
+
+    def __init__(self, answerable: Sequence[str]):
+        self._answerable = answerable
+
+    @property
+    def output_cls(self) -> Type[BaseModel]:
+        return StructuredRefineResponse
+
+    def __call__(
+        self, *args: Any, context_str: Optional[str] = None, **kwargs: Any
+    ) -> StructuredRefineResponse:
+        context_str = cast(str, context_str)
+        return StructuredRefineResponse(
+            answer=context_str, query_satisfied=context_str in self._answerable
+        )
+
+    async def acall(
+        self, *args: Any, context_str: Optional[str] = None, **kwargs: Any
+    ) -> StructuredRefineResponse:
+        return self(context_str=context_str)
+
+
+@pytest.fixture()
+def mock_service_context_merge_chunks(
+    mock_service_context: ServiceContext,
+) -> ServiceContext:
+    def mock_repack(
+        prompt_template: PromptTemplate, text_chunks: Sequence[str]
+    ) -> List[str]:
+        merged_chunks = []
+        for chunks in zip(*[iter(text_chunks)] * 2):
+            merged_chunks.append("\n".join(chunks))
+        return merged_chunks
+
+    mock_prompt_helper = Mock(spec=PromptHelper)
+    mock_prompt_helper.repack.side_effect = mock_repack
+    mock_service_context.prompt_helper = mock_prompt_helper
+    return mock_service_context
+
+
+def test_map_reduce(mock_service_context_merge_chunks: ServiceContext) -> None:
+    """Test map-reduce."""
+    map_reduce = MapReduce(
+        service_context=mock_service_context_merge_chunks,
+        text_qa_template=QA_PROMPT,
+        summary_template=SUMMARY_PROMPT,
+        max_concurrency=1,
+    )
+    response = map_reduce.get_response(text_chunks=TEXTS, query_str="What is?")
+    # each pair of chunks is answered, then both answers are merged
+    assert str(response) == (
+        "What is?:Text chunk 1\nText chunk 2\nWhat is?:Text chunk 3\nText chunk 4"
+    )
+
+
+@pytest.mark.asyncio
+async def test_map_reduce_async(
+    mock_service_context_merge_chunks: ServiceContext,
+) -> None:
+    """Test async map-reduce."""
+    map_reduce = MapReduce(
+        service_context=mock_service_context_merge_chunks,
+        text_qa_template=QA_PROMPT,
+        summary_template=SUMMARY_PROMPT,
+    )
+    response = await map_reduce.aget_response(text_chunks=TEXTS, query_str="What is?")
+    assert str(response) == (
+        "What is?:Text chunk 1\nText chunk 2\nWhat is?:Text chunk 3\nText chunk 4"
+    )
+
+
+def test_map_reduce_streaming(
+    mock_service_context_merge_chunks: ServiceContext,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the final reduction is streamed."""
+
+    def mock_stream(
+        self: Any, prompt: BasePromptTemplate, **prompt_args: Any
+    ) -> Generator[str, None, None]:
+        response = patch_llmpredictor_predict(self, prompt, **prompt_args)
+        yield from response.split(" ")
+
+    monkeypatch.setattr(LLMPredictor, "stream", mock_stream)
+    map_reduce = MapReduce(
+        service_context=mock_service_context_merge_chunks,
+        text_qa_template=QA_PROMPT,
+        summary_template=SUMMARY_PROMPT,
+        streaming=True,
+    )
+    response = map_reduce.get_response(text_chunks=TEXTS, query_str="What is?")
+    assert isinstance(response, Generator)
+    assert " ".join(response) == (
+        "What is?:Text chunk 1\nText chunk 2\nWhat is?:Text chunk 3\nText chunk 4"
+    )
+
+
+@pytest.mark.parametrize(
+    ("answerable", "expected"),
+    [
+        # only one chunk is left, no need to reduce
+        (["Text chunk 3\nText chunk 4"], "Text chunk 3\nText chunk 4"),
+        ([], "Empty Response"),
+    ],
+)
+def test_map_reduce_answer_filtering(
+    mock_service_context_merge_chunks: ServiceContext,
+    answerable: List[str],
+    expected: str,
+) -> None:
+    """Test that chunks with no answer are dropped before the reduction."""
+    map_reduce = MapReduce(
+        service_context=mock_service_context_merge_chunks,
+        text_qa_template=QA_PROMPT,
+        summary_template=SUMMARY_PROMPT,
+        structured_answer_filtering=True,
+        program_factory=lambda _: MockAnswerProgram(answerable),
+    )
+    response = map_reduce.get_response(text_chunks=TEXTS, query_str="What is?")
+    assert response == expected
+
+
+def test_constructor_args(mock_service_context: ServiceContext) -> None:
+    with pytest.raises(ValueError):
+        # cant construct map-reduce with a program factory but not answer filtering
+        MapReduce(
+            service_context=mock_service_context,
+            program_factory=lambda _: MockAnswerProgram([]),
+        )
+
+    map_reduce = get_response_synthesizer(
+        service_context=mock_service_context,
+        response_mode=ResponseMode.MAP_REDUCE,
+        max_concurrency=2,
+    )
+    assert isinstance(map_reduce, MapReduce)
+    assert map_reduce._max_concurrency == 2
+
+
+def test_map_reduce_input_counts(
+    mock_service_context_merge_chunks: ServiceContext,
+) -> None:
+    """Test that every level is repacked once."""
+    map_reduce = MapReduce(
+        service_context=mock_service_context_merge_chunks,
+        text_qa_template=QA_PROMPT,
+        summary_template=SUMMARY_PROMPT,
+    )
+    texts: Dict[int, List[str]] = {}
+    map_reduce.get_response(text_chunks=TEXTS, query_str="What is?")
+    repack = cast(Mock, mock_service_context_merge_chunks.prompt_helper.repack)
+    for i, call in enumerate(repack.call_args_list):
+        texts[i] = list(call.args[1])
+    assert texts == {
+        0: TEXTS,
+        1: [
+            "What is?:Text chunk 1\nText chunk 2",
+            "What is?:Text chunk 3\nText chunk 4",
+        ],
+    }
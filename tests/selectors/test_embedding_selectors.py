@@ -0,0 +1,111 @@
+from typing import Any, Dict, List
+from unittest.mock import Mock
+
+import pytest
+
+from llama_index.embeddings.base import BaseEmbedding
+from llama_index.selectors.embedding_selectors import (
+    EmbeddingMultiSelector,
+    EmbeddingSingleSelector,
+)
+from llama_index.selectors.types import BaseSelector, SelectorResult, SingleSelection
+
+EMBEDDINGS: Dict[str, List[float]] = {
+    "apple": [1, 0, 0],
+    "pear": [0, 1, 0],
+    "peach": [0, 0, 1],
+    "apple pie": [0.9, 0.1, 0],
+    "apple or pear": [0.6, 0.55, 0.1],
+    "fruit": [0.5, 0.5, 0.5],
+}
+CHOICES = ["apple", "pear", "peach"]
+
+
+class MockEmbedding(BaseEmbedding):
+    num_texts_embedded: int = 0
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "MockEmbedding"
+
+    def _get_query_embedding(self, query: str) -> List[float]:
+        return EMBEDDINGS[query]
+
+    async def _aget_query_embedding(self, query: str) -> List[float]:
+        return EMBEDDINGS[query]
+
+    def _get_text_embedding(self, text: str) -> List[float]:
+        self.num_texts_embedded += 1
+        return EMBEDDINGS[text]
+
+
+def _get_fallback_selector() -> Any:
+    fallback_selector = Mock(spec=BaseSelector)
+    result = SelectorResult(selections=[SingleSelection(index=2, reason="LLM")])
+    fallback_selector.select.return_value = result
+    fallback_selector.aselect.return_value = result
+    return fallback_selector
+
+
+def test_embedding_single_selector() -> None:
+    embed_model = MockEmbedding()
+    fallback_selector = _get_fallback_selector()
+    selector = EmbeddingSingleSelector(embed_model, fallback_selector=fallback_selector)
+
+    result = selector.select(CHOICES, "apple pie")
+    assert result.ind == 0
+    fallback_selector.select.assert_not_called()
+
+    # the choices are embedded once
+    result = selector.select(CHOICES, "apple or pear")
+    assert result.ind == 0
+    assert embed_model.num_texts_embedded == len(CHOICES)
+
+    # no confident choice, the fallback selector chooses
+    result = selector.select(CHOICES, "fruit")
+    assert result.ind == 2
+    assert result.reason == "LLM"
+    fallback_selector.select.assert_called_once()
+
+
+def test_embedding_single_selector_no_fallback() -> None:
+    selector = EmbeddingSingleSelector(MockEmbedding())
+    result = selector.select(CHOICES, "fruit")
+    assert result.ind == 0
+
+
+def test_embedding_multi_selector() -> None:
+    fallback_selector = _get_fallback_selector()
+    selector = EmbeddingMultiSelector(
+        MockEmbedding(), fallback_selector=fallback_selector
+    )
+
+    result = selector.select(CHOICES, "apple or pear")
+    assert result.inds == [0, 1]
+    result = selector.select(CHOICES, "apple pie")
+    assert result.inds == [0]
+    fallback_selector.select.assert_not_called()
+
+    result = selector.select(CHOICES, "fruit")
+    assert result.inds == [2]
+    fallback_selector.select.assert_called_once()
+
+
+def test_embedding_multi_selector_max_outputs() -> None:
+    selector = EmbeddingMultiSelector(MockEmbedding(), max_outputs=1)
+    result = selector.select(CHOICES, "apple or pear")
+    assert result.inds == [0]
+
+
+@pytest.mark.asyncio
+async def test_embedding_selector_async() -> None:
+    fallback_selector = _get_fallback_selector()
+    selector = EmbeddingSingleSelector(
+        MockEmbedding(), fallback_selector=fallback_selector
+    )
+
+    result = await selector.aselect(CHOICES, "apple pie")
+    assert result.ind == 0
+    result = await selector.aselect(CHOICES, "fruit")
+    assert result.ind == 2
+    fallback_selector.aselect.assert_called_once()
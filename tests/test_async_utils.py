@@ -0,0 +1,103 @@
+"""Test async utils."""
+import asyncio
+from contextvars import ContextVar
+from typing import List
+
+import pytest
+
+from llama_index.async_utils import asyncio_run, run_jobs
+
+test_var: ContextVar[str] = ContextVar("test_var", default="default")
+
+
+async def _get_value(value: int, delay: float = 0.0) -> int:
+    await asyncio.sleep(delay)
+    return value
+
+
+def test_asyncio_run() -> None:
+    """Test running a coroutine from sync code."""
+    assert asyncio_run(_get_value(1)) == 1
+
+    async def _get_var() -> str:
+        return test_var.get()
+
+    # context variables of the caller are visible to the coroutine
+    token = test_var.set("caller")
+    try:
+        assert asyncio_run(_get_var()) == "caller"
+    finally:
+        test_var.reset(token)
+
+
+@pytest.mark.asyncio
+async def test_asyncio_run_in_running_loop() -> None:
+    """Test running a coroutine from sync code called inside a running loop."""
+    assert asyncio_run(_get_value(1)) == 1
+
+
+def test_asyncio_run_timeout() -> None:
+    """Test that a timeout cancels the coroutine."""
+    cancelled: List[bool] = []
+
+    async def _sleep() -> None:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio_run(_sleep(), timeout=0.05)
+    # wait for the cancellation to reach the coroutine
+    asyncio_run(asyncio.sleep(0.01))
+    assert cancelled == [True]
+
+
+def test_asyncio_run_nested() -> None:
+    """Test sync code that calls asyncio_run from a coroutine it runs."""
+
+    async def _outer() -> int:
+        return asyncio_run(_get_value(2))
+
+    assert asyncio_run(_outer()) == 2
+
+
+@pytest.mark.asyncio
+async def test_run_jobs() -> None:
+    """Test bounded concurrency, ordering and timeouts of jobs."""
+    running = [0, 0]
+
+    async def _job(value: int) -> int:
+        running[0] += 1
+        running[1] = max(running)
+        await asyncio.sleep(0.01 * (5 - value))
+        running[0] -= 1
+        return value
+
+    assert await run_jobs([_job(i) for i in range(5)], workers=2) == list(range(5))
+    assert running[1] == 2
+
+    with pytest.raises(asyncio.TimeoutError):
+        await run_jobs([_get_value(1, delay=10)], timeout=0.01)
+
+
+@pytest.mark.asyncio
+async def test_run_jobs_failure() -> None:
+    """Test that a failing job cancels the other jobs."""
+    cancelled: List[bool] = []
+
+    async def _fail() -> None:
+        raise ValueError("failed")
+
+    async def _sleep() -> None:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    with pytest.raises(ValueError, match="failed"):
+        await run_jobs([_sleep(), _fail()])
+    await asyncio.sleep(0)
+    assert cancelled == [True]
@@ -0,0 +1,46 @@
+"""Test the lazily imported public API."""
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "module_name",
+    [
+        "llama_index",
+        "llama_index.indices",
+        "llama_index.llms",
+        "llama_index.readers",
+        "llama_index.vector_stores",
+    ],
+)
+def test_public_names(module_name: str) -> None:
+    """Test that every public name can be imported."""
+    module = importlib.import_module(module_name)
+    for name in module.__all__:
+        assert getattr(module, name) is not None
+
+    with pytest.raises(AttributeError):
+        getattr(module, "NotAName")
+
+
+def test_sql_context_builder_alias() -> None:
+    from llama_index import SQLContextBuilder, SQLDocumentContextBuilder
+
+    assert SQLContextBuilder is SQLDocumentContextBuilder
+
+
+def test_import_is_lazy() -> None:
+    """Test that importing the package doesn't import its heavy dependencies."""
+    code = (
+        "import sys\n"
+        "import llama_index\n"
+        "print([m for m in ['langchain', 'pandas', 'sqlalchemy'] if m in sys.modules])"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    assert output.strip() == "[]"
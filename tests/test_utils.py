@@ -1,11 +1,14 @@
 """Test utils."""
 
+import sys
+from collections import OrderedDict, deque
 from typing import Optional, Type, Union
 
 import pytest
 
 from llama_index.utils import (
     ErrorToRetry,
+    get_lazy_getattr,
     globals_helper,
     retry_on_exceptions_with_backoff,
     iter_batch,
@@ -109,3 +112,22 @@ def test_iter_batch() -> None:
     assert list(iter_batch(gen, 3)) == [[0, 1, 2], [3, 4]]
 
     assert list(iter_batch([], 3)) == []
+
+
+def test_get_lazy_getattr() -> None:
+    """Test lazy module attributes."""
+    module_dict = sys.modules[__name__].__dict__
+    lazy_getattr = get_lazy_getattr(
+        __name__,
+        {"OrderedDict": "collections", "Dequeue": "collections:deque"},
+    )
+    try:
+        assert lazy_getattr("OrderedDict") is OrderedDict
+        assert lazy_getattr("Dequeue") is deque
+        # cached on the module
+        assert module_dict["Dequeue"] is deque
+
+        with pytest.raises(AttributeError):
+            lazy_getattr("defaultdict")
+    finally:
+        module_dict.pop("Dequeue", None)
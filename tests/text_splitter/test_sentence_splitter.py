@@ -60,3 +60,11 @@ def test_edge_case() -> None:
     splitter = SentenceSplitter()
     chunks = splitter.split_text(text)
     assert len(chunks) == 2
+
+
+def test_truncate_text() -> None:
+    """Test truncating to the first chunk, through the TextSplitter interface."""
+    sentence_text_splitter = SentenceSplitter(chunk_size=20, chunk_overlap=0)
+
+    text = " ".join(["foo"] * 15) + ". " + " ".join(["bar"] * 15)
+    assert sentence_text_splitter.truncate_text(text) == " ".join(["foo"] * 15) + "."
@@ -1,4 +1,6 @@
 """Test text splitter."""
+from typing import List
+
 import tiktoken
 
 from llama_index.text_splitter import TokenTextSplitter
@@ -28,6 +30,25 @@ def test_truncate_token() -> None:
     assert text == "foo"
 
 
+def test_truncate_first_chunk_only() -> None:
+    """Test that truncating only tokenizes the splits of the first chunk."""
+    tokenized_texts: List[str] = []
+
+    def _tokenizer(text: str) -> List[str]:
+        tokenized_texts.append(text)
+        return text.split()
+
+    text_splitter = TokenTextSplitter(
+        chunk_size=2, chunk_overlap=0, tokenizer=_tokenizer
+    )
+    assert text_splitter.truncate_text("foo bar hello world") == "foo bar"
+    assert tokenized_texts == ["foo bar hello world", "foo", " bar", " hello"]
+    assert text_splitter.split_text("foo bar hello world") == [
+        "foo bar",
+        "hello world",
+    ]
+
+
 def test_split_long_token() -> None:
     """Test split a really long token."""
     # tiktoken will say length is ~5k
@@ -0,0 +1,116 @@
+"""Test query plan tool."""
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from llama_index.callbacks.base import CallbackManager
+from llama_index.callbacks.llama_debug import LlamaDebugHandler
+from llama_index.callbacks.schema import CBEventType, EventPayload
+from llama_index.indices.service_context import ServiceContext
+from llama_index.response_synthesizers import get_response_synthesizer
+from llama_index.tools.function_tool import FunctionTool
+from llama_index.tools.query_plan import QueryPlanTool
+from llama_index.tools.types import BaseTool
+
+
+def _get_plan() -> Dict[str, Any]:
+    """Get a plan where node 4 is a dependency of both nodes 2 and 3."""
+    return {
+        "nodes": [
+            {"id": 1, "query_str": "root", "dependencies": [2, 3]},
+            {"id": 2, "query_str": "left", "dependencies": [4]},
+            {"id": 3, "query_str": "right", "dependencies": [4, 5]},
+            {"id": 4, "query_str": "shared", "tool_name": "foo"},
+            {"id": 5, "query_str": "other", "tool_name": "bar"},
+        ]
+    }
+
+
+def _get_tools(calls: List[str], running: List[int]) -> List[BaseTool]:
+    """Get tools recording their calls and the maximum concurrency."""
+
+    async def _acall(input: str) -> str:
+        calls.append(input)
+        running[0] += 1
+        running[1] = max(running[0], running[1])
+        await asyncio.sleep(0.01)
+        running[0] -= 1
+        return f"answer to {input}"
+
+    return [
+        FunctionTool.from_defaults(
+            fn=lambda input: input, async_fn=_acall, name=name, description=name
+        )
+        for name in ("foo", "bar")
+    ]
+
+
+def test_query_plan_tool(mock_service_context: ServiceContext) -> None:
+    """Test executing a query plan."""
+    calls: List[str] = []
+    # currently running, max running
+    running = [0, 0]
+    debug_handler = LlamaDebugHandler()
+    query_plan_tool = QueryPlanTool.from_defaults(
+        _get_tools(calls, running),
+        response_synthesizer=get_response_synthesizer(
+            service_context=mock_service_context
+        ),
+        callback_manager=CallbackManager([debug_handler]),
+    )
+
+    query_plan_tool(**_get_plan())
+
+    # the shared dependency runs once, concurrently with the other leaf
+    assert sorted(calls) == ["other", "shared"]
+    assert running[1] == 2
+
+    event_pairs = debug_handler.get_event_pairs(CBEventType.QUERY_PLAN)
+    assert len(event_pairs) == 5
+    # dependencies finish before their dependents
+    end_order = []
+    for start_event, end_event in sorted(event_pairs, key=lambda pair: pair[1].time):
+        assert start_event.payload is not None
+        assert end_event.payload is not None
+        assert end_event.payload[EventPayload.DURATION] >= 0
+        end_order.append(start_event.payload[EventPayload.QUERY_PLAN_NODE].id)
+    assert end_order[-1] == 1
+    assert end_order.index(4) < end_order.index(2)
+
+
+@pytest.mark.asyncio
+async def test_query_plan_tool_async(mock_service_context: ServiceContext) -> None:
+    """Test executing a query plan with a concurrency limit."""
+    calls: List[str] = []
+    running = [0, 0]
+    query_plan_tool = QueryPlanTool.from_defaults(
+        _get_tools(calls, running),
+        response_synthesizer=get_response_synthesizer(
+            service_context=mock_service_context
+        ),
+        max_concurrency=1,
+    )
+
+    await query_plan_tool.acall(**_get_plan())
+    assert sorted(calls) == ["other", "shared"]
+    assert running[1] == 1
+
+
+def test_query_plan_tool_cycle(mock_service_context: ServiceContext) -> None:
+    """Test that a cyclic plan is rejected."""
+    query_plan_tool = QueryPlanTool.from_defaults(
+        _get_tools([], [0, 0]),
+        response_synthesizer=get_response_synthesizer(
+            service_context=mock_service_context
+        ),
+    )
+    plan = {
+        "nodes": [
+            {"id": 1, "query_str": "root", "dependencies": [2]},
+            {"id": 2, "query_str": "a", "dependencies": [3]},
+            {"id": 3, "query_str": "b", "dependencies": [2]},
+        ]
+    }
+    with pytest.raises(ValueError, match="cycle"):
+        query_plan_tool(**plan)